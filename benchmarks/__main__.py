@@ -0,0 +1,85 @@
+"""
+Provide implementation of the command line interface to run the benchmarks.
+
+To use:
+    $ python -m benchmarks --output=benchmarks.json
+    $ python -m benchmarks --output=benchmarks.json --compare=previous-benchmarks.json
+"""
+import json
+import sys
+
+import click
+
+from benchmarks.suite import (
+    compare_results,
+    run_benchmarks,
+)
+from cli.constants import FAILED_EXIT_FROM_COMMAND_CODE
+from cli.utils import (
+    print_errors,
+    print_result,
+)
+
+BENCHMARKS_SECTIONS = ['cold-start', 'latency', 'throughput', 'peak-rss']
+
+
+@click.option('--output', type=str, required=False, help='Path to the file to write the results to.')
+@click.option('--compare', type=click.File('r'), required=False, help='Path to the file of the results to compare to.')
+@click.option(
+    '--sections',
+    type=str,
+    required=False,
+    default=','.join(BENCHMARKS_SECTIONS),
+    help='Comma-separated sections of the benchmarks to run.',
+)
+@click.option(
+    '--iterations', type=int, required=False, default=50, help='Amount of executions per command to measure.',
+)
+@click.option(
+    '--sizes',
+    type=str,
+    required=False,
+    default='1000,10000,100000',
+    help='Comma-separated amounts of the objects to list to measure peak memory usage at.',
+)
+@click.command()
+def benchmarks_command(output, compare, sections, iterations, sizes):
+    """
+    Run the benchmarks of the commands against the mock node.
+    """
+    sections = sections.split(',')
+
+    if not set(sections) <= set(BENCHMARKS_SECTIONS):
+        print_errors(errors=f'Sections must be of the following: {", ".join(BENCHMARKS_SECTIONS)}.')
+        sys.exit(FAILED_EXIT_FROM_COMMAND_CODE)
+
+    try:
+        sizes = [int(size) for size in sizes.split(',')]
+
+    except ValueError:
+        print_errors(errors='Sizes must be comma-separated integers.')
+        sys.exit(FAILED_EXIT_FROM_COMMAND_CODE)
+
+    if iterations < 1 or any(size < 1 for size in sizes):
+        print_errors(errors='Iterations and sizes must be greater than 0.')
+        sys.exit(FAILED_EXIT_FROM_COMMAND_CODE)
+
+    try:
+        results = run_benchmarks(sections=sections, iterations=iterations, sizes=sizes)
+
+    except Exception as error:
+        print_errors(errors=str(error))
+        sys.exit(FAILED_EXIT_FROM_COMMAND_CODE)
+
+    if output is not None:
+        with open(output, 'w') as file:
+            json.dump(results, file, indent=4, sort_keys=True)
+
+    if compare is not None:
+        results['comparison'] = compare_results(previous_results=json.load(compare), results=results)
+
+    print_result(result=results)
+
+
+if __name__ == '__main__':
+    benchmarks_command()
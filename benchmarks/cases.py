@@ -0,0 +1,122 @@
+"""
+Provide the commands the benchmarks execute against the mock node.
+
+Cases of the latency and throughput are functions of the mock node's chain, so identifiers passed to the commands
+are the ones the mock node serves.
+"""
+import json
+
+NODE_URL_ARGUMENTS = ['--node-url', 'localhost']
+NODE_URLS_ARGUMENTS = ['--node-urls', 'localhost,127.0.0.1']
+
+NODE_ACCOUNT_ADDRESS = '116829caa6f35dddf2ce1d4b3c4d5ee0e6b8e0b3c7b0e5f7e9f1f9f8d6d3b1c5d2e8f0'
+PUBLIC_KEY_ADDRESS = 'a23be1ae97d605bcbe61c312d9a443c010dbe7e6a0761e24b10d5368829ab0a7d36acc'
+SWAP_ID = '033402fe1346742486b15a3a9966eb5249271025fc7fb0b37ed3fdb4bcce6808'
+
+BATCH_THROUGHPUT_ITEMS_AMOUNT = 1000
+
+LATENCY_CASES = {
+    'account get-balance': lambda chain: [
+        'account', 'get-balance', '--address', chain.transactions[0].get('header').get('inputs')[0],
+    ] + NODE_URL_ARGUMENTS,
+    'account get-balance --node-urls': lambda chain: [
+        'account', 'get-balance', '--address', chain.transactions[0].get('header').get('inputs')[0],
+    ] + NODE_URLS_ARGUMENTS,
+    'atomic-swap get-info': lambda chain: ['atomic-swap', 'get-info', '--id', SWAP_ID] + NODE_URL_ARGUMENTS,
+    'atomic-swap get-public-key': lambda chain: ['atomic-swap', 'get-public-key'] + NODE_URL_ARGUMENTS,
+    'batch get': lambda chain: [
+        'batch', 'get', '--id', chain.batches[-1].get('header_signature'), '--no-cache',
+    ] + NODE_URL_ARGUMENTS,
+    'batch get-list': lambda chain: ['batch', 'get-list', '--limit', 100] + NODE_URL_ARGUMENTS,
+    'batch get-status': lambda chain: [
+        'batch', 'get-status', '--id', chain.batches[-1].get('header_signature'),
+    ] + NODE_URL_ARGUMENTS,
+    'block get': lambda chain: [
+        'block', 'get', '--id', chain.head.get('header_signature'), '--no-cache',
+    ] + NODE_URL_ARGUMENTS,
+    'block get-list': lambda chain: ['block', 'get-list', '--limit', 100] + NODE_URL_ARGUMENTS,
+    'block get-list --node-urls': lambda chain: ['block', 'get-list', '--limit', 100] + NODE_URLS_ARGUMENTS,
+    'block get-range': lambda chain: ['block', 'get-range', '--from', 0, '--to', 99] + NODE_URL_ARGUMENTS,
+    'index query': lambda chain: [
+        'index', 'query', '--address', chain.transactions[-1].get('header').get('inputs')[0],
+    ],
+    'node fleet-status': lambda chain: ['node', 'fleet-status'] + NODE_URLS_ARGUMENTS,
+    'node get-configs': lambda chain: ['node', 'get-configs'] + NODE_URL_ARGUMENTS,
+    'node get-configs --node-urls': lambda chain: ['node', 'get-configs'] + NODE_URLS_ARGUMENTS,
+    'node get-info': lambda chain: ['node', 'get-info'] + NODE_URL_ARGUMENTS,
+    'node get-info --node-urls': lambda chain: ['node', 'get-info'] + NODE_URLS_ARGUMENTS,
+    'node get-initial-stake': lambda chain: ['node', 'get-initial-stake'] + NODE_URL_ARGUMENTS,
+    'node get-initial-stake --node-urls': lambda chain: ['node', 'get-initial-stake'] + NODE_URLS_ARGUMENTS,
+    'node get-peers': lambda chain: ['node', 'get-peers'] + NODE_URL_ARGUMENTS,
+    'node get-peers --node-urls': lambda chain: ['node', 'get-peers'] + NODE_URLS_ARGUMENTS,
+    'node-account get': lambda chain: ['node-account', 'get', '--address', NODE_ACCOUNT_ADDRESS] + NODE_URL_ARGUMENTS,
+    'public-key get-info': lambda chain: [
+        'public-key', 'get-info', '--address', PUBLIC_KEY_ADDRESS,
+    ] + NODE_URL_ARGUMENTS,
+    'public-key get-list': lambda chain: [
+        'public-key', 'get-list', '--address', chain.transactions[0].get('header').get('inputs')[0],
+    ] + NODE_URL_ARGUMENTS,
+    'receipt get': lambda chain: [
+        'receipt', 'get', '--ids', chain.transactions[-1].get('header_signature'), '--no-cache',
+    ] + NODE_URL_ARGUMENTS,
+    'state get': lambda chain: [
+        'state', 'get', '--address', chain.transactions[-1].get('header').get('outputs')[0],
+    ] + NODE_URL_ARGUMENTS,
+    'state get-list': lambda chain: ['state', 'get-list', '--limit', 100] + NODE_URL_ARGUMENTS,
+    'transaction get': lambda chain: [
+        'transaction', 'get', '--id', chain.transactions[-1].get('header_signature'), '--no-cache',
+    ] + NODE_URL_ARGUMENTS,
+    'transaction get-list': lambda chain: ['transaction', 'get-list', '--limit', 100] + NODE_URL_ARGUMENTS,
+}
+
+
+LATENCY_SETUP_COMMANDS = [
+    ['index', 'sync'] + NODE_URL_ARGUMENTS,
+]
+
+
+def get_batch_execution_case(chain):
+    """
+    Get the batch execution of the batches' status commands, a line per batch.
+    """
+    batches = chain.batches[-BATCH_THROUGHPUT_ITEMS_AMOUNT:]
+
+    lines = '\n'.join(
+        json.dumps({'cmd': 'batch get-status', 'id': batch.get('header_signature'), 'node-url': 'localhost'})
+        for batch in batches
+    )
+
+    return ['batch-exec'], lines, len(batches)
+
+
+def get_batches_wait_case(chain):
+    """
+    Get waiting for the batches to be committed, passed by the input.
+    """
+    batches = chain.batches[-BATCH_THROUGHPUT_ITEMS_AMOUNT:]
+
+    lines = '\n'.join(batch.get('header_signature') for batch in batches)
+
+    return ['batch', 'wait'] + NODE_URL_ARGUMENTS, lines, len(batches)
+
+
+def get_blocks_range_case(chain):
+    """
+    Get the range of all blocks of the chain.
+    """
+    arguments = ['block', 'get-range', '--from', 0, '--to', len(chain.blocks) - 1] + NODE_URL_ARGUMENTS
+
+    return arguments, None, len(chain.blocks)
+
+
+THROUGHPUT_CASES = {
+    'batch-exec': get_batch_execution_case,
+    'batch wait': get_batches_wait_case,
+    'block get-range': get_blocks_range_case,
+}
+
+PEAK_RSS_CASES = {
+    'block get-list': ['block', 'get-list', '--all', '--page-size', '1000', '--output', 'ndjson'] + NODE_URL_ARGUMENTS,
+    'batch get-list': ['batch', 'get-list', '--all', '--output', 'ndjson'] + NODE_URL_ARGUMENTS,
+    'transaction get-list': ['transaction', 'get-list', '--all', '--output', 'ndjson'] + NODE_URL_ARGUMENTS,
+}
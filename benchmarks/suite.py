@@ -0,0 +1,376 @@
+"""
+Provide implementation of the benchmarks of the commands against the mock node.
+"""
+import asyncio
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+
+from click.testing import CliRunner
+
+from benchmarks.cases import (
+    LATENCY_CASES,
+    LATENCY_SETUP_COMMANDS,
+    PEAK_RSS_CASES,
+    THROUGHPUT_CASES,
+)
+from cli import client
+from cli.client import RemmeClient
+from cli.config import Settings
+from cli.constants import (
+    CACHE_PATH_ENVIRONMENT_VARIABLE,
+    INDEX_PATH_ENVIRONMENT_VARIABLE,
+    PASSED_EXIT_FROM_COMMAND_CODE,
+    READ_CACHE_TTL_ENVIRONMENT_VARIABLE,
+)
+from cli.entrypoint import (
+    COMMANDS,
+    cli,
+)
+from cli.mock_node.service import (
+    MockNode,
+    SyntheticChain,
+)
+
+COMMAND_EXECUTION_CODE = 'import sys; from cli.entrypoint import cli; cli()'
+COMMAND_EXECUTION_ON_PORT_CODE = 'import sys; import cli.client; cli.client.NODE_PORT = int(sys.argv.pop(1)); ' \
+                                 'from cli.entrypoint import cli; cli()'
+
+LATENCY_PERCENTILES = (50, 90, 99)
+
+
+def get_percentile(measurements, percentile):
+    """
+    Get the percentile of the measurements by the nearest rank.
+    """
+    measurements = sorted(measurements)
+    rank = max(1, -(-len(measurements) * percentile // 100))
+
+    return measurements[rank - 1]
+
+
+def get_commit():
+    """
+    Get the commit the benchmarks are run on, if the sources are a git repository.
+    """
+    try:
+        process = subprocess.run(
+            ['git', 'rev-parse', 'HEAD'],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+            universal_newlines=True,
+        )
+
+    except OSError:
+        return None
+
+    return process.stdout.strip() or None
+
+
+class MockNodeThread:
+    """
+    Implements the mock node running on the event loop of its own thread.
+
+    Commands are executed on the event loop of the main thread (or by other processes), so the mock node serving
+    them on its own loop doesn't share the time of the measured commands.
+    """
+
+    def __init__(self, chain):
+        """
+        Constructor.
+
+        Arguments:
+            chain (SyntheticChain, required): chain to serve.
+        """
+        self.node = MockNode(chain=chain)
+        self.port = None
+
+        self._loop = None
+        self._thread = None
+        self._is_started = threading.Event()
+
+    def _serve(self):
+        """
+        Start the mock node on the thread's event loop and serve until the loop is stopped.
+        """
+        self._loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self._loop)
+
+        self.port = self._loop.run_until_complete(self.node.start_async(host='localhost', port=0))
+        self._is_started.set()
+
+        self._loop.run_forever()
+
+        self._loop.run_until_complete(self.node.stop_async())
+        self._loop.close()
+
+    def __enter__(self):
+        """
+        Start the mock node, point the clients of the process to it.
+
+        Clients created before are set aside, so none of them keeps sending requests to the former node port.
+        """
+        self._thread = threading.Thread(target=self._serve, daemon=True)
+        self._thread.start()
+        self._is_started.wait()
+
+        self._node_port = client.NODE_PORT
+        client.NODE_PORT = self.port
+
+        self._clients = RemmeClient._clients
+        RemmeClient._clients = {}
+
+        return self
+
+    def __exit__(self, *args):
+        """
+        Stop the mock node, close the clients' connections to it.
+        """
+        RemmeClient.close()
+        RemmeClient._clients = self._clients
+        client.NODE_PORT = self._node_port
+
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+
+
+class Benchmarks:
+    """
+    Implements the benchmarks of the commands.
+
+    Commands are executed against the mock node, so the results measure the command line interface
+    and Remme core API rather than the network and the node. Caches are disabled to measure the requests.
+    """
+
+    def __init__(self, iterations, sizes, cache_path, index_path):
+        """
+        Constructor.
+
+        Arguments:
+            iterations (int, required): amount of executions of a command to take the latency percentiles of.
+            sizes (list, required): amounts of the objects to list to get the peak memory usage at.
+            cache_path (string, required): path to the on-disk cache of the chain objects of the commands.
+            index_path (string, required): path to the local chain index of the commands.
+        """
+        self.iterations = iterations
+        self.sizes = sizes
+        self.cache_path = cache_path
+        self.index_path = index_path
+
+        self.environment = dict(os.environ)
+        self.environment[CACHE_PATH_ENVIRONMENT_VARIABLE] = cache_path
+        self.environment[INDEX_PATH_ENVIRONMENT_VARIABLE] = index_path
+        self.environment[READ_CACHE_TTL_ENVIRONMENT_VARIABLE] = '0'
+
+    def invoke(self, arguments, input=None):
+        """
+        Execute the command in the process, fail if the command is failed.
+        """
+        result = CliRunner().invoke(cli, [str(argument) for argument in arguments], input=input)
+
+        if result.exit_code != PASSED_EXIT_FROM_COMMAND_CODE:
+            raise RuntimeError(f'The following command `{" ".join(arguments)}` is failed: {result.output}')
+
+        return result
+
+    def get_cold_start_time(self):
+        """
+        Get time to print help of the entrypoint and each of the commands by a fresh interpreter in milliseconds.
+
+        Printing a command's help imports the command's modules, so it measures the interpreter's startup
+        and the imports without the requests.
+        """
+        cold_start_time = {}
+
+        for name in [None] + sorted(COMMANDS):
+            arguments = ['--help'] if name is None else [name, '--help']
+
+            measurements = []
+
+            for _ in range(max(1, self.iterations // 10)):
+                start = time.perf_counter()
+                subprocess.run(
+                    [sys.executable, '-c', COMMAND_EXECUTION_CODE] + arguments,
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.DEVNULL,
+                    env=self.environment,
+                    check=True,
+                )
+                measurements.append(time.perf_counter() - start)
+
+            cold_start_time[name or 'remme'] = round(min(measurements) * 1000, 2)
+
+        return cold_start_time
+
+    def get_latency(self, chain):
+        """
+        Get percentiles of the commands' latency in milliseconds.
+
+        Setup commands are executed first, e.g. the index is synchronized to query it.
+        """
+        latency = {}
+
+        with MockNodeThread(chain=chain):
+            for arguments in LATENCY_SETUP_COMMANDS:
+                self.invoke(arguments=arguments)
+
+            for name, get_arguments in LATENCY_CASES.items():
+                arguments = get_arguments(chain)
+
+                self.invoke(arguments=arguments)
+
+                measurements = []
+
+                for _ in range(self.iterations):
+                    start = time.perf_counter()
+                    self.invoke(arguments=arguments)
+                    measurements.append((time.perf_counter() - start) * 1000)
+
+                latency[name] = {
+                    f'p{percentile}': round(get_percentile(measurements, percentile), 3)
+                    for percentile in LATENCY_PERCENTILES
+                }
+                latency[name]['mean'] = round(sum(measurements) / len(measurements), 3)
+
+        return latency
+
+    def get_throughput(self, chain):
+        """
+        Get throughput of the commands executing many commands or requests at once in items per second.
+        """
+        throughput = {}
+
+        with MockNodeThread(chain=chain):
+            for name, get_arguments in THROUGHPUT_CASES.items():
+                arguments, input, items_amount = get_arguments(chain)
+
+                start = time.perf_counter()
+                self.invoke(arguments=arguments, input=input)
+
+                throughput[name] = round(items_amount / (time.perf_counter() - start), 2)
+
+        return throughput
+
+    def get_peak_rss(self):
+        """
+        Get peak memory usage (resident set size) of listing all the objects by a fresh interpreter in megabytes.
+
+        Every size is listed from its own chain, so the mock node of the largest chain doesn't slow down
+        the smaller ones.
+        """
+        peak_rss = {name: {} for name in PEAK_RSS_CASES}
+
+        for size in self.sizes:
+            chain = SyntheticChain(blocks_amount=size + 1, transactions_per_block=1)
+
+            with MockNodeThread(chain=chain) as node:
+                for name, arguments in PEAK_RSS_CASES.items():
+                    peak_rss[name][str(size)] = self._measure_peak_rss(port=node.port, arguments=arguments)
+
+        return peak_rss
+
+    def _measure_peak_rss(self, port, arguments):
+        """
+        Execute the command by a fresh interpreter and get its peak memory usage in megabytes.
+        """
+        process = subprocess.Popen(
+            [sys.executable, '-c', COMMAND_EXECUTION_ON_PORT_CODE, str(port)] + arguments,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            env=self.environment,
+        )
+
+        _, status, resource_usage = os.wait4(process.pid, 0)
+        process.returncode = os.WEXITSTATUS(status)
+
+        if process.returncode != PASSED_EXIT_FROM_COMMAND_CODE:
+            raise RuntimeError(f'The following command `{" ".join(arguments)}` is failed.')
+
+        # Peak resident set size is reported in bytes by MacOS and in kilobytes by Linux.
+        peak_rss = resource_usage.ru_maxrss if sys.platform == 'darwin' else resource_usage.ru_maxrss * 1024
+
+        return round(peak_rss / 1024 / 1024, 2)
+
+    def run(self, sections):
+        """
+        Run the sections of the benchmarks.
+
+        Arguments:
+            sections (list, required): names of the sections to run (cold-start, latency, throughput, peak-rss).
+        """
+        previous_settings = Settings.get()
+        Settings.share(Settings(overrides={
+            'cache_path': self.cache_path, 'index_path': self.index_path, 'read_cache_ttl': 0,
+        }))
+
+        results = {
+            'commit': get_commit(),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'timestamp': int(time.time()),
+        }
+
+        try:
+            if 'cold-start' in sections:
+                results['cold_start'] = self.get_cold_start_time()
+
+            if 'latency' in sections or 'throughput' in sections:
+                chain = SyntheticChain(blocks_amount=1000, transactions_per_block=2)
+
+                if 'latency' in sections:
+                    results['latency'] = self.get_latency(chain=chain)
+
+                if 'throughput' in sections:
+                    results['throughput'] = self.get_throughput(chain=chain)
+
+            if 'peak-rss' in sections:
+                results['peak_rss'] = self.get_peak_rss()
+
+        finally:
+            Settings.share(previous_settings)
+
+        return results
+
+
+def run_benchmarks(sections, iterations, sizes):
+    """
+    Run the sections of the benchmarks with the on-disk cache and the index in the temporary directory.
+    """
+    with tempfile.TemporaryDirectory() as directory:
+        benchmarks = Benchmarks(
+            iterations=iterations,
+            sizes=sizes,
+            cache_path=os.path.join(directory, 'cache.sqlite3'),
+            index_path=os.path.join(directory, 'index.sqlite3'),
+        )
+
+        return benchmarks.run(sections=sections)
+
+
+def compare_results(previous_results, results):
+    """
+    Compare the results with the previous ones.
+
+    Returns ratios of the results' metrics to the previous ones by the metrics' paths (e.g. `latency.block get.p50`),
+    a ratio greater than 1 is the increase of time, throughput or memory.
+    """
+    ratios = {}
+
+    def compare(previous, current, path):
+        if isinstance(current, dict) and isinstance(previous, dict):
+            for key, value in current.items():
+                compare(previous.get(key), value, path + [key])
+            return
+
+        if isinstance(current, (int, float)) and isinstance(previous, (int, float)) and previous:
+            ratios['.'.join(path)] = round(current / previous, 3)
+
+    for section in ('cold_start', 'latency', 'throughput', 'peak_rss'):
+        compare(previous_results.get(section), results.get(section), [section])
+
+    return ratios
@@ -0,0 +1,6 @@
+"""
+Provide implementation of the command line interface to interact with Remme-core.
+"""
+import time
+
+STARTED_AT = time.perf_counter()
@@ -1,28 +1,49 @@
 """
 Provide implementation of the command line interface's account commands.
 """
+import csv
 import sys
 
 import click
-from remme import Remme
 
-from cli.account.forms import GetAccountBalanceForm
+from cli.account.forms import (
+    GetAccountBalanceForm,
+    TransferTokensBulkForm,
+    TransferTokensRowForm,
+)
 from cli.account.help import (
     ACCOUNT_ADDRESS_ARGUMENT_HELP_MESSAGE,
     ACCOUNT_ADDRESS_TO_ARGUMENT_HELP_MESSAGE,
     AMOUNT_ARGUMENT_HELP_MESSAGE,
     PRIVATE_KEY_ARGUMENT_HELP_MESSAGE,
+    TRANSFER_TOKENS_BULK_CONCURRENCY_ARGUMENT_HELP_MESSAGE,
+    TRANSFER_TOKENS_BULK_INPUT_ARGUMENT_HELP_MESSAGE,
+    TRANSFER_TOKENS_BULK_OUTPUT_FILE_ARGUMENT_HELP_MESSAGE,
+    TRANSFER_TOKENS_BULK_PROCESSES_ARGUMENT_HELP_MESSAGE,
+)
+from cli.account.service import (
+    Account,
+    TokensBulkTransfer,
+)
+from cli.cache import ReadCache
+from cli.client import (
+    RemmeClient,
+    fan_out,
 )
-from cli.account.service import Account
 from cli.constants import (
+    DEFAULT_TRANSACTION_SIGNER_PROCESSES,
+    DEFAULT_TRANSFER_TOKENS_BULK_CONCURRENCY,
     FAILED_EXIT_FROM_COMMAND_CODE,
     NODE_URL_ARGUMENT_HELP_MESSAGE,
+    NODE_URLS_ARGUMENT_HELP_MESSAGE,
 )
 from cli.generic.forms.forms import TransferTokensForm
+from cli.signer import TransactionSigner
 from cli.utils import (
     default_node_url,
     print_errors,
     print_result,
+    resolve_node_urls,
 )
 
 
@@ -35,15 +56,19 @@ def account_commands():
 
 
 @click.option('--address', type=str, required=True, help=ACCOUNT_ADDRESS_ARGUMENT_HELP_MESSAGE)
-@click.option('--node-url', type=str, required=False, help=NODE_URL_ARGUMENT_HELP_MESSAGE, default=default_node_url())
+@click.option('--node-url', type=str, required=False, help=NODE_URL_ARGUMENT_HELP_MESSAGE)
+@click.option('--node-urls', type=str, required=False, help=NODE_URLS_ARGUMENT_HELP_MESSAGE)
 @account_commands.command('get-balance')
-def get_balance(address, node_url):
+def get_balance(address, node_url, node_urls):
     """
     Get balance of the account by its address.
     """
+    node_url, node_urls = resolve_node_urls(node_url=node_url, node_urls=node_urls)
+
     arguments, errors = GetAccountBalanceForm().load({
         'address': address,
         'node_url': node_url,
+        'node_urls': node_urls,
     })
 
     if errors:
@@ -52,12 +77,24 @@ def get_balance(address, node_url):
 
     address = arguments.get('address')
     node_url = arguments.get('node_url')
+    node_urls = arguments.get('node_urls')
 
-    remme = Remme(network_config={
-        'node_address': str(node_url) + ':8080',
-    })
+    if node_urls is not None:
+        results, failed_node_urls = fan_out(
+            request=lambda remme: Account(service=remme, cache=ReadCache.get()).get_balance_async(address=address),
+            node_urls=node_urls,
+        )
+
+        print_result(result=results)
 
-    result, errors = Account(service=remme).get_balance(address=address)
+        if failed_node_urls:
+            sys.exit(FAILED_EXIT_FROM_COMMAND_CODE)
+
+        return
+
+    remme = RemmeClient.get(node_url=node_url)
+
+    result, errors = Account(service=remme, cache=ReadCache.get()).get_balance(address=address)
 
     if errors is not None:
         print_errors(errors=errors)
@@ -69,7 +106,7 @@ def get_balance(address, node_url):
 @click.option('--private-key', type=str, required=True, help=PRIVATE_KEY_ARGUMENT_HELP_MESSAGE)
 @click.option('--address-to', type=str, required=True, help=ACCOUNT_ADDRESS_TO_ARGUMENT_HELP_MESSAGE)
 @click.option('--amount', type=int, required=True, help=AMOUNT_ARGUMENT_HELP_MESSAGE)
-@click.option('--node-url', type=str, required=False, help=NODE_URL_ARGUMENT_HELP_MESSAGE, default=default_node_url())
+@click.option('--node-url', type=str, required=False, help=NODE_URL_ARGUMENT_HELP_MESSAGE, default=default_node_url)
 @account_commands.command('transfer-tokens')
 def transfer_tokens(private_key, address_to, amount, node_url):
     """
@@ -91,15 +128,90 @@ def transfer_tokens(private_key, address_to, amount, node_url):
     amount = arguments.get('amount')
     node_url = arguments.get('node_url')
 
-    remme = Remme(
-        account_config={'private_key_hex': private_key},
-        network_config={'node_address': str(node_url) + ':8080'},
-    )
+    remme = RemmeClient.get(node_url=node_url, private_key=private_key)
 
-    result, errors = Account(service=remme).transfer_tokens(address_to=address_to, amount=amount)
+    result, errors = Account(service=remme, cache=ReadCache.get()).transfer_tokens(address_to=address_to, amount=amount)
 
     if errors is not None:
         print_errors(errors=errors)
         sys.exit(FAILED_EXIT_FROM_COMMAND_CODE)
 
     print_result(result=result)
+
+
+@click.option('--private-key', type=str, required=True, help=PRIVATE_KEY_ARGUMENT_HELP_MESSAGE)
+@click.option('--input', type=click.File('r'), required=True, help=TRANSFER_TOKENS_BULK_INPUT_ARGUMENT_HELP_MESSAGE)
+@click.option('--output-file', type=str, required=True, help=TRANSFER_TOKENS_BULK_OUTPUT_FILE_ARGUMENT_HELP_MESSAGE)
+@click.option(
+    '--concurrency',
+    type=int,
+    required=False,
+    default=DEFAULT_TRANSFER_TOKENS_BULK_CONCURRENCY,
+    help=TRANSFER_TOKENS_BULK_CONCURRENCY_ARGUMENT_HELP_MESSAGE,
+)
+@click.option(
+    '--processes',
+    type=int,
+    required=False,
+    default=DEFAULT_TRANSACTION_SIGNER_PROCESSES,
+    help=TRANSFER_TOKENS_BULK_PROCESSES_ARGUMENT_HELP_MESSAGE,
+)
+@click.option('--node-url', type=str, required=False, help=NODE_URL_ARGUMENT_HELP_MESSAGE, default=default_node_url)
+@account_commands.command('transfer-tokens-bulk')
+def transfer_tokens_bulk(private_key, input, output_file, concurrency, processes, node_url):
+    """
+    Transfer tokens to addresses of the input file.
+    """
+    arguments, errors = TransferTokensBulkForm().load({
+        'private_key': private_key,
+        'concurrency': concurrency,
+        'processes': processes,
+        'node_url': node_url,
+    })
+
+    if errors:
+        print_errors(errors=errors)
+        sys.exit(FAILED_EXIT_FROM_COMMAND_CODE)
+
+    private_key = arguments.get('private_key')
+    concurrency = arguments.get('concurrency')
+    processes = arguments.get('processes')
+    node_url = arguments.get('node_url')
+
+    transfers, rows_errors = [], {}
+
+    for row, transfer in enumerate(csv.DictReader(input), start=1):
+        transfer_arguments, errors = TransferTokensRowForm().load({
+            'address_to': transfer.get('address_to'),
+            'amount': transfer.get('amount'),
+        })
+
+        if errors:
+            rows_errors[row] = errors
+            continue
+
+        transfers.append((row, transfer_arguments.get('address_to'), transfer_arguments.get('amount')))
+
+    if rows_errors:
+        print_errors(errors={'input': rows_errors})
+        sys.exit(FAILED_EXIT_FROM_COMMAND_CODE)
+
+    remme = RemmeClient.get(node_url=node_url, private_key=private_key)
+    signer = TransactionSigner(service=remme, processes=processes)
+
+    try:
+        result, errors = TokensBulkTransfer(service=remme, signer=signer, results_path=output_file).transfer(
+            transfers=transfers, concurrency=concurrency,
+        )
+
+    finally:
+        signer.close()
+
+    if errors is not None:
+        print_errors(errors=errors)
+        sys.exit(FAILED_EXIT_FROM_COMMAND_CODE)
+
+    print_result(result=result)
+
+    if result.get('failed'):
+        sys.exit(FAILED_EXIT_FROM_COMMAND_CODE)
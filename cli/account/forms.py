@@ -1,18 +1,62 @@
 """
 Provide forms for command line interface's account commands.
 """
-from marshmallow import Schema
+from marshmallow import (
+    fields,
+    validate,
+)
 
 from cli.generic.forms.fields import (
     AccountAddressField,
     NodeUrlField,
+    NodeUrlsListField,
+    PrivateKeyField,
 )
+from cli.generic.forms.forms import Form
 
 
-class GetAccountBalanceForm(Schema):
+class GetAccountBalanceForm(Form):
     """
     Get balance of the account form.
     """
 
     address = AccountAddressField(required=True)
     node_url = NodeUrlField(required=True)
+    node_urls = NodeUrlsListField(allow_none=True, required=False)
+
+
+class TransferTokensBulkForm(Form):
+    """
+    Transfer tokens to addresses of the input file form.
+    """
+
+    private_key = PrivateKeyField(required=True)
+    concurrency = fields.Integer(
+        strict=True,
+        required=True,
+        validate=[
+            validate.Range(min=1, error='Concurrency must be greater than 0.'),
+        ],
+    )
+    processes = fields.Integer(
+        strict=True,
+        required=True,
+        validate=[
+            validate.Range(min=1, error='Processes must be greater than 0.'),
+        ],
+    )
+    node_url = NodeUrlField(required=True)
+
+
+class TransferTokensRowForm(Form):
+    """
+    Transfer tokens to address by the row of the input file form.
+    """
+
+    address_to = AccountAddressField(required=True)
+    amount = fields.Integer(
+        required=True,
+        validate=[
+            validate.Range(min=1, error='Amount must be greater than 0.'),
+        ],
+    )
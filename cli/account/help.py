@@ -6,3 +6,7 @@ ACCOUNT_ADDRESS_TO_ARGUMENT_HELP_MESSAGE = 'Account address to transfer tokens t
 AMOUNT_ARGUMENT_HELP_MESSAGE = 'Amount to transfer.'
 GET_ACCOUNT_BALANCE_ADDRESS_ARGUMENT_HELP_MESSAGE = 'Account address to get a balance by.'
 PRIVATE_KEY_ARGUMENT_HELP_MESSAGE = 'Account\'s private key to transfer tokens from.'
+TRANSFER_TOKENS_BULK_INPUT_ARGUMENT_HELP_MESSAGE = 'CSV file with `address_to` and `amount` columns to transfer by.'
+TRANSFER_TOKENS_BULK_OUTPUT_FILE_ARGUMENT_HELP_MESSAGE = 'CSV file to append results of the transfers to and resume by.'
+TRANSFER_TOKENS_BULK_CONCURRENCY_ARGUMENT_HELP_MESSAGE = 'Maximum amount of transfers to send concurrently.'
+TRANSFER_TOKENS_BULK_PROCESSES_ARGUMENT_HELP_MESSAGE = 'Amount of processes to sign transfers in.'
@@ -8,14 +8,52 @@ class AccountInterface:
     Implements account interface.
     """
 
+    async def get_balance_async(self, address):
+        """
+        Get balance of the account by its address.
+        """
+        pass
+
     def get_balance(self, address):
         """
         Get balance of the account by its address.
         """
         pass
 
+    async def transfer_tokens_async(self, address_to, amount):
+        """
+        Transfer tokens to address.
+        """
+        pass
+
     def transfer_tokens(self, address_to, amount):
         """
         Transfer tokens to address.
         """
         pass
+
+
+class TokensBulkTransferInterface:
+    """
+    Implements bulk transfer of tokens interface.
+    """
+
+    async def transfer_async(self, transfers, concurrency):
+        """
+        Transfer tokens by the rows which transfers aren't sent yet.
+
+        Arguments:
+            transfers (list, required): tuples of the row's number, address to transfer tokens to and amount.
+            concurrency (int, required): maximum amount of transfers to send concurrently.
+        """
+        pass
+
+    def transfer(self, transfers, concurrency):
+        """
+        Transfer tokens by the rows which transfers aren't sent yet.
+
+        Arguments:
+            transfers (list, required): tuples of the row's number, address to transfer tokens to and amount.
+            concurrency (int, required): maximum amount of transfers to send concurrently.
+        """
+        pass
@@ -2,12 +2,41 @@
 Provide implementation of the account.
 """
 import asyncio
+import collections
+import csv
+import itertools
+import json
+import os
+import re
 
 from accessify import implements
+from remme.models.utils.constants import CONSENSUS_ADDRESS
+from remme.models.utils.family_name import RemmeFamilyName
+from remme.protobuf.account_pb2 import (
+    AccountMethod,
+    TransferPayload,
+)
+from remme.protobuf.transaction_pb2 import TransactionPayload
 
-from cli.account.interfaces import AccountInterface
+from cli.account.interfaces import (
+    AccountInterface,
+    TokensBulkTransferInterface,
+)
+from cli.cache import (
+    cached_read,
+    invalidates_reads,
+)
+from cli.constants import (
+    ACCOUNT_FAMILY_VERSION,
+    BATCH_IDENTIFIER_REGEXP,
+    TRANSFER_TOKENS_BULK_JOURNAL_SUFFIX,
+)
+from cli.utils import (
+    get_event_loop,
+    run_until_complete,
+)
 
-loop = asyncio.get_event_loop()
+TRANSFER_TOKENS_BULK_RESULTS_FIELDS = ['row', 'address_to', 'amount', 'transaction_id', 'batch_id', 'errors']
 
 
 @implements(AccountInterface)
@@ -16,21 +45,24 @@ class Account:
     Implements account.
     """
 
-    def __init__(self, service):
+    def __init__(self, service, cache=None):
         """
         Constructor.
 
         Arguments:
             service: object to interact with Remme core API.
+            cache (ReadCache, optional): in-process cache of the reads, nothing is cached if it isn't passed.
         """
         self.service = service
+        self.cache = cache
 
-    def get_balance(self, address):
+    @cached_read(name='balance')
+    async def get_balance_async(self, address):
         """
         Get balance of the account by its address.
         """
         try:
-            balance = loop.run_until_complete(self.service.token.get_balance(address=address))
+            balance = await self.service.token.get_balance(address=address)
 
         except Exception as error:
             return None, str(error)
@@ -39,12 +71,19 @@ class Account:
             'balance': balance,
         }, None
 
-    def transfer_tokens(self, address_to, amount):
+    def get_balance(self, address):
+        """
+        Get balance of the account by its address.
+        """
+        return run_until_complete(self.get_balance_async(address=address))
+
+    @invalidates_reads
+    async def transfer_tokens_async(self, address_to, amount):
         """
         Transfer tokens to address.
         """
         try:
-            transaction = loop.run_until_complete(self.service.token.transfer(address_to=address_to, amount=amount))
+            transaction = await self.service.token.transfer(address_to=address_to, amount=amount)
 
         except Exception as error:
             return None, str(error)
@@ -52,3 +91,263 @@ class Account:
         return {
             'batch_identifier': transaction.batch_id,
         }, None
+
+    def transfer_tokens(self, address_to, amount):
+        """
+        Transfer tokens to address.
+        """
+        return run_until_complete(self.transfer_tokens_async(address_to=address_to, amount=amount))
+
+
+@implements(TokensBulkTransferInterface)
+class TokensBulkTransfer:
+    """
+    Implements bulk transfer of tokens.
+
+    Transfers go through two stages: the signing stage signs transactions in the signer's pool of processes
+    and appends them to the journal in the rows' order, the sending stage sends signed transactions concurrently.
+    The stages overlap, so the throughput is bounded by the node rather than by signing. A row of the results
+    file is appended for every sent transfer. As every signed transaction is journaled before it is sent,
+    after an interruption the same transaction is sent again instead of signing a new one: the node doesn't apply
+    the same transaction twice, so the resumed transfer can't be doubled.
+    """
+
+    def __init__(self, service, signer, results_path):
+        """
+        Constructor.
+
+        Arguments:
+            service: object to interact with Remme core API.
+            signer (TransactionSigner, required): signer of the transactions.
+            results_path (string, required): path to the CSV file to append results of the transfers to.
+        """
+        self.service = service
+        self.signer = signer
+        self.results_path = results_path
+        self.journal_path = results_path + TRANSFER_TOKENS_BULK_JOURNAL_SUFFIX
+
+    def load_sent_rows(self):
+        """
+        Get numbers of the rows which transfers are sent (have a batch identifier in the results file).
+        """
+        sent_rows = {}
+
+        if not os.path.exists(self.results_path):
+            return sent_rows
+
+        with open(self.results_path, newline='') as results_file:
+            for result in csv.DictReader(results_file):
+                if re.match(pattern=BATCH_IDENTIFIER_REGEXP, string=result.get('batch_id') or '') is not None:
+                    sent_rows[result.get('row')] = (result.get('address_to'), result.get('amount'))
+
+        return sent_rows
+
+    def load_journal(self):
+        """
+        Get the signed transactions of the journal by their rows' numbers.
+
+        The last line could be written partially if the previous transfer was interrupted, it is skipped.
+        """
+        journal = {}
+
+        if not os.path.exists(self.journal_path):
+            return journal
+
+        with open(self.journal_path) as journal_file:
+            for line in journal_file:
+                try:
+                    entry = json.loads(line)
+
+                except ValueError:
+                    continue
+
+                journal[str(entry.get('row'))] = entry
+
+        return journal
+
+    async def sign_transfer_async(self, row, address_to, amount):
+        """
+        Sign the transaction to transfer tokens to address with the same payload Remme core API's token creates.
+
+        Returns the journal's entry of the transaction or the entry with errors if it could not be signed.
+        """
+        entry = {'row': row, 'address_to': address_to, 'amount': amount}
+
+        transfer_payload = TransferPayload(address_to=address_to, value=amount)
+
+        if self.service.account.family_name == RemmeFamilyName.NODE_ACCOUNT.value:
+            transfer_payload.sender_account_type = TransferPayload.SenderAccountType.Value('NODE_ACCOUNT')
+
+        else:
+            transfer_payload.sender_account_type = TransferPayload.SenderAccountType.Value('ACCOUNT')
+
+        try:
+            entry['transaction_id'], entry['transaction'] = await self.signer.sign_async(
+                family_name=RemmeFamilyName.ACCOUNT.value,
+                family_version=ACCOUNT_FAMILY_VERSION,
+                inputs=[address_to, CONSENSUS_ADDRESS],
+                outputs=[address_to, CONSENSUS_ADDRESS],
+                payload_bytes=TransactionPayload(
+                    method=AccountMethod.TRANSFER, data=transfer_payload.SerializeToString(),
+                ).SerializeToString(),
+            )
+
+        except Exception as error:
+            entry['errors'] = str(error)
+
+        return entry
+
+    async def get_signed_transfer_async(self, row, address_to, amount, journal):
+        """
+        Get the journaled transaction of the row or sign the new one.
+
+        Returns the journal's entry and whether the entry is new (isn't journaled yet).
+        """
+        entry = journal.get(str(row))
+
+        if entry is not None and entry.get('address_to') == address_to and entry.get('amount') == amount:
+            return entry, False
+
+        entry = await self.sign_transfer_async(row=row, address_to=address_to, amount=amount)
+
+        return entry, 'errors' not in entry
+
+    async def sign_transfers_async(self, transfers, journal, journal_file, signed_transfers, senders_amount):
+        """
+        Sign transfers which aren't journaled yet and put them to the queue of the signed transfers (signing stage).
+
+        Up to twice the signer's processes transfers are signed at once. Signed transfers are appended
+        to the journal in the rows' order, the journal is flushed to the disk once for all transfers signed
+        by the moment and only then they are put to the queue. When all transfers are put, the end of
+        the transfers (none) is put for every sender.
+        """
+        loop = get_event_loop()
+
+        signings = collections.deque()
+        transfers = iter(transfers)
+
+        while True:
+            for row, address_to, amount in itertools.islice(transfers, 2 * self.signer.processes - len(signings)):
+                signings.append(loop.create_task(self.get_signed_transfer_async(
+                    row=row, address_to=address_to, amount=amount, journal=journal,
+                )))
+
+            if not signings:
+                break
+
+            entries = [await signings.popleft()]
+
+            while signings and signings[0].done():
+                entries.append(signings.popleft().result())
+
+            new_entries = [entry for entry, is_new in entries if is_new]
+
+            for entry in new_entries:
+                journal_file.write(json.dumps(entry) + '\n')
+
+            if new_entries:
+                journal_file.flush()
+                os.fsync(journal_file.fileno())
+
+            for entry, _ in entries:
+                await signed_transfers.put(entry)
+
+        for _ in range(senders_amount):
+            await signed_transfers.put(None)
+
+    async def send_transfers_async(self, signed_transfers, results_file, summary):
+        """
+        Send signed transfers taking them from the queue until its end (sending stage).
+
+        The result of each transfer is appended to the results file as soon as the transfer is sent.
+        """
+        results = csv.DictWriter(results_file, fieldnames=TRANSFER_TOKENS_BULK_RESULTS_FIELDS)
+
+        while True:
+            entry = await signed_transfers.get()
+
+            if entry is None:
+                return
+
+            result = {
+                'row': entry.get('row'),
+                'address_to': entry.get('address_to'),
+                'amount': entry.get('amount'),
+                'transaction_id': entry.get('transaction_id'),
+                'batch_id': None,
+                'errors': entry.get('errors'),
+            }
+
+            if result.get('errors') is None:
+                try:
+                    response = await self.service.transaction.send(payload=entry.get('transaction'))
+                    result['batch_id'] = response.batch_id
+
+                except Exception as error:
+                    result['errors'] = str(error)
+
+            results.writerow(result)
+            results_file.flush()
+
+            summary['failed' if result.get('errors') is not None else 'sent'] += 1
+
+    async def transfer_async(self, transfers, concurrency):
+        """
+        Transfer tokens by the rows which transfers aren't sent yet.
+
+        Arguments:
+            transfers (list, required): tuples of the row's number, address to transfer tokens to and amount.
+            concurrency (int, required): maximum amount of transfers to send concurrently.
+
+        Returns amounts of sent, already sent (skipped) and failed transfers.
+        """
+        summary = {'sent': 0, 'skipped': 0, 'failed': 0}
+
+        try:
+            sent_rows = self.load_sent_rows()
+            journal = self.load_journal()
+
+            is_results_file_new = not os.path.exists(self.results_path)
+
+            with open(self.results_path, 'a', newline='') as results_file, open(self.journal_path, 'a') as journal_file:
+                if is_results_file_new:
+                    csv.DictWriter(results_file, fieldnames=TRANSFER_TOKENS_BULK_RESULTS_FIELDS).writeheader()
+
+                pending_transfers = []
+
+                for row, address_to, amount in transfers:
+                    if sent_rows.get(str(row)) == (address_to, str(amount)):
+                        summary['skipped'] += 1
+                        continue
+
+                    pending_transfers.append((row, address_to, amount))
+
+                signed_transfers = asyncio.Queue(maxsize=concurrency)
+
+                await asyncio.gather(
+                    self.sign_transfers_async(
+                        transfers=pending_transfers,
+                        journal=journal,
+                        journal_file=journal_file,
+                        signed_transfers=signed_transfers,
+                        senders_amount=concurrency,
+                    ),
+                    *[self.send_transfers_async(
+                        signed_transfers=signed_transfers, results_file=results_file, summary=summary,
+                    ) for _ in range(concurrency)],
+                )
+
+        except OSError as error:
+            return None, str(error)
+
+        return summary, None
+
+    def transfer(self, transfers, concurrency):
+        """
+        Transfer tokens by the rows which transfers aren't sent yet.
+
+        Arguments:
+            transfers (list, required): tuples of the row's number, address to transfer tokens to and amount.
+            concurrency (int, required): maximum amount of transfers to send concurrently.
+        """
+        return run_until_complete(self.transfer_async(transfers=transfers, concurrency=concurrency))
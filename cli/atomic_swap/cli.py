@@ -4,7 +4,6 @@ Provide implementation of the command line interface's atomic swap commands.
 import sys
 
 import click
-from remme import Remme
 
 from cli.atomic_swap.forms import (
     GetAtomicSwapInformationForm,
@@ -12,6 +11,7 @@ from cli.atomic_swap.forms import (
 )
 from cli.atomic_swap.help import SWAP_IDENTIFIER_ARGUMENT_HELP_MESSAGE
 from cli.atomic_swap.service import AtomicSwap
+from cli.client import RemmeClient
 from cli.constants import (
     FAILED_EXIT_FROM_COMMAND_CODE,
     NODE_URL_ARGUMENT_HELP_MESSAGE,
@@ -31,7 +31,7 @@ def atomic_swap_commands():
     pass
 
 
-@click.option('--node-url', type=str, required=False, help=NODE_URL_ARGUMENT_HELP_MESSAGE, default=default_node_url())
+@click.option('--node-url', type=str, required=False, help=NODE_URL_ARGUMENT_HELP_MESSAGE, default=default_node_url)
 @atomic_swap_commands.command('get-public-key')
 def get_public_key(node_url):
     """
@@ -47,9 +47,7 @@ def get_public_key(node_url):
 
     node_url = arguments.get('node_url')
 
-    remme = Remme(network_config={
-        'node_address': str(node_url) + ':8080',
-    })
+    remme = RemmeClient.get(node_url=node_url)
 
     result, errors = AtomicSwap(service=remme).get_public_key()
 
@@ -61,7 +59,7 @@ def get_public_key(node_url):
 
 
 @click.option('--id', type=str, required=True, help=SWAP_IDENTIFIER_ARGUMENT_HELP_MESSAGE)
-@click.option('--node-url', type=str, required=False, help=NODE_URL_ARGUMENT_HELP_MESSAGE, default=default_node_url())
+@click.option('--node-url', type=str, required=False, help=NODE_URL_ARGUMENT_HELP_MESSAGE, default=default_node_url)
 @atomic_swap_commands.command('get-info')
 def get_swap_info(id, node_url):
     """
@@ -79,9 +77,7 @@ def get_swap_info(id, node_url):
     swap_id = arguments.get('id')
     node_url = arguments.get('node_url')
 
-    remme = Remme(network_config={
-        'node_address': str(node_url) + ':8080',
-    })
+    remme = RemmeClient.get(node_url=node_url)
 
     result, errors = AtomicSwap(service=remme).get(swap_id=swap_id)
 
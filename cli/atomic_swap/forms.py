@@ -1,15 +1,14 @@
 """
 Provide forms for command line interface's atomic swap commands.
 """
-from marshmallow import Schema
-
 from cli.generic.forms.fields import (
     NodeUrlField,
     SwapIdentifierField,
 )
+from cli.generic.forms.forms import Form
 
 
-class GetAtomicSwapInformationForm(Schema):
+class GetAtomicSwapInformationForm(Form):
     """
     Get information about atomic swap by its identifier form.
     """
@@ -18,7 +17,7 @@ class GetAtomicSwapInformationForm(Schema):
     node_url = NodeUrlField(required=True)
 
 
-class GetAtomicSwapPublicKeyForm(Schema):
+class GetAtomicSwapPublicKeyForm(Form):
     """
     Get the public key of the atomic swap form.
     """
@@ -8,12 +8,24 @@ class AtomicSwapInterface:
     Implements atomic swap interface.
     """
 
+    async def get_public_key_async(self):
+        """
+        Get the public key of atomic swap.
+        """
+        pass
+
     def get_public_key(self):
         """
         Get the public key of atomic swap.
         """
         pass
 
+    async def get_async(self, swap_id):
+        """
+        Get information about atomic swap by its identifier.
+        """
+        pass
+
     def get(self, swap_id):
         """
         Get information about atomic swap by its identifier.
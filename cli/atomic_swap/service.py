@@ -1,14 +1,11 @@
 """
 Provide implementation of the atomic swap.
 """
-import asyncio
-
 from accessify import implements
 from aiohttp_json_rpc import RpcGenericServerDefinedError
 
 from cli.atomic_swap.interfaces import AtomicSwapInterface
-
-loop = asyncio.get_event_loop()
+from cli.utils import run_until_complete
 
 
 @implements(AtomicSwapInterface)
@@ -26,12 +23,12 @@ class AtomicSwap:
         """
         self.service = service
 
-    def get_public_key(self):
+    async def get_public_key_async(self):
         """
         Get the public key of atomic swap.
         """
         try:
-            public_key = loop.run_until_complete(self.service.swap.get_public_key())
+            public_key = await self.service.swap.get_public_key()
 
         except Exception as error:
             return None, str(error)
@@ -40,12 +37,18 @@ class AtomicSwap:
             'public_key': public_key,
         }, None
 
-    def get(self, swap_id):
+    def get_public_key(self):
+        """
+        Get the public key of atomic swap.
+        """
+        return run_until_complete(self.get_public_key_async())
+
+    async def get_async(self, swap_id):
         """
         Get information about atomic swap by its identifier.
         """
         try:
-            swap_info = loop.run_until_complete(self.service.swap.get_info(swap_id=swap_id))
+            swap_info = await self.service.swap.get_info(swap_id=swap_id)
 
         except RpcGenericServerDefinedError as error:
             return None, str(error.message)
@@ -56,3 +59,9 @@ class AtomicSwap:
         return {
             'information': swap_info.data,
         }, None
+
+    def get(self, swap_id):
+        """
+        Get information about atomic swap by its identifier.
+        """
+        return run_until_complete(self.get_async(swap_id=swap_id))
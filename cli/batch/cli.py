@@ -4,32 +4,58 @@ Provide implementation of the command line interface's batch commands.
 import sys
 
 import click
-from remme import Remme
 
 from cli.batch.forms import (
     GetBatchesListForm,
     GetBatchForm,
     GetBatchStatusForm,
+    WaitBatchesForm,
 )
 from cli.batch.help import (
     BATCH_IDENTIFIER_ARGUMENT_HELP_MESSAGE,
     BATCH_STATUS_IDENTIFIER_ARGUMENT_HELP_MESSAGE,
+    BATCHES_ALL_ARGUMENT_HELP_MESSAGE,
     BATCHES_HEAD_ARGUMENT_HELP_MESSAGE,
     BATCHES_IDENTIFIERS_ARGUMENT_HELP_MESSAGE,
     BATCHES_IDENTIFIERS_ONLY_ARGUMENT_HELP_MESSAGE,
     BATCHES_LIMIT_ARGUMENT_HELP_MESSAGE,
+    BATCHES_PAGE_SIZE_ARGUMENT_HELP_MESSAGE,
     BATCHES_REVERSE_ARGUMENT_HELP_MESSAGE,
     BATCHES_START_ARGUMENT_HELP_MESSAGE,
+    BATCHES_WAIT_CONCURRENCY_ARGUMENT_HELP_MESSAGE,
+    BATCHES_WAIT_IDENTIFIERS_ARGUMENT_HELP_MESSAGE,
+    BATCHES_WAIT_INPUT_ARGUMENT_HELP_MESSAGE,
+    BATCHES_WAIT_TIMEOUT_ARGUMENT_HELP_MESSAGE,
+    BATCHES_WAIT_UNTIL_ARGUMENT_HELP_MESSAGE,
 )
 from cli.batch.service import Batch
+from cli.cache import (
+    ObjectCache,
+    ReadCache,
+)
+from cli.client import RemmeClient
 from cli.constants import (
+    BATCH_WAIT_STATUSES,
+    COMMITTED_BATCH_STATUS,
+    DEFAULT_BATCH_WAIT_CONCURRENCY,
+    DEFAULT_BATCH_WAIT_TIMEOUT,
+    DEFAULT_PAGE_SIZE,
     FAILED_EXIT_FROM_COMMAND_CODE,
+    INVALID_BATCH_STATUS,
+    JSON_OUTPUT_FORMAT,
+    NDJSON_OUTPUT_FORMAT,
+    NO_CACHE_ARGUMENT_HELP_MESSAGE,
     NODE_URL_ARGUMENT_HELP_MESSAGE,
+    OUTPUT_ARGUMENT_HELP_MESSAGE,
+    UNKNOWN_BATCH_STATUS,
 )
 from cli.utils import (
     default_node_url,
+    dict_to_json_line,
     print_errors,
     print_result,
+    print_result_lines,
+    print_result_pages,
 )
 
 
@@ -42,14 +68,16 @@ def batch_commands():
 
 
 @click.option('--id', required=True, type=str, help=BATCH_IDENTIFIER_ARGUMENT_HELP_MESSAGE)
-@click.option('--node-url', required=False, type=str, help=NODE_URL_ARGUMENT_HELP_MESSAGE, default=default_node_url())
+@click.option('--no-cache', required=False, is_flag=True, help=NO_CACHE_ARGUMENT_HELP_MESSAGE)
+@click.option('--node-url', required=False, type=str, help=NODE_URL_ARGUMENT_HELP_MESSAGE, default=default_node_url)
 @batch_commands.command('get')
-def get_batch(id, node_url):
+def get_batch(id, no_cache, node_url):
     """
     Get a batch by its identifier.
     """
     arguments, errors = GetBatchForm().load({
         'id': id,
+        'no_cache': no_cache,
         'node_url': node_url,
     })
 
@@ -58,13 +86,14 @@ def get_batch(id, node_url):
         sys.exit(FAILED_EXIT_FROM_COMMAND_CODE)
 
     batch_id = arguments.get('id')
+    no_cache = arguments.get('no_cache')
     node_url = arguments.get('node_url')
 
-    remme = Remme(network_config={
-        'node_address': str(node_url) + ':8080',
-    })
+    cache = None if no_cache else ObjectCache.get()
+
+    remme = RemmeClient.get(node_url=node_url)
 
-    batch, errors = Batch(service=remme).get(id=batch_id)
+    batch, errors = Batch(service=remme, cache=cache).get(id=batch_id)
 
     if errors is not None:
         print_errors(errors=errors)
@@ -74,7 +103,7 @@ def get_batch(id, node_url):
 
 
 @click.option('--id', required=True, type=str, help=BATCH_STATUS_IDENTIFIER_ARGUMENT_HELP_MESSAGE)
-@click.option('--node-url', required=False, type=str, help=NODE_URL_ARGUMENT_HELP_MESSAGE, default=default_node_url())
+@click.option('--node-url', required=False, type=str, help=NODE_URL_ARGUMENT_HELP_MESSAGE, default=default_node_url)
 @batch_commands.command('get-status')
 def get_batch_status(id, node_url):
     """
@@ -92,9 +121,7 @@ def get_batch_status(id, node_url):
     batch_id = arguments.get('id')
     node_url = arguments.get('node_url')
 
-    remme = Remme(network_config={
-        'node_address': str(node_url) + ':8080',
-    })
+    remme = RemmeClient.get(node_url=node_url)
 
     result, errors = Batch(service=remme).get_status(id=batch_id)
 
@@ -110,10 +137,15 @@ def get_batch_status(id, node_url):
 @click.option('--limit', required=False, type=int, help=BATCHES_LIMIT_ARGUMENT_HELP_MESSAGE)
 @click.option('--head', required=False, type=str, help=BATCHES_HEAD_ARGUMENT_HELP_MESSAGE)
 @click.option('--reverse', required=False, is_flag=True, help=BATCHES_REVERSE_ARGUMENT_HELP_MESSAGE)
+@click.option('--all', 'all_pages', required=False, is_flag=True, help=BATCHES_ALL_ARGUMENT_HELP_MESSAGE)
+@click.option(
+    '--page-size', required=False, type=int, help=BATCHES_PAGE_SIZE_ARGUMENT_HELP_MESSAGE, default=DEFAULT_PAGE_SIZE,
+)
 @click.option('--ids-only', required=False, is_flag=True, help=BATCHES_IDENTIFIERS_ONLY_ARGUMENT_HELP_MESSAGE)
-@click.option('--node-url', required=False, type=str, help=NODE_URL_ARGUMENT_HELP_MESSAGE, default=default_node_url())
+@click.option('--output', required=False, type=str, help=OUTPUT_ARGUMENT_HELP_MESSAGE, default=JSON_OUTPUT_FORMAT)
+@click.option('--node-url', required=False, type=str, help=NODE_URL_ARGUMENT_HELP_MESSAGE, default=default_node_url)
 @batch_commands.command('get-list')
-def get_batches(ids, start, limit, head, reverse, ids_only, node_url):
+def get_batches(ids, start, limit, head, reverse, ids_only, all_pages, page_size, output, node_url):
     """
     Get a list of batches.
     """
@@ -124,6 +156,9 @@ def get_batches(ids, start, limit, head, reverse, ids_only, node_url):
         'head': head,
         'reverse': reverse,
         'ids_only': ids_only,
+        'all_pages': all_pages,
+        'page_size': page_size,
+        'output': output,
         'node_url': node_url,
     })
 
@@ -137,18 +172,35 @@ def get_batches(ids, start, limit, head, reverse, ids_only, node_url):
     head = arguments.get('head')
     reverse = arguments.get('reverse')
     ids_only = arguments.get('ids_only')
+    all_pages = arguments.get('all_pages')
+    page_size = arguments.get('page_size')
+    output = arguments.get('output')
     node_url = arguments.get('node_url')
 
-    remme = Remme(network_config={
-        'node_address': str(node_url) + ':8080',
-    })
+    remme = RemmeClient.get(node_url=node_url)
+
+    if all_pages:
+        batch = Batch(service=remme)
+        get_pages = batch.get_ids_pages if ids_only else batch.get_pages
+
+        print_pages = print_result_lines if output == NDJSON_OUTPUT_FORMAT else print_result_pages
+
+        errors = print_pages(pages=get_pages(
+            ids=batch_ids, start=start, limit=limit, head=head, reverse=reverse, page_size=page_size,
+        ))
+
+        if errors is not None:
+            print_errors(errors=errors)
+            sys.exit(FAILED_EXIT_FROM_COMMAND_CODE)
+
+        return
 
     if ids_only:
-        result, errors = Batch(service=remme).get_list_ids(
+        result, errors = Batch(service=remme, read_cache=ReadCache.get()).get_list_ids(
             ids=batch_ids, start=start, limit=limit, head=head, reverse=reverse,
         )
     else:
-        result, errors = Batch(service=remme).get_list(
+        result, errors = Batch(service=remme, read_cache=ReadCache.get()).get_list(
             ids=batch_ids, start=start, limit=limit, head=head, reverse=reverse,
         )
 
@@ -156,4 +208,79 @@ def get_batches(ids, start, limit, head, reverse, ids_only, node_url):
         print_errors(errors=errors)
         sys.exit(FAILED_EXIT_FROM_COMMAND_CODE)
 
+    if output == NDJSON_OUTPUT_FORMAT:
+        print_result_lines(pages=[(result, None)])
+        return
+
     print_result(result=result)
+
+
+@click.option('--ids', required=False, type=str, help=BATCHES_WAIT_IDENTIFIERS_ARGUMENT_HELP_MESSAGE)
+@click.option(
+    '--input', type=click.File('r'), required=False, default='-', help=BATCHES_WAIT_INPUT_ARGUMENT_HELP_MESSAGE,
+)
+@click.option(
+    '--until', type=str, required=False, default=COMMITTED_BATCH_STATUS, help=BATCHES_WAIT_UNTIL_ARGUMENT_HELP_MESSAGE,
+)
+@click.option(
+    '--concurrency',
+    type=int,
+    required=False,
+    default=DEFAULT_BATCH_WAIT_CONCURRENCY,
+    help=BATCHES_WAIT_CONCURRENCY_ARGUMENT_HELP_MESSAGE,
+)
+@click.option(
+    '--timeout',
+    type=int,
+    required=False,
+    default=DEFAULT_BATCH_WAIT_TIMEOUT,
+    help=BATCHES_WAIT_TIMEOUT_ARGUMENT_HELP_MESSAGE,
+)
+@click.option('--node-url', required=False, type=str, help=NODE_URL_ARGUMENT_HELP_MESSAGE, default=default_node_url)
+@batch_commands.command('wait')
+def wait_batches(ids, input, until, concurrency, timeout, node_url):
+    """
+    Wait for batches to reach the status.
+    """
+    if ids is None:
+        ids = ','.join(input.read().split())
+
+    arguments, errors = WaitBatchesForm().load({
+        'ids': ids,
+        'until': until,
+        'concurrency': concurrency,
+        'timeout': timeout,
+        'node_url': node_url,
+    })
+
+    if errors:
+        print_errors(errors=errors)
+        sys.exit(FAILED_EXIT_FROM_COMMAND_CODE)
+
+    batch_ids = arguments.get('ids')
+    until = arguments.get('until')
+    concurrency = arguments.get('concurrency')
+    timeout = arguments.get('timeout')
+    node_url = arguments.get('node_url')
+
+    remme = RemmeClient.get(node_url=node_url)
+
+    batches_statuses = dict.fromkeys(batch_ids, UNKNOWN_BATCH_STATUS)
+
+    for transition in Batch(service=remme).wait(ids=batch_ids, until=until, concurrency=concurrency, timeout=timeout):
+        if 'status' in transition:
+            batches_statuses[transition.get('id')] = transition.get('status')
+
+        click.echo(dict_to_json_line(transition))
+
+    summary = dict.fromkeys([UNKNOWN_BATCH_STATUS, INVALID_BATCH_STATUS] + BATCH_WAIT_STATUSES, 0)
+
+    for status in batches_statuses.values():
+        summary[status] = summary.get(status, 0) + 1
+
+    click.echo(dict_to_json_line({'result': summary}))
+
+    reached_statuses = BATCH_WAIT_STATUSES[BATCH_WAIT_STATUSES.index(until):]
+
+    if any(status not in reached_statuses for status in batches_statuses.values()):
+        sys.exit(FAILED_EXIT_FROM_COMMAND_CODE)
@@ -2,28 +2,31 @@
 Provide forms for command line interface's batch commands.
 """
 from marshmallow import (
-    Schema,
     fields,
     validate,
 )
 
+from cli.constants import BATCH_WAIT_STATUSES
 from cli.generic.forms.fields import (
     BatchIdentifierField,
     BatchIdentifiersListField,
     NodeUrlField,
+    OutputFormatField,
 )
+from cli.generic.forms.forms import Form
 
 
-class GetBatchForm(Schema):
+class GetBatchForm(Form):
     """
     Get a batch by its identifier form.
     """
 
     id = BatchIdentifierField(required=True)
     node_url = NodeUrlField(required=True)
+    no_cache = fields.Boolean(required=False)
 
 
-class GetBatchStatusForm(Schema):
+class GetBatchStatusForm(Form):
     """
     Get a batch status by its identifier form.
     """
@@ -32,7 +35,7 @@ class GetBatchStatusForm(Schema):
     node_url = NodeUrlField(required=True)
 
 
-class GetBatchesListForm(Schema):
+class GetBatchesListForm(Form):
     """
     Get a list of batches form.
     """
@@ -50,4 +53,43 @@ class GetBatchesListForm(Schema):
     )
     reverse = fields.Boolean(required=False)
     ids_only = fields.Boolean(required=False)
+    all_pages = fields.Boolean(required=False)
+    page_size = fields.Integer(
+        allow_none=True,
+        strict=True,
+        required=False,
+        validate=[
+            validate.Range(min=1, error='Page size must be greater than 0.'),
+        ],
+    )
+    output = OutputFormatField(required=False)
+    node_url = NodeUrlField(required=True)
+
+
+class WaitBatchesForm(Form):
+    """
+    Wait for batches to reach the status form.
+    """
+
+    ids = BatchIdentifiersListField(required=True)
+    until = fields.String(
+        required=True,
+        validate=[
+            validate.OneOf(choices=BATCH_WAIT_STATUSES, error='Until must be one of: {choices}.'),
+        ],
+    )
+    concurrency = fields.Integer(
+        strict=True,
+        required=True,
+        validate=[
+            validate.Range(min=1, error='Concurrency must be greater than 0.'),
+        ],
+    )
+    timeout = fields.Integer(
+        strict=True,
+        required=True,
+        validate=[
+            validate.Range(min=1, error='Timeout must be greater than 0.'),
+        ],
+    )
     node_url = NodeUrlField(required=True)
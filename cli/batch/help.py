@@ -9,3 +9,10 @@ BATCHES_LIMIT_ARGUMENT_HELP_MESSAGE = 'Maximum amount of batches to return.'
 BATCHES_HEAD_ARGUMENT_HELP_MESSAGE = 'Block identifier to get a list of batches to.'
 BATCHES_REVERSE_ARGUMENT_HELP_MESSAGE = 'Parameter to reverse result.'
 BATCHES_IDENTIFIERS_ONLY_ARGUMENT_HELP_MESSAGE = 'The flag to get a list of batches\' identifiers.'
+BATCHES_ALL_ARGUMENT_HELP_MESSAGE = 'The flag to get all batches page by page following the node\'s paging.'
+BATCHES_PAGE_SIZE_ARGUMENT_HELP_MESSAGE = 'Maximum amount of batches to request per page with `--all`.'
+BATCHES_WAIT_IDENTIFIERS_ARGUMENT_HELP_MESSAGE = 'Identifiers of the batches to wait for (`--input` by default).'
+BATCHES_WAIT_INPUT_ARGUMENT_HELP_MESSAGE = 'File with identifiers of the batches to wait for (stdin by default).'
+BATCHES_WAIT_UNTIL_ARGUMENT_HELP_MESSAGE = 'Status to wait for the batches to reach: `PENDING` or `COMMITTED`.'
+BATCHES_WAIT_CONCURRENCY_ARGUMENT_HELP_MESSAGE = 'Maximum amount of batches\' statuses to request concurrently.'
+BATCHES_WAIT_TIMEOUT_ARGUMENT_HELP_MESSAGE = 'Maximum amount of seconds to wait for the batches.'
@@ -8,6 +8,15 @@ class BatchInterface:
     Implements batch interface.
     """
 
+    async def get_async(self, id):
+        """
+        Get a batch by its identifier.
+
+        Arguments:
+            id (string, required): batch identifier.
+        """
+        pass
+
     def get(self, id):
         """
         Get a batch by its identifier.
@@ -17,6 +26,15 @@ class BatchInterface:
         """
         pass
 
+    async def get_status_async(self, id):
+        """
+        Get a batch status by its identifier.
+
+        Arguments:
+            id (string, required): batch identifier.
+        """
+        pass
+
     def get_status(self, id):
         """
         Get a batch status by its identifier.
@@ -26,6 +44,46 @@ class BatchInterface:
         """
         pass
 
+    async def wait_async(self, ids, until, concurrency, timeout):
+        """
+        Wait for batches to reach the status.
+
+        Arguments:
+            ids (list, required): identifiers of the batches to wait for.
+            until (string, required): status to wait for, `PENDING` or `COMMITTED`, the committed batch is pending too.
+            concurrency (int, required): maximum amount of statuses to request concurrently.
+            timeout (float, required): maximum amount of seconds to wait for.
+        """
+        pass
+
+    def wait(self, ids, until, concurrency, timeout):
+        """
+        Wait for batches to reach the status.
+
+        Arguments:
+            ids (list, required): identifiers of the batches to wait for.
+            until (string, required): status to wait for, `PENDING` or `COMMITTED`, the committed batch is pending too.
+            concurrency (int, required): maximum amount of statuses to request concurrently.
+            timeout (float, required): maximum amount of seconds to wait for.
+        """
+        pass
+
+    async def get_list_async(self, ids, start, limit, head, reverse):
+        """
+        Get a list of batches.
+
+        A list of batches could be filtered by batch identifiers, start identifier, limit, head identifier,
+        reverse.
+
+        Arguments:
+            ids (list, optional): identifiers to get a list of batches by.
+            start (string, optional): batch identifier to get a list of batches starting from.
+            limit (int, optional): maximum amount of batches to return.
+            head (string, optional): block identifier to get a list of batches from.
+            reverse (bool, optional): parameter to reverse result.
+        """
+        pass
+
     def get_list(self, ids, start, limit, head, reverse):
         """
         Get a list of batches.
@@ -42,6 +100,22 @@ class BatchInterface:
         """
         pass
 
+    async def get_list_ids_async(self, ids, start, limit, head, reverse):
+        """
+        Get a list of batches' identifiers.
+
+        A list of batch identifiers could be filtered by batch identifiers, start identifier, limit, head identifier,
+        reverse.
+
+        Arguments:
+            ids (list, optional): identifiers to get a list of batches by.
+            start (string, optional): batch identifier to get a list of batches starting from.
+            limit (int, optional): maximum amount of batches to return.
+            head (string, optional): block identifier to get a list of batches from.
+            reverse (bool, optional): parameter to reverse result.
+        """
+        pass
+
     def get_list_ids(self, ids, start, limit, head, reverse):
         """
         Get a list of batches' identifiers.
@@ -57,3 +131,69 @@ class BatchInterface:
             reverse (bool, optional): parameter to reverse result.
         """
         pass
+
+    async def get_pages_async(self, ids, start, limit, head, reverse, page_size):
+        """
+        Get a list of batches by pages.
+
+        Follows the node's paging cursors and yields batches page by page as tuples of the page's batches
+        and errors, so the whole list is never kept in memory.
+
+        Arguments:
+            ids (list, optional): identifiers to get a list of batches by.
+            start (string, optional): batch identifier to get a list of batches starting from.
+            limit (int, optional): maximum amount of batches to return.
+            head (string, optional): block identifier to get a list of batches from.
+            reverse (bool, optional): parameter to reverse result.
+            page_size (int, required): maximum amount of batches to request per page.
+        """
+        pass
+
+    def get_pages(self, ids, start, limit, head, reverse, page_size):
+        """
+        Get a list of batches by pages.
+
+        Follows the node's paging cursors and yields batches page by page as tuples of the page's batches
+        and errors, so the whole list is never kept in memory.
+
+        Arguments:
+            ids (list, optional): identifiers to get a list of batches by.
+            start (string, optional): batch identifier to get a list of batches starting from.
+            limit (int, optional): maximum amount of batches to return.
+            head (string, optional): block identifier to get a list of batches from.
+            reverse (bool, optional): parameter to reverse result.
+            page_size (int, required): maximum amount of batches to request per page.
+        """
+        pass
+
+    async def get_ids_pages_async(self, ids, start, limit, head, reverse, page_size):
+        """
+        Get a list of batches identifiers by pages.
+
+        Yields batch identifiers page by page as tuples of the page's identifiers and errors.
+
+        Arguments:
+            ids (list, optional): identifiers to get a list of batches by.
+            start (string, optional): batch identifier to get a list of batches starting from.
+            limit (int, optional): maximum amount of batches to return.
+            head (string, optional): block identifier to get a list of batches from.
+            reverse (bool, optional): parameter to reverse result.
+            page_size (int, required): maximum amount of batches to request per page.
+        """
+        pass
+
+    def get_ids_pages(self, ids, start, limit, head, reverse, page_size):
+        """
+        Get a list of batches identifiers by pages.
+
+        Yields batch identifiers page by page as tuples of the page's identifiers and errors.
+
+        Arguments:
+            ids (list, optional): identifiers to get a list of batches by.
+            start (string, optional): batch identifier to get a list of batches starting from.
+            limit (int, optional): maximum amount of batches to return.
+            head (string, optional): block identifier to get a list of batches from.
+            reverse (bool, optional): parameter to reverse result.
+            page_size (int, required): maximum amount of batches to request per page.
+        """
+        pass
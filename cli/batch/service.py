@@ -7,8 +7,21 @@ from accessify import implements
 from aiohttp_json_rpc import RpcGenericServerDefinedError
 
 from cli.batch.interfaces import BatchInterface
-
-loop = asyncio.get_event_loop()
+from cli.cache import BATCH_CACHE_KIND
+from cli.constants import (
+    BATCH_WAIT_POLL_INTERVAL,
+    BATCH_WAIT_STATUSES,
+    DEFAULT_PAGE_SIZE,
+    INVALID_BATCH_STATUS,
+    MAX_BATCH_WAIT_POLL_INTERVAL,
+)
+from cli.utils import (
+    collect_pages,
+    get_event_loop,
+    iterate_pages,
+    iterate_until_complete,
+    run_until_complete,
+)
 
 
 @implements(BatchInterface)
@@ -17,26 +30,34 @@ class Batch:
     Implements batch.
     """
 
-    def __init__(self, service):
+    def __init__(self, service, cache=None, read_cache=None):
         """
         Constructor.
 
         Arguments:
             service: object to interact with Remme core API.
+            cache (ObjectCache, optional): on-disk cache of the chain objects, nothing is cached if it isn't passed.
+            read_cache (ReadCache, optional): in-process cache of the reads to report the node's head block to.
         """
         self.service = service
+        self.cache = cache
+        self.read_cache = read_cache
 
-    def get(self, id):
+    async def get_async(self, id):
         """
         Get a batch by its identifier.
 
         Arguments:
             id (string, required): batch identifier.
         """
+        if self.cache is not None:
+            batch = self.cache.load(kind=BATCH_CACHE_KIND, identifier=id)
+
+            if batch is not None:
+                return batch, None
+
         try:
-            batch = loop.run_until_complete(
-                self.service.blockchain_info.get_batch_by_id(batch_id=id),
-            )
+            batch = await self.service.blockchain_info.get_batch_by_id(batch_id=id)
 
         except RpcGenericServerDefinedError as error:
             return None, str(error.message)
@@ -44,9 +65,23 @@ class Batch:
         except Exception as error:
             return None, str(error)
 
-        return batch.get('data'), None
+        batch = batch.get('data')
 
-    def get_status(self, id):
+        if self.cache is not None:
+            self.cache.store(kind=BATCH_CACHE_KIND, identifier=id, value=batch)
+
+        return batch, None
+
+    def get(self, id):
+        """
+        Get a batch by its identifier.
+
+        Arguments:
+            id (string, required): batch identifier.
+        """
+        return run_until_complete(self.get_async(id=id))
+
+    async def get_status_async(self, id):
         """
         Get a batch status by its identifier.
 
@@ -54,7 +89,7 @@ class Batch:
             id (string, required): batch identifier.
         """
         try:
-            batch_status = loop.run_until_complete(self.service.blockchain_info.get_batch_status(batch_id=id))
+            batch_status = await self.service.blockchain_info.get_batch_status(batch_id=id)
 
         except RpcGenericServerDefinedError as error:
             return None, str(error.message)
@@ -64,7 +99,119 @@ class Batch:
 
         return batch_status, None
 
-    def get_list(self, ids, start, limit, head, reverse):
+    def get_status(self, id):
+        """
+        Get a batch status by its identifier.
+
+        Arguments:
+            id (string, required): batch identifier.
+        """
+        return run_until_complete(self.get_status_async(id=id))
+
+    async def wait_status_async(self, id, statuses, deadline, semaphore, transitions):
+        """
+        Poll a batch status until it is one of the statuses, the batch is invalid or the deadline is passed.
+
+        The polling interval is doubled after every poll that doesn't finish the waiting, up to the maximum.
+        Failed polls are retried the same way, as timeouts and dropped connections are transient.
+        Changes of the status, errors of the last poll if the deadline is passed after it and the end of the waiting
+        (none) are put to the transitions queue.
+
+        Arguments:
+            id (string, required): batch identifier.
+            statuses (list, required): statuses to wait for the batch to have one of.
+            deadline (float, required): time of the event loop to stop waiting at.
+            semaphore (asyncio.Semaphore, required): semaphore to limit amount of concurrent requests with.
+            transitions (asyncio.Queue, required): queue to put changes of the status to.
+        """
+        loop = get_event_loop()
+
+        status = None
+        interval = BATCH_WAIT_POLL_INTERVAL
+
+        try:
+            while True:
+                async with semaphore:
+                    polled_status, errors = await self.get_status_async(id=id)
+
+                if errors is None:
+                    if polled_status != status:
+                        status = polled_status
+                        transitions.put_nowait({'id': id, 'status': status})
+
+                    if status in statuses or status == INVALID_BATCH_STATUS:
+                        return
+
+                remaining_time = deadline - loop.time()
+
+                if remaining_time <= 0:
+                    if errors is not None:
+                        transitions.put_nowait({'id': id, 'errors': errors})
+
+                    return
+
+                await asyncio.sleep(min(interval, remaining_time))
+                interval = min(interval * 2, MAX_BATCH_WAIT_POLL_INTERVAL)
+
+        finally:
+            transitions.put_nowait(None)
+
+    async def wait_async(self, ids, until, concurrency, timeout):
+        """
+        Wait for batches to reach the status.
+
+        Batches' statuses are polled concurrently, each one with exponential backoff. Changes of the statuses
+        are yielded as soon as they are polled as dictionaries with the batch identifier and its status
+        (or errors if the status could not be requested until the timeout).
+
+        Arguments:
+            ids (list, required): identifiers of the batches to wait for.
+            until (string, required): status to wait for, `PENDING` or `COMMITTED`, the committed batch is pending too.
+            concurrency (int, required): maximum amount of statuses to request concurrently.
+            timeout (float, required): maximum amount of seconds to wait for.
+        """
+        loop = get_event_loop()
+
+        deadline = loop.time() + timeout
+        statuses = BATCH_WAIT_STATUSES[BATCH_WAIT_STATUSES.index(until):]
+        semaphore = asyncio.Semaphore(concurrency)
+        transitions = asyncio.Queue()
+
+        tasks = [loop.create_task(self.wait_status_async(
+            id=id, statuses=statuses, deadline=deadline, semaphore=semaphore, transitions=transitions,
+        )) for id in dict.fromkeys(ids)]
+
+        waiting_amount = len(tasks)
+
+        try:
+            while waiting_amount:
+                transition = await transitions.get()
+
+                if transition is None:
+                    waiting_amount -= 1
+                    continue
+
+                yield transition
+
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    def wait(self, ids, until, concurrency, timeout):
+        """
+        Wait for batches to reach the status.
+
+        Arguments:
+            ids (list, required): identifiers of the batches to wait for.
+            until (string, required): status to wait for, `PENDING` or `COMMITTED`, the committed batch is pending too.
+            concurrency (int, required): maximum amount of statuses to request concurrently.
+            timeout (float, required): maximum amount of seconds to wait for.
+        """
+        return iterate_until_complete(self.wait_async(
+            ids=ids, until=until, concurrency=concurrency, timeout=timeout,
+        ))
+
+    async def get_list_async(self, ids, start, limit, head, reverse):
         """
         Get a list of batches.
 
@@ -76,15 +223,13 @@ class Batch:
             reverse (bool, optional): parameter to reverse result.
         """
         try:
-            batches = loop.run_until_complete(
-                self.service.blockchain_info.get_batches(query={
-                    'ids': ids,
-                    'start': start,
-                    'limit': limit,
-                    'head': head,
-                    'reverse': reverse,
-                }),
-            )
+            batches = await self.service.blockchain_info.get_batches(query={
+                'ids': ids,
+                'start': start,
+                'limit': limit,
+                'head': head,
+                'reverse': reverse,
+            })
 
         except RpcGenericServerDefinedError as error:
             return None, str(error.message)
@@ -92,12 +237,32 @@ class Batch:
         except Exception as error:
             return None, str(error)
 
+        if self.read_cache is not None and head is None:
+            self.read_cache.observe_head(service=self.service, head=batches.get('head'))
+
         return batches.get('data'), None
 
-    def get_list_ids(self, ids, start, limit, head, reverse):
+    def get_list(self, ids, start, limit, head, reverse):
+        """
+        Get a list of batches.
+
+        Arguments:
+            ids (list, optional): identifiers to get a list of batches by.
+            start (string, optional): batch identifier to get a list of batches starting from.
+            limit (int, optional): maximum amount of batches to return.
+            head (string, optional): block identifier to get a list of batches from.
+            reverse (bool, optional): parameter to reverse result.
+        """
+        return run_until_complete(self.get_list_async(ids=ids, start=start, limit=limit, head=head, reverse=reverse))
+
+    async def get_list_ids_async(self, ids, start, limit, head, reverse):
         """
         Get a list of batches' identifiers.
 
+        If the limit is over the page's size, batches are requested by pages and only identifiers are kept
+        of each page, so the limit doesn't bound the amount of batches kept in memory at once.
+        Otherwise a single list is requested, as for the full batches; the whole list is streamed by `--all`.
+
         Arguments:
             ids (list, optional): identifiers to get a list of batches by.
             start (string, optional): batch identifier to get a list of batches starting from.
@@ -105,7 +270,12 @@ class Batch:
             head (string, optional): block identifier to get a list of batches from.
             reverse (bool, optional): parameter to reverse result.
         """
-        batches, errors = self.get_list(ids=ids, start=start, head=head, limit=limit, reverse=reverse)
+        if limit is not None and limit > DEFAULT_PAGE_SIZE:
+            return await collect_pages(pages=self.get_ids_pages_async(
+                ids=ids, start=start, limit=limit, head=head, reverse=reverse, page_size=DEFAULT_PAGE_SIZE,
+            ))
+
+        batches, errors = await self.get_list_async(ids=ids, start=start, head=head, limit=limit, reverse=reverse)
 
         if errors is not None:
             return None, errors
@@ -117,3 +287,101 @@ class Batch:
             batch_identifiers.append(batch_identifier)
 
         return batch_identifiers, None
+
+    def get_list_ids(self, ids, start, limit, head, reverse):
+        """
+        Get a list of batches' identifiers.
+
+        Arguments:
+            ids (list, optional): identifiers to get a list of batches by.
+            start (string, optional): batch identifier to get a list of batches starting from.
+            limit (int, optional): maximum amount of batches to return.
+            head (string, optional): block identifier to get a list of batches from.
+            reverse (bool, optional): parameter to reverse result.
+        """
+        return run_until_complete(
+            self.get_list_ids_async(ids=ids, start=start, limit=limit, head=head, reverse=reverse),
+        )
+
+    async def get_pages_async(self, ids, start, limit, head, reverse, page_size):
+        """
+        Get a list of batches by pages.
+
+        Follows the node's paging cursors and yields batches page by page as tuples of the page's batches
+        and errors, so the whole list is never kept in memory.
+
+        Arguments:
+            ids (list, optional): identifiers to get a list of batches by.
+            start (string, optional): batch identifier to get a list of batches starting from.
+            limit (int, optional): maximum amount of batches to return.
+            head (string, optional): block identifier to get a list of batches from.
+            reverse (bool, optional): parameter to reverse result.
+            page_size (int, required): maximum amount of batches to request per page.
+        """
+        async for batches, errors in iterate_pages(
+            request=self.service.blockchain_info.get_batches,
+            query={'ids': ids, 'start': start, 'head': head, 'reverse': reverse},
+            page_size=page_size,
+            limit=limit,
+        ):
+            yield batches, errors
+
+    def get_pages(self, ids, start, limit, head, reverse, page_size):
+        """
+        Get a list of batches by pages.
+
+        Follows the node's paging cursors and yields batches page by page as tuples of the page's batches
+        and errors, so the whole list is never kept in memory.
+
+        Arguments:
+            ids (list, optional): identifiers to get a list of batches by.
+            start (string, optional): batch identifier to get a list of batches starting from.
+            limit (int, optional): maximum amount of batches to return.
+            head (string, optional): block identifier to get a list of batches from.
+            reverse (bool, optional): parameter to reverse result.
+            page_size (int, required): maximum amount of batches to request per page.
+        """
+        return iterate_until_complete(self.get_pages_async(
+            ids=ids, start=start, limit=limit, head=head, reverse=reverse, page_size=page_size,
+        ))
+
+    async def get_ids_pages_async(self, ids, start, limit, head, reverse, page_size):
+        """
+        Get a list of batches identifiers by pages.
+
+        Yields batch identifiers page by page as tuples of the page's identifiers and errors.
+
+        Arguments:
+            ids (list, optional): identifiers to get a list of batches by.
+            start (string, optional): batch identifier to get a list of batches starting from.
+            limit (int, optional): maximum amount of batches to return.
+            head (string, optional): block identifier to get a list of batches from.
+            reverse (bool, optional): parameter to reverse result.
+            page_size (int, required): maximum amount of batches to request per page.
+        """
+        async for batches, errors in self.get_pages_async(
+            ids=ids, start=start, limit=limit, head=head, reverse=reverse, page_size=page_size,
+        ):
+            if errors is not None:
+                yield None, errors
+                continue
+
+            yield [batch.get('header_signature') for batch in batches], None
+
+    def get_ids_pages(self, ids, start, limit, head, reverse, page_size):
+        """
+        Get a list of batches identifiers by pages.
+
+        Yields batch identifiers page by page as tuples of the page's identifiers and errors.
+
+        Arguments:
+            ids (list, optional): identifiers to get a list of batches by.
+            start (string, optional): batch identifier to get a list of batches starting from.
+            limit (int, optional): maximum amount of batches to return.
+            head (string, optional): block identifier to get a list of batches from.
+            reverse (bool, optional): parameter to reverse result.
+            page_size (int, required): maximum amount of batches to request per page.
+        """
+        return iterate_until_complete(self.get_ids_pages_async(
+            ids=ids, start=start, limit=limit, head=head, reverse=reverse, page_size=page_size,
+        ))
@@ -0,0 +1,66 @@
+"""
+Provide implementation of the command line interface's batch execution command.
+"""
+import sys
+
+import click
+
+from cli.batch_exec.forms import BatchExecutionForm
+from cli.batch_exec.help import (
+    BATCH_EXECUTION_CONCURRENCY_ARGUMENT_HELP_MESSAGE,
+    BATCH_EXECUTION_INPUT_ARGUMENT_HELP_MESSAGE,
+    BATCH_EXECUTION_ORDER_ARGUMENT_HELP_MESSAGE,
+)
+from cli.batch_exec.service import BatchExecution
+from cli.constants import (
+    BATCH_EXECUTION_DEFAULT_CONCURRENCY,
+    FAILED_EXIT_FROM_COMMAND_CODE,
+)
+from cli.utils import (
+    dict_to_json_line,
+    print_errors,
+)
+
+
+@click.option(
+    '--input',
+    type=click.File('r'),
+    required=False,
+    default='-',
+    help=BATCH_EXECUTION_INPUT_ARGUMENT_HELP_MESSAGE,
+)
+@click.option(
+    '--concurrency',
+    type=int,
+    required=False,
+    default=BATCH_EXECUTION_DEFAULT_CONCURRENCY,
+    help=BATCH_EXECUTION_CONCURRENCY_ARGUMENT_HELP_MESSAGE,
+)
+@click.option('--order', type=str, required=False, default='input', help=BATCH_EXECUTION_ORDER_ARGUMENT_HELP_MESSAGE)
+@click.command('batch-exec')
+def batch_exec_command(input, concurrency, order):
+    """
+    Execute newline-delimited JSON commands concurrently.
+    """
+    arguments, errors = BatchExecutionForm().load({
+        'concurrency': concurrency,
+        'order': order,
+    })
+
+    if errors:
+        print_errors(errors=errors)
+        sys.exit(FAILED_EXIT_FROM_COMMAND_CODE)
+
+    concurrency = arguments.get('concurrency')
+    order = arguments.get('order')
+
+    are_all_executed = True
+
+    for result in BatchExecution(concurrency=concurrency, order=order).execute(lines=input):
+        if 'errors' in result:
+            are_all_executed = False
+
+        click.echo(dict_to_json_line(result))
+
+    if not are_all_executed:
+        sys.exit(FAILED_EXIT_FROM_COMMAND_CODE)
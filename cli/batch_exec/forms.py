@@ -0,0 +1,30 @@
+"""
+Provide forms for command line interface's batch execution command.
+"""
+from marshmallow import (
+    fields,
+    validate,
+)
+
+from cli.constants import BATCH_EXECUTION_ORDERS
+from cli.generic.forms.forms import Form
+
+
+class BatchExecutionForm(Form):
+    """
+    Execute a batch of commands form.
+    """
+
+    concurrency = fields.Integer(
+        strict=True,
+        required=True,
+        validate=[
+            validate.Range(min=1, error='Concurrency must be greater than 0.'),
+        ],
+    )
+    order = fields.String(
+        required=True,
+        validate=[
+            validate.OneOf(choices=BATCH_EXECUTION_ORDERS, error='Order must be one of: {choices}.'),
+        ],
+    )
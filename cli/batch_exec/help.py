@@ -0,0 +1,6 @@
+"""
+Provide help messages for command line interface's batch execution command.
+"""
+BATCH_EXECUTION_INPUT_ARGUMENT_HELP_MESSAGE = 'File with newline-delimited JSON commands to execute (stdin by default).'
+BATCH_EXECUTION_CONCURRENCY_ARGUMENT_HELP_MESSAGE = 'Maximum amount of commands to execute concurrently.'
+BATCH_EXECUTION_ORDER_ARGUMENT_HELP_MESSAGE = 'Order to output results in: order of the input or of the completion.'
@@ -0,0 +1,400 @@
+"""
+Provide implementation of the batch execution of the commands.
+"""
+import asyncio
+import collections
+import json
+
+from cli.account.forms import GetAccountBalanceForm
+from cli.account.service import Account
+from cli.atomic_swap.forms import (
+    GetAtomicSwapInformationForm,
+    GetAtomicSwapPublicKeyForm,
+)
+from cli.atomic_swap.service import AtomicSwap
+from cli.batch.forms import (
+    GetBatchesListForm,
+    GetBatchForm,
+    GetBatchStatusForm,
+)
+from cli.batch.service import Batch
+from cli.block.forms import (
+    GetBlockByIdentifierForm,
+    GetBlocksListForm,
+)
+from cli.block.service import Block
+from cli.cache import ReadCache
+from cli.client import RemmeClient
+from cli.constants import BATCH_EXECUTION_PENDING_COMMANDS_PER_CONCURRENCY
+from cli.node.forms import (
+    GetNodeConfigurationsForm,
+    GetNodeInformationForm,
+    GetNodeInitialStakeForm,
+    GetNodePeersForm,
+)
+from cli.node.service import Node
+from cli.node_account.forms import GetNodeAccountInformationForm
+from cli.node_account.service import NodeAccount
+from cli.public_key.forms import (
+    GetPublicKeyInformationForm,
+    GetPublicKeysForm,
+)
+from cli.public_key.service import PublicKey
+from cli.receipt.forms import GetReceiptsForm
+from cli.receipt.service import Receipt
+from cli.state.forms import (
+    GetStateForm,
+    GetStateListForm,
+)
+from cli.state.service import State
+from cli.transaction.forms import (
+    GetTransactionForm,
+    GetTransactionsListForm,
+)
+from cli.transaction.service import Transaction
+from cli.utils import (
+    default_node_url,
+    get_event_loop,
+)
+
+
+async def get_account_balance(remme, arguments):
+    """
+    Get balance of the account by its address.
+    """
+    return await Account(service=remme, cache=ReadCache.get()).get_balance_async(address=arguments.get('address'))
+
+
+async def get_atomic_swap_public_key(remme, arguments):
+    """
+    Get the public key of atomic swap.
+    """
+    return await AtomicSwap(service=remme).get_public_key_async()
+
+
+async def get_atomic_swap_info(remme, arguments):
+    """
+    Get information about atomic swap by its identifier.
+    """
+    return await AtomicSwap(service=remme).get_async(swap_id=arguments.get('id'))
+
+
+async def get_batch(remme, arguments):
+    """
+    Get a batch by its identifier.
+    """
+    return await Batch(service=remme).get_async(id=arguments.get('id'))
+
+
+async def get_batch_status(remme, arguments):
+    """
+    Get a batch status by its identifier.
+    """
+    return await Batch(service=remme).get_status_async(id=arguments.get('id'))
+
+
+async def get_batches(remme, arguments):
+    """
+    Get a list of batches.
+    """
+    batch = Batch(service=remme, read_cache=ReadCache.get())
+    get_list = batch.get_list_ids_async if arguments.get('ids_only') else batch.get_list_async
+
+    return await get_list(
+        ids=arguments.get('ids'),
+        start=arguments.get('start'),
+        limit=arguments.get('limit'),
+        head=arguments.get('head'),
+        reverse=arguments.get('reverse'),
+    )
+
+
+async def get_block(remme, arguments):
+    """
+    Get a block by its identifier.
+    """
+    return await Block(service=remme).get_async(identifier=arguments.get('id'))
+
+
+async def get_blocks(remme, arguments):
+    """
+    Get a list of blocks.
+    """
+    block = Block(service=remme, read_cache=ReadCache.get())
+    get_list = block.get_list_ids_async if arguments.get('ids_only') else block.get_list_async
+
+    return await get_list(
+        ids=arguments.get('ids'),
+        head=arguments.get('head'),
+        limit=arguments.get('limit'),
+        reverse=arguments.get('reverse'),
+    )
+
+
+async def get_node_configs(remme, arguments):
+    """
+    Get the node configurations.
+    """
+    return await Node(service=remme).get_configs_async()
+
+
+async def get_node_peers(remme, arguments):
+    """
+    Get the node's peers.
+    """
+    return await Node(service=remme, cache=ReadCache.get()).get_peers_async()
+
+
+async def get_node_info(remme, arguments):
+    """
+    Get information about synchronization and peer count of the node.
+    """
+    return await Node(service=remme, cache=ReadCache.get()).get_info_async()
+
+
+async def get_node_initial_stake(remme, arguments):
+    """
+    Get the initial stake of the node.
+    """
+    return await Node(service=remme).get_initial_stake_async()
+
+
+async def get_node_account(remme, arguments):
+    """
+    Get information about the node account by its address.
+    """
+    return await NodeAccount(service=remme, cache=ReadCache.get()).get_async(address=arguments.get('address'))
+
+
+async def get_public_key_info(remme, arguments):
+    """
+    Get information about public key by its address.
+    """
+    return await PublicKey(service=remme).get_async(address=arguments.get('address'))
+
+
+async def get_public_keys(remme, arguments):
+    """
+    Get a list of the addresses of the public keys by account address.
+    """
+    return await PublicKey(service=remme).get_list_async(address=arguments.get('address'))
+
+
+async def get_receipts(remme, arguments):
+    """
+    Get a list of the transaction's receipts by identifiers.
+    """
+    return await Receipt(service=remme).get_async(identifiers=arguments.get('ids'))
+
+
+async def get_state(remme, arguments):
+    """
+    Get a state by its address.
+    """
+    return await State(service=remme, cache=ReadCache.get()).get_async(address=arguments.get('address'))
+
+
+async def get_states(remme, arguments):
+    """
+    Get a list of states.
+    """
+    return await State(service=remme, cache=ReadCache.get()).get_list_async(
+        address=arguments.get('address'),
+        start=arguments.get('start'),
+        limit=arguments.get('limit'),
+        head=arguments.get('head'),
+        reverse=arguments.get('reverse'),
+    )
+
+
+async def get_transaction(remme, arguments):
+    """
+    Get a transaction by its identifier.
+    """
+    return await Transaction(service=remme).get_async(transaction_id=arguments.get('id'))
+
+
+async def get_transactions(remme, arguments):
+    """
+    Get a list of transactions.
+    """
+    transaction = Transaction(service=remme)
+    get_list = transaction.get_list_ids_async if arguments.get('ids_only') else transaction.get_list_async
+
+    return await get_list(
+        ids=arguments.get('ids'),
+        start=arguments.get('start'),
+        limit=arguments.get('limit'),
+        head=arguments.get('head'),
+        reverse=arguments.get('reverse'),
+        family_name=arguments.get('family_name'),
+    )
+
+
+BATCH_EXECUTION_COMMANDS = {
+    'account get-balance': (GetAccountBalanceForm, get_account_balance),
+    'atomic-swap get-public-key': (GetAtomicSwapPublicKeyForm, get_atomic_swap_public_key),
+    'atomic-swap get-info': (GetAtomicSwapInformationForm, get_atomic_swap_info),
+    'batch get': (GetBatchForm, get_batch),
+    'batch get-status': (GetBatchStatusForm, get_batch_status),
+    'batch get-list': (GetBatchesListForm, get_batches),
+    'block get': (GetBlockByIdentifierForm, get_block),
+    'block get-list': (GetBlocksListForm, get_blocks),
+    'node get-configs': (GetNodeConfigurationsForm, get_node_configs),
+    'node get-peers': (GetNodePeersForm, get_node_peers),
+    'node get-info': (GetNodeInformationForm, get_node_info),
+    'node get-initial-stake': (GetNodeInitialStakeForm, get_node_initial_stake),
+    'node-account get': (GetNodeAccountInformationForm, get_node_account),
+    'public-key get-info': (GetPublicKeyInformationForm, get_public_key_info),
+    'public-key get-list': (GetPublicKeysForm, get_public_keys),
+    'receipt get': (GetReceiptsForm, get_receipts),
+    'state get': (GetStateForm, get_state),
+    'state get-list': (GetStateListForm, get_states),
+    'transaction get': (GetTransactionForm, get_transaction),
+    'transaction get-list': (GetTransactionsListForm, get_transactions),
+}
+
+
+def parse_command_arguments(command):
+    """
+    Parse command's arguments named as the command line interface's options to the command's form arguments.
+
+    Options' names could be passed as is (`ids-only`) or with underscores (`ids_only`), lists of the identifiers
+    could be passed as JSON arrays as well as comma-separated strings. Arguments' values could be strings, numbers,
+    booleans or lists of strings, other ones are reported as errors.
+    """
+    arguments, errors = {}, {}
+
+    for name, value in command.items():
+        name = name.replace('-', '_')
+
+        if isinstance(value, list) and all(isinstance(item, str) for item in value):
+            value = ','.join(value)
+
+        if value is not None and not isinstance(value, (str, int, float, bool)):
+            errors[name] = ['Not a valid string, number, boolean or list of strings.']
+            continue
+
+        arguments[name] = value
+
+    if arguments.get('node_url') is None:
+        arguments['node_url'] = default_node_url()
+
+    return arguments, errors
+
+
+async def execute_command(numbered_line):
+    """
+    Execute a command from the newline-delimited JSON line.
+
+    Arguments:
+        numbered_line (tuple, required): number of the line in the input and the line itself.
+    """
+    line_number, line = numbered_line
+
+    try:
+        command = json.loads(line)
+
+    except ValueError:
+        return {'line': line_number, 'errors': 'The line is not a valid JSON.'}
+
+    if not isinstance(command, dict):
+        return {'line': line_number, 'errors': 'The line is not a JSON object.'}
+
+    command_name = command.pop('cmd', None)
+
+    if not isinstance(command_name, str) or command_name not in BATCH_EXECUTION_COMMANDS:
+        return {
+            'line': line_number,
+            'cmd': command_name,
+            'errors': f'The following command `{command_name}` is not supported.',
+        }
+
+    form, handler = BATCH_EXECUTION_COMMANDS.get(command_name)
+
+    arguments, errors = parse_command_arguments(command=command)
+
+    if not errors:
+        try:
+            arguments, errors = form().load(arguments)
+
+        # Forms' fields validate strings, so a number passed instead of a string (e.g. identifier) fails them.
+        except (AttributeError, TypeError):
+            errors = 'The command\'s arguments are of invalid types.'
+
+    if not errors:
+        remme = RemmeClient.get(node_url=arguments.get('node_url'))
+        result, errors = await handler(remme=remme, arguments=arguments)
+
+    if errors:
+        return {'line': line_number, 'cmd': command_name, 'errors': errors}
+
+    return {'line': line_number, 'cmd': command_name, 'result': result}
+
+
+class BatchExecution:
+    """
+    Implements batch execution of the commands.
+    """
+
+    def __init__(self, concurrency, order):
+        """
+        Constructor.
+
+        Arguments:
+            concurrency (int, required): maximum amount of commands to execute concurrently.
+            order (string, required): order to yield results in: `input` or `completion`.
+        """
+        self.concurrency = concurrency
+        self.order = order
+
+    async def _execute_bounded(self, numbered_line, semaphore):
+        """
+        Execute the command as soon as the amount of the commands being executed is less than the concurrency.
+        """
+        async with semaphore:
+            return await execute_command(numbered_line=numbered_line)
+
+    def execute(self, lines):
+        """
+        Execute the newline-delimited JSON commands concurrently.
+
+        Commands are executed on the single event loop, requests to the same node share the client and its
+        connection, so the concurrency is limited by the node rather than by the amount of worker processes.
+
+        Lines are read as the commands are executed, at most a few times the concurrency of the lines are read
+        but not yielded yet, so large inputs are streamed with the bounded memory.
+
+        Results are yielded as soon as they are ready: in the order of the input lines if order is `input`,
+        else in the order of completion. Empty lines are skipped.
+
+        Arguments:
+            lines (iterable, required): newline-delimited JSON commands.
+        """
+        loop = get_event_loop()
+
+        semaphore = asyncio.Semaphore(self.concurrency)
+        numbered_lines = ((line_number, line) for line_number, line in enumerate(lines, start=1) if line.strip())
+
+        pending_commands_amount = self.concurrency * BATCH_EXECUTION_PENDING_COMMANDS_PER_CONCURRENCY
+        tasks = collections.deque()
+
+        while True:
+            for numbered_line in numbered_lines:
+                tasks.append(loop.create_task(self._execute_bounded(numbered_line=numbered_line, semaphore=semaphore)))
+
+                if len(tasks) >= pending_commands_amount:
+                    break
+
+            if not tasks:
+                return
+
+            if self.order == 'input':
+                yield loop.run_until_complete(tasks.popleft())
+                continue
+
+            done_tasks, _ = loop.run_until_complete(asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED))
+
+            for task in done_tasks:
+                tasks.remove(task)
+                yield task.result()
@@ -4,29 +4,68 @@ Provide implementation of the command line interface's block commands.
 import sys
 
 import click
-from remme import Remme
 
 from cli.block.forms import (
     GetBlockByIdentifierForm,
     GetBlocksListForm,
+    GetBlocksRangeForm,
+    MirrorBlocksForm,
 )
 from cli.block.help import (
     BLOCK_IDENTIFIER_ARGUMENT_HELP_MESSAGE,
+    BLOCKS_ALL_ARGUMENT_HELP_MESSAGE,
+    BLOCKS_FOLLOW_ARGUMENT_HELP_MESSAGE,
     BLOCKS_HEAD_ARGUMENT_HELP_MESSAGE,
     BLOCKS_IDENTIFIERS_ARGUMENT_HELP_MESSAGE,
     BLOCKS_IDENTIFIERS_ONLY_ARGUMENT_HELP_MESSAGE,
     BLOCKS_LIMIT_ARGUMENT_HELP_MESSAGE,
+    BLOCKS_PAGE_SIZE_ARGUMENT_HELP_MESSAGE,
+    BLOCKS_RANGE_CHUNK_SIZE_ARGUMENT_HELP_MESSAGE,
+    BLOCKS_RANGE_CONCURRENCY_ARGUMENT_HELP_MESSAGE,
+    BLOCKS_RANGE_FROM_ARGUMENT_HELP_MESSAGE,
+    BLOCKS_RANGE_OUTPUT_FILE_ARGUMENT_HELP_MESSAGE,
+    BLOCKS_RANGE_TO_ARGUMENT_HELP_MESSAGE,
     BLOCKS_REVERSE_ARGUMENT_HELP_MESSAGE,
+    MIRROR_COMMIT_EVERY_ARGUMENT_HELP_MESSAGE,
+    MIRROR_PAGE_SIZE_ARGUMENT_HELP_MESSAGE,
+    MIRROR_PATH_ARGUMENT_HELP_MESSAGE,
+    MIRROR_RECHECK_ARGUMENT_HELP_MESSAGE,
+)
+from cli.block.service import (
+    Block,
+    BlockMirror,
+)
+from cli.cache import (
+    ObjectCache,
+    ReadCache,
+)
+from cli.client import (
+    RemmeClient,
+    fan_out,
 )
-from cli.block.service import Block
 from cli.constants import (
+    DEFAULT_BLOCKS_RANGE_CONCURRENCY,
+    DEFAULT_FOLLOW_POLL_INTERVAL,
+    DEFAULT_MIRROR_COMMIT_EVERY,
+    DEFAULT_MIRROR_RECHECK,
+    DEFAULT_PAGE_SIZE,
     FAILED_EXIT_FROM_COMMAND_CODE,
+    JSON_OUTPUT_FORMAT,
+    NDJSON_OUTPUT_FORMAT,
+    NO_CACHE_ARGUMENT_HELP_MESSAGE,
     NODE_URL_ARGUMENT_HELP_MESSAGE,
+    NODE_URLS_ARGUMENT_HELP_MESSAGE,
+    OUTPUT_ARGUMENT_HELP_MESSAGE,
 )
 from cli.utils import (
+    default_mirror_path,
     default_node_url,
+    iterate_identifiers,
     print_errors,
     print_result,
+    print_result_lines,
+    print_result_pages,
+    resolve_node_urls,
 )
 
 
@@ -42,20 +81,34 @@ def block_commands():
 @click.option('--limit', required=False, type=int, help=BLOCKS_LIMIT_ARGUMENT_HELP_MESSAGE)
 @click.option('--head', required=False, type=str, help=BLOCKS_HEAD_ARGUMENT_HELP_MESSAGE)
 @click.option('--reverse', required=False, is_flag=True, help=BLOCKS_REVERSE_ARGUMENT_HELP_MESSAGE)
+@click.option('--all', 'all_pages', required=False, is_flag=True, help=BLOCKS_ALL_ARGUMENT_HELP_MESSAGE)
+@click.option(
+    '--page-size', required=False, type=int, help=BLOCKS_PAGE_SIZE_ARGUMENT_HELP_MESSAGE, default=DEFAULT_PAGE_SIZE,
+)
 @click.option('--ids-only', required=False, is_flag=True, help=BLOCKS_IDENTIFIERS_ONLY_ARGUMENT_HELP_MESSAGE)
-@click.option('--node-url', required=False, type=str, help=NODE_URL_ARGUMENT_HELP_MESSAGE, default=default_node_url())
+@click.option('--follow', required=False, is_flag=True, help=BLOCKS_FOLLOW_ARGUMENT_HELP_MESSAGE)
+@click.option('--output', required=False, type=str, help=OUTPUT_ARGUMENT_HELP_MESSAGE, default=JSON_OUTPUT_FORMAT)
+@click.option('--node-url', required=False, type=str, help=NODE_URL_ARGUMENT_HELP_MESSAGE)
+@click.option('--node-urls', required=False, type=str, help=NODE_URLS_ARGUMENT_HELP_MESSAGE)
 @block_commands.command('get-list')
-def get_blocks(ids, head, limit, reverse, ids_only, node_url):
+def get_blocks(ids, head, limit, reverse, ids_only, all_pages, page_size, follow, output, node_url, node_urls):
     """
     Get a list of blocks.
     """
+    node_url, node_urls = resolve_node_urls(node_url=node_url, node_urls=node_urls)
+
     arguments, errors = GetBlocksListForm().load({
         'ids': ids,
         'limit': limit,
         'head': head,
         'reverse': reverse,
         'ids_only': ids_only,
+        'all_pages': all_pages,
+        'page_size': page_size,
+        'follow': follow,
+        'output': output,
         'node_url': node_url,
+        'node_urls': node_urls,
     })
 
     if errors:
@@ -67,33 +120,92 @@ def get_blocks(ids, head, limit, reverse, ids_only, node_url):
     head = arguments.get('head')
     reverse = arguments.get('reverse')
     ids_only = arguments.get('ids_only')
+    all_pages = arguments.get('all_pages')
+    page_size = arguments.get('page_size')
+    follow = arguments.get('follow')
+    output = arguments.get('output')
     node_url = arguments.get('node_url')
+    node_urls = arguments.get('node_urls')
 
-    remme = Remme(network_config={
-        'node_address': str(node_url) + ':8080',
-    })
+    if node_urls is not None:
+        get_list = 'get_list_ids_async' if ids_only else 'get_list_async'
+
+        results, failed_node_urls = fan_out(
+            request=lambda remme: getattr(Block(service=remme), get_list)(
+                ids=block_ids, head=head, limit=limit, reverse=reverse,
+            ),
+            node_urls=node_urls,
+        )
+
+        print_result(result=results)
+
+        if failed_node_urls:
+            sys.exit(FAILED_EXIT_FROM_COMMAND_CODE)
+
+        return
+
+    remme = RemmeClient.get(node_url=node_url)
+
+    if follow:
+        pages = Block(service=remme).follow(
+            limit=limit, page_size=page_size, poll_interval=DEFAULT_FOLLOW_POLL_INTERVAL,
+        )
+
+        errors = print_result_lines(pages=iterate_identifiers(pages=pages) if ids_only else pages)
+
+        if errors is not None:
+            print_errors(errors=errors)
+            sys.exit(FAILED_EXIT_FROM_COMMAND_CODE)
+
+        return
+
+    if all_pages:
+        block = Block(service=remme)
+        get_pages = block.get_ids_pages if ids_only else block.get_pages
+
+        print_pages = print_result_lines if output == NDJSON_OUTPUT_FORMAT else print_result_pages
+
+        errors = print_pages(pages=get_pages(
+            ids=block_ids, head=head, limit=limit, reverse=reverse, page_size=page_size,
+        ))
+
+        if errors is not None:
+            print_errors(errors=errors)
+            sys.exit(FAILED_EXIT_FROM_COMMAND_CODE)
+
+        return
 
     if ids_only:
-        result, errors = Block(service=remme).get_list_ids(ids=block_ids, head=head, limit=limit, reverse=reverse)
+        result, errors = Block(service=remme, read_cache=ReadCache.get()).get_list_ids(
+            ids=block_ids, head=head, limit=limit, reverse=reverse,
+        )
     else:
-        result, errors = Block(service=remme).get_list(ids=block_ids, head=head, limit=limit, reverse=reverse)
+        result, errors = Block(service=remme, read_cache=ReadCache.get()).get_list(
+            ids=block_ids, head=head, limit=limit, reverse=reverse,
+        )
 
     if errors is not None:
         print_errors(errors=errors)
         sys.exit(FAILED_EXIT_FROM_COMMAND_CODE)
 
+    if output == NDJSON_OUTPUT_FORMAT:
+        print_result_lines(pages=[(result, None)])
+        return
+
     print_result(result=result)
 
 
 @click.option('--id', type=str, required=True, help=BLOCK_IDENTIFIER_ARGUMENT_HELP_MESSAGE)
-@click.option('--node-url', type=str, required=False, help=NODE_URL_ARGUMENT_HELP_MESSAGE, default=default_node_url())
+@click.option('--no-cache', required=False, is_flag=True, help=NO_CACHE_ARGUMENT_HELP_MESSAGE)
+@click.option('--node-url', type=str, required=False, help=NODE_URL_ARGUMENT_HELP_MESSAGE, default=default_node_url)
 @block_commands.command('get')
-def get_block(id, node_url):
+def get_block(id, no_cache, node_url):
     """
     Get a block by its identifier.
     """
     arguments, errors = GetBlockByIdentifierForm().load({
         'id': id,
+        'no_cache': no_cache,
         'node_url': node_url,
     })
 
@@ -102,13 +214,128 @@ def get_block(id, node_url):
         sys.exit(FAILED_EXIT_FROM_COMMAND_CODE)
 
     identifier = arguments.get('id')
+    no_cache = arguments.get('no_cache')
+    node_url = arguments.get('node_url')
+
+    cache = None if no_cache else ObjectCache.get()
+
+    remme = RemmeClient.get(node_url=node_url)
+
+    result, errors = Block(service=remme, cache=cache).get(identifier=identifier)
+
+    if errors is not None:
+        print_errors(errors=errors)
+        sys.exit(FAILED_EXIT_FROM_COMMAND_CODE)
+
+    print_result(result=result)
+
+
+@click.option('--from', 'start', type=int, required=True, help=BLOCKS_RANGE_FROM_ARGUMENT_HELP_MESSAGE)
+@click.option('--to', 'end', type=int, required=True, help=BLOCKS_RANGE_TO_ARGUMENT_HELP_MESSAGE)
+@click.option(
+    '--concurrency',
+    type=int,
+    required=False,
+    help=BLOCKS_RANGE_CONCURRENCY_ARGUMENT_HELP_MESSAGE,
+    default=DEFAULT_BLOCKS_RANGE_CONCURRENCY,
+)
+@click.option(
+    '--chunk-size',
+    type=int,
+    required=False,
+    help=BLOCKS_RANGE_CHUNK_SIZE_ARGUMENT_HELP_MESSAGE,
+    default=DEFAULT_PAGE_SIZE,
+)
+@click.option('--output-file', type=str, required=False, help=BLOCKS_RANGE_OUTPUT_FILE_ARGUMENT_HELP_MESSAGE)
+@click.option('--node-url', type=str, required=False, help=NODE_URL_ARGUMENT_HELP_MESSAGE, default=default_node_url)
+@block_commands.command('get-range')
+def get_blocks_range(start, end, concurrency, chunk_size, output_file, node_url):
+    """
+    Get blocks from the start to the end block numbers as newline-delimited JSON.
+    """
+    arguments, errors = GetBlocksRangeForm().load({
+        'start': start,
+        'end': end,
+        'concurrency': concurrency,
+        'chunk_size': chunk_size,
+        'output_file': output_file,
+        'node_url': node_url,
+    })
+
+    if errors:
+        print_errors(errors=errors)
+        sys.exit(FAILED_EXIT_FROM_COMMAND_CODE)
+
+    start = arguments.get('start')
+    end = arguments.get('end')
+    concurrency = arguments.get('concurrency')
+    chunk_size = arguments.get('chunk_size')
+    output_file = arguments.get('output_file')
     node_url = arguments.get('node_url')
 
-    remme = Remme(network_config={
-        'node_address': str(node_url) + ':8080',
+    remme = RemmeClient.get(node_url=node_url)
+
+    pages = Block(service=remme).get_range(start=start, end=end, concurrency=concurrency, chunk_size=chunk_size)
+
+    if output_file is None:
+        errors = print_result_lines(pages=pages)
+
+    else:
+        try:
+            with open(output_file, 'w') as file:
+                errors = print_result_lines(pages=pages, file=file)
+
+        except OSError as error:
+            errors = str(error)
+
+    if errors is not None:
+        print_errors(errors=errors)
+        sys.exit(FAILED_EXIT_FROM_COMMAND_CODE)
+
+
+@click.option('--path', type=str, required=False, help=MIRROR_PATH_ARGUMENT_HELP_MESSAGE, default=default_mirror_path)
+@click.option(
+    '--page-size', type=int, required=False, help=MIRROR_PAGE_SIZE_ARGUMENT_HELP_MESSAGE, default=DEFAULT_PAGE_SIZE,
+)
+@click.option(
+    '--commit-every',
+    type=int,
+    required=False,
+    help=MIRROR_COMMIT_EVERY_ARGUMENT_HELP_MESSAGE,
+    default=DEFAULT_MIRROR_COMMIT_EVERY,
+)
+@click.option(
+    '--recheck', type=int, required=False, help=MIRROR_RECHECK_ARGUMENT_HELP_MESSAGE, default=DEFAULT_MIRROR_RECHECK,
+)
+@click.option('--node-url', type=str, required=False, help=NODE_URL_ARGUMENT_HELP_MESSAGE, default=default_node_url)
+@block_commands.command('mirror')
+def mirror_blocks(path, page_size, commit_every, recheck, node_url):
+    """
+    Append blocks committed since the last mirrored block to the local mirror.
+    """
+    arguments, errors = MirrorBlocksForm().load({
+        'path': path,
+        'page_size': page_size,
+        'commit_every': commit_every,
+        'recheck': recheck,
+        'node_url': node_url,
     })
 
-    result, errors = Block(service=remme).get(identifier=identifier)
+    if errors:
+        print_errors(errors=errors)
+        sys.exit(FAILED_EXIT_FROM_COMMAND_CODE)
+
+    path = arguments.get('path')
+    page_size = arguments.get('page_size')
+    commit_every = arguments.get('commit_every')
+    recheck = arguments.get('recheck')
+    node_url = arguments.get('node_url')
+
+    remme = RemmeClient.get(node_url=node_url)
+
+    result, errors = BlockMirror(service=remme, path=path, recheck=recheck).mirror(
+        page_size=page_size, commit_every=commit_every,
+    )
 
     if errors is not None:
         print_errors(errors=errors)
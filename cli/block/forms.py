@@ -2,19 +2,24 @@
 Provide forms for command line interface's block commands.
 """
 from marshmallow import (
-    Schema,
+    ValidationError,
     fields,
     validate,
+    validates_schema,
 )
 
+from cli.constants import NDJSON_OUTPUT_FORMAT
 from cli.generic.forms.fields import (
     BlockIdentifierField,
     BlockIdentifiersListField,
     NodeUrlField,
+    NodeUrlsListField,
+    OutputFormatField,
 )
+from cli.generic.forms.forms import Form
 
 
-class GetBlocksListForm(Schema):
+class GetBlocksListForm(Form):
     """
     Get a list of blocks form.
     """
@@ -31,13 +36,119 @@ class GetBlocksListForm(Schema):
     head = BlockIdentifierField(allow_none=True, required=False)
     reverse = fields.Boolean(required=False)
     ids_only = fields.Boolean(required=False)
+    all_pages = fields.Boolean(required=False)
+    page_size = fields.Integer(
+        allow_none=True,
+        strict=True,
+        required=False,
+        validate=[
+            validate.Range(min=1, error='Page size must be greater than 0.'),
+        ],
+    )
+    follow = fields.Boolean(required=False)
+    output = OutputFormatField(required=False)
     node_url = NodeUrlField(required=True)
+    node_urls = NodeUrlsListField(allow_none=True, required=False)
+
+    @validates_schema(skip_on_field_errors=True)
+    def validate_follow(self, data):
+        """
+        Validate following isn't combined with the arguments to get the committed list by.
+        """
+        if data.get('follow') and any(data.get(name) for name in ('ids', 'head', 'reverse', 'all_pages')):
+            raise ValidationError('Follow could not be combined with identifiers, head, reverse or all.', 'follow')
 
+    @validates_schema(skip_on_field_errors=True)
+    def validate_node_urls(self, data):
+        """
+        Validate applying to several nodes isn't combined with the arguments to stream the list by.
+        """
+        if data.get('node_urls') is not None and (
+            data.get('follow') or data.get('all_pages') or data.get('output') == NDJSON_OUTPUT_FORMAT
+        ):
+            raise ValidationError('Node URLs could not be combined with follow, all or NDJSON output.', 'node_urls')
 
-class GetBlockByIdentifierForm(Schema):
+
+class GetBlockByIdentifierForm(Form):
     """
     Get a block by its identifier form.
     """
 
     id = BlockIdentifierField(required=True)
     node_url = NodeUrlField(required=True)
+    no_cache = fields.Boolean(required=False)
+
+
+class GetBlocksRangeForm(Form):
+    """
+    Get blocks from the start to the end block numbers form.
+    """
+
+    start = fields.Integer(
+        strict=True,
+        required=True,
+        validate=[
+            validate.Range(min=0, error='From must be greater than or equal to 0.'),
+        ],
+    )
+    end = fields.Integer(
+        strict=True,
+        required=True,
+        validate=[
+            validate.Range(min=0, error='To must be greater than or equal to 0.'),
+        ],
+    )
+    concurrency = fields.Integer(
+        strict=True,
+        required=True,
+        validate=[
+            validate.Range(min=1, error='Concurrency must be greater than 0.'),
+        ],
+    )
+    chunk_size = fields.Integer(
+        strict=True,
+        required=True,
+        validate=[
+            validate.Range(min=1, error='Chunk size must be greater than 0.'),
+        ],
+    )
+    output_file = fields.String(allow_none=True, required=False)
+    node_url = NodeUrlField(required=True)
+
+    @validates_schema(skip_on_field_errors=True)
+    def validate_range(self, data):
+        """
+        Validate the end block number isn't less than the start one.
+        """
+        if data.get('end') < data.get('start'):
+            raise ValidationError('To must be greater than or equal to from.', 'end')
+
+
+class MirrorBlocksForm(Form):
+    """
+    Append blocks committed since the last mirrored block to the mirror form.
+    """
+
+    path = fields.String(required=True)
+    page_size = fields.Integer(
+        strict=True,
+        required=True,
+        validate=[
+            validate.Range(min=1, error='Page size must be greater than 0.'),
+        ],
+    )
+    commit_every = fields.Integer(
+        strict=True,
+        required=True,
+        validate=[
+            validate.Range(min=1, error='Commit every must be greater than 0.'),
+        ],
+    )
+    recheck = fields.Integer(
+        strict=True,
+        required=True,
+        validate=[
+            validate.Range(min=1, error='Recheck must be greater than 0.'),
+        ],
+    )
+    node_url = NodeUrlField(required=True)
@@ -7,3 +7,15 @@ BLOCKS_LIMIT_ARGUMENT_HELP_MESSAGE = 'Maximum amount of blocks to return.'
 BLOCKS_HEAD_ARGUMENT_HELP_MESSAGE = 'Block identifier to get a list of transactions to.'
 BLOCKS_REVERSE_ARGUMENT_HELP_MESSAGE = 'Parameter to reverse result.'
 BLOCKS_IDENTIFIERS_ONLY_ARGUMENT_HELP_MESSAGE = 'The flag to get a list of blocks\' identifiers.'
+BLOCKS_ALL_ARGUMENT_HELP_MESSAGE = 'The flag to get all blocks page by page following the node\'s paging.'
+BLOCKS_PAGE_SIZE_ARGUMENT_HELP_MESSAGE = 'Maximum amount of blocks to request per page with `--all`.'
+MIRROR_PATH_ARGUMENT_HELP_MESSAGE = 'Path to the mirror\'s directory (`~/.remme-core-cli-mirror` by default).'
+MIRROR_PAGE_SIZE_ARGUMENT_HELP_MESSAGE = 'Maximum amount of blocks to request per page.'
+MIRROR_COMMIT_EVERY_ARGUMENT_HELP_MESSAGE = 'Amount of blocks to flush to the disk and save the checkpoint after.'
+MIRROR_RECHECK_ARGUMENT_HELP_MESSAGE = 'Amount of the last mirrored blocks to check against the node for a fork.'
+BLOCKS_RANGE_FROM_ARGUMENT_HELP_MESSAGE = 'Number of the block to get blocks from.'
+BLOCKS_RANGE_TO_ARGUMENT_HELP_MESSAGE = 'Number of the block to get blocks to (inclusive, up to the head block).'
+BLOCKS_RANGE_CONCURRENCY_ARGUMENT_HELP_MESSAGE = 'Maximum amount of chunks of blocks to request concurrently.'
+BLOCKS_RANGE_CHUNK_SIZE_ARGUMENT_HELP_MESSAGE = 'Amount of blocks per chunk.'
+BLOCKS_RANGE_OUTPUT_FILE_ARGUMENT_HELP_MESSAGE = 'File to write blocks as newline-delimited JSON (stdout by default).'
+BLOCKS_FOLLOW_ARGUMENT_HELP_MESSAGE = 'The flag to print blocks committed from now on as JSON lines.'
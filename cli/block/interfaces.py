@@ -8,12 +8,32 @@ class BlockInterface:
     Implements block interface.
     """
 
+    async def get_async(self, identifier):
+        """
+        Get a block by its identifier.
+        """
+        pass
+
     def get(self, identifier):
         """
         Get a block by its identifier.
         """
         pass
 
+    async def get_list_async(self, ids, head, limit, reverse):
+        """
+        Get a list of blocks.
+
+        A list of blocks could be filtered by blocks identifiers, limit, head, reverse.
+
+        Arguments:
+            ids (list, optional): identifiers to get a list of blocks by.
+            limit (int, optional): maximum amount of blocks to return.
+            head (string, optional): block identifier to get a list of transactions to.
+            reverse (bool, optional): parameter to reverse result.
+        """
+        pass
+
     def get_list(self, ids, head, limit, reverse):
         """
         Get a list of blocks.
@@ -28,6 +48,20 @@ class BlockInterface:
         """
         pass
 
+    async def get_list_ids_async(self, ids, head, limit, reverse):
+        """
+        Get a list of blocks identifiers.
+
+        A list of blocks identifiers could be filtered by blocks identifiers, limit, head, reverse.
+
+        Arguments:
+            ids (list, optional): identifiers to get a list of blocks by.
+            limit (int, optional): maximum amount of blocks to return.
+            head (string, optional): block identifier to get a list of transactions to.
+            reverse (bool, optional): parameter to reverse result.
+        """
+        pass
+
     def get_list_ids(self, ids, head, limit, reverse):
         """
         Get a list of blocks identifiers.
@@ -41,3 +75,137 @@ class BlockInterface:
             reverse (bool, optional): parameter to reverse result.
         """
         pass
+
+    async def get_pages_async(self, ids, head, limit, reverse, page_size):
+        """
+        Get a list of blocks by pages.
+
+        Follows the node's paging cursors and yields blocks page by page as tuples of the page's blocks
+        and errors, so the whole list is never kept in memory.
+
+        Arguments:
+            ids (list, optional): identifiers to get a list of blocks by.
+            limit (int, optional): maximum amount of blocks to return.
+            head (string, optional): block identifier to get a list of transactions to.
+            reverse (bool, optional): parameter to reverse result.
+            page_size (int, required): maximum amount of blocks to request per page.
+        """
+        pass
+
+    def get_pages(self, ids, head, limit, reverse, page_size):
+        """
+        Get a list of blocks by pages.
+
+        Follows the node's paging cursors and yields blocks page by page as tuples of the page's blocks
+        and errors, so the whole list is never kept in memory.
+
+        Arguments:
+            ids (list, optional): identifiers to get a list of blocks by.
+            limit (int, optional): maximum amount of blocks to return.
+            head (string, optional): block identifier to get a list of transactions to.
+            reverse (bool, optional): parameter to reverse result.
+            page_size (int, required): maximum amount of blocks to request per page.
+        """
+        pass
+
+    async def get_ids_pages_async(self, ids, head, limit, reverse, page_size):
+        """
+        Get a list of blocks identifiers by pages.
+
+        Yields block identifiers page by page as tuples of the page's identifiers and errors.
+
+        Arguments:
+            ids (list, optional): identifiers to get a list of blocks by.
+            limit (int, optional): maximum amount of blocks to return.
+            head (string, optional): block identifier to get a list of transactions to.
+            reverse (bool, optional): parameter to reverse result.
+            page_size (int, required): maximum amount of blocks to request per page.
+        """
+        pass
+
+    def get_ids_pages(self, ids, head, limit, reverse, page_size):
+        """
+        Get a list of blocks identifiers by pages.
+
+        Yields block identifiers page by page as tuples of the page's identifiers and errors.
+
+        Arguments:
+            ids (list, optional): identifiers to get a list of blocks by.
+            limit (int, optional): maximum amount of blocks to return.
+            head (string, optional): block identifier to get a list of transactions to.
+            reverse (bool, optional): parameter to reverse result.
+            page_size (int, required): maximum amount of blocks to request per page.
+        """
+        pass
+
+    async def get_range_async(self, start, end, concurrency, chunk_size):
+        """
+        Get blocks from the start to the end block numbers inclusive by chunks requested concurrently.
+
+        Arguments:
+            start (int, required): number of the block to get blocks from.
+            end (int, required): number of the block to get blocks to.
+            concurrency (int, required): maximum amount of chunks to request concurrently.
+            chunk_size (int, required): amount of blocks per chunk.
+        """
+        pass
+
+    def get_range(self, start, end, concurrency, chunk_size):
+        """
+        Get blocks from the start to the end block numbers inclusive by chunks requested concurrently.
+
+        Arguments:
+            start (int, required): number of the block to get blocks from.
+            end (int, required): number of the block to get blocks to.
+            concurrency (int, required): maximum amount of chunks to request concurrently.
+            chunk_size (int, required): amount of blocks per chunk.
+        """
+        pass
+
+    async def follow_async(self, limit, page_size, poll_interval):
+        """
+        Follow blocks committed after the node's current head, from the oldest to the newest.
+
+        Arguments:
+            limit (int, optional): maximum amount of blocks to yield, blocks are followed endlessly if not passed.
+            page_size (int, required): maximum amount of blocks to request per page.
+            poll_interval (float, required): minimum amount of seconds between polls of the node's head.
+        """
+        pass
+
+    def follow(self, limit, page_size, poll_interval):
+        """
+        Follow blocks committed after the node's current head, from the oldest to the newest.
+
+        Arguments:
+            limit (int, optional): maximum amount of blocks to yield, blocks are followed endlessly if not passed.
+            page_size (int, required): maximum amount of blocks to request per page.
+            poll_interval (float, required): minimum amount of seconds between polls of the node's head.
+        """
+        pass
+
+
+class BlockMirrorInterface:
+    """
+    Implements block mirror interface.
+    """
+
+    async def mirror_async(self, page_size, commit_every):
+        """
+        Append blocks committed since the last mirrored block to the mirror.
+
+        Arguments:
+            page_size (int, required): maximum amount of blocks to request per page.
+            commit_every (int, required): amount of blocks to flush to the disk and save the checkpoint after.
+        """
+        pass
+
+    def mirror(self, page_size, commit_every):
+        """
+        Append blocks committed since the last mirrored block to the mirror.
+
+        Arguments:
+            page_size (int, required): maximum amount of blocks to request per page.
+            commit_every (int, required): amount of blocks to flush to the disk and save the checkpoint after.
+        """
+        pass
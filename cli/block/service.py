@@ -2,13 +2,34 @@
 Provide implementation of the block.
 """
 import asyncio
+import collections
+import itertools
+import json
+import os
 
 from accessify import implements
 from aiohttp_json_rpc import RpcGenericServerDefinedError
 
-from cli.block.interfaces import BlockInterface
-
-loop = asyncio.get_event_loop()
+from cli.block.interfaces import (
+    BlockInterface,
+    BlockMirrorInterface,
+)
+from cli.cache import BLOCK_CACHE_KIND
+from cli.constants import (
+    BLOCK_NUMBER_PAGING_POSITION,
+    DEFAULT_PAGE_SIZE,
+    MAX_FOLLOW_POLL_INTERVAL,
+    MIRROR_BLOCKS_FILE_NAME,
+    MIRROR_CHECKPOINT_FILE_NAME,
+)
+from cli.utils import (
+    collect_pages,
+    dict_to_json_line,
+    get_event_loop,
+    iterate_pages,
+    iterate_until_complete,
+    run_until_complete,
+)
 
 
 @implements(BlockInterface)
@@ -17,23 +38,31 @@ class Block:
     Implements block.
     """
 
-    def __init__(self, service):
+    def __init__(self, service, cache=None, read_cache=None):
         """
         Constructor.
 
         Arguments:
             service: object to interact with Remme core API.
+            cache (ObjectCache, optional): on-disk cache of the chain objects, nothing is cached if it isn't passed.
+            read_cache (ReadCache, optional): in-process cache of the reads to report the node's head block to.
         """
         self.service = service
+        self.cache = cache
+        self.read_cache = read_cache
 
-    def get(self, identifier):
+    async def get_async(self, identifier):
         """
         Get a block by its identifier.
         """
+        if self.cache is not None:
+            block = self.cache.load(kind=BLOCK_CACHE_KIND, identifier=identifier)
+
+            if block is not None:
+                return block, None
+
         try:
-            block = loop.run_until_complete(
-                self.service.blockchain_info.get_block_by_id(block_id=identifier),
-            )
+            block = await self.service.blockchain_info.get_block_by_id(block_id=identifier)
 
         except RpcGenericServerDefinedError as error:
             return None, str(error.message)
@@ -41,9 +70,20 @@ class Block:
         except Exception as error:
             return None, str(error)
 
-        return block.get('data'), None
+        block = block.get('data')
 
-    def get_list(self, ids, head, limit, reverse):
+        if self.cache is not None:
+            self.cache.store(kind=BLOCK_CACHE_KIND, identifier=identifier, value=block)
+
+        return block, None
+
+    def get(self, identifier):
+        """
+        Get a block by its identifier.
+        """
+        return run_until_complete(self.get_async(identifier=identifier))
+
+    async def get_list_async(self, ids, head, limit, reverse):
         """
         Get a list of blocks.
 
@@ -56,14 +96,12 @@ class Block:
             reverse (bool, optional): parameter to reverse result.
         """
         try:
-            blocks = loop.run_until_complete(
-                self.service.blockchain_info.get_blocks(query={
-                    'ids': ids,
-                    'limit': limit,
-                    'head': head,
-                    'reverse': reverse,
-                }),
-            )
+            blocks = await self.service.blockchain_info.get_blocks(query={
+                'ids': ids,
+                'limit': limit,
+                'head': head,
+                'reverse': reverse,
+            })
 
         except RpcGenericServerDefinedError as error:
             return None, str(error.message)
@@ -71,21 +109,47 @@ class Block:
         except Exception as error:
             return None, str(error)
 
+        if self.read_cache is not None and head is None:
+            self.read_cache.observe_head(service=self.service, head=blocks.get('head'))
+
         return blocks.get('data'), None
 
-    def get_list_ids(self, ids, head, limit, reverse):
+    def get_list(self, ids, head, limit, reverse):
+        """
+        Get a list of blocks.
+
+        A list of blocks could be filtered by blocks identifiers, limit, head, reverse.
+
+        Arguments:
+            ids (list, optional): identifiers to get a list of blocks by.
+            limit (int, optional): maximum amount of blocks to return.
+            head (string, optional): block identifier to get a list of transactions to.
+            reverse (bool, optional): parameter to reverse result.
+        """
+        return run_until_complete(self.get_list_async(ids=ids, head=head, limit=limit, reverse=reverse))
+
+    async def get_list_ids_async(self, ids, head, limit, reverse):
         """
         Get a list of blocks identifiers.
 
         A list of blocks identifiers could be filtered by blocks identifiers, limit, head, reverse.
 
+        If the limit is over the page's size, blocks are requested by pages and only identifiers are kept
+        of each page, so the limit doesn't bound the amount of blocks kept in memory at once.
+        Otherwise a single list is requested, as for the full blocks; the whole list is streamed by `--all`.
+
         Arguments:
             ids (list, optional): identifiers to get a list of blocks by.
             limit (int, optional): maximum amount of blocks to return.
             head (string, optional): block identifier to get a list of transactions to.
             reverse (bool, optional): parameter to reverse result.
         """
-        blocks, errors = self.get_list(ids=ids, head=head, limit=limit, reverse=reverse)
+        if limit is not None and limit > DEFAULT_PAGE_SIZE:
+            return await collect_pages(pages=self.get_ids_pages_async(
+                ids=ids, head=head, limit=limit, reverse=reverse, page_size=DEFAULT_PAGE_SIZE,
+            ))
+
+        blocks, errors = await self.get_list_async(ids=ids, head=head, limit=limit, reverse=reverse)
 
         if errors is not None:
             return None, errors
@@ -97,3 +161,451 @@ class Block:
             blocks_identifiers.append(block_identifier)
 
         return blocks_identifiers, None
+
+    def get_list_ids(self, ids, head, limit, reverse):
+        """
+        Get a list of blocks identifiers.
+
+        A list of blocks identifiers could be filtered by blocks identifiers, limit, head, reverse.
+
+        Arguments:
+            ids (list, optional): identifiers to get a list of blocks by.
+            limit (int, optional): maximum amount of blocks to return.
+            head (string, optional): block identifier to get a list of transactions to.
+            reverse (bool, optional): parameter to reverse result.
+        """
+        return run_until_complete(self.get_list_ids_async(ids=ids, head=head, limit=limit, reverse=reverse))
+
+    async def get_pages_async(self, ids, head, limit, reverse, page_size):
+        """
+        Get a list of blocks by pages.
+
+        Follows the node's paging cursors and yields blocks page by page as tuples of the page's blocks
+        and errors, so the whole list is never kept in memory.
+
+        Arguments:
+            ids (list, optional): identifiers to get a list of blocks by.
+            limit (int, optional): maximum amount of blocks to return.
+            head (string, optional): block identifier to get a list of transactions to.
+            reverse (bool, optional): parameter to reverse result.
+            page_size (int, required): maximum amount of blocks to request per page.
+        """
+        async for blocks, errors in iterate_pages(
+            request=self.service.blockchain_info.get_blocks,
+            query={'ids': ids, 'head': head, 'reverse': reverse},
+            page_size=page_size,
+            limit=limit,
+        ):
+            yield blocks, errors
+
+    def get_pages(self, ids, head, limit, reverse, page_size):
+        """
+        Get a list of blocks by pages.
+
+        Follows the node's paging cursors and yields blocks page by page as tuples of the page's blocks
+        and errors, so the whole list is never kept in memory.
+
+        Arguments:
+            ids (list, optional): identifiers to get a list of blocks by.
+            limit (int, optional): maximum amount of blocks to return.
+            head (string, optional): block identifier to get a list of transactions to.
+            reverse (bool, optional): parameter to reverse result.
+            page_size (int, required): maximum amount of blocks to request per page.
+        """
+        return iterate_until_complete(self.get_pages_async(
+            ids=ids, head=head, limit=limit, reverse=reverse, page_size=page_size,
+        ))
+
+    async def get_ids_pages_async(self, ids, head, limit, reverse, page_size):
+        """
+        Get a list of blocks identifiers by pages.
+
+        Yields block identifiers page by page as tuples of the page's identifiers and errors.
+
+        Arguments:
+            ids (list, optional): identifiers to get a list of blocks by.
+            limit (int, optional): maximum amount of blocks to return.
+            head (string, optional): block identifier to get a list of transactions to.
+            reverse (bool, optional): parameter to reverse result.
+            page_size (int, required): maximum amount of blocks to request per page.
+        """
+        async for blocks, errors in self.get_pages_async(
+            ids=ids, head=head, limit=limit, reverse=reverse, page_size=page_size,
+        ):
+            if errors is not None:
+                yield None, errors
+                continue
+
+            yield [block.get('header_signature') for block in blocks], None
+
+    def get_ids_pages(self, ids, head, limit, reverse, page_size):
+        """
+        Get a list of blocks identifiers by pages.
+
+        Yields block identifiers page by page as tuples of the page's identifiers and errors.
+
+        Arguments:
+            ids (list, optional): identifiers to get a list of blocks by.
+            limit (int, optional): maximum amount of blocks to return.
+            head (string, optional): block identifier to get a list of transactions to.
+            reverse (bool, optional): parameter to reverse result.
+            page_size (int, required): maximum amount of blocks to request per page.
+        """
+        return iterate_until_complete(self.get_ids_pages_async(
+            ids=ids, head=head, limit=limit, reverse=reverse, page_size=page_size,
+        ))
+
+    async def get_range_chunk_async(self, start, end, page_size):
+        """
+        Get blocks from the start to the end block numbers inclusive, from the oldest to the newest.
+
+        Arguments:
+            start (int, required): number of the block to get blocks from.
+            end (int, required): number of the block to get blocks to.
+            page_size (int, required): maximum amount of blocks to request per page.
+        """
+        return await collect_pages(pages=iterate_pages(
+            request=self.service.blockchain_info.get_blocks,
+            query={'start': BLOCK_NUMBER_PAGING_POSITION.format(start), 'reverse': True},
+            page_size=page_size,
+            limit=end - start + 1,
+        ))
+
+    async def get_range_async(self, start, end, concurrency, chunk_size):
+        """
+        Get blocks from the start to the end block numbers inclusive by chunks requested concurrently.
+
+        The range is split into chunks of block numbers, up to the concurrency chunks are requested at once over
+        the shared connection. Chunks are yielded in the order of block numbers as tuples of the chunk's blocks
+        and errors, so at most the concurrency chunks are kept in memory. The end is limited to the node's head block.
+
+        Arguments:
+            start (int, required): number of the block to get blocks from.
+            end (int, required): number of the block to get blocks to.
+            concurrency (int, required): maximum amount of chunks to request concurrently.
+            chunk_size (int, required): amount of blocks per chunk.
+        """
+        head_block_num, errors = await self.get_head_block_num_async()
+
+        if errors is not None:
+            yield None, errors
+            return
+
+        end = min(end, head_block_num)
+
+        loop = get_event_loop()
+
+        chunks = ((chunk_start, min(chunk_start + chunk_size - 1, end)) for chunk_start in range(
+            start, end + 1, chunk_size,
+        ))
+
+        pending_chunks = collections.deque()
+
+        for chunk_start, chunk_end in itertools.islice(chunks, concurrency):
+            pending_chunks.append(loop.create_task(self.get_range_chunk_async(
+                start=chunk_start, end=chunk_end, page_size=chunk_size,
+            )))
+
+        while pending_chunks:
+            blocks, errors = await pending_chunks.popleft()
+
+            if errors is not None:
+                for pending_chunk in pending_chunks:
+                    pending_chunk.cancel()
+
+                await asyncio.gather(*pending_chunks, return_exceptions=True)
+
+                yield None, errors
+                return
+
+            for chunk_start, chunk_end in itertools.islice(chunks, 1):
+                pending_chunks.append(loop.create_task(self.get_range_chunk_async(
+                    start=chunk_start, end=chunk_end, page_size=chunk_size,
+                )))
+
+            yield blocks, None
+
+    def get_range(self, start, end, concurrency, chunk_size):
+        """
+        Get blocks from the start to the end block numbers inclusive by chunks requested concurrently.
+
+        Arguments:
+            start (int, required): number of the block to get blocks from.
+            end (int, required): number of the block to get blocks to.
+            concurrency (int, required): maximum amount of chunks to request concurrently.
+            chunk_size (int, required): amount of blocks per chunk.
+        """
+        return iterate_until_complete(self.get_range_async(
+            start=start, end=end, concurrency=concurrency, chunk_size=chunk_size,
+        ))
+
+    async def get_head_block_num_async(self):
+        """
+        Get number of the node's head block, -1 if there are no blocks yet.
+        """
+        blocks, errors = await self.get_list_async(ids=None, head=None, limit=1, reverse=False)
+
+        if errors is not None:
+            return None, errors
+
+        if not blocks:
+            return -1, None
+
+        return int(blocks[0].get('header').get('block_num')), None
+
+    async def follow_async(self, limit, page_size, poll_interval):
+        """
+        Follow blocks committed after the node's current head, from the oldest to the newest.
+
+        The node's head is polled and blocks committed since the last yielded block are requested by pages,
+        so no block is missed if several blocks are committed between polls. The polling interval is doubled
+        (up to the maximum) while no blocks are committed and is reset once they are. Blocks are yielded
+        as tuples of blocks and errors.
+
+        Arguments:
+            limit (int, optional): maximum amount of blocks to yield, blocks are followed endlessly if not passed.
+            page_size (int, required): maximum amount of blocks to request per page.
+            poll_interval (float, required): minimum amount of seconds between polls of the node's head.
+        """
+        last_block_num, errors = await self.get_head_block_num_async()
+
+        if errors is not None:
+            yield None, errors
+            return
+
+        interval = poll_interval
+        blocks_amount = 0
+
+        while limit is None or blocks_amount < limit:
+            await asyncio.sleep(interval)
+
+            head_block_num, errors = await self.get_head_block_num_async()
+
+            if errors is not None:
+                yield None, errors
+                return
+
+            if head_block_num <= last_block_num:
+                interval = min(interval * 2, max(poll_interval, MAX_FOLLOW_POLL_INTERVAL))
+                continue
+
+            interval = poll_interval
+
+            new_blocks_amount = head_block_num - last_block_num
+
+            if limit is not None:
+                new_blocks_amount = min(new_blocks_amount, limit - blocks_amount)
+
+            async for blocks, errors in iterate_pages(
+                request=self.service.blockchain_info.get_blocks,
+                query={'start': BLOCK_NUMBER_PAGING_POSITION.format(last_block_num + 1), 'reverse': True},
+                page_size=page_size,
+                limit=new_blocks_amount,
+            ):
+                if errors is not None:
+                    yield None, errors
+                    return
+
+                last_block_num = int(blocks[-1].get('header').get('block_num'))
+                blocks_amount += len(blocks)
+
+                yield blocks, None
+
+    def follow(self, limit, page_size, poll_interval):
+        """
+        Follow blocks committed after the node's current head, from the oldest to the newest.
+
+        Arguments:
+            limit (int, optional): maximum amount of blocks to yield, blocks are followed endlessly if not passed.
+            page_size (int, required): maximum amount of blocks to request per page.
+            poll_interval (float, required): minimum amount of seconds between polls of the node's head.
+        """
+        return iterate_until_complete(self.follow_async(
+            limit=limit, page_size=page_size, poll_interval=poll_interval,
+        ))
+
+
+@implements(BlockMirrorInterface)
+class BlockMirror:
+    """
+    Implements local mirror of blocks with their batches and transactions.
+
+    Blocks are appended to the newline-delimited JSON file in the order of their numbers. The checkpoint file keeps
+    the file's committed size and the numbers, identifiers, offsets and paging positions of the last blocks,
+    it is replaced atomically after each portion of blocks is flushed to the disk.
+    """
+
+    def __init__(self, service, path, recheck):
+        """
+        Constructor.
+
+        Arguments:
+            service: object to interact with Remme core API.
+            path (string, required): path to the mirror's directory.
+            recheck (int, required): amount of the last mirrored blocks to check against the node for a fork.
+        """
+        self.service = service
+        self.path = path
+        self.recheck = recheck
+
+        self.blocks_path = os.path.join(path, MIRROR_BLOCKS_FILE_NAME)
+        self.checkpoint_path = os.path.join(path, MIRROR_CHECKPOINT_FILE_NAME)
+
+    def load_checkpoint(self):
+        """
+        Load the checkpoint, the empty one if the mirror isn't created yet.
+        """
+        if not os.path.exists(self.checkpoint_path):
+            return {'size': 0, 'blocks': []}
+
+        with open(self.checkpoint_path) as checkpoint_file:
+            return json.load(checkpoint_file)
+
+    def save_checkpoint(self, checkpoint):
+        """
+        Replace the checkpoint atomically, so an interrupted saving keeps the previous checkpoint.
+        """
+        temporary_checkpoint_path = self.checkpoint_path + '.tmp'
+
+        with open(temporary_checkpoint_path, 'w') as checkpoint_file:
+            json.dump(checkpoint, checkpoint_file)
+            checkpoint_file.flush()
+            os.fsync(checkpoint_file.fileno())
+
+        os.replace(temporary_checkpoint_path, self.checkpoint_path)
+
+    async def find_fork_point(self, checkpoint):
+        """
+        Get the index of the last checkpoint's block presented on the node, -1 if none of them is presented.
+        """
+        recent_blocks = checkpoint.get('blocks')
+
+        if not recent_blocks:
+            return -1, None
+
+        blocks_identifiers, errors = await Block(service=self.service).get_list_ids_async(
+            ids=[identifier for _, identifier, _, _ in recent_blocks], head=None, limit=None, reverse=False,
+        )
+
+        if errors is not None:
+            return None, errors
+
+        blocks_identifiers = set(blocks_identifiers)
+
+        for index in range(len(recent_blocks) - 1, -1, -1):
+            if recent_blocks[index][1] in blocks_identifiers:
+                return index, None
+
+        return -1, None
+
+    async def mirror_async(self, page_size, commit_every):
+        """
+        Append blocks committed since the last mirrored block to the mirror.
+
+        The mirror resumes from its checkpoint: blocks written after the checkpoint are discarded, the last mirrored
+        blocks are checked against the node and, if the node switched to another fork, the blocks of the abandoned
+        fork are discarded too. Blocks are requested from the oldest to the newest by pages, the page of the last
+        kept block is requested again and its older blocks are skipped.
+
+        Arguments:
+            page_size (int, required): maximum amount of blocks to request per page.
+            commit_every (int, required): amount of blocks to flush to the disk and save the checkpoint after.
+        """
+        mirrored = {'blocks': 0, 'discarded': 0, 'head': None}
+
+        try:
+            os.makedirs(self.path, exist_ok=True)
+            checkpoint = self.load_checkpoint()
+
+            fork_point, errors = await self.find_fork_point(checkpoint=checkpoint)
+
+            if errors is not None:
+                return None, errors
+
+            recent_blocks = checkpoint.get('blocks')
+
+            if recent_blocks and fork_point == -1:
+                return None, f'The mirror forked from the node deeper than the last {len(recent_blocks)} blocks.'
+
+            if fork_point < len(recent_blocks) - 1:
+                mirrored['discarded'] = len(recent_blocks) - 1 - fork_point
+                checkpoint['size'] = recent_blocks[fork_point + 1][2]
+                checkpoint['blocks'] = recent_blocks[:fork_point + 1]
+
+            start, last_block_num = None, -1
+
+            if checkpoint.get('blocks'):
+                last_block_num, _, _, start = checkpoint.get('blocks')[-1]
+                mirrored['head'] = last_block_num
+
+            with open(self.blocks_path, 'ab') as blocks_file:
+                blocks_file.truncate(checkpoint.get('size'))
+                blocks_file.seek(0, os.SEEK_END)
+
+                uncommitted_blocks_amount = 0
+                query = {'start': start, 'head': None, 'reverse': True, 'limit': page_size}
+
+                while True:
+                    try:
+                        page = await self.service.blockchain_info.get_blocks(query=dict(query))
+
+                    except RpcGenericServerDefinedError as error:
+                        return None, str(error.message)
+
+                    except Exception as error:
+                        return None, str(error)
+
+                    for block in page.get('data') or []:
+                        block_num = int(block.get('header').get('block_num'))
+
+                        if block_num <= last_block_num:
+                            continue
+
+                        offset = blocks_file.tell()
+                        blocks_file.write((dict_to_json_line(block) + '\n').encode())
+
+                        checkpoint['blocks'].append([block_num, block.get('header_signature'), offset, query['start']])
+                        checkpoint['blocks'] = checkpoint['blocks'][-self.recheck:]
+                        checkpoint['size'] = blocks_file.tell()
+
+                        last_block_num = mirrored['head'] = block_num
+                        mirrored['blocks'] += 1
+                        uncommitted_blocks_amount += 1
+
+                        if uncommitted_blocks_amount >= commit_every:
+                            self.commit(blocks_file=blocks_file, checkpoint=checkpoint)
+                            uncommitted_blocks_amount = 0
+
+                    next_position = (page.get('paging') or {}).get('next')
+
+                    if not page.get('data') or not next_position:
+                        break
+
+                    query['start'] = next_position
+                    query['head'] = page.get('head') or query.get('head')
+
+                self.commit(blocks_file=blocks_file, checkpoint=checkpoint)
+
+        except (OSError, ValueError) as error:
+            return None, str(error)
+
+        return mirrored, None
+
+    def commit(self, blocks_file, checkpoint):
+        """
+        Flush the appended blocks to the disk and save the checkpoint.
+        """
+        blocks_file.flush()
+        os.fsync(blocks_file.fileno())
+
+        self.save_checkpoint(checkpoint=checkpoint)
+
+    def mirror(self, page_size, commit_every):
+        """
+        Append blocks committed since the last mirrored block to the mirror.
+
+        Arguments:
+            page_size (int, required): maximum amount of blocks to request per page.
+            commit_every (int, required): amount of blocks to flush to the disk and save the checkpoint after.
+        """
+        return run_until_complete(self.mirror_async(page_size=page_size, commit_every=commit_every))
@@ -0,0 +1,350 @@
+"""
+Provide implementation of the caches of the chain objects and reads.
+"""
+import asyncio
+import functools
+import json
+import sqlite3
+import time
+
+from cli.config import Settings
+
+BLOCK_CACHE_KIND = 'block'
+BATCH_CACHE_KIND = 'batch'
+TRANSACTION_CACHE_KIND = 'transaction'
+RECEIPT_CACHE_KIND = 'receipt'
+
+
+class ObjectCache:
+    """
+    Implementation of the on-disk cache of the immutable chain objects (blocks, batches, transactions, receipts).
+
+    Objects are addressed by their kind and identifier (header signature), which never refer to other content
+    once committed, so cached objects are never invalidated. The total size of the cached objects is bounded,
+    the least recently used objects are evicted first.
+
+    Cache is best-effort: if the cache's file could not be read or written, objects are fetched from the node.
+    """
+
+    _caches = {}
+
+    def __init__(self, path, max_size):
+        """
+        Constructor.
+
+        Arguments:
+            path (string, required): path to the cache's file.
+            max_size (int, required): maximum total size of the cached objects in bytes.
+        """
+        self.path = path
+        self.max_size = max_size
+
+        self._connection = None
+        self._total_size = 0
+
+    @classmethod
+    def get(cls):
+        """
+        Get the cache by the shared settings, the cache is shared by all commands of the process.
+        """
+        settings = Settings.get()
+
+        cache_key = (settings.cache_path, settings.cache_max_size)
+
+        if cache_key not in cls._caches:
+            cls._caches[cache_key] = cls(path=settings.cache_path, max_size=settings.cache_max_size)
+
+        return cls._caches[cache_key]
+
+    @property
+    def connection(self):
+        """
+        Get connection to the cache's file, create the cache's table and read its total size on the first access.
+        """
+        if self._connection is None:
+            connection = sqlite3.connect(self.path, timeout=5)
+            connection.execute(
+                'CREATE TABLE IF NOT EXISTS objects ('
+                'kind TEXT NOT NULL, '
+                'identifier TEXT NOT NULL, '
+                'data TEXT NOT NULL, '
+                'size INTEGER NOT NULL, '
+                'accessed_at REAL NOT NULL, '
+                'PRIMARY KEY (kind, identifier))',
+            )
+            connection.execute('CREATE INDEX IF NOT EXISTS objects_accessed_at ON objects (accessed_at)')
+            connection.commit()
+
+            self._total_size = self.get_total_size(connection=connection)
+            self._connection = connection
+
+        return self._connection
+
+    @staticmethod
+    def get_total_size(connection):
+        """
+        Get the total size of the cached objects from the cache's file.
+        """
+        total_size, = connection.execute('SELECT COALESCE(SUM(size), 0) FROM objects').fetchone()
+        return total_size
+
+    def load(self, kind, identifier):
+        """
+        Get the cached object by its kind and identifier, none if the object isn't cached.
+
+        The object that could not be parsed is removed from the cache, so it is fetched from the node and cached again.
+        """
+        try:
+            row = self.connection.execute(
+                'SELECT data, size FROM objects WHERE kind = ? AND identifier = ?', (kind, identifier),
+            ).fetchone()
+
+            if row is None:
+                return
+
+            data, size = row
+
+            try:
+                value = json.loads(data)
+
+            except ValueError:
+                with self.connection:
+                    self.connection.execute(
+                        'DELETE FROM objects WHERE kind = ? AND identifier = ?', (kind, identifier),
+                    )
+
+                self._total_size -= size
+                return
+
+            with self.connection:
+                self.connection.execute(
+                    'UPDATE objects SET accessed_at = ? WHERE kind = ? AND identifier = ?',
+                    (time.time(), kind, identifier),
+                )
+
+        except sqlite3.Error:
+            return
+
+        return value
+
+    def store(self, kind, identifier, value):
+        """
+        Cache the object by its kind and identifier, evict the least recently used objects over the size limit.
+
+        The total size of the cached objects is kept by the cache instead of being summed up on every store,
+        it is summed up only to evict objects, as other processes could have stored objects meanwhile.
+        """
+        if identifier is None or value is None:
+            return
+
+        data = json.dumps(value)
+
+        try:
+            with self.connection:
+                replaced_row = self.connection.execute(
+                    'SELECT size FROM objects WHERE kind = ? AND identifier = ?', (kind, identifier),
+                ).fetchone()
+
+                self.connection.execute(
+                    'INSERT OR REPLACE INTO objects (kind, identifier, data, size, accessed_at) VALUES (?, ?, ?, ?, ?)',
+                    (kind, identifier, data, len(data), time.time()),
+                )
+
+                total_size = self._total_size + len(data) - (replaced_row[0] if replaced_row is not None else 0)
+
+                if total_size > self.max_size:
+                    total_size = self.evict()
+
+        except sqlite3.Error:
+            return
+
+        self._total_size = total_size
+
+    def evict(self):
+        """
+        Evict the least recently used objects until the total size of the cached objects is within the limit.
+
+        Returns the total size of the cached objects after the eviction.
+        """
+        total_size = self.get_total_size(connection=self.connection)
+
+        if total_size <= self.max_size:
+            return total_size
+
+        evicted_objects = []
+
+        for kind, identifier, size in self.connection.execute(
+            'SELECT kind, identifier, size FROM objects ORDER BY accessed_at',
+        ):
+            if total_size <= self.max_size:
+                break
+
+            evicted_objects.append((kind, identifier))
+            total_size -= size
+
+        self.connection.executemany('DELETE FROM objects WHERE kind = ? AND identifier = ?', evicted_objects)
+
+        return total_size
+
+
+def get_node_key(service):
+    """
+    Get the key of the node the service interacts with.
+
+    Clients with and without the private key interact with the same node, so reads of one client are invalidated
+    by transactions sent with another one. Services without network configurations are keyed by themselves.
+    """
+    network_config = getattr(service, 'network_config', None)
+
+    if isinstance(network_config, dict) and network_config.get('node_address') is not None:
+        return network_config.get('node_address')
+
+    return id(service)
+
+
+class ReadCache:
+    """
+    Implementation of the in-process cache of the mutable reads (balances, node's information and peers, states).
+
+    Values are kept for the time to live and until a new head block of the node is observed, so chained commands,
+    batch execution and the daemon coalesce duplicate reads within a block interval. Concurrent reads of the same
+    value share a single request. Errors are never cached.
+    """
+
+    _caches = {}
+
+    def __init__(self, ttl, clock=time.monotonic):
+        """
+        Constructor.
+
+        Arguments:
+            ttl (float, required): time to keep values for in seconds, values are not kept if it is zero.
+            clock (callable, optional): clock to measure the time to live with.
+        """
+        self.ttl = ttl
+        self.clock = clock
+
+        self._values = {}
+        self._requests = {}
+        self._heads = {}
+
+    @classmethod
+    def get(cls):
+        """
+        Get the cache by the shared settings, the cache is shared by all commands of the process.
+        """
+        ttl = Settings.get().read_cache_ttl
+
+        if ttl not in cls._caches:
+            cls._caches[ttl] = cls(ttl=ttl)
+
+        return cls._caches[ttl]
+
+    async def fetch(self, service, key, request):
+        """
+        Get the value by the node of the service it is read from and the key, request it if it isn't cached or expired.
+
+        Arguments:
+            service: object to interact with Remme core API the value is read from.
+            key (tuple, required): name and arguments of the read.
+            request (callable, required): coroutine function to read the value with, returns result and errors.
+        """
+        cache_key = (get_node_key(service=service), key)
+
+        cached_value = self._values.get(cache_key)
+
+        if cached_value is not None:
+            expires_at, value = cached_value
+
+            if expires_at > self.clock():
+                return value
+
+            del self._values[cache_key]
+
+        if cache_key in self._requests:
+            return await asyncio.shield(self._requests.get(cache_key))
+
+        pending_request = asyncio.ensure_future(request())
+        self._requests[cache_key] = pending_request
+
+        try:
+            result, errors = await pending_request
+
+        finally:
+            self._requests.pop(cache_key, None)
+
+        if errors is None and self.ttl > 0:
+            self._values[cache_key] = (self.clock() + self.ttl, (result, None))
+
+        return result, errors
+
+    def observe_head(self, service, head):
+        """
+        Drop values read from the service's node if its head block differs from the previously observed one.
+
+        Arguments:
+            service: object to interact with Remme core API the values are read from.
+            head (string, required): identifier of the node's current head block, nothing is done if it is none.
+        """
+        node_key = get_node_key(service=service)
+
+        if head is None or self._heads.get(node_key) == head:
+            return
+
+        if node_key in self._heads:
+            self.invalidate(service=service)
+
+        self._heads[node_key] = head
+
+    def invalidate(self, service):
+        """
+        Drop values read from the service's node, e.g. after sending a transaction that changes them.
+        """
+        node_key = get_node_key(service=service)
+
+        for cache_key in [cache_key for cache_key in self._values if cache_key[0] == node_key]:
+            del self._values[cache_key]
+
+
+def cached_read(name):
+    """
+    Read the value through the service's read cache if it is passed to the service.
+
+    Decorated coroutine method should accept keyword arguments only, they are the part of the value's key.
+
+    Arguments:
+        name (string, required): name of the read to distinguish values of the reads with the same arguments.
+    """
+    def decorator(method):
+        @functools.wraps(method)
+        async def wrapper(self, **arguments):
+            if self.cache is None:
+                return await method(self, **arguments)
+
+            return await self.cache.fetch(
+                service=self.service,
+                key=(name, tuple(sorted(arguments.items()))),
+                request=functools.partial(method, self, **arguments),
+            )
+
+        return wrapper
+
+    return decorator
+
+
+def invalidates_reads(method):
+    """
+    Drop values read through the service's read cache after the decorated coroutine method, e.g. sending a transaction.
+
+    Values are dropped whether the method succeeds or not, as a failed request could still have sent the transaction.
+    """
+    @functools.wraps(method)
+    async def wrapper(self, *args, **kwargs):
+        try:
+            return await method(self, *args, **kwargs)
+
+        finally:
+            if self.cache is not None:
+                self.cache.invalidate(service=self.service)
+
+    return wrapper
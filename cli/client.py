@@ -0,0 +1,233 @@
+"""
+Provide implementation of the shared clients to interact with Remme-core.
+"""
+import asyncio
+import atexit
+
+from aiohttp_json_rpc import JsonRpcClient
+from aiohttp_json_rpc.protocol import encode_request
+from remme import Remme
+from remme.account import DEFAULT_ACCOUNT_CONFIG
+from remme.models.account.account_type import AccountType
+
+from cli.constants import NODE_PORT
+from cli.trace import (
+    CLIENT_TRACE_EVENT,
+    CONNECT_TRACE_EVENT,
+    RPC_TRACE_EVENT,
+    trace,
+)
+from cli.utils import (
+    get_event_loop,
+    run_until_complete,
+)
+
+
+class PendingRequests(dict):
+    """
+    Implementation of the futures of the requests by their identifiers.
+
+    The client's messages handler resolves the future if its identifier is pending. A late response to the request
+    that is already timed out or cancelled would be resolved as well, so a done future isn't pending anymore.
+    """
+
+    def __contains__(self, identifier):
+        """
+        Check if the request of the identifier is waiting for its response.
+        """
+        future = self.get(identifier)
+        return future is not None and not future.done()
+
+
+class PersistentJsonRpcClient(JsonRpcClient):
+    """
+    Implementation of the JSON-RPC client that keeps its connection to the node open between requests.
+
+    Remme core API connects and disconnects its JSON-RPC client on every request. This client opens the connection
+    once, ignores the disconnection and assigns unique identifiers to the requests, so a single connection serves
+    sequential and concurrent requests to the node.
+    """
+
+    def __init__(self, *args, **kwargs):
+        """
+        Constructor.
+        """
+        super().__init__(*args, **kwargs)
+
+        self._pending = PendingRequests()
+        self._connection_lock = asyncio.Lock()
+
+    @property
+    def is_connected(self):
+        """
+        Check if the connection to the node is open.
+        """
+        connection = getattr(self, '_ws', None)
+        return connection is not None and not connection.closed
+
+    async def connect_url(self, url, cookies=None, ssl=None):
+        """
+        Connect to the node if there is no open connection yet.
+
+        The SSL context is passed to the client only if it is set, as aiohttp-json-rpc 0.11 pinned by Remme core API
+        doesn't accept it.
+        """
+        async with self._connection_lock:
+            if self.is_connected:
+                return
+
+            session = getattr(self, '_session', None)
+
+            if session is not None and not session.closed:
+                await session.close()
+
+            with trace(CONNECT_TRACE_EVENT, url=url):
+                if ssl is None:
+                    await super().connect_url(url=url, cookies=cookies)
+
+                else:
+                    await super().connect_url(url=url, cookies=cookies, ssl=ssl)
+
+    async def disconnect(self):
+        """
+        Keep the connection open, it is closed by the clients registry on exit.
+        """
+        pass
+
+    async def call(self, method, params=None, id=None, timeout=1):
+        """
+        Send request to the node.
+
+        Identifier passed by Remme core API is random (from 0 to 100) and could clash among concurrent requests,
+        so the client's own identifiers' counter is used instead. The request's future is removed from the pending
+        ones however the request is finished, so timed out and cancelled requests aren't kept by the long-lived
+        processes (the daemon, the exporter).
+        """
+        with trace(RPC_TRACE_EVENT, method=method):
+            await self.auto_connect()
+
+            id = self._msg_id
+            self._msg_id += 1
+
+            future = self._pending[id] = asyncio.Future()
+
+            try:
+                await self._ws.send_str(encode_request(method, id=id, params=params))
+
+                if timeout:
+                    return await asyncio.wait_for(future, timeout=timeout)
+
+                return await future
+
+            finally:
+                self._pending.pop(id, None)
+
+    async def close(self):
+        """
+        Close the connection to the node.
+        """
+        if self.is_connected:
+            await super().disconnect()
+
+
+class RemmeClient:
+    """
+    Implementation of the registry of the clients to interact with Remme-core.
+
+    Clients are shared by node URL and account configurations, so chained commands and repeated calls within
+    the same process reuse the client and its connection to the node instead of constructing them every time.
+    """
+
+    _clients = {}
+
+    @classmethod
+    def get(cls, node_url, private_key=None, account_type=AccountType.USER):
+        """
+        Get the client to interact with Remme-core.
+
+        Arguments:
+            node_url (string, required): node URL to send requests to.
+            private_key (string, optional): private key of the account to sign transactions with.
+            account_type (AccountType, optional): type of the account to sign transactions with.
+        """
+        client_key = (node_url, private_key, account_type)
+
+        if client_key in cls._clients:
+            return cls._clients[client_key]
+
+        account_config = DEFAULT_ACCOUNT_CONFIG
+
+        if private_key is not None:
+            account_config = {'private_key_hex': private_key, 'account_type': account_type}
+
+        with trace(CLIENT_TRACE_EVENT, node_url=node_url):
+            remme = Remme(
+                account_config=account_config,
+                network_config={'node_address': f'{node_url}:{NODE_PORT}'},
+            )
+
+            remme._remme_api._rpc_client = PersistentJsonRpcClient()
+
+        cls._clients[client_key] = remme
+
+        return remme
+
+    @classmethod
+    def close(cls):
+        """
+        Close connections of all the clients to the nodes.
+        """
+        loop = get_event_loop()
+
+        if loop.is_closed() or loop.is_running():
+            return
+
+        for remme in cls._clients.values():
+            loop.run_until_complete(remme._remme_api._rpc_client.close())
+
+        cls._clients.clear()
+
+
+async def fan_out_async(request, node_urls):
+    """
+    Apply the request to every node concurrently.
+
+    Arguments:
+        request (callable, required): function that accepts the node's client and returns the coroutine to get
+            the node's result and errors with.
+        node_urls (list, required): node URLs to apply the request to.
+
+    Returns results and errors keyed by node URLs and node URLs the request failed for.
+    """
+    responses = await asyncio.gather(
+        *[request(RemmeClient.get(node_url=node_url)) for node_url in node_urls], return_exceptions=True,
+    )
+
+    results, failed_node_urls = {}, []
+
+    for node_url, response in zip(node_urls, responses):
+        result, errors = (None, str(response)) if isinstance(response, Exception) else response
+
+        if errors is not None:
+            results[node_url] = {'errors': errors}
+            failed_node_urls.append(node_url)
+            continue
+
+        results[node_url] = {'result': result}
+
+    return results, failed_node_urls
+
+
+def fan_out(request, node_urls):
+    """
+    Apply the request to every node concurrently.
+
+    Arguments:
+        request (callable, required): function that accepts the node's client and returns the coroutine to get
+            the node's result and errors with.
+        node_urls (list, required): node URLs to apply the request to.
+    """
+    return run_until_complete(fan_out_async(request=request, node_urls=node_urls))
+
+
+atexit.register(RemmeClient.close)
@@ -1,6 +1,7 @@
 """
 Provide implementation of the CLI configurations file.
 """
+import os
 import pathlib
 import platform
 
@@ -8,11 +9,31 @@ import yaml
 from accessify import private
 
 from cli.constants import (
+    CACHE_FILE_NAME,
+    CACHE_MAX_SIZE_ENVIRONMENT_VARIABLE,
+    CACHE_PATH_ENVIRONMENT_VARIABLE,
     CLI_CONFIG_FILE_NAME,
+    DEFAULT_CACHE_MAX_SIZE,
+    DEFAULT_NODE_URL,
+    DEFAULT_READ_CACHE_TTL,
+    INDEX_FILE_NAME,
+    INDEX_PATH_ENVIRONMENT_VARIABLE,
     LINUX_NODE_PRIVATE_KEY_FILE_PATH,
+    MIRROR_DIRECTORY_NAME,
+    MIRROR_PATH_ENVIRONMENT_VARIABLE,
+    NODE_URL_ENVIRONMENT_VARIABLE,
+    NODE_URLS_ENVIRONMENT_VARIABLE,
+    READ_CACHE_TTL_ENVIRONMENT_VARIABLE,
     SUPPORTED_OS_TO_EXECUTE_NODE_MANAGEMENT_COMMANDS,
 )
-from cli.errors import NotSupportedOsToGetNodePrivateKeyError
+from cli.errors import (
+    InvalidSettingError,
+    NotSupportedOsToGetNodePrivateKeyError,
+)
+from cli.trace import (
+    CONFIG_TRACE_EVENT,
+    trace,
+)
 
 
 class ConfigParameters:
@@ -20,8 +41,9 @@ class ConfigParameters:
     Configuration parameters data transfer object.
     """
 
-    def __init__(self, node_url):
+    def __init__(self, node_url, node_urls=None):
         self._node_url = node_url
+        self._node_urls = node_urls
 
     @property
     def node_url(self):
@@ -30,6 +52,13 @@ class ConfigParameters:
         """
         return self._node_url
 
+    @property
+    def node_urls(self):
+        """
+        Get configuration file's node urls (nodes to apply read commands to concurrently).
+        """
+        return self._node_urls
+
 
 class ConfigFile:
     """
@@ -67,8 +96,200 @@ class ConfigFile:
             return ConfigParameters(node_url=None)
 
         node_url = config_as_dict.get('node-url')
+        node_urls = config_as_dict.get('nodes')
+
+        return ConfigParameters(node_url=node_url, node_urls=node_urls)
+
+
+class Settings:
+    """
+    Implementation of command line interface settings.
+
+    Settings are resolved lazily on the first access, so the configuration file is read once per process
+    however many commands and options use it. A setting is taken from the first of the layers it is presented in:
+    environment variables, the configuration file, defaults. Options passed to the command take precedence over
+    the settings, as the settings are only the options' defaults.
+    """
+
+    _shared = None
+
+    def __init__(self, environment=None, config_file_name=CLI_CONFIG_FILE_NAME):
+        """
+        Constructor.
+
+        Arguments:
+            environment (dict, optional): environment variables, the process' environment by default.
+            config_file_name (string, optional): name of the configuration file.
+        """
+        self._environment = os.environ if environment is None else environment
+        self._config_file_name = config_file_name
+        self._config_parameters = None
+
+    @classmethod
+    def get(cls):
+        """
+        Get settings shared by all commands of the process.
+        """
+        if cls._shared is None:
+            cls._shared = cls()
+
+        return cls._shared
+
+    @classmethod
+    def share(cls, settings):
+        """
+        Share the settings with all commands of the process.
+        """
+        cls._shared = settings
+
+    @property
+    def config_parameters(self):
+        """
+        Get configuration file's parameters, the file is parsed on the first access only.
+        """
+        if self._config_parameters is None:
+            with trace(CONFIG_TRACE_EVENT):
+                self._config_parameters = ConfigFile().parse(name=self._config_file_name)
+
+        return self._config_parameters
+
+    def _get(self, environment_variable, config_parameter=None, default=None):
+        """
+        Get the setting from the first of the layers it is presented in, the default if it isn't presented.
+
+        Arguments:
+            environment_variable (string, required): name of the setting's environment variable.
+            config_parameter (string, optional): name of the setting's configuration file parameter.
+            default (optional): value of the setting if it isn't presented in any of the layers.
+        """
+        value = self._environment.get(environment_variable)
+
+        if value is None and config_parameter is not None:
+            value = getattr(self.config_parameters, config_parameter)
+
+        if value is None:
+            return default
+
+        return value
+
+    def _get_number(self, environment_variable, default, number_type, description):
+        """
+        Get the non-negative number setting, environment variables are strings to be converted to the number.
+
+        Raises the invalid setting error if the setting isn't a non-negative number of the type.
+        """
+        value = self._get(environment_variable=environment_variable, default=default)
+
+        try:
+            number = number_type(value)
 
-        return ConfigParameters(node_url=node_url)
+        except (TypeError, ValueError):
+            number = None
+
+        if number is None or not number >= 0:
+            raise InvalidSettingError(f'The following {description} `{value}` is invalid.')
+
+        return number
+
+    def validate(self):
+        """
+        Validate the settings converted from the environment variables.
+
+        Returns errors by the settings' names, none if the settings are valid.
+        """
+        errors = {}
+
+        for name in ('cache_max_size', 'read_cache_ttl'):
+            try:
+                getattr(self, name)
+
+            except InvalidSettingError as error:
+                errors[name] = [error.message]
+
+        return errors or None
+
+    @property
+    def node_url(self):
+        """
+        Get node URL to apply commands to.
+        """
+        return self._get(
+            environment_variable=NODE_URL_ENVIRONMENT_VARIABLE,
+            config_parameter='node_url',
+            default=DEFAULT_NODE_URL,
+        )
+
+    @property
+    def node_urls(self):
+        """
+        Get node URLs to apply read commands to concurrently, none if there are no such nodes.
+
+        Node URLs are set as a comma-separated string by the environment variable
+        and as a list (`nodes`) by the configuration file.
+        """
+        node_urls = self._get(environment_variable=NODE_URLS_ENVIRONMENT_VARIABLE, config_parameter='node_urls')
+
+        if not node_urls:
+            return None
+
+        if isinstance(node_urls, str):
+            return node_urls
+
+        return ','.join(node_urls)
+
+    @property
+    def cache_path(self):
+        """
+        Get path to the on-disk cache of the chain objects.
+        """
+        return self._get(
+            environment_variable=CACHE_PATH_ENVIRONMENT_VARIABLE,
+            default=os.path.join(str(pathlib.Path.home()), CACHE_FILE_NAME),
+        )
+
+    @property
+    def cache_max_size(self):
+        """
+        Get maximum size of the on-disk cache of the chain objects in bytes.
+        """
+        return self._get_number(
+            environment_variable=CACHE_MAX_SIZE_ENVIRONMENT_VARIABLE,
+            default=DEFAULT_CACHE_MAX_SIZE,
+            number_type=int,
+            description='cache maximum size',
+        )
+
+    @property
+    def read_cache_ttl(self):
+        """
+        Get time to keep mutable reads (balances, node's information and peers, states) in seconds.
+        """
+        return self._get_number(
+            environment_variable=READ_CACHE_TTL_ENVIRONMENT_VARIABLE,
+            default=DEFAULT_READ_CACHE_TTL,
+            number_type=float,
+            description='read cache time to live',
+        )
+
+    @property
+    def index_path(self):
+        """
+        Get path to the local index of blocks, batches and transactions.
+        """
+        return self._get(
+            environment_variable=INDEX_PATH_ENVIRONMENT_VARIABLE,
+            default=os.path.join(str(pathlib.Path.home()), INDEX_FILE_NAME),
+        )
+
+    @property
+    def mirror_path(self):
+        """
+        Get path to the directory of the local mirror of blocks.
+        """
+        return self._get(
+            environment_variable=MIRROR_PATH_ENVIRONMENT_VARIABLE,
+            default=os.path.join(str(pathlib.Path.home()), MIRROR_DIRECTORY_NAME),
+        )
 
 
 class NodePrivateKey:
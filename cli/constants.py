@@ -1,6 +1,9 @@
 """
 Provide constants for command line interface.
 """
+import os
+
+from remme.models.general.batch_status import BatchStatus
 from remme.models.general.patterns import RemmePatterns
 from remme.models.utils.family_name import RemmeFamilyName
 
@@ -13,12 +16,21 @@ PUBLIC_KEY_ADDRESS_REGEXP = RemmePatterns.ADDRESS.value
 PUBLIC_KEY_REGEXP = RemmePatterns.PUBLIC_KEY.value
 SWAP_IDENTIFIER_REGEXP = RemmePatterns.SWAP_ID.value
 TRANSACTION_IDENTIFIER_REGEXP = RemmePatterns.HEADER_SIGNATURE.value
+HEADER_SIGNATURE_LENGTH = 128
 
 PASSED_EXIT_FROM_COMMAND_CODE = 0
 FAILED_EXIT_FROM_COMMAND_CODE = -1
 INCORRECT_ENTERED_COMMAND_CODE = 2
 
+NODE_PORT = 8080
+DEFAULT_NODE_URL = 'localhost'
+NODE_URL_ENVIRONMENT_VARIABLE = 'REMME_CORE_CLI_NODE_URL'
+NODE_URLS_ENVIRONMENT_VARIABLE = 'REMME_CORE_CLI_NODE_URLS'
+
 NODE_URL_ARGUMENT_HELP_MESSAGE = 'Node URL to apply a command to.'
+NODE_URLS_ARGUMENT_HELP_MESSAGE = 'Comma-separated node URLs to apply a command to concurrently.'
+OUTPUT_ARGUMENT_HELP_MESSAGE = 'Format to print a result in: `json` or `ndjson` (a line of JSON per item).'
+NO_CACHE_ARGUMENT_HELP_MESSAGE = 'Request the node bypassing the on-disk cache of the chain objects.'
 
 CLI_CONFIG_FILE_NAME = 'remme-core-cli'
 
@@ -31,6 +43,71 @@ FAMILY_NAMES = [
 
 BET_TYPES = ['max', 'min']
 
+BATCH_EXECUTION_ORDERS = ['input', 'completion']
+BATCH_EXECUTION_DEFAULT_CONCURRENCY = 8
+BATCH_EXECUTION_PENDING_COMMANDS_PER_CONCURRENCY = 4
+
+UNKNOWN_BATCH_STATUS = BatchStatus.UNKNOWN.value
+INVALID_BATCH_STATUS = BatchStatus.INVALID.value
+PENDING_BATCH_STATUS = BatchStatus.PENDING.value
+COMMITTED_BATCH_STATUS = BatchStatus.COMMITTED.value
+BATCH_WAIT_STATUSES = [PENDING_BATCH_STATUS, COMMITTED_BATCH_STATUS]
+DEFAULT_BATCH_WAIT_CONCURRENCY = 32
+DEFAULT_BATCH_WAIT_TIMEOUT = 300
+BATCH_WAIT_POLL_INTERVAL = 0.5
+MAX_BATCH_WAIT_POLL_INTERVAL = 8
+
+ACCOUNT_FAMILY_VERSION = '0.1'
+DEFAULT_TRANSFER_TOKENS_BULK_CONCURRENCY = 16
+TRANSFER_TOKENS_BULK_JOURNAL_SUFFIX = '.journal'
+DEFAULT_TRANSACTION_SIGNER_PROCESSES = os.cpu_count() or 1
+
+NODE_OK_STATUS = 'ok'
+NODE_LAGGING_STATUS = 'lagging'
+NODE_DIVERGED_STATUS = 'diverged'
+NODE_UNAVAILABLE_STATUS = 'unavailable'
+DEFAULT_FLEET_MAX_LAG = 10
+
+DEFAULT_EXPORTER_HOST = 'localhost'
+DEFAULT_EXPORTER_PORT = 9788
+DEFAULT_EXPORTER_INTERVAL = 15
+EXPORTER_DURATION_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+EXPORTER_METRICS_CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+
+DEFAULT_PAGE_SIZE = 100
+BLOCK_NUMBER_PAGING_POSITION = '0x{:016x}'
+DEFAULT_BLOCKS_RANGE_CONCURRENCY = 8
+DEFAULT_FOLLOW_POLL_INTERVAL = 1
+MAX_FOLLOW_POLL_INTERVAL = 16
+
+DEFAULT_MOCK_NODE_HOST = 'localhost'
+DEFAULT_MOCK_NODE_BLOCKS_AMOUNT = 1000
+DEFAULT_MOCK_NODE_TRANSACTIONS_PER_BLOCK = 2
+MOCK_NODE_MAX_PAGE_SIZE = 1000
+MOCK_NODE_ERROR_CODE = -32000
+MOCK_NODE_INITIAL_STAKE = 250000
+
+CACHE_FILE_NAME = '.remme-core-cli-cache.sqlite3'
+CACHE_PATH_ENVIRONMENT_VARIABLE = 'REMME_CORE_CLI_CACHE_PATH'
+CACHE_MAX_SIZE_ENVIRONMENT_VARIABLE = 'REMME_CORE_CLI_CACHE_MAX_SIZE'
+DEFAULT_CACHE_MAX_SIZE = 256 * 1024 * 1024
+READ_CACHE_TTL_ENVIRONMENT_VARIABLE = 'REMME_CORE_CLI_READ_CACHE_TTL'
+DEFAULT_READ_CACHE_TTL = 3
+
+INDEX_FILE_NAME = '.remme-core-cli-index.sqlite3'
+INDEX_PATH_ENVIRONMENT_VARIABLE = 'REMME_CORE_CLI_INDEX_PATH'
+
+MIRROR_DIRECTORY_NAME = '.remme-core-cli-mirror'
+MIRROR_PATH_ENVIRONMENT_VARIABLE = 'REMME_CORE_CLI_MIRROR_PATH'
+MIRROR_BLOCKS_FILE_NAME = 'blocks.ndjson'
+MIRROR_CHECKPOINT_FILE_NAME = 'checkpoint.json'
+DEFAULT_MIRROR_COMMIT_EVERY = 1000
+DEFAULT_MIRROR_RECHECK = 10
+
+JSON_OUTPUT_FORMAT = 'json'
+NDJSON_OUTPUT_FORMAT = 'ndjson'
+OUTPUT_FORMATS = [JSON_OUTPUT_FORMAT, NDJSON_OUTPUT_FORMAT]
+
 DEV_CONSENSUS_GENESIS_NODE_IP_ADDRESS_FOR_TESTING = '142.93.161.195'
 DEV_CONSENSUS_GENESIS_NODE_ACCOUNT_ADDRESS = '1168292465adcaffeea284f89330dcc013533c8c285089b75466a958733f4f3fc9174d'
 DEV_CONSENSUS_GENESIS_ACCOUNT_ADDRESS = '1120072465adcaffeea284f89330dcc013533c8c285089b75466a958733f4f3fc9174d'
@@ -0,0 +1,61 @@
+"""
+Provide implementation of the command line interface's daemon command.
+"""
+import signal
+import sys
+
+import click
+
+from cli.constants import FAILED_EXIT_FROM_COMMAND_CODE
+from cli.daemon.client import get_daemon_socket_path
+from cli.daemon.help import DAEMON_SOCKET_ARGUMENT_HELP_MESSAGE
+from cli.daemon.server import Daemon
+from cli.errors import DaemonIsAlreadyRunningError
+from cli.utils import (
+    print_errors,
+    print_result,
+)
+
+
+def stop_daemon(signal_number, frame):
+    """
+    Stop the daemon on the termination signal.
+    """
+    sys.exit(0)
+
+
+@click.option(
+    '--socket',
+    type=str,
+    required=False,
+    default=get_daemon_socket_path,
+    help=DAEMON_SOCKET_ARGUMENT_HELP_MESSAGE,
+)
+@click.command('serve')
+def serve_command(socket):
+    """
+    Run the daemon to execute forwarded commands.
+    """
+    try:
+        daemon = Daemon(socket_path=socket)
+
+    except DaemonIsAlreadyRunningError as error:
+        print_errors(errors=error.message)
+        sys.exit(FAILED_EXIT_FROM_COMMAND_CODE)
+
+    except OSError as error:
+        print_errors(errors=str(error))
+        sys.exit(FAILED_EXIT_FROM_COMMAND_CODE)
+
+    signal.signal(signal.SIGTERM, stop_daemon)
+
+    with daemon:
+        daemon.warm_up()
+
+        print_result(result={'socket': socket})
+
+        try:
+            daemon.serve_forever()
+
+        except KeyboardInterrupt:
+            pass
@@ -0,0 +1,151 @@
+"""
+Provide implementation of the client to forward commands to the daemon.
+
+The client is imported by the entrypoint on every call, so it imports neither Remme core API nor the commands.
+"""
+import json
+import os
+import pathlib
+import socket
+import sys
+
+DAEMON_SOCKET_PATH_ENVIRONMENT_VARIABLE = 'REMME_CORE_CLI_SOCKET'
+DAEMON_SOCKET_FILE_NAME = '.remme-core-cli.sock'
+DAEMON_FAILED_EXIT_CODE = -1
+DAEMON_REQUEST_TIMEOUT = 10
+DAEMON_CONNECT_TIMEOUT = 1
+DAEMON_RESPONSE_TIMEOUT = 120
+DAEMON_READY_MESSAGE = b'ready\n'
+
+LOCAL_COMMANDS = (
+    'account transfer-tokens-bulk',
+    'batch wait',
+    'batch-exec',
+    'block get-range',
+    'block mirror',
+    'exporter',
+    'index',
+    'mock-node',
+    'serve',
+    'startup-profile',
+)
+LOCAL_ARGUMENTS = ('--follow', '--trace', '--trace-file')
+STREAMED_OUTPUT_FORMAT = 'ndjson'
+
+
+def get_daemon_socket_path():
+    """
+    Get path to the daemon's Unix domain socket.
+    """
+    socket_path = os.environ.get(DAEMON_SOCKET_PATH_ENVIRONMENT_VARIABLE)
+
+    if socket_path:
+        return socket_path
+
+    return os.path.join(str(pathlib.Path.home()), DAEMON_SOCKET_FILE_NAME)
+
+
+def get_command_names(arguments):
+    """
+    Get names of the command and its subcommand from the command line arguments, e.g. `block get-range`.
+    """
+    return ' '.join([argument for argument in arguments if not argument.startswith('-')][:2])
+
+
+def is_local_command(arguments):
+    """
+    Check if the command should be executed locally, even if the daemon is running.
+
+    The daemon executes commands one by one and sends their output back once they are finished. So commands
+    that read the standard input or files, write files, stream their output (`--follow`, `--output ndjson`)
+    or run until they are interrupted are never forwarded, relative paths are resolved by the client's directory
+    as well. Traced commands aren't forwarded either, so the trace has the phases of the client's execution.
+    """
+    options = [argument.split('=')[0] for argument in arguments if argument.startswith('-')]
+
+    if any(option in LOCAL_ARGUMENTS for option in options):
+        return True
+
+    for index, argument in enumerate(arguments):
+        if argument == f'--output={STREAMED_OUTPUT_FORMAT}':
+            return True
+
+        if argument == '--output' and arguments[index + 1:index + 2] == [STREAMED_OUTPUT_FORMAT]:
+            return True
+
+    command_names = get_command_names(arguments=arguments)
+
+    return any(
+        command_names == local_command or command_names.startswith(local_command + ' ')
+        for local_command in LOCAL_COMMANDS
+    )
+
+
+def forward(arguments, socket_path=None):
+    """
+    Forward the command to the daemon and print its output.
+
+    The daemon executes commands one by one, so the command is sent only after the daemon is ready to read it.
+    If the daemon doesn't get ready within the connect timeout, e.g. it is stuck on the other command, the command
+    is executed locally, the daemon finds the connection closed and doesn't execute it. If the command's output
+    isn't received within the response timeout, the command could have been executed already, so the error
+    is reported instead.
+
+    Returns exit code of the command, or none if the daemon isn't running and the command should be executed locally.
+
+    Arguments:
+        arguments (list, required): command line arguments of the command.
+        socket_path (string, optional): path to the daemon's Unix domain socket.
+    """
+    if socket_path is None:
+        socket_path = get_daemon_socket_path()
+
+    if is_local_command(arguments=arguments) or not os.path.exists(socket_path):
+        return
+
+    connection = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    connection.settimeout(DAEMON_CONNECT_TIMEOUT)
+    stream = connection.makefile('rwb')
+
+    try:
+        connection.connect(socket_path)
+        is_daemon_ready = stream.readline() == DAEMON_READY_MESSAGE
+
+    except OSError:
+        is_daemon_ready = False
+
+    if not is_daemon_ready:
+        stream.close()
+        connection.close()
+        return
+
+    request = {
+        'arguments': list(arguments),
+        'environment': dict(os.environ),
+        'color': sys.stdout.isatty(),
+    }
+
+    try:
+        with connection, stream:
+            connection.settimeout(DAEMON_RESPONSE_TIMEOUT)
+
+            stream.write(json.dumps(request).encode() + b'\n')
+            stream.flush()
+
+            response = json.loads(stream.readline().decode())
+
+    except socket.timeout:
+        sys.stderr.write(
+            f'The daemon on the following socket `{socket_path}` has not responded '
+            f'in {DAEMON_RESPONSE_TIMEOUT} seconds, the command could have been executed.\n',
+        )
+        return DAEMON_FAILED_EXIT_CODE
+
+    except (OSError, ValueError):
+        sys.stderr.write(f'The daemon on the following socket `{socket_path}` has not responded.\n')
+        return DAEMON_FAILED_EXIT_CODE
+
+    sys.stdout.write(response.get('output'))
+    sys.stderr.write(response.get('errors_output'))
+
+    return response.get('exit_code')
@@ -0,0 +1,4 @@
+"""
+Provide help messages for command line interface's daemon command.
+"""
+DAEMON_SOCKET_ARGUMENT_HELP_MESSAGE = 'Path to the Unix domain socket to listen to.'
@@ -0,0 +1,178 @@
+"""
+Provide implementation of the daemon to execute commands in the long-lived process.
+"""
+import contextlib
+import io
+import json
+import os
+import socket
+import socketserver
+
+from cli.client import RemmeClient
+from cli.config import Settings
+from cli.constants import (
+    FAILED_EXIT_FROM_COMMAND_CODE,
+    PASSED_EXIT_FROM_COMMAND_CODE,
+)
+from cli.daemon.client import (
+    DAEMON_READY_MESSAGE,
+    DAEMON_REQUEST_TIMEOUT,
+    is_local_command,
+)
+from cli.entrypoint import (
+    COMMANDS,
+    cli,
+)
+from cli.errors import DaemonIsAlreadyRunningError
+
+
+def execute_command(arguments, environment, color=False):
+    """
+    Execute the command and get its output and exit code.
+
+    Settings are resolved from the client's environment, so the configuration file is read per command and
+    changes of it are applied without restarting the daemon.
+
+    Arguments:
+        arguments (list, required): command line arguments of the command.
+        environment (dict, required): environment variables of the client.
+        color (bool, optional): flag to keep styles of the output.
+    """
+    if is_local_command(arguments=arguments):
+        return {
+            'output': '',
+            'errors_output': 'The command could not be executed by the daemon, execute it without the daemon.\n',
+            'exit_code': FAILED_EXIT_FROM_COMMAND_CODE,
+        }
+
+    Settings.share(settings=Settings(environment=environment))
+
+    output, errors_output = io.StringIO(), io.StringIO()
+    exit_code = PASSED_EXIT_FROM_COMMAND_CODE
+
+    with contextlib.redirect_stdout(output), contextlib.redirect_stderr(errors_output):
+        try:
+            cli.main(args=arguments, prog_name='remme', color=color)
+
+        except SystemExit as exit:
+            exit_code = exit.code if isinstance(exit.code, int) else FAILED_EXIT_FROM_COMMAND_CODE
+
+        except Exception as error:
+            errors_output.write(f'{error}\n')
+            exit_code = FAILED_EXIT_FROM_COMMAND_CODE
+
+    return {
+        'output': output.getvalue(),
+        'errors_output': errors_output.getvalue(),
+        'exit_code': exit_code,
+    }
+
+
+class DaemonRequestHandler(socketserver.StreamRequestHandler):
+    """
+    Implements handling of the command forwarded to the daemon.
+
+    The daemon tells the client it is ready before the command is sent, so the client of the daemon that is busy
+    with the other command executes its command locally. The request is read with the timeout, so a client that
+    connects but doesn't send the command doesn't keep the daemon from handling the other clients.
+    """
+
+    timeout = DAEMON_REQUEST_TIMEOUT
+
+    def handle(self):
+        """
+        Execute the command and send its output and exit code back.
+        """
+        try:
+            self.wfile.write(DAEMON_READY_MESSAGE)
+            request = json.loads(self.rfile.readline().decode())
+
+        except (OSError, ValueError):
+            return
+
+        response = execute_command(
+            arguments=request.get('arguments'),
+            environment=request.get('environment'),
+            color=request.get('color', False),
+        )
+
+        try:
+            self.wfile.write(json.dumps(response).encode() + b'\n')
+
+        except OSError:
+            return
+
+
+class Daemon(socketserver.UnixStreamServer):
+    """
+    Implements the daemon to execute commands in the long-lived process.
+
+    Modules of all commands are imported once, clients to interact with Remme-core are shared by all commands,
+    so a command costs the node's response time instead of the interpreter's startup and imports.
+    Commands are executed one by one on the daemon's event loop the shared clients are bound to.
+    """
+
+    def __init__(self, socket_path):
+        """
+        Constructor.
+
+        Arguments:
+            socket_path (string, required): path to the Unix domain socket to listen to.
+        """
+        self.socket_path = socket_path
+
+        if os.path.exists(socket_path):
+            if self.is_running(socket_path=socket_path):
+                raise DaemonIsAlreadyRunningError(
+                    f'The daemon is already running on the following socket `{socket_path}`.',
+                )
+
+            os.remove(socket_path)
+
+        # The socket is created without permissions for other users, so nobody else connects before the chmod.
+        umask = os.umask(0o077)
+
+        try:
+            super().__init__(socket_path, DaemonRequestHandler)
+
+        finally:
+            os.umask(umask)
+
+        os.chmod(socket_path, 0o600)
+
+    @staticmethod
+    def is_running(socket_path):
+        """
+        Check if the daemon is listening to the socket.
+        """
+        connection = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+
+        try:
+            connection.connect(socket_path)
+
+        except OSError:
+            return False
+
+        finally:
+            connection.close()
+
+        return True
+
+    @staticmethod
+    def warm_up():
+        """
+        Import modules of all commands.
+        """
+        for command_name in COMMANDS:
+            cli.get_command(ctx=None, cmd_name=command_name)
+
+    def server_close(self):
+        """
+        Stop listening to the socket and close connections of the shared clients to the nodes.
+        """
+        super().server_close()
+
+        if os.path.exists(self.socket_path):
+            os.remove(self.socket_path)
+
+        RemmeClient.close()
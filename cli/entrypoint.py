@@ -1,39 +1,197 @@
 """
 Provide implementation of the command line interface to interact with Remme-core.
 """
+import importlib
+import sys
+
 import click
 
-from cli.account.cli import account_commands
-from cli.atomic_swap.cli import atomic_swap_commands
-from cli.batch.cli import batch_commands
-from cli.block.cli import block_commands
-from cli.masternode.cli import masternode_commands
-from cli.node.cli import node_commands
-from cli.node_account.cli import node_account_commands
-from cli.public_key.cli import public_key_commands
-from cli.receipt.cli import receipt_commands
-from cli.state.cli import state_command
-from cli.transaction.cli import transaction_command
+from cli.daemon.client import forward
+from cli.trace import (
+    IMPORT_TRACE_EVENT,
+    Tracer,
+    trace,
+)
+
+TRACE_ARGUMENT_HELP_MESSAGE = 'Write the time spent by the phases of the execution to the standard error.'
+TRACE_FILE_ARGUMENT_HELP_MESSAGE = 'Path to the file to append the time spent by the phases of the execution to.'
+
+COMMANDS = {
+    'account': (
+        'cli.account.cli', 'account_commands', 'Provide commands for working with account.',
+    ),
+    'atomic-swap': (
+        'cli.atomic_swap.cli', 'atomic_swap_commands', 'Provide commands for working with atomic swap.',
+    ),
+    'batch': (
+        'cli.batch.cli', 'batch_commands', 'Provide commands for working with batch.',
+    ),
+    'batch-exec': (
+        'cli.batch_exec.cli', 'batch_exec_command', 'Execute newline-delimited JSON commands concurrently.',
+    ),
+    'block': (
+        'cli.block.cli', 'block_commands', 'Provide commands for working with block.',
+    ),
+    'exporter': (
+        'cli.exporter.cli', 'exporter_command', 'Serve metrics of the nodes in Prometheus text exposition format.',
+    ),
+    'index': (
+        'cli.index.cli', 'index_commands', 'Provide commands for working with the local chain index.',
+    ),
+    'masternode': (
+        'cli.masternode.cli', 'masternode_commands', 'Provide commands for working with masternode.',
+    ),
+    'mock-node': (
+        'cli.mock_node.cli', 'mock_node_command', 'Run the local mock node serving a synthetic chain.',
+    ),
+    'node': (
+        'cli.node.cli', 'node_commands', 'Provide commands for working with node.',
+    ),
+    'node-account': (
+        'cli.node_account.cli', 'node_account_commands', 'Provide commands for working with node account.',
+    ),
+    'public-key': (
+        'cli.public_key.cli', 'public_key_commands', 'Provide commands for working with public key.',
+    ),
+    'receipt': (
+        'cli.receipt.cli', 'receipt_commands', 'Provide commands for working with receipt.',
+    ),
+    'serve': (
+        'cli.daemon.cli', 'serve_command', 'Run the daemon to execute forwarded commands.',
+    ),
+    'startup-profile': (
+        'cli.startup_profile.cli', 'startup_profile_command', 'Report import time of the commands\' modules.',
+    ),
+    'state': (
+        'cli.state.cli', 'state_command', 'Provide commands for working with state.',
+    ),
+    'transaction': (
+        'cli.transaction.cli', 'transaction_command', 'Provide commands for working with transaction.',
+    ),
+}
+
+
+class LazyGroup(click.Group):
+    """
+    Implements the group of commands that imports a command's module only when the command is invoked.
+
+    Commands' modules import Remme core API, its JSON-RPC client and forms, so importing them all on every call
+    (even for `--help` or `--version`) dominates the startup time. Help messages of the commands are kept
+    along with their modules' paths, so the group's help does not import the modules either.
+    """
+
+    def __init__(self, *args, lazy_commands=None, **kwargs):
+        """
+        Constructor.
+
+        Arguments:
+            lazy_commands (dict, optional): commands' names to their modules, objects names and help messages.
+        """
+        super().__init__(*args, **kwargs)
+
+        self.lazy_commands = lazy_commands or {}
+
+    def list_commands(self, ctx):
+        """
+        Get names of the loaded and lazy commands.
+        """
+        return sorted(set(super().list_commands(ctx)) | set(self.lazy_commands))
+
+    def get_command(self, ctx, cmd_name):
+        """
+        Get the command by its name, import the command's module if it is not imported yet.
+        """
+        if cmd_name in self.commands or cmd_name not in self.lazy_commands:
+            return super().get_command(ctx, cmd_name)
+
+        module_name, command_name, _ = self.lazy_commands.get(cmd_name)
+
+        with trace(IMPORT_TRACE_EVENT, module=module_name):
+            command = getattr(importlib.import_module(module_name), command_name)
+
+        self.add_command(command, name=cmd_name)
+
+        return command
+
+    def invoke(self, ctx):
+        """
+        Invoke the command, trace its execution if tracing is requested.
+
+        Tracing is started before the command is resolved, so importing the command's module is traced as well.
+        """
+        if not ctx.params.get('trace') and ctx.params.get('trace_file') is None:
+            return super().invoke(ctx)
+
+        tracer = Tracer.start(file=ctx.params.get('trace_file'))
 
+        exit_code = 0
 
-@click.group()
+        try:
+            return super().invoke(ctx)
+
+        except SystemExit as error:
+            exit_code = error.code
+            raise
+
+        except Exception as error:
+            exit_code = getattr(error, 'exit_code', 1)
+            raise
+
+        finally:
+            tracer.finish(exit_code=exit_code)
+
+    def format_commands(self, ctx, formatter):
+        """
+        Write the commands' help messages to the formatter without importing the commands' modules.
+        """
+        rows = []
+
+        for command_name in self.list_commands(ctx):
+            if command_name in self.commands or command_name not in self.lazy_commands:
+                command = self.get_command(ctx, command_name)
+
+                if command is None or getattr(command, 'hidden', False):
+                    continue
+
+                rows.append((command_name, command.get_short_help_str()))
+                continue
+
+            _, _, help_message = self.lazy_commands.get(command_name)
+            rows.append((command_name, help_message))
+
+        if rows:
+            with formatter.section('Commands'):
+                formatter.write_dl(rows)
+
+
+@click.group(cls=LazyGroup, lazy_commands=COMMANDS)
 @click.version_option()
 @click.help_option()
-def cli():
+@click.option('--trace', is_flag=True, help=TRACE_ARGUMENT_HELP_MESSAGE)
+@click.option('--trace-file', type=str, required=False, help=TRACE_FILE_ARGUMENT_HELP_MESSAGE)
+def cli(trace, trace_file):
     """
     Command-line interface to interact with Remme-core.
     """
-    pass
-
-
-cli.add_command(account_commands)
-cli.add_command(atomic_swap_commands)
-cli.add_command(batch_commands)
-cli.add_command(block_commands)
-cli.add_command(masternode_commands)
-cli.add_command(node_commands)
-cli.add_command(node_account_commands)
-cli.add_command(public_key_commands)
-cli.add_command(receipt_commands)
-cli.add_command(state_command)
-cli.add_command(transaction_command)
+    from cli.config import Settings
+    from cli.constants import FAILED_EXIT_FROM_COMMAND_CODE
+    from cli.utils import print_errors
+
+    # Settings converted from the environment variables are validated before any command is executed.
+    errors = Settings.get().validate()
+
+    if errors:
+        print_errors(errors=errors)
+        sys.exit(FAILED_EXIT_FROM_COMMAND_CODE)
+
+
+def main():
+    """
+    Execute the command, forward it to the daemon if the daemon is running.
+    """
+    exit_code = forward(arguments=sys.argv[1:])
+
+    if exit_code is not None:
+        sys.exit(exit_code)
+
+    cli()
@@ -19,3 +19,21 @@ class NotSupportedBetError(Exception):
 
     def __init__(self, message):
         self.message = message
+
+
+class DaemonIsAlreadyRunningError(Exception):
+    """
+    The daemon is already running on the following socket error.
+    """
+
+    def __init__(self, message):
+        self.message = message
+
+
+class InvalidSettingError(Exception):
+    """
+    The following setting is invalid error.
+    """
+
+    def __init__(self, message):
+        self.message = message
@@ -0,0 +1,91 @@
+"""
+Provide implementation of the command line interface's exporter command.
+"""
+import sys
+
+import click
+
+from cli.client import RemmeClient
+from cli.constants import (
+    DEFAULT_EXPORTER_HOST,
+    DEFAULT_EXPORTER_INTERVAL,
+    DEFAULT_EXPORTER_PORT,
+    FAILED_EXIT_FROM_COMMAND_CODE,
+)
+from cli.exporter.forms import RunExporterForm
+from cli.exporter.help import (
+    EXPORTER_HOST_ARGUMENT_HELP_MESSAGE,
+    EXPORTER_INTERVAL_ARGUMENT_HELP_MESSAGE,
+    EXPORTER_NODE_URLS_ARGUMENT_HELP_MESSAGE,
+    EXPORTER_PORT_ARGUMENT_HELP_MESSAGE,
+)
+from cli.exporter.service import Exporter
+from cli.utils import (
+    default_node_url,
+    default_node_urls,
+    get_event_loop,
+    print_errors,
+    print_result,
+)
+
+
+@click.option('--node-urls', type=str, required=False, help=EXPORTER_NODE_URLS_ARGUMENT_HELP_MESSAGE)
+@click.option(
+    '--host', type=str, required=False, default=DEFAULT_EXPORTER_HOST, help=EXPORTER_HOST_ARGUMENT_HELP_MESSAGE,
+)
+@click.option(
+    '--port', type=int, required=False, default=DEFAULT_EXPORTER_PORT, help=EXPORTER_PORT_ARGUMENT_HELP_MESSAGE,
+)
+@click.option(
+    '--interval',
+    type=float,
+    required=False,
+    default=DEFAULT_EXPORTER_INTERVAL,
+    help=EXPORTER_INTERVAL_ARGUMENT_HELP_MESSAGE,
+)
+@click.command('exporter')
+def exporter_command(node_urls, host, port, interval):
+    """
+    Serve metrics of the nodes in Prometheus text exposition format.
+    """
+    if node_urls is None:
+        node_urls = default_node_urls() or default_node_url()
+
+    arguments, errors = RunExporterForm().load({
+        'node_urls': node_urls,
+        'host': host,
+        'port': port,
+        'interval': interval,
+    })
+
+    if errors:
+        print_errors(errors=errors)
+        sys.exit(FAILED_EXIT_FROM_COMMAND_CODE)
+
+    node_urls = arguments.get('node_urls')
+
+    exporter = Exporter(
+        services={node_url: RemmeClient.get(node_url=node_url) for node_url in node_urls},
+        interval=arguments.get('interval'),
+    )
+
+    try:
+        port = exporter.start(host=arguments.get('host'), port=arguments.get('port'))
+
+    except OSError as error:
+        print_errors(errors=str(error))
+        sys.exit(FAILED_EXIT_FROM_COMMAND_CODE)
+
+    print_result(result={
+        'metrics_url': f'http://{arguments.get("host")}:{port}/metrics',
+        'node_urls': node_urls,
+    })
+
+    try:
+        get_event_loop().run_forever()
+
+    except KeyboardInterrupt:
+        pass
+
+    finally:
+        exporter.stop()
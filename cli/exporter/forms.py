@@ -0,0 +1,32 @@
+"""
+Provide forms for command line interface's exporter command.
+"""
+from marshmallow import (
+    fields,
+    validate,
+)
+
+from cli.generic.forms.fields import NodeUrlsListField
+from cli.generic.forms.forms import Form
+
+
+class RunExporterForm(Form):
+    """
+    Run the exporter of the nodes' metrics form.
+    """
+
+    node_urls = NodeUrlsListField(required=True)
+    host = fields.String(required=True)
+    port = fields.Integer(
+        strict=True,
+        required=True,
+        validate=[
+            validate.Range(min=0, max=65535, error='Port must be between 0 and 65535.'),
+        ],
+    )
+    interval = fields.Float(
+        required=True,
+        validate=[
+            validate.Range(min=1, error='Interval must be greater than or equal to 1.'),
+        ],
+    )
@@ -0,0 +1,8 @@
+"""
+Provide help messages for command line interface's exporter command.
+"""
+EXPORTER_NODE_URLS_ARGUMENT_HELP_MESSAGE = 'Comma-separated node URLs to export metrics of (`nodes` of the ' \
+                                           'configuration file or the node URL).'
+EXPORTER_HOST_ARGUMENT_HELP_MESSAGE = 'Host to serve the metrics on.'
+EXPORTER_PORT_ARGUMENT_HELP_MESSAGE = 'Port to serve the metrics on, a free one is chosen if it is 0.'
+EXPORTER_INTERVAL_ARGUMENT_HELP_MESSAGE = 'Seconds between the collections of the metrics.'
@@ -0,0 +1,51 @@
+"""
+Provide implementation of the exporter interfaces.
+"""
+
+
+class ExporterInterface:
+    """
+    Implements exporter interface.
+    """
+
+    async def collect_async(self):
+        """
+        Collect metrics of all the nodes concurrently.
+        """
+        pass
+
+    def collect(self):
+        """
+        Collect metrics of all the nodes concurrently.
+        """
+        pass
+
+    def get_metrics(self):
+        """
+        Get metrics of the latest collection in Prometheus text exposition format.
+        """
+        pass
+
+    async def start_async(self, host, port):
+        """
+        Start serving the metrics and collecting them on the schedule.
+        """
+        pass
+
+    def start(self, host, port):
+        """
+        Start serving the metrics and collecting them on the schedule.
+        """
+        pass
+
+    async def stop_async(self):
+        """
+        Stop collecting and serving the metrics.
+        """
+        pass
+
+    def stop(self):
+        """
+        Stop collecting and serving the metrics.
+        """
+        pass
@@ -0,0 +1,384 @@
+"""
+Provide implementation of the exporter of the nodes' metrics.
+"""
+import asyncio
+import bisect
+import collections
+import time
+
+import aiohttp.web
+from accessify import implements
+
+from cli.block.service import Block
+from cli.constants import (
+    EXPORTER_DURATION_BUCKETS,
+    EXPORTER_METRICS_CONTENT_TYPE,
+)
+from cli.exporter.interfaces import ExporterInterface
+from cli.node.service import Node
+from cli.node_account.service import NodeAccount
+from cli.utils import run_until_complete
+
+GAUGE_METRIC_TYPE = 'gauge'
+COUNTER_METRIC_TYPE = 'counter'
+HISTOGRAM_METRIC_TYPE = 'histogram'
+HISTOGRAM_SUFFIXES = ('_bucket', '_sum', '_count')
+
+NODE_UP_METRIC = 'remme_node_up'
+NODE_IS_SYNCED_METRIC = 'remme_node_is_synced'
+NODE_PEER_COUNT_METRIC = 'remme_node_peer_count'
+NODE_PEERS_METRIC = 'remme_node_peers'
+NODE_HEAD_BLOCK_NUMBER_METRIC = 'remme_node_head_block_number'
+NODE_ACCOUNT_BALANCE_METRIC = 'remme_node_account_balance'
+NODE_ACCOUNT_FROZEN_REPUTATION_METRIC = 'remme_node_account_reputation_frozen'
+NODE_ACCOUNT_UNFROZEN_REPUTATION_METRIC = 'remme_node_account_reputation_unfrozen'
+NODE_ACCOUNT_STATE_METRIC = 'remme_node_account_state'
+COLLECTIONS_METRIC = 'remme_exporter_collections_total'
+COLLECTION_ERRORS_METRIC = 'remme_exporter_collection_errors_total'
+COLLECTION_DURATION_METRIC = 'remme_exporter_collection_duration_seconds'
+
+METRICS = collections.OrderedDict([
+    (NODE_UP_METRIC, (GAUGE_METRIC_TYPE, 'Whether the node\'s information, peers and head are collected.')),
+    (NODE_IS_SYNCED_METRIC, (GAUGE_METRIC_TYPE, 'Whether the node is synchronized.')),
+    (NODE_PEER_COUNT_METRIC, (GAUGE_METRIC_TYPE, 'Peer count of the node\'s information.')),
+    (NODE_PEERS_METRIC, (GAUGE_METRIC_TYPE, 'Amount of the node\'s peers.')),
+    (NODE_HEAD_BLOCK_NUMBER_METRIC, (GAUGE_METRIC_TYPE, 'Number of the node\'s head block.')),
+    (NODE_ACCOUNT_BALANCE_METRIC, (GAUGE_METRIC_TYPE, 'Balance of the node\'s account.')),
+    (NODE_ACCOUNT_FROZEN_REPUTATION_METRIC, (GAUGE_METRIC_TYPE, 'Frozen reputation of the node\'s account.')),
+    (NODE_ACCOUNT_UNFROZEN_REPUTATION_METRIC, (GAUGE_METRIC_TYPE, 'Unfrozen reputation of the node\'s account.')),
+    (NODE_ACCOUNT_STATE_METRIC, (GAUGE_METRIC_TYPE, 'State of the node\'s masternode, 1 for the current one.')),
+    (COLLECTIONS_METRIC, (COUNTER_METRIC_TYPE, 'Amount of the collections of the nodes\' metrics.')),
+    (COLLECTION_ERRORS_METRIC, (COUNTER_METRIC_TYPE, 'Amount of the failed collections of the node\'s metrics.')),
+    (COLLECTION_DURATION_METRIC, (HISTOGRAM_METRIC_TYPE, 'Duration of the collection of the node\'s metrics.')),
+])
+
+
+def format_labels(labels):
+    """
+    Format the labels of the sample, the values are escaped as the text exposition format requires.
+    """
+    if not labels:
+        return ''
+
+    formatted_labels = ','.join(
+        '{}="{}"'.format(name, str(value).replace('\\', '\\\\').replace('\n', '\\n').replace('"', '\\"'))
+        for name, value in labels.items()
+    )
+
+    return '{' + formatted_labels + '}'
+
+
+def format_value(value):
+    """
+    Format the value of the sample.
+    """
+    if value == float('inf'):
+        return '+Inf'
+
+    return repr(float(value)) if isinstance(value, float) else str(int(value))
+
+
+class Histogram:
+    """
+    Implements histogram of the observed values with the cumulative buckets.
+    """
+
+    def __init__(self, buckets=EXPORTER_DURATION_BUCKETS):
+        """
+        Constructor.
+
+        Arguments:
+            buckets (tuple, optional): sorted upper bounds of the buckets, the infinite one is added.
+        """
+        self.buckets = tuple(buckets) + (float('inf'),)
+        self.counts = [0] * len(self.buckets)
+        self.sum = 0
+
+    def observe(self, value):
+        """
+        Observe the value.
+        """
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.sum += value
+
+    @property
+    def count(self):
+        """
+        Get amount of the observed values.
+        """
+        return sum(self.counts)
+
+    def get_samples(self, name, labels):
+        """
+        Get samples of the buckets, sum and count of the histogram.
+        """
+        samples = []
+        cumulative_count = 0
+
+        for bucket, count in zip(self.buckets, self.counts):
+            cumulative_count += count
+            samples.append((name + '_bucket', dict(labels, le=format_value(bucket)), cumulative_count))
+
+        samples.append((name + '_sum', labels, self.sum))
+        samples.append((name + '_count', labels, self.count))
+
+        return samples
+
+
+@implements(ExporterInterface)
+class Exporter:
+    """
+    Implements exporter of the nodes' metrics in Prometheus text exposition format.
+
+    Metrics are collected on the schedule rather than per scrape, every node is requested concurrently with its
+    own client, which keeps its connection to the node open between the collections. A scrape returns
+    the metrics of the latest collection.
+    """
+
+    def __init__(self, services, interval):
+        """
+        Constructor.
+
+        Arguments:
+            services (dict, required): objects to interact with Remme core API of the nodes by their URLs.
+            interval (float, required): seconds between the starts of the collections.
+        """
+        self.services = services
+        self.interval = interval
+
+        self.samples = collections.OrderedDict((node_url, []) for node_url in services)
+        self.durations = {node_url: Histogram() for node_url in services}
+        self.errors_amounts = dict.fromkeys(services, 0)
+        self.collections_amount = 0
+
+        self._runner = None
+        self._collection = None
+
+    @staticmethod
+    async def collect_node_account_async(service, node_account_address, labels):
+        """
+        Collect balance, reputation and masternode state of the node's account.
+        """
+        node_account, errors = await NodeAccount(service=service).get_async(address=node_account_address)
+
+        if errors is not None:
+            return [], errors
+
+        reputation = node_account.get('reputation')
+
+        return [
+            (NODE_ACCOUNT_BALANCE_METRIC, labels, float(node_account.get('balance'))),
+            (NODE_ACCOUNT_FROZEN_REPUTATION_METRIC, labels, float(reputation.get('frozen'))),
+            (NODE_ACCOUNT_UNFROZEN_REPUTATION_METRIC, labels, float(reputation.get('unfrozen'))),
+            (NODE_ACCOUNT_STATE_METRIC, dict(labels, state=node_account.get('node_state')), 1),
+        ], None
+
+    async def collect_node_async(self, node_url):
+        """
+        Collect the node's information, peers, head block and its account's metrics concurrently.
+
+        The node's account is collected once its address is received by the node configurations, as it's needed
+        to request the account. If only the account could not be collected, the node's metrics are kept.
+
+        Returns samples of the node's metrics and errors.
+        """
+        service = self.services.get(node_url)
+        labels = {'node_url': node_url}
+
+        node = Node(service=service)
+
+        (information, information_errors), (peers, peers_errors), (blocks, blocks_errors), (
+            configurations, configurations_errors,
+        ) = await asyncio.gather(
+            node.get_info_async(),
+            node.get_peers_async(),
+            Block(service=service).get_list_async(ids=None, head=None, limit=1, reverse=False),
+            node.get_configs_async(),
+        )
+
+        errors = information_errors or peers_errors or blocks_errors
+
+        if errors is None and not blocks:
+            errors = 'The node has no blocks.'
+
+        if errors is not None:
+            return [(NODE_UP_METRIC, labels, 0)], errors
+
+        samples = [
+            (NODE_UP_METRIC, labels, 1),
+            (NODE_IS_SYNCED_METRIC, labels, int(bool(information.get('information').get('is_synced')))),
+            (NODE_PEER_COUNT_METRIC, labels, information.get('information').get('peer_count') or 0),
+            (NODE_PEERS_METRIC, labels, len(peers.get('peers') or [])),
+            (NODE_HEAD_BLOCK_NUMBER_METRIC, labels, int(blocks[0].get('header').get('block_num'))),
+        ]
+
+        if configurations_errors is not None:
+            return samples, configurations_errors
+
+        node_account_samples, errors = await self.collect_node_account_async(
+            service=service,
+            node_account_address=configurations.get('configurations').get('node_address'),
+            labels=labels,
+        )
+
+        return samples + node_account_samples, errors
+
+    async def collect_timed_node_async(self, node_url):
+        """
+        Collect the node's metrics, observe the collection's duration and count the failed collections.
+        """
+        start = time.perf_counter()
+
+        try:
+            samples, errors = await self.collect_node_async(node_url=node_url)
+
+        except Exception as error:
+            samples, errors = [(NODE_UP_METRIC, {'node_url': node_url}, 0)], str(error)
+
+        self.durations.get(node_url).observe(time.perf_counter() - start)
+
+        if errors is not None:
+            self.errors_amounts[node_url] += 1
+
+        return samples, errors
+
+    async def collect_async(self):
+        """
+        Collect metrics of all the nodes concurrently.
+
+        Returns errors of the nodes the metrics are (partly) not collected from by their URLs, none if there are no.
+        """
+        node_urls = list(self.services)
+
+        responses = await asyncio.gather(*[self.collect_timed_node_async(node_url=node_url) for node_url in node_urls])
+
+        errors = {}
+
+        for node_url, (samples, node_errors) in zip(node_urls, responses):
+            self.samples[node_url] = samples
+
+            if node_errors is not None:
+                errors[node_url] = node_errors
+
+        self.collections_amount += 1
+
+        return None, errors or None
+
+    def collect(self):
+        """
+        Collect metrics of all the nodes concurrently.
+        """
+        return run_until_complete(self.collect_async())
+
+    def get_metrics(self):
+        """
+        Get metrics of the latest collection in Prometheus text exposition format.
+        """
+        samples = [sample for node_samples in self.samples.values() for sample in node_samples]
+        samples.append((COLLECTIONS_METRIC, {}, self.collections_amount))
+
+        for node_url in self.services:
+            labels = {'node_url': node_url}
+
+            samples.append((COLLECTION_ERRORS_METRIC, labels, self.errors_amounts.get(node_url)))
+            samples += self.durations.get(node_url).get_samples(name=COLLECTION_DURATION_METRIC, labels=labels)
+
+        lines = []
+
+        for name, (metric_type, help_message) in METRICS.items():
+            sample_names = [name]
+
+            if metric_type == HISTOGRAM_METRIC_TYPE:
+                sample_names = [name + suffix for suffix in HISTOGRAM_SUFFIXES]
+
+            metric_samples = [sample for sample in samples if sample[0] in sample_names]
+
+            if not metric_samples:
+                continue
+
+            lines.append(f'# HELP {name} {help_message}')
+            lines.append(f'# TYPE {name} {metric_type}')
+
+            for sample_name, labels, value in metric_samples:
+                lines.append(f'{sample_name}{format_labels(labels)} {format_value(value)}')
+
+        return '\n'.join(lines) + '\n'
+
+    async def handle_metrics_request(self, request):
+        """
+        Respond with the metrics of the latest collection.
+        """
+        return aiohttp.web.Response(
+            body=self.get_metrics().encode('utf-8'), headers={'Content-Type': EXPORTER_METRICS_CONTENT_TYPE},
+        )
+
+    async def collect_forever_async(self, previous_start):
+        """
+        Collect metrics of all the nodes on the schedule, a collection starts the interval after the previous one.
+
+        Arguments:
+            previous_start (float, required): time the previous collection is started at.
+        """
+        start = previous_start
+
+        while True:
+            await asyncio.sleep(max(0, self.interval - (time.perf_counter() - start)))
+
+            start = time.perf_counter()
+            await self.collect_async()
+
+    async def start_async(self, host, port):
+        """
+        Start serving the metrics and collecting them on the schedule, the first collection is awaited.
+
+        Arguments:
+            host (string, required): host to listen to.
+            port (int, required): port to listen to, a free one is chosen if it is 0.
+
+        Returns the port the exporter listens to.
+        """
+        start = time.perf_counter()
+        await self.collect_async()
+
+        application = aiohttp.web.Application()
+        application.router.add_get('/metrics', self.handle_metrics_request)
+
+        self._runner = aiohttp.web.AppRunner(application)
+        await self._runner.setup()
+
+        await aiohttp.web.TCPSite(self._runner, host=host, port=port).start()
+
+        self._collection = asyncio.ensure_future(self.collect_forever_async(previous_start=start))
+
+        return self._runner.addresses[0][1]
+
+    def start(self, host, port):
+        """
+        Start serving the metrics and collecting them on the schedule.
+        """
+        return run_until_complete(self.start_async(host=host, port=port))
+
+    async def stop_async(self):
+        """
+        Stop collecting and serving the metrics.
+        """
+        if self._collection is not None:
+            self._collection.cancel()
+
+            try:
+                await self._collection
+
+            except asyncio.CancelledError:
+                pass
+
+            self._collection = None
+
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+    def stop(self):
+        """
+        Stop collecting and serving the metrics.
+        """
+        return run_until_complete(self.stop_async())
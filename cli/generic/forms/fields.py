@@ -18,12 +18,74 @@ from cli.constants import (
     BLOCK_IDENTIFIER_REGEXP,
     DOMAIN_NAME_REGEXP,
     FAMILY_NAMES,
+    HEADER_SIGNATURE_LENGTH,
+    OUTPUT_FORMATS,
     PRIVATE_KEY_REGEXP,
     PUBLIC_KEY_ADDRESS_REGEXP,
+    PUBLIC_KEY_REGEXP,
     SWAP_IDENTIFIER_REGEXP,
     TRANSACTION_IDENTIFIER_REGEXP,
 )
 
+ADDRESS_PATTERN = re.compile(ADDRESS_REGEXP)
+BATCH_IDENTIFIER_PATTERN = re.compile(BATCH_IDENTIFIER_REGEXP)
+BLOCK_IDENTIFIER_PATTERN = re.compile(BLOCK_IDENTIFIER_REGEXP)
+DOMAIN_NAME_PATTERN = re.compile(DOMAIN_NAME_REGEXP)
+PRIVATE_KEY_PATTERN = re.compile(PRIVATE_KEY_REGEXP)
+PUBLIC_KEY_ADDRESS_PATTERN = re.compile(PUBLIC_KEY_ADDRESS_REGEXP)
+PUBLIC_KEY_PATTERN = re.compile(PUBLIC_KEY_REGEXP)
+SWAP_IDENTIFIER_PATTERN = re.compile(SWAP_IDENTIFIER_REGEXP)
+TRANSACTION_IDENTIFIER_PATTERN = re.compile(TRANSACTION_IDENTIFIER_REGEXP)
+
+
+def are_header_signatures(identifiers):
+    """
+    Check the identifiers are header signatures (lowercase hexadecimal strings of 128 characters) at once.
+
+    Checking the whole list by the length and a single conversion of the joined identifiers is a lot faster
+    than matching the header signature pattern per identifier, so it's the fast path for the valid lists of
+    transaction, batch and block identifiers.
+    """
+    if any(len(identifier) != HEADER_SIGNATURE_LENGTH for identifier in identifiers):
+        return False
+
+    joined_identifiers = ''.join(identifiers)
+
+    if joined_identifiers != joined_identifiers.lower():
+        return False
+
+    try:
+        # Conversion skips whitespaces, so the amount of bytes ensures there are none.
+        return len(bytes.fromhex(joined_identifiers)) * 2 == len(joined_identifiers)
+
+    except ValueError:
+        return False
+
+
+def validate_identifiers(value, pattern, error_message, are_valid=None):
+    """
+    Validate the comma-separated identifiers, all of the invalid ones are reported at once.
+
+    Arguments:
+        value (string, required): comma-separated identifiers.
+        pattern (re.Pattern, required): compiled pattern of the identifier.
+        error_message (string, required): error message of the invalid identifier with its placeholder.
+        are_valid (callable, optional): fast check of the whole list that is equivalent to the pattern.
+    """
+    identifiers = [identifier.strip() for identifier in value.split(',')]
+
+    if are_valid is not None and are_valid(identifiers):
+        return identifiers
+
+    invalid_identifiers = dict.fromkeys(
+        identifier for identifier in identifiers if pattern.fullmatch(identifier) is None
+    )
+
+    if invalid_identifiers:
+        raise ValidationError([error_message.format(identifier) for identifier in invalid_identifiers])
+
+    return identifiers
+
 
 class AccountAddressField(fields.Field):
     """
@@ -36,7 +98,7 @@ class AccountAddressField(fields.Field):
         """
         address = value
 
-        if re.match(pattern=ADDRESS_REGEXP, string=address) is None:
+        if ADDRESS_PATTERN.fullmatch(address) is None:
             raise ValidationError(f'The following address `{address}` is invalid.')
 
         return address
@@ -59,26 +121,38 @@ class FamilyNameField(fields.Field):
         return family_name
 
 
-class TransactionIdentifiersListField(fields.Field):
+class OutputFormatField(fields.Field):
     """
-    Implements validation of the list of the identifiers.
+    Implements validation of the output format.
     """
 
     def _deserialize(self, value, attr, obj, **kwargs):
         """
-        Validate data (list of the identifiers) that was passed to field.
+        Validate data (output format) that was passed to field.
         """
-        validated_identifiers = []
+        output_format = value
 
-        for identifier in value.split(','):
-            identifier = identifier.strip()
+        if output_format not in OUTPUT_FORMATS:
+            raise ValidationError(f'The following output format `{output_format}` is invalid.')
 
-            if re.match(pattern=TRANSACTION_IDENTIFIER_REGEXP, string=identifier) is None:
-                raise ValidationError(f'The following identifier `{identifier}` is invalid.')
+        return output_format
 
-            validated_identifiers.append(identifier)
 
-        return validated_identifiers
+class TransactionIdentifiersListField(fields.Field):
+    """
+    Implements validation of the list of the identifiers.
+    """
+
+    def _deserialize(self, value, attr, obj, **kwargs):
+        """
+        Validate data (list of the identifiers) that was passed to field.
+        """
+        return validate_identifiers(
+            value=value,
+            pattern=TRANSACTION_IDENTIFIER_PATTERN,
+            error_message='The following identifier `{}` is invalid.',
+            are_valid=are_header_signatures,
+        )
 
 
 class TransactionIdentifierField(fields.Field):
@@ -92,7 +166,7 @@ class TransactionIdentifierField(fields.Field):
         """
         transaction_identifier = value
 
-        if re.match(pattern=TRANSACTION_IDENTIFIER_REGEXP, string=transaction_identifier) is None:
+        if TRANSACTION_IDENTIFIER_PATTERN.fullmatch(transaction_identifier) is None:
             raise ValidationError(f'The following identifier `{transaction_identifier}` is invalid.')
 
         return transaction_identifier
@@ -107,17 +181,12 @@ class BatchIdentifiersListField(fields.Field):
         """
         Validate data (list of the identifiers) that was passed to field.
         """
-        validated_identifiers = []
-
-        for identifier in value.split(','):
-            identifier = identifier.strip()
-
-            if re.match(pattern=BATCH_IDENTIFIER_REGEXP, string=identifier) is None:
-                raise ValidationError(f'The following identifier `{identifier}` is invalid.')
-
-            validated_identifiers.append(identifier)
-
-        return validated_identifiers
+        return validate_identifiers(
+            value=value,
+            pattern=BATCH_IDENTIFIER_PATTERN,
+            error_message='The following identifier `{}` is invalid.',
+            are_valid=are_header_signatures,
+        )
 
 
 class BatchIdentifierField(fields.Field):
@@ -131,7 +200,7 @@ class BatchIdentifierField(fields.Field):
         """
         batch_identifier = value
 
-        if re.match(pattern=BATCH_IDENTIFIER_REGEXP, string=batch_identifier) is None:
+        if BATCH_IDENTIFIER_PATTERN.fullmatch(batch_identifier) is None:
             raise ValidationError(f'The following identifier `{batch_identifier}` is invalid.')
 
         return batch_identifier
@@ -156,12 +225,34 @@ class NodeUrlField(fields.Field):
         if 'http' in node_url or 'https' in node_url:
             raise ValidationError(f'Pass the following node URL `{node_url}` without protocol (http, https, etc.).')
 
-        if re.match(pattern=DOMAIN_NAME_REGEXP, string=node_url) is None:
+        if DOMAIN_NAME_PATTERN.match(node_url) is None:
             raise ValidationError(f'The following node URL `{node_url}` is invalid.')
 
         return node_url
 
 
+class NodeUrlsListField(fields.Field):
+    """
+    Implements validation of the list of node URLs.
+    """
+
+    def _deserialize(self, value, attr, obj, **kwargs):
+        """
+        Validate data (list of node URLs) that was passed to field.
+        """
+        node_urls = value
+        node_url_field = NodeUrlField()
+        validated_node_urls = []
+
+        for node_url in node_urls.split(','):
+            node_url = node_url_field.deserialize(value=node_url.strip(), attr=attr, data=obj)
+
+            if node_url not in validated_node_urls:
+                validated_node_urls.append(node_url)
+
+        return validated_node_urls
+
+
 class PrivateKeyField(fields.Field):
     """
     Implements validation of the private key.
@@ -173,7 +264,7 @@ class PrivateKeyField(fields.Field):
         """
         private_key = value
 
-        if re.match(pattern=PRIVATE_KEY_REGEXP, string=private_key) is None:
+        if PRIVATE_KEY_PATTERN.fullmatch(private_key) is None:
             raise ValidationError(f'The following private key `{private_key}` is invalid.')
 
         return private_key
@@ -190,12 +281,29 @@ class PublicKeyAddressField(fields.Field):
         """
         public_key_address = value
 
-        if re.match(pattern=PUBLIC_KEY_ADDRESS_REGEXP, string=public_key_address) is None:
+        if PUBLIC_KEY_ADDRESS_PATTERN.fullmatch(public_key_address) is None:
             raise ValidationError(f'The following public key address `{public_key_address}` is invalid.')
 
         return public_key_address
 
 
+class PublicKeyField(fields.Field):
+    """
+    Implements validation of the public key.
+    """
+
+    def _deserialize(self, value, attr, data, **kwargs):
+        """
+        Validate data (public key) that was passed to field.
+        """
+        public_key = value
+
+        if PUBLIC_KEY_PATTERN.fullmatch(public_key) is None:
+            raise ValidationError(f'The following public key `{public_key}` is invalid.')
+
+        return public_key
+
+
 class SwapIdentifierField(fields.Field):
     """
     Implements validation of the swap identifier.
@@ -207,7 +315,7 @@ class SwapIdentifierField(fields.Field):
         """
         swap_identifier = value
 
-        if re.match(pattern=SWAP_IDENTIFIER_REGEXP, string=swap_identifier) is None:
+        if SWAP_IDENTIFIER_PATTERN.fullmatch(swap_identifier) is None:
             raise ValidationError(f'The following swap identifier `{swap_identifier}` is invalid.')
 
         return swap_identifier
@@ -224,7 +332,7 @@ class BlockIdentifierField(fields.Field):
         """
         block_identifier = value
 
-        if re.match(pattern=BLOCK_IDENTIFIER_REGEXP, string=block_identifier) is None:
+        if BLOCK_IDENTIFIER_PATTERN.fullmatch(block_identifier) is None:
             raise ValidationError(f'The following block identifier `{block_identifier}` is invalid.')
 
         return block_identifier
@@ -239,18 +347,12 @@ class BlockIdentifiersListField(fields.Field):
         """
         Validate data (list of block identifiers) that was passed to field.
         """
-        block_identifiers = value
-        block_validated_identifiers = []
-
-        for identifier in block_identifiers.split(','):
-            identifier = identifier.strip()
-
-            if re.match(pattern=BLOCK_IDENTIFIER_REGEXP, string=identifier) is None:
-                raise ValidationError(f'The following block identifier `{identifier}` is invalid.')
-
-            block_validated_identifiers.append(identifier)
-
-        return block_validated_identifiers
+        return validate_identifiers(
+            value=value,
+            pattern=BLOCK_IDENTIFIER_PATTERN,
+            error_message='The following block identifier `{}` is invalid.',
+            are_valid=are_header_signatures,
+        )
 
 
 class BetField(fields.Field):
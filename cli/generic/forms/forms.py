@@ -12,9 +12,26 @@ from cli.generic.forms.fields import (
     NodeUrlField,
     PrivateKeyField,
 )
+from cli.trace import (
+    FORM_TRACE_EVENT,
+    trace,
+)
+
+
+class Form(Schema):
+    """
+    Implements the form of the command's arguments, loading of the form is traced if the execution is traced.
+    """
+
+    def load(self, *args, **kwargs):
+        """
+        Validate and deserialize the data.
+        """
+        with trace(FORM_TRACE_EVENT, form=type(self).__name__):
+            return super().load(*args, **kwargs)
 
 
-class TransferTokensForm(Schema):
+class TransferTokensForm(Form):
     """
     Transfer tokens to address form.
     """
@@ -0,0 +1,122 @@
+"""
+Provide implementation of the command line interface's index commands.
+"""
+import sys
+
+import click
+
+from cli.client import RemmeClient
+from cli.constants import (
+    DEFAULT_PAGE_SIZE,
+    FAILED_EXIT_FROM_COMMAND_CODE,
+    NODE_URL_ARGUMENT_HELP_MESSAGE,
+)
+from cli.index.forms import (
+    QueryIndexForm,
+    SyncIndexForm,
+)
+from cli.index.help import (
+    INDEX_ADDRESS_ARGUMENT_HELP_MESSAGE,
+    INDEX_FAMILY_NAME_ARGUMENT_HELP_MESSAGE,
+    INDEX_LIMIT_ARGUMENT_HELP_MESSAGE,
+    INDEX_PAGE_SIZE_ARGUMENT_HELP_MESSAGE,
+    INDEX_PATH_ARGUMENT_HELP_MESSAGE,
+    INDEX_SIGNER_ARGUMENT_HELP_MESSAGE,
+    INDEX_START_ARGUMENT_HELP_MESSAGE,
+)
+from cli.index.service import Index
+from cli.utils import (
+    default_index_path,
+    default_node_url,
+    print_errors,
+    print_result,
+)
+
+
+@click.group('index', chain=True)
+def index_commands():
+    """
+    Provide commands for working with the local chain index.
+    """
+    pass
+
+
+@click.option('--path', type=str, required=False, help=INDEX_PATH_ARGUMENT_HELP_MESSAGE, default=default_index_path)
+@click.option('--start', type=int, required=False, help=INDEX_START_ARGUMENT_HELP_MESSAGE, default=0)
+@click.option(
+    '--page-size',
+    type=int,
+    required=False,
+    help=INDEX_PAGE_SIZE_ARGUMENT_HELP_MESSAGE,
+    default=DEFAULT_PAGE_SIZE,
+)
+@click.option('--node-url', type=str, required=False, help=NODE_URL_ARGUMENT_HELP_MESSAGE, default=default_node_url)
+@index_commands.command('sync')
+def sync_index(path, start, page_size, node_url):
+    """
+    Index blocks, batches and transactions of the node.
+    """
+    arguments, errors = SyncIndexForm().load({
+        'path': path,
+        'start': start,
+        'page_size': page_size,
+        'node_url': node_url,
+    })
+
+    if errors:
+        print_errors(errors=errors)
+        sys.exit(FAILED_EXIT_FROM_COMMAND_CODE)
+
+    path = arguments.get('path')
+    start = arguments.get('start')
+    page_size = arguments.get('page_size')
+    node_url = arguments.get('node_url')
+
+    remme = RemmeClient.get(node_url=node_url)
+
+    result, errors = Index(service=remme, path=path).sync(start_block_num=start, page_size=page_size)
+
+    if errors is not None:
+        print_errors(errors=errors)
+        sys.exit(FAILED_EXIT_FROM_COMMAND_CODE)
+
+    print_result(result=result)
+
+
+@click.option('--path', type=str, required=False, help=INDEX_PATH_ARGUMENT_HELP_MESSAGE, default=default_index_path)
+@click.option('--family-name', type=str, required=False, help=INDEX_FAMILY_NAME_ARGUMENT_HELP_MESSAGE)
+@click.option('--address', type=str, required=False, help=INDEX_ADDRESS_ARGUMENT_HELP_MESSAGE)
+@click.option('--signer', type=str, required=False, help=INDEX_SIGNER_ARGUMENT_HELP_MESSAGE)
+@click.option('--limit', type=int, required=False, help=INDEX_LIMIT_ARGUMENT_HELP_MESSAGE)
+@index_commands.command('query')
+def query_index(path, family_name, address, signer, limit):
+    """
+    Get a list of the indexed transactions.
+    """
+    arguments, errors = QueryIndexForm().load({
+        'path': path,
+        'family_name': family_name,
+        'address': address,
+        'signer': signer,
+        'limit': limit,
+    })
+
+    if errors:
+        print_errors(errors=errors)
+        sys.exit(FAILED_EXIT_FROM_COMMAND_CODE)
+
+    path = arguments.get('path')
+    family_name = arguments.get('family_name')
+    address = arguments.get('address')
+    signer = arguments.get('signer')
+    limit = arguments.get('limit')
+
+    result, errors = Index(service=None, path=path).get_transactions(
+        family_name=family_name, address=address, signer=signer, limit=limit,
+    )
+
+    if errors is not None:
+        print_errors(errors=errors)
+        sys.exit(FAILED_EXIT_FROM_COMMAND_CODE)
+
+    print_result(result=result)
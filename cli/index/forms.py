@@ -0,0 +1,57 @@
+"""
+Provide forms for command line interface's index commands.
+"""
+from marshmallow import (
+    fields,
+    validate,
+)
+
+from cli.generic.forms.fields import (
+    AccountAddressField,
+    FamilyNameField,
+    NodeUrlField,
+    PublicKeyField,
+)
+from cli.generic.forms.forms import Form
+
+
+class SyncIndexForm(Form):
+    """
+    Index blocks, batches and transactions of the node form.
+    """
+
+    path = fields.String(required=True)
+    start = fields.Integer(
+        strict=True,
+        required=True,
+        validate=[
+            validate.Range(min=0, error='Start must be greater than or equal to 0.'),
+        ],
+    )
+    page_size = fields.Integer(
+        strict=True,
+        required=True,
+        validate=[
+            validate.Range(min=1, error='Page size must be greater than 0.'),
+        ],
+    )
+    node_url = NodeUrlField(required=True)
+
+
+class QueryIndexForm(Form):
+    """
+    Get a list of the indexed transactions form.
+    """
+
+    path = fields.String(required=True)
+    family_name = FamilyNameField(allow_none=True, required=False)
+    address = AccountAddressField(allow_none=True, required=False)
+    signer = PublicKeyField(allow_none=True, required=False)
+    limit = fields.Integer(
+        allow_none=True,
+        strict=True,
+        required=False,
+        validate=[
+            validate.Range(min=1, error='Limit must be greater than 0.'),
+        ],
+    )
@@ -0,0 +1,10 @@
+"""
+Provide help messages for command line interface's index commands.
+"""
+INDEX_PATH_ARGUMENT_HELP_MESSAGE = 'Path to the index\'s database file (`~/.remme-core-cli-index.sqlite3` by default).'
+INDEX_START_ARGUMENT_HELP_MESSAGE = 'Number of the block to index from, e.g. a checkpoint (genesis by default).'
+INDEX_PAGE_SIZE_ARGUMENT_HELP_MESSAGE = 'Maximum amount of blocks to request per page.'
+INDEX_FAMILY_NAME_ARGUMENT_HELP_MESSAGE = 'Family name to get a list of the indexed transactions by.'
+INDEX_ADDRESS_ARGUMENT_HELP_MESSAGE = 'Address the indexed transactions read or write to get a list of them by.'
+INDEX_SIGNER_ARGUMENT_HELP_MESSAGE = 'Public key of the signer to get a list of the indexed transactions by.'
+INDEX_LIMIT_ARGUMENT_HELP_MESSAGE = 'Maximum amount of the indexed transactions to return.'
@@ -0,0 +1,41 @@
+"""
+Provide implementation of the index interfaces.
+"""
+
+
+class IndexInterface:
+    """
+    Implements index interface.
+    """
+
+    async def sync_async(self, start_block_num, page_size):
+        """
+        Index blocks from the node's head down to the start block number.
+
+        Arguments:
+            start_block_num (int, required): number of the block to index from, e.g. a checkpoint.
+            page_size (int, required): maximum amount of blocks to request per page.
+        """
+        pass
+
+    def sync(self, start_block_num, page_size):
+        """
+        Index blocks from the node's head down to the start block number.
+
+        Arguments:
+            start_block_num (int, required): number of the block to index from, e.g. a checkpoint.
+            page_size (int, required): maximum amount of blocks to request per page.
+        """
+        pass
+
+    def get_transactions(self, family_name, address, signer, limit):
+        """
+        Get a list of the indexed transactions, the latest first.
+
+        Arguments:
+            family_name (string, optional): family name to get a list of transactions by.
+            address (string, optional): address to get a list of transactions by.
+            signer (string, optional): public key of the signer to get a list of transactions by.
+            limit (int, optional): maximum amount of transactions to return.
+        """
+        pass
@@ -0,0 +1,302 @@
+"""
+Provide implementation of the local chain index.
+"""
+import sqlite3
+
+from accessify import implements
+
+from cli.block.service import Block
+from cli.index.interfaces import IndexInterface
+from cli.utils import run_until_complete
+
+INDEX_SCHEMA = (
+    'CREATE TABLE IF NOT EXISTS blocks ('
+    'block_num INTEGER PRIMARY KEY, '
+    'header_signature TEXT NOT NULL UNIQUE, '
+    'previous_block_id TEXT, '
+    'signer_public_key TEXT, '
+    'state_root_hash TEXT)',
+    'CREATE TABLE IF NOT EXISTS batches ('
+    'header_signature TEXT PRIMARY KEY, '
+    'block_num INTEGER NOT NULL, '
+    'signer_public_key TEXT)',
+    'CREATE TABLE IF NOT EXISTS transactions ('
+    'header_signature TEXT PRIMARY KEY, '
+    'block_num INTEGER NOT NULL, '
+    'batch_id TEXT NOT NULL, '
+    'family_name TEXT, '
+    'family_version TEXT, '
+    'signer_public_key TEXT)',
+    'CREATE TABLE IF NOT EXISTS transaction_addresses ('
+    'transaction_id TEXT NOT NULL, '
+    'block_num INTEGER NOT NULL, '
+    'address TEXT NOT NULL, '
+    'PRIMARY KEY (address, transaction_id))',
+    'CREATE INDEX IF NOT EXISTS blocks_signer_public_key ON blocks (signer_public_key)',
+    'CREATE INDEX IF NOT EXISTS batches_block_num ON batches (block_num)',
+    'CREATE INDEX IF NOT EXISTS transactions_block_num ON transactions (block_num)',
+    'CREATE INDEX IF NOT EXISTS transactions_family_name ON transactions (family_name, block_num)',
+    'CREATE INDEX IF NOT EXISTS transactions_signer_public_key ON transactions (signer_public_key, block_num)',
+    'CREATE INDEX IF NOT EXISTS transaction_addresses_block_num ON transaction_addresses (block_num)',
+)
+
+
+@implements(IndexInterface)
+class Index:
+    """
+    Implements local chain index.
+
+    Blocks, batches and transactions are stored to the SQLite database with indexes on block number, signer,
+    family name and address, so lookups like transactions of the family for the address do not scan the node.
+    """
+
+    def __init__(self, service, path):
+        """
+        Constructor.
+
+        Arguments:
+            service: object to interact with Remme core API.
+            path (string, required): path to the index's database file.
+        """
+        self.service = service
+        self.path = path
+
+        self._connection = None
+
+    @property
+    def connection(self):
+        """
+        Get connection to the index's database, create the index's tables on the first access.
+        """
+        if self._connection is None:
+            connection = sqlite3.connect(self.path)
+
+            for statement in INDEX_SCHEMA:
+                connection.execute(statement)
+
+            connection.commit()
+
+            self._connection = connection
+
+        return self._connection
+
+    def get_indexed_block_identifier(self, block_num):
+        """
+        Get identifier of the indexed block by its number, none if the block isn't indexed.
+        """
+        row = self.connection.execute(
+            'SELECT header_signature FROM blocks WHERE block_num = ?', (block_num,),
+        ).fetchone()
+
+        return row[0] if row is not None else None
+
+    def remove_block(self, block_num):
+        """
+        Remove the indexed block by its number with its batches and transactions.
+        """
+        for table in ('transaction_addresses', 'transactions', 'batches', 'blocks'):
+            self.connection.execute(f'DELETE FROM {table} WHERE block_num = ?', (block_num,))
+
+    def remove_blocks_above(self, block_num):
+        """
+        Remove the indexed blocks above the block number with their batches and transactions.
+        """
+        for table in ('transaction_addresses', 'transactions', 'batches', 'blocks'):
+            self.connection.execute(f'DELETE FROM {table} WHERE block_num > ?', (block_num,))
+
+    def store_block(self, block):
+        """
+        Store the block with its batches, transactions, transactions' families and addresses.
+        """
+        block_header = block.get('header')
+        block_num = int(block_header.get('block_num'))
+
+        self.remove_block(block_num=block_num)
+
+        self.connection.execute('INSERT INTO blocks VALUES (?, ?, ?, ?, ?)', (
+            block_num,
+            block.get('header_signature'),
+            block_header.get('previous_block_id'),
+            block_header.get('signer_public_key'),
+            block_header.get('state_root_hash'),
+        ))
+
+        transactions_amount = 0
+
+        for batch in block.get('batches') or []:
+            self.connection.execute('INSERT OR REPLACE INTO batches VALUES (?, ?, ?)', (
+                batch.get('header_signature'), block_num, batch.get('header').get('signer_public_key'),
+            ))
+
+            for transaction in batch.get('transactions') or []:
+                transaction_header = transaction.get('header')
+                transaction_id = transaction.get('header_signature')
+
+                self.connection.execute('INSERT OR REPLACE INTO transactions VALUES (?, ?, ?, ?, ?, ?)', (
+                    transaction_id,
+                    block_num,
+                    batch.get('header_signature'),
+                    transaction_header.get('family_name'),
+                    transaction_header.get('family_version'),
+                    transaction_header.get('signer_public_key'),
+                ))
+
+                addresses = set(transaction_header.get('inputs') or []) | set(transaction_header.get('outputs') or [])
+
+                self.connection.executemany('INSERT OR REPLACE INTO transaction_addresses VALUES (?, ?, ?)', [
+                    (transaction_id, block_num, address) for address in addresses
+                ])
+
+                transactions_amount += 1
+
+        return len(block.get('batches') or []), transactions_amount
+
+    def get_lowest_contiguous_block(self, block_num):
+        """
+        Get number and previous block identifier of the lowest block indexed without gaps up to the block number.
+        """
+        return self.connection.execute(
+            'SELECT block_num, previous_block_id FROM blocks AS block WHERE block_num <= ? AND NOT EXISTS ('
+            'SELECT 1 FROM blocks WHERE blocks.block_num = block.block_num - 1) ORDER BY block_num DESC LIMIT 1',
+            (block_num,),
+        ).fetchone()
+
+    async def _index_blocks(self, head, start_block_num, page_size, indexed):
+        """
+        Index blocks from the head down to the first already indexed block or the start block number.
+
+        Returns number of the first already indexed block (none if the walk reached the start or genesis) and errors.
+        """
+        async for blocks, errors in Block(service=self.service).get_pages_async(
+            ids=None, head=head, limit=None, reverse=False, page_size=page_size,
+        ):
+            if errors is not None:
+                return None, errors
+
+            with self.connection:
+                for block in blocks:
+                    block_num = int(block.get('header').get('block_num'))
+
+                    if indexed.get('head') is None:
+                        indexed['head'] = block_num
+                        self.remove_blocks_above(block_num=block_num)
+
+                    if block_num < start_block_num:
+                        return None, None
+
+                    if self.get_indexed_block_identifier(block_num=block_num) == block.get('header_signature'):
+                        return block_num, None
+
+                    batches_amount, transactions_amount = self.store_block(block=block)
+
+                    indexed['blocks'] += 1
+                    indexed['batches'] += batches_amount
+                    indexed['transactions'] += transactions_amount
+
+        return None, None
+
+    async def sync_async(self, start_block_num, page_size):
+        """
+        Index blocks from the node's head down to the start block number.
+
+        Blocks are walked from the head, so already indexed blocks are not requested again: on the first indexed
+        block the walk jumps below the blocks indexed without gaps, e.g. left by an interrupted synchronization.
+        If the indexed block differs from the node's block with the same number (the chain was forked),
+        it is replaced, and indexed blocks above the node's head (the node switched to a shorter fork) are removed.
+        Every page of blocks is committed at once, so an interrupted synchronization keeps progress.
+
+        Arguments:
+            start_block_num (int, required): number of the block to index from, e.g. a checkpoint.
+            page_size (int, required): maximum amount of blocks to request per page.
+        """
+        indexed = {'blocks': 0, 'batches': 0, 'transactions': 0, 'head': None}
+        head = None
+
+        try:
+            while True:
+                indexed_block_num, errors = await self._index_blocks(
+                    head=head, start_block_num=start_block_num, page_size=page_size, indexed=indexed,
+                )
+
+                if errors is not None:
+                    return None, errors
+
+                if indexed_block_num is None:
+                    break
+
+                lowest_block_num, previous_block_id = self.get_lowest_contiguous_block(block_num=indexed_block_num)
+
+                if lowest_block_num <= start_block_num or not previous_block_id or set(previous_block_id) == {'0'}:
+                    break
+
+                head = previous_block_id
+
+        except sqlite3.Error as error:
+            return None, str(error)
+
+        return indexed, None
+
+    def sync(self, start_block_num, page_size):
+        """
+        Index blocks from the node's head down to the last indexed block or the start block number.
+
+        Arguments:
+            start_block_num (int, required): number of the block to index from, e.g. a checkpoint.
+            page_size (int, required): maximum amount of blocks to request per page.
+        """
+        return run_until_complete(self.sync_async(start_block_num=start_block_num, page_size=page_size))
+
+    def get_transactions(self, family_name, address, signer, limit):
+        """
+        Get a list of the indexed transactions, the latest first.
+
+        A list of transactions could be filtered by family name, address the transaction reads or writes, signer.
+
+        Arguments:
+            family_name (string, optional): family name to get a list of transactions by.
+            address (string, optional): address to get a list of transactions by.
+            signer (string, optional): public key of the signer to get a list of transactions by.
+            limit (int, optional): maximum amount of transactions to return.
+        """
+        query = 'SELECT transactions.header_signature, transactions.block_num, transactions.batch_id, ' \
+                'transactions.family_name, transactions.family_version, transactions.signer_public_key ' \
+                'FROM transactions'
+        conditions, parameters = [], []
+
+        if address is not None:
+            query += ' JOIN transaction_addresses ' \
+                     'ON transaction_addresses.transaction_id = transactions.header_signature'
+            conditions.append('transaction_addresses.address = ?')
+            parameters.append(address)
+
+        if family_name is not None:
+            conditions.append('transactions.family_name = ?')
+            parameters.append(family_name)
+
+        if signer is not None:
+            conditions.append('transactions.signer_public_key = ?')
+            parameters.append(signer)
+
+        if conditions:
+            query += ' WHERE ' + ' AND '.join(conditions)
+
+        query += ' ORDER BY transactions.block_num DESC'
+
+        if limit is not None:
+            query += ' LIMIT ?'
+            parameters.append(limit)
+
+        try:
+            rows = self.connection.execute(query, parameters).fetchall()
+
+        except sqlite3.Error as error:
+            return None, str(error)
+
+        return [{
+            'header_signature': header_signature,
+            'block_num': block_num,
+            'batch_id': batch_id,
+            'family_name': family_name,
+            'family_version': family_version,
+            'signer_public_key': signer_public_key,
+        } for header_signature, block_num, batch_id, family_name, family_version, signer_public_key in rows], None
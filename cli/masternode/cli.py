@@ -4,9 +4,10 @@ Provide implementation of the command line interface's masternode commands.
 import sys
 
 import click
-from remme import Remme
 from remme.models.account.account_type import AccountType
 
+from cli.cache import ReadCache
+from cli.client import RemmeClient
 from cli.config import NodePrivateKey
 from cli.constants import FAILED_EXIT_FROM_COMMAND_CODE
 from cli.errors import (
@@ -59,12 +60,9 @@ def open(amount):
         print_errors(errors=str(error))
         sys.exit(FAILED_EXIT_FROM_COMMAND_CODE)
 
-    remme = Remme(
-        account_config={'private_key_hex': node_private_key, 'account_type': AccountType.NODE},
-        network_config={'node_address': 'localhost' + ':8080'},
-    )
+    remme = RemmeClient.get(node_url='localhost', private_key=node_private_key, account_type=AccountType.NODE)
 
-    result, errors = Masternode(service=remme).open(amount=amount)
+    result, errors = Masternode(service=remme, cache=ReadCache.get()).open(amount=amount)
 
     if errors is not None:
         print_errors(errors=errors)
@@ -85,12 +83,9 @@ def close():
         print_errors(errors=str(error))
         sys.exit(FAILED_EXIT_FROM_COMMAND_CODE)
 
-    remme = Remme(
-        account_config={'private_key_hex': node_private_key, 'account_type': AccountType.NODE},
-        network_config={'node_address': 'localhost' + ':8080'},
-    )
+    remme = RemmeClient.get(node_url='localhost', private_key=node_private_key, account_type=AccountType.NODE)
 
-    result, errors = Masternode(service=remme).close()
+    result, errors = Masternode(service=remme, cache=ReadCache.get()).close()
 
     if errors is not None:
         print_errors(errors=errors)
@@ -122,13 +117,10 @@ def set_bet(bet):
         print_errors(errors=str(error))
         sys.exit(FAILED_EXIT_FROM_COMMAND_CODE)
 
-    remme = Remme(
-        account_config={'private_key_hex': node_private_key, 'account_type': AccountType.NODE},
-        network_config={'node_address': 'localhost' + ':8080'},
-    )
+    remme = RemmeClient.get(node_url='localhost', private_key=node_private_key, account_type=AccountType.NODE)
 
     try:
-        result, errors = Masternode(service=remme).set_bet(bet=bet)
+        result, errors = Masternode(service=remme, cache=ReadCache.get()).set_bet(bet=bet)
 
     except NotSupportedBetError as error:
         print_errors(errors=str(error))
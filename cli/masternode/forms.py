@@ -2,15 +2,15 @@
 Provide forms for command line interface's masternode commands.
 """
 from marshmallow import (
-    Schema,
     fields,
     validate,
 )
 
 from cli.generic.forms.fields import BetField
+from cli.generic.forms.forms import Form
 
 
-class OpenMasternodeForm(Schema):
+class OpenMasternodeForm(Form):
     """
     Open the masternode with starting amount form.
     """
@@ -24,7 +24,7 @@ class OpenMasternodeForm(Schema):
     )
 
 
-class SetBetMasternodeForm(Schema):
+class SetBetMasternodeForm(Form):
     """
     Set the masternode betting behavior form.
     """
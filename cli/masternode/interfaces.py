@@ -8,18 +8,40 @@ class MasternodeInterface:
     Implements masternode interface.
     """
 
+    async def open_async(self, amount):
+        """
+        Open the masternode with starting amount.
+        """
+        pass
+
     def open(self, amount):
         """
         Open the masternode with starting amount.
         """
         pass
 
+    async def close_async(self):
+        """
+        Close the masternode.
+        """
+        pass
+
     def close(self):
         """
         Close the masternode.
         """
         pass
 
+    async def set_bet_async(self, bet):
+        """
+        Set the masternode betting behavior.
+
+        Arguments:
+            bet (string or integer, required): type of bet to set to the masternode account. Valid bet is
+                                               `min` or `max` as strings, or an integer value (e.g. 20).
+        """
+        pass
+
     def set_bet(self, bet):
         """
         Set the masternode betting behavior.
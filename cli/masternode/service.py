@@ -1,14 +1,12 @@
 """
 Provide implementation of the masternode.
 """
-import asyncio
-
 from accessify import implements
 
+from cli.cache import invalidates_reads
 from cli.errors import NotSupportedBetError
 from cli.masternode.interfaces import MasternodeInterface
-
-loop = asyncio.get_event_loop()
+from cli.utils import run_until_complete
 
 
 @implements(MasternodeInterface)
@@ -17,23 +15,24 @@ class Masternode:
     Implements masternode.
     """
 
-    def __init__(self, service):
+    def __init__(self, service, cache=None):
         """
         Constructor.
 
         Arguments:
             service: object to interact with Remme core API.
+            cache (ReadCache, optional): in-process cache of the reads to drop after sending transactions.
         """
         self.service = service
+        self.cache = cache
 
-    def open(self, amount):
+    @invalidates_reads
+    async def open_async(self, amount):
         """
         Open the masternode with starting amount.
         """
         try:
-            open_masternode = loop.run_until_complete(
-                self.service.node_management.open_master_node(amount=amount),
-            )
+            open_masternode = await self.service.node_management.open_master_node(amount=amount)
 
         except Exception as error:
             return None, str(error)
@@ -42,14 +41,19 @@ class Masternode:
             'batch_id': open_masternode.batch_id,
         }, None
 
-    def close(self):
+    def open(self, amount):
+        """
+        Open the masternode with starting amount.
+        """
+        return run_until_complete(self.open_async(amount=amount))
+
+    @invalidates_reads
+    async def close_async(self):
         """
         Close the masternode.
         """
         try:
-            close_masternode = loop.run_until_complete(
-                self.service.node_management.close_master_node(),
-            )
+            close_masternode = await self.service.node_management.close_master_node()
 
         except Exception as error:
             return None, str(error)
@@ -58,7 +62,14 @@ class Masternode:
             'batch_id': close_masternode.batch_id,
         }, None
 
-    def set_bet(self, bet):
+    def close(self):
+        """
+        Close the masternode.
+        """
+        return run_until_complete(self.close_async())
+
+    @invalidates_reads
+    async def set_bet_async(self, bet):
         """
         Set the masternode betting behavior.
 
@@ -76,9 +87,7 @@ class Masternode:
                 )
 
         try:
-            masternode_bet = loop.run_until_complete(
-                self.service.node_management.set_bet(bet_type=bet),
-            )
+            masternode_bet = await self.service.node_management.set_bet(bet_type=bet)
 
         except Exception as error:
             return None, str(error)
@@ -86,3 +95,13 @@ class Masternode:
         return {
             'batch_id': masternode_bet.batch_id,
         }, None
+
+    def set_bet(self, bet):
+        """
+        Set the masternode betting behavior.
+
+        Arguments:
+            bet (string or integer, required): type of bet to set to the masternode account. Valid bet is
+                                               `min` or `max` as strings, or an integer value (e.g. 20).
+        """
+        return run_until_complete(self.set_bet_async(bet=bet))
@@ -0,0 +1,106 @@
+"""
+Provide implementation of the command line interface's mock node command.
+"""
+import sys
+
+import click
+
+from cli.constants import (
+    DEFAULT_MOCK_NODE_BLOCKS_AMOUNT,
+    DEFAULT_MOCK_NODE_HOST,
+    DEFAULT_MOCK_NODE_TRANSACTIONS_PER_BLOCK,
+    FAILED_EXIT_FROM_COMMAND_CODE,
+    NODE_PORT,
+)
+from cli.mock_node.forms import RunMockNodeForm
+from cli.mock_node.help import (
+    MOCK_NODE_BLOCKS_ARGUMENT_HELP_MESSAGE,
+    MOCK_NODE_ERROR_RATE_ARGUMENT_HELP_MESSAGE,
+    MOCK_NODE_HOST_ARGUMENT_HELP_MESSAGE,
+    MOCK_NODE_LATENCY_ARGUMENT_HELP_MESSAGE,
+    MOCK_NODE_PORT_ARGUMENT_HELP_MESSAGE,
+    MOCK_NODE_SEED_ARGUMENT_HELP_MESSAGE,
+    MOCK_NODE_TRANSACTIONS_PER_BLOCK_ARGUMENT_HELP_MESSAGE,
+)
+from cli.mock_node.service import (
+    MockNode,
+    SyntheticChain,
+)
+from cli.utils import (
+    get_event_loop,
+    print_errors,
+    print_result,
+)
+
+
+@click.option(
+    '--host', type=str, required=False, default=DEFAULT_MOCK_NODE_HOST, help=MOCK_NODE_HOST_ARGUMENT_HELP_MESSAGE,
+)
+@click.option('--port', type=int, required=False, default=NODE_PORT, help=MOCK_NODE_PORT_ARGUMENT_HELP_MESSAGE)
+@click.option(
+    '--blocks', type=int, required=False, default=DEFAULT_MOCK_NODE_BLOCKS_AMOUNT,
+    help=MOCK_NODE_BLOCKS_ARGUMENT_HELP_MESSAGE,
+)
+@click.option(
+    '--transactions-per-block', type=int, required=False, default=DEFAULT_MOCK_NODE_TRANSACTIONS_PER_BLOCK,
+    help=MOCK_NODE_TRANSACTIONS_PER_BLOCK_ARGUMENT_HELP_MESSAGE,
+)
+@click.option('--latency', type=float, required=False, default=0, help=MOCK_NODE_LATENCY_ARGUMENT_HELP_MESSAGE)
+@click.option('--error-rate', type=float, required=False, default=0, help=MOCK_NODE_ERROR_RATE_ARGUMENT_HELP_MESSAGE)
+@click.option('--seed', type=int, required=False, default=0, help=MOCK_NODE_SEED_ARGUMENT_HELP_MESSAGE)
+@click.command('mock-node')
+def mock_node_command(host, port, blocks, transactions_per_block, latency, error_rate, seed):
+    """
+    Run the local mock node serving a synthetic chain.
+    """
+    arguments, errors = RunMockNodeForm().load({
+        'host': host,
+        'port': port,
+        'blocks': blocks,
+        'transactions_per_block': transactions_per_block,
+        'latency': latency,
+        'error_rate': error_rate,
+        'seed': seed,
+    })
+
+    if errors:
+        print_errors(errors=errors)
+        sys.exit(FAILED_EXIT_FROM_COMMAND_CODE)
+
+    chain = SyntheticChain(
+        blocks_amount=arguments.get('blocks'),
+        transactions_per_block=arguments.get('transactions_per_block'),
+        seed=arguments.get('seed'),
+    )
+
+    mock_node = MockNode(
+        chain=chain,
+        latency=arguments.get('latency'),
+        error_rate=arguments.get('error_rate'),
+        seed=arguments.get('seed'),
+    )
+
+    try:
+        port = mock_node.start(host=arguments.get('host'), port=arguments.get('port'))
+
+    except OSError as error:
+        print_errors(errors=str(error))
+        sys.exit(FAILED_EXIT_FROM_COMMAND_CODE)
+
+    print_result(result={
+        'node_url': arguments.get('host'),
+        'port': port,
+        'head': {
+            'block_id': chain.head.get('header_signature'),
+            'block_num': len(chain.blocks) - 1,
+        },
+    })
+
+    try:
+        get_event_loop().run_forever()
+
+    except KeyboardInterrupt:
+        pass
+
+    finally:
+        mock_node.stop()
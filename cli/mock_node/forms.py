@@ -0,0 +1,51 @@
+"""
+Provide forms for command line interface's mock node command.
+"""
+from marshmallow import (
+    fields,
+    validate,
+)
+
+from cli.generic.forms.forms import Form
+
+
+class RunMockNodeForm(Form):
+    """
+    Run the mock node form.
+    """
+
+    host = fields.String(required=True)
+    port = fields.Integer(
+        strict=True,
+        required=True,
+        validate=[
+            validate.Range(min=0, max=65535, error='Port must be between 0 and 65535.'),
+        ],
+    )
+    blocks = fields.Integer(
+        strict=True,
+        required=True,
+        validate=[
+            validate.Range(min=1, error='Blocks must be greater than 0.'),
+        ],
+    )
+    transactions_per_block = fields.Integer(
+        strict=True,
+        required=True,
+        validate=[
+            validate.Range(min=0, error='Transactions per block must be greater than or equal to 0.'),
+        ],
+    )
+    latency = fields.Float(
+        required=True,
+        validate=[
+            validate.Range(min=0, error='Latency must be greater than or equal to 0.'),
+        ],
+    )
+    error_rate = fields.Float(
+        required=True,
+        validate=[
+            validate.Range(min=0, max=1, error='Error rate must be between 0 and 1.'),
+        ],
+    )
+    seed = fields.Integer(strict=True, required=True)
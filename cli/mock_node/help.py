@@ -0,0 +1,10 @@
+"""
+Provide help messages for command line interface's mock node command.
+"""
+MOCK_NODE_HOST_ARGUMENT_HELP_MESSAGE = 'Host to listen to.'
+MOCK_NODE_PORT_ARGUMENT_HELP_MESSAGE = 'Port to listen to, a free one is chosen if it is 0.'
+MOCK_NODE_BLOCKS_ARGUMENT_HELP_MESSAGE = 'Amount of blocks of the synthetic chain, including the genesis one.'
+MOCK_NODE_TRANSACTIONS_PER_BLOCK_ARGUMENT_HELP_MESSAGE = 'Amount of transactions (and batches) per block.'
+MOCK_NODE_LATENCY_ARGUMENT_HELP_MESSAGE = 'Seconds to delay every response by.'
+MOCK_NODE_ERROR_RATE_ARGUMENT_HELP_MESSAGE = 'Share of the requests (from 0 to 1) to fail.'
+MOCK_NODE_SEED_ARGUMENT_HELP_MESSAGE = 'Seed to build the chain and the random failures from.'
@@ -0,0 +1,33 @@
+"""
+Provide implementation of the mock node interfaces.
+"""
+
+
+class MockNodeInterface:
+    """
+    Implements mock node interface.
+    """
+
+    async def start_async(self, host, port):
+        """
+        Start serving the chain.
+        """
+        pass
+
+    def start(self, host, port):
+        """
+        Start serving the chain.
+        """
+        pass
+
+    async def stop_async(self):
+        """
+        Stop serving the chain, close connections of the clients.
+        """
+        pass
+
+    def stop(self):
+        """
+        Stop serving the chain, close connections of the clients.
+        """
+        pass
@@ -0,0 +1,678 @@
+"""
+Provide implementation of the mock node.
+"""
+import asyncio
+import base64
+import bisect
+import hashlib
+import random
+import re
+
+import aiohttp.web
+from accessify import implements
+from aiohttp_json_rpc import (
+    JsonRpc,
+    RpcGenericServerDefinedError,
+)
+from remme.models.general.methods import RemmeMethods
+from remme.models.utils.family_name import RemmeFamilyName
+from remme.utils import generate_settings_address
+from sawtooth_sdk.protobuf.setting_pb2 import Setting
+
+from cli.constants import (
+    ACCOUNT_FAMILY_VERSION,
+    BLOCK_NUMBER_PAGING_POSITION,
+    COMMITTED_BATCH_STATUS,
+    DEFAULT_PAGE_SIZE,
+    MOCK_NODE_ERROR_CODE,
+    MOCK_NODE_INITIAL_STAKE,
+    MOCK_NODE_MAX_PAGE_SIZE,
+    UNKNOWN_BATCH_STATUS,
+)
+from cli.mock_node.interfaces import MockNodeInterface
+from cli.utils import (
+    get_event_loop,
+    run_until_complete,
+)
+
+
+def get_identifier(*parts):
+    """
+    Get the deterministic identifier (hex of SHA-512, as the chain objects' identifiers are) of the parts.
+    """
+    return hashlib.sha512(':'.join(str(part) for part in parts).encode()).hexdigest()
+
+
+STAKE_SETTINGS_ADDRESS = generate_settings_address(key='remme.settings.minimum_stake')
+
+
+class SyntheticChain:
+    """
+    Implements synthetic chain of blocks, batches and transactions.
+
+    The chain is built from the seed, so chains with the same size and seed have the same identifiers. As the node
+    packs each transaction to its own batch, every batch of the chain has a single transaction. Every transaction
+    writes the state to its own address, the transaction's receipt contains the state's change.
+    """
+
+    def __init__(self, blocks_amount, transactions_per_block, seed=0):
+        """
+        Constructor.
+
+        Arguments:
+            blocks_amount (int, required): amount of blocks of the chain, including the genesis one.
+            transactions_per_block (int, required): amount of transactions (and batches) per block.
+            seed (int, optional): seed to build identifiers of the chain's objects from.
+        """
+        self.blocks = []
+        self.batches = []
+        self.transactions = []
+
+        self.states = []
+
+        self.blocks_by_identifiers = {}
+        self.batches_by_identifiers = {}
+        self.transactions_by_identifiers = {}
+        self.receipts_by_identifiers = {}
+        self.block_nums = {}
+
+        self.blocks_indices = {}
+        self.batches_indices = {}
+        self.transactions_indices = {}
+        self.states_indices = {}
+        self.batches_block_nums = []
+        self.transactions_block_nums = []
+        self.states_block_nums = []
+
+        previous_block_id = '0' * 16
+        signer_public_key = '02' + get_identifier(seed, 'signer')[:64]
+
+        for block_num in range(blocks_amount):
+            batches = [
+                self.build_batch(
+                    seed=seed,
+                    block_num=block_num,
+                    index=index,
+                    signer_public_key=signer_public_key,
+                ) for index in range(transactions_per_block if block_num else 0)
+            ]
+
+            block = {
+                'header_signature': get_identifier(seed, 'block', block_num),
+                'header': {
+                    'block_num': str(block_num),
+                    'previous_block_id': previous_block_id,
+                    'signer_public_key': signer_public_key,
+                    'state_root_hash': get_identifier(seed, 'state', block_num)[:64],
+                    'batch_ids': [batch.get('header_signature') for batch in batches],
+                    'consensus': '',
+                },
+                'batches': batches,
+            }
+
+            self.add_block(block=block)
+
+            previous_block_id = block.get('header_signature')
+
+    @staticmethod
+    def build_batch(seed, block_num, index, signer_public_key):
+        """
+        Build the batch with the single transaction to transfer tokens.
+        """
+        payload = get_identifier(seed, 'payload', block_num, index).encode()
+        address = '112007' + get_identifier(seed, 'address', block_num, index)[:64]
+
+        transaction = {
+            'header_signature': get_identifier(seed, 'transaction', block_num, index),
+            'header': {
+                'family_name': RemmeFamilyName.ACCOUNT.value,
+                'family_version': ACCOUNT_FAMILY_VERSION,
+                'inputs': [address],
+                'outputs': [address],
+                'signer_public_key': signer_public_key,
+                'batcher_public_key': signer_public_key,
+                'nonce': get_identifier(seed, 'nonce', block_num, index),
+                'dependencies': [],
+                'payload_sha512': hashlib.sha512(payload).hexdigest(),
+            },
+            'payload': base64.b64encode(payload).decode('utf-8'),
+        }
+
+        return {
+            'header_signature': get_identifier(seed, 'batch', block_num, index),
+            'header': {
+                'signer_public_key': signer_public_key,
+                'transaction_ids': [transaction.get('header_signature')],
+            },
+            'transactions': [transaction],
+            'trace': False,
+        }
+
+    def add_block(self, block):
+        """
+        Add the block with its batches and transactions to the head of the chain.
+        """
+        block_num = int(block.get('header').get('block_num'))
+
+        self.blocks_indices[block.get('header_signature')] = len(self.blocks)
+        self.blocks.append(block)
+        self.blocks_by_identifiers[block.get('header_signature')] = block
+        self.block_nums[block.get('header_signature')] = block_num
+
+        for batch in block.get('batches'):
+            self.batches_indices[batch.get('header_signature')] = len(self.batches)
+            self.batches.append(batch)
+            self.batches_block_nums.append(block_num)
+            self.batches_by_identifiers[batch.get('header_signature')] = batch
+            self.block_nums[batch.get('header_signature')] = block_num
+
+            for transaction in batch.get('transactions'):
+                self.transactions_indices[transaction.get('header_signature')] = len(self.transactions)
+                self.transactions.append(transaction)
+                self.transactions_block_nums.append(block_num)
+                self.transactions_by_identifiers[transaction.get('header_signature')] = transaction
+                self.block_nums[transaction.get('header_signature')] = block_num
+
+                state_changes = []
+
+                for address in transaction.get('header').get('outputs'):
+                    state = {'address': address, 'data': transaction.get('payload')}
+
+                    self.states_indices[address] = len(self.states)
+                    self.states.append(state)
+                    self.states_block_nums.append(block_num)
+
+                    state_changes.append({'address': address, 'type': 'SET', 'value': state.get('data')})
+
+                self.receipts_by_identifiers[transaction.get('header_signature')] = {
+                    'id': transaction.get('header_signature'),
+                    'data': [],
+                    'events': [],
+                    'state_changes': state_changes,
+                }
+
+    @property
+    def head(self):
+        """
+        Get the head block of the chain.
+        """
+        return self.blocks[-1]
+
+
+@implements(MockNodeInterface)
+class MockNode:
+    """
+    Implements mock node, a stand-in for Remme core's JSON-RPC API serving the synthetic chain.
+
+    The mock node speaks JSON-RPC over the websocket as the node does, so Remme core API (and the command line
+    interface) works with it as with the node. Every request could be delayed by the latency and failed with
+    the error rate, the random failures are repeatable with the seed.
+    """
+
+    def __init__(self, chain, latency=0, error_rate=0, seed=None):
+        """
+        Constructor.
+
+        Arguments:
+            chain (SyntheticChain, required): chain to serve.
+            latency (float, optional): seconds to delay every response by.
+            error_rate (float, optional): share of the requests (from 0 to 1) to fail.
+            seed (int, optional): seed of the random failures.
+        """
+        self.chain = chain
+        self.latency = latency
+        self.error_rate = error_rate
+
+        self.random = random.Random(seed)
+        self.requests_amount = 0
+        self.sent_batches = {}
+
+        self._runner = None
+
+    @property
+    def methods(self):
+        """
+        Get the JSON-RPC methods the mock node serves by Remme core API's methods.
+        """
+        return {
+            RemmeMethods.BLOCKS: self.list_blocks,
+            RemmeMethods.FETCH_BLOCK: self.fetch_block,
+            RemmeMethods.BATCHES: self.list_batches,
+            RemmeMethods.FETCH_BATCH: self.fetch_batch,
+            RemmeMethods.BATCH_STATUS: self.get_batch_status,
+            RemmeMethods.TRANSACTIONS: self.list_transactions,
+            RemmeMethods.FETCH_TRANSACTION: self.fetch_transaction,
+            RemmeMethods.RECEIPTS: self.list_receipts,
+            RemmeMethods.STATE: self.list_state,
+            RemmeMethods.FETCH_STATE: self.fetch_state,
+            RemmeMethods.TOKEN: self.get_balance,
+            RemmeMethods.PUBLIC_KEY: self.get_public_key_info,
+            RemmeMethods.USER_PUBLIC_KEY: self.get_public_keys_list,
+            RemmeMethods.ATOMIC_SWAP: self.get_atomic_swap_info,
+            RemmeMethods.ATOMIC_SWAP_PUBLIC_KEY: self.get_atomic_swap_public_key,
+            RemmeMethods.NETWORK_STATUS: self.get_node_info,
+            RemmeMethods.PEERS: self.fetch_peers,
+            RemmeMethods.NODE_CONFIG: self.get_node_config,
+            RemmeMethods.NODE_KEY: self.get_node_public_key,
+            RemmeMethods.NODE_ACCOUNT: self.get_node_account,
+            RemmeMethods.TRANSACTION: self.send_raw_transaction,
+        }
+
+    async def start_async(self, host, port):
+        """
+        Start serving the chain.
+
+        Arguments:
+            host (string, required): host to listen to.
+            port (int, required): port to listen to, a free one is chosen if it is 0.
+
+        Returns the port the mock node listens to.
+        """
+        rpc = JsonRpc(loop=get_event_loop())
+        rpc.add_methods(*[('', method, remme_method.value) for remme_method, method in self.methods.items()])
+
+        application = aiohttp.web.Application()
+        # JSON-RPC handler is the handler's method since aiohttp-json-rpc 0.12 and the handler itself before.
+        application.router.add_route('*', '/', getattr(rpc, 'handle_request', rpc))
+
+        self._runner = aiohttp.web.AppRunner(application)
+        await self._runner.setup()
+
+        await aiohttp.web.TCPSite(self._runner, host=host, port=port).start()
+
+        return self._runner.addresses[0][1]
+
+    def start(self, host, port):
+        """
+        Start serving the chain.
+
+        Arguments:
+            host (string, required): host to listen to.
+            port (int, required): port to listen to, a free one is chosen if it is 0.
+        """
+        return run_until_complete(self.start_async(host=host, port=port))
+
+    async def stop_async(self):
+        """
+        Stop serving the chain, close connections of the clients.
+        """
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+    def stop(self):
+        """
+        Stop serving the chain, close connections of the clients.
+        """
+        return run_until_complete(self.stop_async())
+
+    async def respond(self, params):
+        """
+        Delay the response by the latency and fail it with the error rate.
+
+        Returns parameters of the request.
+        """
+        self.requests_amount += 1
+
+        if self.latency:
+            await asyncio.sleep(self.latency)
+
+        if self.error_rate and self.random.random() < self.error_rate:
+            raise RpcGenericServerDefinedError(error_code=MOCK_NODE_ERROR_CODE, message='Mock node\'s failure.')
+
+        return params or {}
+
+    @staticmethod
+    def fail(message):
+        """
+        Fail the request with the message as the node does.
+        """
+        raise RpcGenericServerDefinedError(error_code=MOCK_NODE_ERROR_CODE, message=message)
+
+    def get_block_num(self, identifier):
+        """
+        Get number of the block the object is committed in, fail if there is no such object.
+        """
+        if identifier not in self.chain.block_nums:
+            self.fail(message=f'Head `{identifier}` not found.')
+
+        return self.chain.block_nums.get(identifier)
+
+    def paginate(self, items, indices_by_identifiers, block_nums, params, get_position, get_index):
+        """
+        Get the page of the list of the chain's objects as the node does.
+
+        Objects are listed from the newest to the oldest, or the oldest to the newest if reverse is passed
+        (as an empty string, as Remme core API passes it). The page starts from the position (the block number's
+        position for blocks, the identifier for other objects) and the next page's position is its paging's next.
+
+        Pages are sliced by the objects' indices instead of copying and filtering the lists, so listing all pages
+        of the long chain costs the pages' size rather than the chain's one per request.
+
+        Arguments:
+            items (list, required): objects from the oldest to the newest.
+            indices_by_identifiers (dict, required): indices of the objects by their identifiers.
+            block_nums (list, required): numbers of the blocks the objects are committed in.
+            params (dict, required): parameters of the request.
+            get_position (callable, required): function to get the object's paging position by its index with.
+            get_index (callable, required): function to get the object's index by its paging position with.
+        """
+        head = params.get('head') or self.chain.head.get('header_signature')
+        items_amount = bisect.bisect_right(block_nums, self.get_block_num(identifier=head))
+
+        indices = range(items_amount)
+
+        if params.get('ids'):
+            indices = sorted(
+                indices_by_identifiers.get(identifier) for identifier in set(params.get('ids'))
+                if indices_by_identifiers.get(identifier, items_amount) < items_amount
+            )
+
+        if params.get('reverse') != '':
+            indices = indices[::-1]
+
+        start = params.get('start')
+        offset = 0
+
+        if start is not None:
+            index = get_index(start)
+
+            if index is None or index not in indices:
+                self.fail(message=f'Start `{start}` not found.')
+
+            offset = indices.index(index)
+
+        limit = min(params.get('limit') or DEFAULT_PAGE_SIZE, MOCK_NODE_MAX_PAGE_SIZE)
+        page_indices = indices[offset:offset + limit + 1]
+
+        return {
+            'data': [items[index] for index in page_indices[:limit]],
+            'head': head,
+            'paging': {
+                'start': start,
+                'limit': limit,
+                'next': get_position(page_indices[limit]) if len(page_indices) > limit else '',
+            },
+        }
+
+    async def list_blocks(self, request):
+        """
+        Get the page of blocks.
+        """
+        params = await self.respond(params=request.params)
+
+        return self.paginate(
+            items=self.chain.blocks,
+            indices_by_identifiers=self.chain.blocks_indices,
+            block_nums=range(len(self.chain.blocks)),
+            params=params,
+            get_position=lambda index: BLOCK_NUMBER_PAGING_POSITION.format(index),
+            get_index=lambda position: int(position, 16) if re.fullmatch('0x[0-9a-f]+', position) else None,
+        )
+
+    async def fetch_block(self, request):
+        """
+        Get the block by its identifier.
+        """
+        params = await self.respond(params=request.params)
+
+        if params.get('id') not in self.chain.blocks_by_identifiers:
+            self.fail(message='Block not found.')
+
+        return {'data': self.chain.blocks_by_identifiers.get(params.get('id'))}
+
+    async def list_batches(self, request):
+        """
+        Get the page of batches.
+        """
+        params = await self.respond(params=request.params)
+
+        return self.paginate(
+            items=self.chain.batches,
+            indices_by_identifiers=self.chain.batches_indices,
+            block_nums=self.chain.batches_block_nums,
+            params=params,
+            get_position=lambda index: self.chain.batches[index].get('header_signature'),
+            get_index=self.chain.batches_indices.get,
+        )
+
+    async def fetch_batch(self, request):
+        """
+        Get the batch by its identifier.
+        """
+        params = await self.respond(params=request.params)
+
+        if params.get('id') not in self.chain.batches_by_identifiers:
+            self.fail(message='Batch not found.')
+
+        return {'data': self.chain.batches_by_identifiers.get(params.get('id'))}
+
+    async def get_batch_status(self, request):
+        """
+        Get the batch's status, the chain's and sent batches are committed.
+        """
+        params = await self.respond(params=request.params)
+
+        if params.get('id') in self.chain.batches_by_identifiers or params.get('id') in self.sent_batches:
+            return COMMITTED_BATCH_STATUS
+
+        return UNKNOWN_BATCH_STATUS
+
+    async def list_transactions(self, request):
+        """
+        Get the page of transactions, all transactions of the synthetic chain are the account's ones.
+        """
+        params = await self.respond(params=request.params)
+
+        block_nums = self.chain.transactions_block_nums
+
+        if params.get('family_name') not in (None, RemmeFamilyName.ACCOUNT.value):
+            block_nums = []
+
+        return self.paginate(
+            items=self.chain.transactions,
+            indices_by_identifiers=self.chain.transactions_indices,
+            block_nums=block_nums,
+            params=params,
+            get_position=lambda index: self.chain.transactions[index].get('header_signature'),
+            get_index=self.chain.transactions_indices.get,
+        )
+
+    async def fetch_transaction(self, request):
+        """
+        Get the transaction by its identifier.
+        """
+        params = await self.respond(params=request.params)
+
+        if params.get('id') not in self.chain.transactions_by_identifiers:
+            self.fail(message='Transaction not found.')
+
+        return {'data': self.chain.transactions_by_identifiers.get(params.get('id'))}
+
+    async def list_receipts(self, request):
+        """
+        Get the transactions' receipts by their identifiers.
+        """
+        params = await self.respond(params=request.params)
+
+        for identifier in params.get('ids') or []:
+            if identifier not in self.chain.receipts_by_identifiers:
+                self.fail(message='Receipt not found.')
+
+        return {'data': [self.chain.receipts_by_identifiers.get(identifier) for identifier in params.get('ids') or []]}
+
+    async def list_state(self, request):
+        """
+        Get the page of states, states are filtered by the address's prefix.
+        """
+        params = await self.respond(params=request.params)
+
+        block_nums = self.chain.states_block_nums
+
+        if params.get('address'):
+            params = dict(params, ids=[
+                address for address in self.chain.states_indices if address.startswith(params.get('address'))
+            ])
+
+            if not params.get('ids'):
+                block_nums = []
+
+        return self.paginate(
+            items=self.chain.states,
+            indices_by_identifiers=self.chain.states_indices,
+            block_nums=block_nums,
+            params=params,
+            get_position=lambda index: self.chain.states[index].get('address'),
+            get_index=self.chain.states_indices.get,
+        )
+
+    async def fetch_state(self, request):
+        """
+        Get the state by its address, the stake settings' state contains the initial stake.
+        """
+        params = await self.respond(params=request.params)
+
+        if params.get('address') == STAKE_SETTINGS_ADDRESS:
+            setting = Setting(entries=[
+                Setting.Entry(key='remme.settings.minimum_stake', value=str(MOCK_NODE_INITIAL_STAKE)),
+            ])
+
+            data = base64.b64encode(setting.SerializeToString()).decode('utf-8')
+
+        elif params.get('address') in self.chain.states_indices:
+            data = self.chain.states[self.chain.states_indices.get(params.get('address'))].get('data')
+
+        else:
+            self.fail(message='State not found.')
+
+        return {'data': data, 'head': self.chain.head.get('header_signature')}
+
+    async def get_balance(self, request):
+        """
+        Get the account's balance, it is derived from the account's address.
+        """
+        params = await self.respond(params=request.params)
+
+        return int(get_identifier('balance', params.get('public_key_address'))[:8], 16) % 1000000
+
+    async def get_public_key_info(self, request):
+        """
+        Get information about the public key, it is derived from the public key's address.
+        """
+        params = await self.respond(params=request.params)
+
+        address = params.get('public_key_address')
+
+        return {
+            'owner_public_key': self.chain.head.get('header').get('signer_public_key'),
+            'is_revoked': False,
+            'is_valid': True,
+            'valid_from': 1556532224,
+            'valid_to': 1619690624,
+            'entity_hash': get_identifier('entity-hash', address),
+            'entity_hash_signature': get_identifier('entity-hash-signature', address),
+            'public_key': get_identifier('public-key', address),
+            'type': 'ecdsa',
+        }
+
+    async def get_public_keys_list(self, request):
+        """
+        Get addresses of the account's public keys, they are derived from the account's address.
+        """
+        params = await self.respond(params=request.params)
+
+        return ['a23be1' + get_identifier('public-key-address', params.get('public_key_address'))[:64]]
+
+    async def get_atomic_swap_info(self, request):
+        """
+        Get information about the atomic swap, it is derived from the swap's identifier.
+        """
+        params = await self.respond(params=request.params)
+
+        swap_id = params.get('swap_id')
+
+        return {
+            'sender_address': '112007' + get_identifier('swap-sender', swap_id)[:64],
+            'receiver_address': '112007' + get_identifier('swap-receiver', swap_id)[:64],
+            'amount': '10.0000',
+            'swap_id': swap_id,
+            'secret_lock': get_identifier('swap-secret-lock', swap_id)[:64],
+            'created_at': 1555943451,
+            'sender_address_non_local': '0x' + get_identifier('swap-sender-non-local', swap_id)[:40],
+            'state': 'OPENED',
+            'email_address_encrypted_optional': '',
+            'secret_key': '',
+            'is_initiator': False,
+        }
+
+    async def get_atomic_swap_public_key(self, request):
+        """
+        Get the public key of atomic swap.
+        """
+        await self.respond(params=request.params)
+
+        return '02' + get_identifier('atomic-swap-public-key')[:64]
+
+    async def get_node_info(self, request):
+        """
+        Get information about synchronization and peer count of the node.
+        """
+        await self.respond(params=request.params)
+
+        return {'is_synced': True, 'peer_count': 1}
+
+    async def fetch_peers(self, request):
+        """
+        Get the node's peers.
+        """
+        await self.respond(params=request.params)
+
+        return {'data': ['tcp://mock-node:8800']}
+
+    async def get_node_config(self, request):
+        """
+        Get the node configurations.
+        """
+        await self.respond(params=request.params)
+
+        return {
+            'node_public_key': self.chain.head.get('header').get('signer_public_key'),
+            'node_address': '116829' + get_identifier('node-address')[:64],
+        }
+
+    async def get_node_public_key(self, request):
+        """
+        Get the node's public key, the node signs every block of the synthetic chain.
+        """
+        await self.respond(params=request.params)
+
+        return self.chain.head.get('header').get('signer_public_key')
+
+    async def get_node_account(self, request):
+        """
+        Get information about the node account, the node account is the opened masternode's one.
+        """
+        await self.respond(params=request.params)
+
+        return {
+            'balance': '0.0000',
+            'last_defrost_timestamp': '0',
+            'min': True,
+            'node_state': 'OPENED',
+            'reputation': {
+                'frozen': '250000.0000',
+                'unfrozen': '1000.0000',
+            },
+            'shares': [],
+        }
+
+    async def send_raw_transaction(self, request):
+        """
+        Accept the transaction, return identifier of the batch the node would pack it to.
+        """
+        params = await self.respond(params=request.params)
+
+        batch_id = get_identifier('sent-batch', params.get('data'))
+        self.sent_batches[batch_id] = params.get('data')
+
+        return batch_id
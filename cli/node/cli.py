@@ -4,26 +4,46 @@ Provide implementation of the command line interface's node commands.
 import sys
 
 import click
-from remme import Remme
 from remme.models.account.account_type import AccountType
 
+from cli.cache import ReadCache
+from cli.client import (
+    RemmeClient,
+    fan_out,
+)
 from cli.config import NodePrivateKey
 from cli.constants import (
+    DEFAULT_FLEET_MAX_LAG,
     FAILED_EXIT_FROM_COMMAND_CODE,
+    JSON_OUTPUT_FORMAT,
+    NDJSON_OUTPUT_FORMAT,
+    NODE_OK_STATUS,
     NODE_URL_ARGUMENT_HELP_MESSAGE,
+    NODE_URLS_ARGUMENT_HELP_MESSAGE,
+    OUTPUT_ARGUMENT_HELP_MESSAGE,
 )
 from cli.errors import NotSupportedOsToGetNodePrivateKeyError
 from cli.node.forms import (
     GetNodeConfigurationsForm,
+    GetNodeFleetStatusForm,
     GetNodeInformationForm,
     GetNodeInitialStakeForm,
     GetNodePeersForm,
 )
-from cli.node.service import Node
+from cli.node.help import (
+    FLEET_MAX_LAG_ARGUMENT_HELP_MESSAGE,
+    FLEET_NODE_URLS_ARGUMENT_HELP_MESSAGE,
+)
+from cli.node.service import (
+    Node,
+    NodeFleet,
+)
 from cli.utils import (
-    default_node_url,
+    default_node_urls,
+    dict_to_json_line,
     print_errors,
     print_result,
+    resolve_node_urls,
 )
 
 
@@ -35,14 +55,18 @@ def node_commands():
     pass
 
 
-@click.option('--node-url', type=str, required=False, help=NODE_URL_ARGUMENT_HELP_MESSAGE, default=default_node_url())
+@click.option('--node-url', type=str, required=False, help=NODE_URL_ARGUMENT_HELP_MESSAGE)
+@click.option('--node-urls', type=str, required=False, help=NODE_URLS_ARGUMENT_HELP_MESSAGE)
 @node_commands.command('get-configs')
-def get_config(node_url):
+def get_config(node_url, node_urls):
     """
     Get the node configurations.
     """
+    node_url, node_urls = resolve_node_urls(node_url=node_url, node_urls=node_urls)
+
     arguments, errors = GetNodeConfigurationsForm().load({
         'node_url': node_url,
+        'node_urls': node_urls,
     })
 
     if errors:
@@ -50,10 +74,21 @@ def get_config(node_url):
         sys.exit(FAILED_EXIT_FROM_COMMAND_CODE)
 
     node_url = arguments.get('node_url')
+    node_urls = arguments.get('node_urls')
 
-    remme = Remme(network_config={
-        'node_address': str(node_url) + ':8080',
-    })
+    if node_urls is not None:
+        results, failed_node_urls = fan_out(
+            request=lambda remme: Node(service=remme).get_configs_async(), node_urls=node_urls,
+        )
+
+        print_result(result=results)
+
+        if failed_node_urls:
+            sys.exit(FAILED_EXIT_FROM_COMMAND_CODE)
+
+        return
+
+    remme = RemmeClient.get(node_url=node_url)
 
     result, errors = Node(service=remme).get_configs()
 
@@ -64,14 +99,18 @@ def get_config(node_url):
     print_result(result=result)
 
 
-@click.option('--node-url', type=str, required=False, help=NODE_URL_ARGUMENT_HELP_MESSAGE, default=default_node_url())
+@click.option('--node-url', type=str, required=False, help=NODE_URL_ARGUMENT_HELP_MESSAGE)
+@click.option('--node-urls', type=str, required=False, help=NODE_URLS_ARGUMENT_HELP_MESSAGE)
 @node_commands.command('get-peers')
-def get_peers(node_url):
+def get_peers(node_url, node_urls):
     """
     Get the node's peers.
     """
+    node_url, node_urls = resolve_node_urls(node_url=node_url, node_urls=node_urls)
+
     arguments, errors = GetNodePeersForm().load({
         'node_url': node_url,
+        'node_urls': node_urls,
     })
 
     if errors:
@@ -79,12 +118,23 @@ def get_peers(node_url):
         sys.exit(FAILED_EXIT_FROM_COMMAND_CODE)
 
     node_url = arguments.get('node_url')
+    node_urls = arguments.get('node_urls')
 
-    remme = Remme(network_config={
-        'node_address': str(node_url) + ':8080',
-    })
+    if node_urls is not None:
+        results, failed_node_urls = fan_out(
+            request=lambda remme: Node(service=remme, cache=ReadCache.get()).get_peers_async(), node_urls=node_urls,
+        )
+
+        print_result(result=results)
 
-    result, errors = Node(service=remme).get_peers()
+        if failed_node_urls:
+            sys.exit(FAILED_EXIT_FROM_COMMAND_CODE)
+
+        return
+
+    remme = RemmeClient.get(node_url=node_url)
+
+    result, errors = Node(service=remme, cache=ReadCache.get()).get_peers()
 
     if errors is not None:
         print_errors(errors=errors)
@@ -93,14 +143,18 @@ def get_peers(node_url):
     print_result(result=result)
 
 
-@click.option('--node-url', type=str, required=False, help=NODE_URL_ARGUMENT_HELP_MESSAGE, default=default_node_url())
+@click.option('--node-url', type=str, required=False, help=NODE_URL_ARGUMENT_HELP_MESSAGE)
+@click.option('--node-urls', type=str, required=False, help=NODE_URLS_ARGUMENT_HELP_MESSAGE)
 @node_commands.command('get-info')
-def get_node_info(node_url):
+def get_node_info(node_url, node_urls):
     """
     Get information about synchronization and peer count of the node.
     """
+    node_url, node_urls = resolve_node_urls(node_url=node_url, node_urls=node_urls)
+
     arguments, errors = GetNodeInformationForm().load({
         'node_url': node_url,
+        'node_urls': node_urls,
     })
 
     if errors:
@@ -108,12 +162,23 @@ def get_node_info(node_url):
         sys.exit(FAILED_EXIT_FROM_COMMAND_CODE)
 
     node_url = arguments.get('node_url')
+    node_urls = arguments.get('node_urls')
 
-    remme = Remme(network_config={
-        'node_address': str(node_url) + ':8080',
-    })
+    if node_urls is not None:
+        results, failed_node_urls = fan_out(
+            request=lambda remme: Node(service=remme, cache=ReadCache.get()).get_info_async(), node_urls=node_urls,
+        )
+
+        print_result(result=results)
 
-    result, errors = Node(service=remme).get_info()
+        if failed_node_urls:
+            sys.exit(FAILED_EXIT_FROM_COMMAND_CODE)
+
+        return
+
+    remme = RemmeClient.get(node_url=node_url)
+
+    result, errors = Node(service=remme, cache=ReadCache.get()).get_info()
 
     if errors is not None:
         print_errors(errors=errors)
@@ -122,14 +187,18 @@ def get_node_info(node_url):
     print_result(result=result)
 
 
-@click.option('--node-url', type=str, required=False, help=NODE_URL_ARGUMENT_HELP_MESSAGE, default=default_node_url())
+@click.option('--node-url', type=str, required=False, help=NODE_URL_ARGUMENT_HELP_MESSAGE)
+@click.option('--node-urls', type=str, required=False, help=NODE_URLS_ARGUMENT_HELP_MESSAGE)
 @node_commands.command('get-initial-stake')
-def get_initial_stake(node_url):
+def get_initial_stake(node_url, node_urls):
     """
     Get the initial stake of the node.
     """
+    node_url, node_urls = resolve_node_urls(node_url=node_url, node_urls=node_urls)
+
     arguments, errors = GetNodeInitialStakeForm().load({
         'node_url': node_url,
+        'node_urls': node_urls,
     })
 
     if errors:
@@ -137,10 +206,21 @@ def get_initial_stake(node_url):
         sys.exit(FAILED_EXIT_FROM_COMMAND_CODE)
 
     node_url = arguments.get('node_url')
+    node_urls = arguments.get('node_urls')
 
-    remme = Remme(network_config={
-        'node_address': str(node_url) + ':8080',
-    })
+    if node_urls is not None:
+        results, failed_node_urls = fan_out(
+            request=lambda remme: Node(service=remme).get_initial_stake_async(), node_urls=node_urls,
+        )
+
+        print_result(result=results)
+
+        if failed_node_urls:
+            sys.exit(FAILED_EXIT_FROM_COMMAND_CODE)
+
+        return
+
+    remme = RemmeClient.get(node_url=node_url)
 
     result, errors = Node(service=remme).get_initial_stake()
 
@@ -151,6 +231,51 @@ def get_initial_stake(node_url):
     print_result(result=result)
 
 
+@click.option(
+    '--node-urls', type=str, required=False, help=FLEET_NODE_URLS_ARGUMENT_HELP_MESSAGE, default=default_node_urls,
+)
+@click.option(
+    '--max-lag', type=int, required=False, help=FLEET_MAX_LAG_ARGUMENT_HELP_MESSAGE, default=DEFAULT_FLEET_MAX_LAG,
+)
+@click.option('--output', type=str, required=False, help=OUTPUT_ARGUMENT_HELP_MESSAGE, default=JSON_OUTPUT_FORMAT)
+@node_commands.command('fleet-status')
+def get_fleet_status(node_urls, max_lag, output):
+    """
+    Get synchronization, peers and head block of every node of the fleet, flag lagging and diverged nodes.
+    """
+    arguments, errors = GetNodeFleetStatusForm().load({
+        'node_urls': node_urls,
+        'max_lag': max_lag,
+        'output': output,
+    })
+
+    if errors:
+        print_errors(errors=errors)
+        sys.exit(FAILED_EXIT_FROM_COMMAND_CODE)
+
+    node_urls = arguments.get('node_urls')
+    max_lag = arguments.get('max_lag')
+    output = arguments.get('output')
+
+    result, errors = NodeFleet(services={
+        node_url: RemmeClient.get(node_url=node_url) for node_url in node_urls
+    }).get_status(max_lag=max_lag)
+
+    if errors is not None:
+        print_errors(errors=errors)
+        sys.exit(FAILED_EXIT_FROM_COMMAND_CODE)
+
+    if output == NDJSON_OUTPUT_FORMAT:
+        for node_url, status in result.get('nodes').items():
+            click.echo(dict_to_json_line(dict(status, node_url=node_url)))
+
+    else:
+        print_result(result=result)
+
+    if any(status.get('status') != NODE_OK_STATUS for status in result.get('nodes').values()):
+        sys.exit(FAILED_EXIT_FROM_COMMAND_CODE)
+
+
 @node_commands.command('open')
 def open():
     """
@@ -163,12 +288,9 @@ def open():
         print_errors(errors=str(error))
         sys.exit(FAILED_EXIT_FROM_COMMAND_CODE)
 
-    remme = Remme(
-        account_config={'private_key_hex': node_private_key, 'account_type': AccountType.NODE},
-        network_config={'node_address': 'localhost' + ':8080'},
-    )
+    remme = RemmeClient.get(node_url='localhost', private_key=node_private_key, account_type=AccountType.NODE)
 
-    result, errors = Node(service=remme).open()
+    result, errors = Node(service=remme, cache=ReadCache.get()).open()
 
     if errors is not None:
         print_errors(errors=errors)
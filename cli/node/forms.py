@@ -1,38 +1,71 @@
 """
 Provide forms for command line interface's node commands.
 """
-from marshmallow import Schema
+from marshmallow import (
+    fields,
+    validate,
+)
 
-from cli.generic.forms.fields import NodeUrlField
+from cli.generic.forms.fields import (
+    NodeUrlField,
+    NodeUrlsListField,
+    OutputFormatField,
+)
+from cli.generic.forms.forms import Form
 
 
-class GetNodeConfigurationsForm(Schema):
+class GetNodeConfigurationsForm(Form):
     """
     Get the node configurations form.
     """
 
     node_url = NodeUrlField(required=True)
+    node_urls = NodeUrlsListField(allow_none=True, required=False)
 
 
-class GetNodePeersForm(Schema):
+class GetNodePeersForm(Form):
     """
     Get the node's peers form.
     """
 
     node_url = NodeUrlField(required=True)
+    node_urls = NodeUrlsListField(allow_none=True, required=False)
 
 
-class GetNodeInformationForm(Schema):
+class GetNodeInformationForm(Form):
     """
     Get the node information form.
     """
 
     node_url = NodeUrlField(required=True)
+    node_urls = NodeUrlsListField(allow_none=True, required=False)
 
 
-class GetNodeInitialStakeForm(Schema):
+class GetNodeInitialStakeForm(Form):
     """
     Get the initial stake of the node form.
     """
 
     node_url = NodeUrlField(required=True)
+    node_urls = NodeUrlsListField(allow_none=True, required=False)
+
+
+class GetNodeFleetStatusForm(Form):
+    """
+    Get status of the fleet of nodes form.
+    """
+
+    node_urls = NodeUrlsListField(
+        required=True,
+        error_messages={
+            'null': 'Node URLs must be passed or declared by the configuration file.',
+        },
+    )
+    max_lag = fields.Integer(
+        strict=True,
+        required=True,
+        validate=[
+            validate.Range(min=0, error='Maximum lag must be greater than or equal to 0.'),
+        ],
+    )
+    output = OutputFormatField(required=True)
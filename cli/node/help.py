@@ -0,0 +1,5 @@
+"""
+Provide help messages for command line interface's node commands.
+"""
+FLEET_NODE_URLS_ARGUMENT_HELP_MESSAGE = 'Comma-separated node URLs of the fleet (`nodes` of the configuration file).'
+FLEET_MAX_LAG_ARGUMENT_HELP_MESSAGE = 'Maximum amount of blocks a node could be behind the fleet\'s head.'
@@ -8,32 +8,80 @@ class NodeInterface:
     Implements node interface.
     """
 
+    async def get_configs_async(self):
+        """
+        Get the node configurations.
+        """
+        pass
+
     def get_configs(self):
         """
         Get the node configurations.
         """
         pass
 
+    async def get_peers_async(self):
+        """
+        Get the node's peers.
+        """
+        pass
+
     def get_peers(self):
         """
         Get the node's peers.
         """
         pass
 
+    async def get_info_async(self):
+        """
+        Get information about synchronization and peer count of the node.
+        """
+        pass
+
     def get_info(self):
         """
         Get information about synchronization and peer count of the node.
         """
         pass
 
+    async def get_initial_stake_async(self):
+        """
+        Get the initial stake of the node.
+        """
+        pass
+
     def get_initial_stake(self):
         """
         Get the initial stake of the node.
         """
         pass
 
+    async def open_async(self):
+        """
+        Open the node to participate in the network.
+        """
+        pass
+
     def open(self):
         """
         Open the node to participate in the network.
         """
         pass
+
+
+class NodeFleetInterface:
+    """
+    Implements fleet of nodes interface.
+    """
+
+    async def get_status_async(self, max_lag):
+        """
+        Get synchronization, peers and head block of every node of the fleet, flag lagging and diverged nodes.
+        """
+        pass
+
+    def get_status(self, max_lag):
+        """
+        Get synchronization, peers and head block of every node of the fleet, flag lagging and diverged nodes.
+        """
+        pass
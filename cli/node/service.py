@@ -2,12 +2,26 @@
 Provide implementation of the node.
 """
 import asyncio
+import collections
 
 from accessify import implements
 
-from cli.node.interfaces import NodeInterface
-
-loop = asyncio.get_event_loop()
+from cli.block.service import Block
+from cli.cache import (
+    cached_read,
+    invalidates_reads,
+)
+from cli.constants import (
+    NODE_DIVERGED_STATUS,
+    NODE_LAGGING_STATUS,
+    NODE_OK_STATUS,
+    NODE_UNAVAILABLE_STATUS,
+)
+from cli.node.interfaces import (
+    NodeFleetInterface,
+    NodeInterface,
+)
+from cli.utils import run_until_complete
 
 
 @implements(NodeInterface)
@@ -16,21 +30,23 @@ class Node:
     Implements node.
     """
 
-    def __init__(self, service):
+    def __init__(self, service, cache=None):
         """
         Constructor.
 
         Arguments:
             service: object to interact with Remme core API.
+            cache (ReadCache, optional): in-process cache of the reads, nothing is cached if it isn't passed.
         """
         self.service = service
+        self.cache = cache
 
-    def get_configs(self):
+    async def get_configs_async(self):
         """
         Get the node configurations.
         """
         try:
-            node_configurations = loop.run_until_complete(self.service.node_management.get_node_config())
+            node_configurations = await self.service.node_management.get_node_config()
 
         except Exception as error:
             return None, str(error)
@@ -39,12 +55,19 @@ class Node:
             'configurations': node_configurations.data,
         }, None
 
-    def get_peers(self):
+    def get_configs(self):
+        """
+        Get the node configurations.
+        """
+        return run_until_complete(self.get_configs_async())
+
+    @cached_read(name='peers')
+    async def get_peers_async(self):
         """
         Get the node's peers.
         """
         try:
-            node_peers = loop.run_until_complete(self.service.blockchain_info.get_peers())
+            node_peers = await self.service.blockchain_info.get_peers()
 
         except Exception as error:
             return None, str(error)
@@ -53,12 +76,19 @@ class Node:
             'peers': node_peers,
         }, None
 
-    def get_info(self):
+    def get_peers(self):
+        """
+        Get the node's peers.
+        """
+        return run_until_complete(self.get_peers_async())
+
+    @cached_read(name='information')
+    async def get_info_async(self):
         """
         Get information about synchronization and peer count of the node form.
         """
         try:
-            node_information = loop.run_until_complete(self.service.node_management.get_node_info())
+            node_information = await self.service.node_management.get_node_info()
 
         except Exception as error:
             return None, str(error)
@@ -67,24 +97,37 @@ class Node:
             'information': node_information.data,
         }, None
 
-    def get_initial_stake(self):
+    def get_info(self):
+        """
+        Get information about synchronization and peer count of the node form.
+        """
+        return run_until_complete(self.get_info_async())
+
+    async def get_initial_stake_async(self):
         """
         Get the initial stake of the node.
         """
         try:
-            node_initial_stake = loop.run_until_complete(self.service.node_management.get_initial_stake())
+            node_initial_stake = await self.service.node_management.get_initial_stake()
 
         except Exception as error:
             return None, str(error)
 
         return node_initial_stake, None
 
-    def open(self):
+    def get_initial_stake(self):
+        """
+        Get the initial stake of the node.
+        """
+        return run_until_complete(self.get_initial_stake_async())
+
+    @invalidates_reads
+    async def open_async(self):
         """
         Open the node to participate in the network.
         """
         try:
-            open_node = loop.run_until_complete(self.service.node_management.open_node())
+            open_node = await self.service.node_management.open_node()
 
         except Exception as error:
             return None, str(error)
@@ -92,3 +135,154 @@ class Node:
         return {
             'batch_id': open_node.batch_id,
         }, None
+
+    def open(self):
+        """
+        Open the node to participate in the network.
+        """
+        return run_until_complete(self.open_async())
+
+
+@implements(NodeFleetInterface)
+class NodeFleet:
+    """
+    Implements fleet of nodes.
+
+    Every node is requested for its information, peers and recent blocks concurrently, and all nodes are requested
+    at once, so getting the fleet's status takes about a single round trip however many nodes there are.
+    """
+
+    def __init__(self, services):
+        """
+        Constructor.
+
+        Arguments:
+            services (dict, required): objects to interact with Remme core API of the nodes by their URLs.
+        """
+        self.services = services
+
+    async def get_node_status_async(self, service, recent_blocks_amount):
+        """
+        Get synchronization, peers and recent blocks of the node.
+
+        Returns the node's status and identifiers of its recent blocks by their numbers.
+        """
+        node = Node(service=service)
+
+        (information, information_errors), (peers, peers_errors), (blocks, blocks_errors) = await asyncio.gather(
+            node.get_info_async(),
+            node.get_peers_async(),
+            Block(service=service).get_list_async(ids=None, head=None, limit=recent_blocks_amount, reverse=False),
+        )
+
+        errors = information_errors or peers_errors or blocks_errors
+
+        if errors is not None:
+            return {'status': NODE_UNAVAILABLE_STATUS, 'errors': errors}, {}
+
+        if not blocks:
+            return {'status': NODE_UNAVAILABLE_STATUS, 'errors': 'The node has no blocks.'}, {}
+
+        recent_blocks = {
+            int(block.get('header').get('block_num')): block.get('header_signature') for block in blocks
+        }
+
+        head_block_num = max(recent_blocks)
+
+        return {
+            'is_synced': information.get('information').get('is_synced'),
+            'peer_count': information.get('information').get('peer_count'),
+            'peers': peers.get('peers'),
+            'head_block_id': recent_blocks.get(head_block_num),
+            'head_block_num': head_block_num,
+        }, recent_blocks
+
+    @staticmethod
+    def is_same_chain(status, other_status, recent_blocks):
+        """
+        Check if the other node's head is on the chain of the node.
+
+        Returns none if it could not be checked: the other node is ahead or further behind than the recent blocks.
+        """
+        head_block_num = other_status.get('head_block_num')
+
+        if head_block_num > status.get('head_block_num') or head_block_num not in recent_blocks:
+            return None
+
+        return recent_blocks.get(head_block_num) == other_status.get('head_block_id')
+
+    async def get_status_async(self, max_lag):
+        """
+        Get synchronization, peers and head block of every node of the fleet, flag lagging and diverged nodes.
+
+        The reference chain is the chain most of the nodes' heads are on (the highest one if there are several),
+        its highest head is the reference head. A node is lagging if its head is more than the maximum lag behind
+        the reference head, diverged if its head isn't on the reference chain.
+
+        Arguments:
+            max_lag (int, required): maximum amount of blocks a node could be behind the reference head.
+        """
+        node_urls = list(self.services)
+
+        responses = await asyncio.gather(*[
+            self.get_node_status_async(
+                service=self.services.get(node_url), recent_blocks_amount=max_lag + 1,
+            ) for node_url in node_urls
+        ])
+
+        statuses = collections.OrderedDict(
+            (node_url, status) for node_url, (status, _) in zip(node_urls, responses)
+        )
+        recent_blocks = {node_url: blocks for node_url, (_, blocks) in zip(node_urls, responses)}
+
+        available_node_urls = [node_url for node_url in node_urls if 'errors' not in statuses.get(node_url)]
+
+        if not available_node_urls:
+            return {'head': None, 'nodes': statuses}, None
+
+        chains = {
+            node_url: [
+                other_node_url for other_node_url in available_node_urls if self.is_same_chain(
+                    status=statuses.get(node_url),
+                    other_status=statuses.get(other_node_url),
+                    recent_blocks=recent_blocks.get(node_url),
+                )
+            ] for node_url in available_node_urls
+        }
+
+        reference_node_url = max(available_node_urls, key=lambda node_url: (
+            len(chains.get(node_url)), statuses.get(node_url).get('head_block_num'),
+        ))
+
+        reference_status = statuses.get(reference_node_url)
+        reference_chain = chains.get(reference_node_url)
+
+        for node_url in available_node_urls:
+            status = statuses.get(node_url)
+            status['lag'] = reference_status.get('head_block_num') - status.get('head_block_num')
+
+            if status.get('lag') > max_lag:
+                status['status'] = NODE_LAGGING_STATUS
+
+            elif node_url not in reference_chain:
+                status['status'] = NODE_DIVERGED_STATUS
+
+            else:
+                status['status'] = NODE_OK_STATUS
+
+        return {
+            'head': {
+                'block_id': reference_status.get('head_block_id'),
+                'block_num': reference_status.get('head_block_num'),
+            },
+            'nodes': statuses,
+        }, None
+
+    def get_status(self, max_lag):
+        """
+        Get synchronization, peers and head block of every node of the fleet, flag lagging and diverged nodes.
+
+        Arguments:
+            max_lag (int, required): maximum amount of blocks a node could be behind the reference head.
+        """
+        return run_until_complete(self.get_status_async(max_lag=max_lag))
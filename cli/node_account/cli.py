@@ -4,9 +4,10 @@ Provide implementation of the command line interface's node account commands.
 import sys
 
 import click
-from remme import Remme
 from remme.models.account.account_type import AccountType
 
+from cli.cache import ReadCache
+from cli.client import RemmeClient
 from cli.config import NodePrivateKey
 from cli.constants import (
     FAILED_EXIT_FROM_COMMAND_CODE,
@@ -38,7 +39,7 @@ def node_account_commands():
 
 
 @click.option('--address', type=str, required=True, help=NODE_ACCOUNT_ADDRESS_ARGUMENT_HELP_MESSAGE)
-@click.option('--node-url', type=str, required=False, help=NODE_URL_ARGUMENT_HELP_MESSAGE, default=default_node_url())
+@click.option('--node-url', type=str, required=False, help=NODE_URL_ARGUMENT_HELP_MESSAGE, default=default_node_url)
 @node_account_commands.command('get')
 def get(address, node_url):
     """
@@ -56,11 +57,9 @@ def get(address, node_url):
     node_account_address = arguments.get('address')
     node_url = arguments.get('node_url')
 
-    remme = Remme(network_config={
-        'node_address': str(node_url) + ':8080'},
-    )
+    remme = RemmeClient.get(node_url=node_url)
 
-    result, errors = NodeAccount(service=remme).get(address=node_account_address)
+    result, errors = NodeAccount(service=remme, cache=ReadCache.get()).get(address=node_account_address)
 
     if errors is not None:
         print_errors(errors=errors)
@@ -72,7 +71,7 @@ def get(address, node_url):
 @click.option('--private-key', type=str, required=True, help=PRIVATE_KEY_ARGUMENT_HELP_MESSAGE)
 @click.option('--address-to', type=str, required=True, help=ACCOUNT_ADDRESS_TO_ARGUMENT_HELP_MESSAGE)
 @click.option('--amount', type=int, required=True, help=AMOUNT_ARGUMENT_HELP_MESSAGE)
-@click.option('--node-url', type=str, required=False, help=NODE_URL_ARGUMENT_HELP_MESSAGE, default=default_node_url())
+@click.option('--node-url', type=str, required=False, help=NODE_URL_ARGUMENT_HELP_MESSAGE, default=default_node_url)
 @node_account_commands.command('transfer-tokens')
 def transfer_tokens(private_key, address_to, amount, node_url):
     """
@@ -94,12 +93,11 @@ def transfer_tokens(private_key, address_to, amount, node_url):
     amount = arguments.get('amount')
     node_url = arguments.get('node_url')
 
-    remme = Remme(
-        account_config={'private_key_hex': private_key, 'account_type': AccountType.NODE},
-        network_config={'node_address': str(node_url) + ':8080'},
-    )
+    remme = RemmeClient.get(node_url=node_url, private_key=private_key, account_type=AccountType.NODE)
 
-    result, errors = NodeAccount(service=remme).transfer_tokens(address_to=address_to, amount=amount)
+    result, errors = NodeAccount(service=remme, cache=ReadCache.get()).transfer_tokens(
+        address_to=address_to, amount=amount,
+    )
 
     if errors is not None:
         print_errors(errors=errors)
@@ -120,12 +118,9 @@ def transfer_tokens_from_frozen_to_unfrozen():
         print_errors(errors=str(error))
         sys.exit(FAILED_EXIT_FROM_COMMAND_CODE)
 
-    remme = Remme(
-        account_config={'private_key_hex': node_private_key, 'account_type': AccountType.NODE},
-        network_config={'node_address': 'localhost' + ':8080'},
-    )
+    remme = RemmeClient.get(node_url='localhost', private_key=node_private_key, account_type=AccountType.NODE)
 
-    result, errors = NodeAccount(service=remme).transfer_tokens_from_frozen_to_unfrozen()
+    result, errors = NodeAccount(service=remme, cache=ReadCache.get()).transfer_tokens_from_frozen_to_unfrozen()
 
     if errors is not None:
         print_errors(errors=errors)
@@ -1,15 +1,14 @@
 """
 Provide forms for command line interface's node account commands.
 """
-from marshmallow import Schema
-
 from cli.generic.forms.fields import (
     AccountAddressField,
     NodeUrlField,
 )
+from cli.generic.forms.forms import Form
 
 
-class GetNodeAccountInformationForm(Schema):
+class GetNodeAccountInformationForm(Form):
     """
     Get information about the node account by its address form.
     """
@@ -8,6 +8,15 @@ class NodeAccountInterface:
     Implements node account interface.
     """
 
+    async def get_async(self, address):
+        """
+        Get information about the node account by its address.
+
+        Arguments:
+            address (str, required): node account address to get information about node account by.
+        """
+        pass
+
     def get(self, address):
         """
         Get information about the node account by its address.
@@ -17,12 +26,24 @@ class NodeAccountInterface:
         """
         pass
 
+    async def transfer_tokens_async(self, address_to, amount):
+        """
+        Transfer tokens to address.
+        """
+        pass
+
     def transfer_tokens(self, address_to, amount):
         """
         Transfer tokens to address.
         """
         pass
 
+    async def transfer_tokens_from_frozen_to_unfrozen_async(self):
+        """
+        Transfer available tokens from frozen to unfrozen reputation's balances.
+        """
+        pass
+
     def transfer_tokens_from_frozen_to_unfrozen(self):
         """
         Transfer available tokens from frozen to unfrozen reputation's balances.
@@ -1,14 +1,15 @@
 """
 Provide implementation of the node account.
 """
-import asyncio
-
 from accessify import implements
 from aiohttp_json_rpc import RpcGenericServerDefinedError
 
+from cli.cache import (
+    cached_read,
+    invalidates_reads,
+)
 from cli.node_account.interfaces import NodeAccountInterface
-
-loop = asyncio.get_event_loop()
+from cli.utils import run_until_complete
 
 
 @implements(NodeAccountInterface)
@@ -17,16 +18,19 @@ class NodeAccount:
     Implements node account.
     """
 
-    def __init__(self, service):
+    def __init__(self, service, cache=None):
         """
         Constructor.
 
         Arguments:
             service: object to interact with Remme core API.
+            cache (ReadCache, optional): in-process cache of the reads, nothing is cached if it isn't passed.
         """
         self.service = service
+        self.cache = cache
 
-    def get(self, address):
+    @cached_read(name='node_account')
+    async def get_async(self, address):
         """
         Get information about the node account by its address.
 
@@ -34,8 +38,8 @@ class NodeAccount:
             address (str, required): node account address to get information about node account by.
         """
         try:
-            node_account_information = loop.run_until_complete(
-                self.service.node_management.get_node_account(node_account_address=address),
+            node_account_information = await self.service.node_management.get_node_account(
+                node_account_address=address,
             )
 
         except RpcGenericServerDefinedError as error:
@@ -46,12 +50,22 @@ class NodeAccount:
 
         return node_account_information.node_account_response, None
 
-    def transfer_tokens(self, address_to, amount):
+    def get(self, address):
+        """
+        Get information about the node account by its address.
+
+        Arguments:
+            address (str, required): node account address to get information about node account by.
+        """
+        return run_until_complete(self.get_async(address=address))
+
+    @invalidates_reads
+    async def transfer_tokens_async(self, address_to, amount):
         """
         Transfer tokens to address.
         """
         try:
-            transaction = loop.run_until_complete(self.service.token.transfer(address_to=address_to, amount=amount))
+            transaction = await self.service.token.transfer(address_to=address_to, amount=amount)
 
         except Exception as error:
             return None, str(error)
@@ -60,14 +74,19 @@ class NodeAccount:
             'batch_id': transaction.batch_id,
         }, None
 
-    def transfer_tokens_from_frozen_to_unfrozen(self):
+    def transfer_tokens(self, address_to, amount):
+        """
+        Transfer tokens to address.
+        """
+        return run_until_complete(self.transfer_tokens_async(address_to=address_to, amount=amount))
+
+    @invalidates_reads
+    async def transfer_tokens_from_frozen_to_unfrozen_async(self):
         """
         Transfer available tokens from frozen to unfrozen reputation's balances.
         """
         try:
-            transfer_transaction = loop.run_until_complete(
-                self.service.token.transfer_from_frozen_to_unfrozen(),
-            )
+            transfer_transaction = await self.service.token.transfer_from_frozen_to_unfrozen()
 
         except Exception as error:
             return None, str(error)
@@ -75,3 +94,9 @@ class NodeAccount:
         return {
             'batch_identifier': transfer_transaction.batch_id,
         }, None
+
+    def transfer_tokens_from_frozen_to_unfrozen(self):
+        """
+        Transfer available tokens from frozen to unfrozen reputation's balances.
+        """
+        return run_until_complete(self.transfer_tokens_from_frozen_to_unfrozen_async())
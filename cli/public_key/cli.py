@@ -4,8 +4,8 @@ Provide implementation of the command line interface's public key commands.
 import sys
 
 import click
-from remme import Remme
 
+from cli.client import RemmeClient
 from cli.constants import (
     FAILED_EXIT_FROM_COMMAND_CODE,
     NODE_URL_ARGUMENT_HELP_MESSAGE,
@@ -35,7 +35,7 @@ def public_key_commands():
 
 
 @click.option('--address', type=str, required=True, help=PUBLIC_KEY_ADDRESS_ARGUMENT_HELP_MESSAGE)
-@click.option('--node-url', type=str, required=False, help=NODE_URL_ARGUMENT_HELP_MESSAGE, default=default_node_url())
+@click.option('--node-url', type=str, required=False, help=NODE_URL_ARGUMENT_HELP_MESSAGE, default=default_node_url)
 @public_key_commands.command('get-info')
 def get_public_key_info(address, node_url):
     """
@@ -53,9 +53,7 @@ def get_public_key_info(address, node_url):
     public_key_address = arguments.get('address')
     node_url = arguments.get('node_url')
 
-    remme = Remme(network_config={
-        'node_address': str(node_url) + ':8080',
-    })
+    remme = RemmeClient.get(node_url=node_url)
 
     result, errors = PublicKey(service=remme).get(address=public_key_address)
 
@@ -67,7 +65,7 @@ def get_public_key_info(address, node_url):
 
 
 @click.option('--address', type=str, required=True, help=ACCOUNT_ADDRESS_ARGUMENT_HELP_MESSAGE)
-@click.option('--node-url', type=str, required=False, help=NODE_URL_ARGUMENT_HELP_MESSAGE, default=default_node_url())
+@click.option('--node-url', type=str, required=False, help=NODE_URL_ARGUMENT_HELP_MESSAGE, default=default_node_url)
 @public_key_commands.command('get-list')
 def get_public_keys(address, node_url):
     """
@@ -85,9 +83,7 @@ def get_public_keys(address, node_url):
     account_address = arguments.get('address')
     node_url = arguments.get('node_url')
 
-    remme = Remme(network_config={
-        'node_address': str(node_url) + ':8080',
-    })
+    remme = RemmeClient.get(node_url=node_url)
 
     result, errors = PublicKey(service=remme).get_list(address=account_address)
 
@@ -1,16 +1,15 @@
 """
 Provide forms for command line interface's public key commands.
 """
-from marshmallow import Schema
-
 from cli.generic.forms.fields import (
     AccountAddressField,
     NodeUrlField,
     PublicKeyAddressField,
 )
+from cli.generic.forms.forms import Form
 
 
-class GetPublicKeyInformationForm(Schema):
+class GetPublicKeyInformationForm(Form):
     """
     Get information about public key of the public key information form.
     """
@@ -19,7 +18,7 @@ class GetPublicKeyInformationForm(Schema):
     node_url = NodeUrlField(required=True)
 
 
-class GetPublicKeysForm(Schema):
+class GetPublicKeysForm(Form):
     """
     Get a list of the addresses of the public keys form.
     """
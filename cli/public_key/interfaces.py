@@ -8,12 +8,24 @@ class PublicKeyInterface:
     Implements public key interface.
     """
 
+    async def get_async(self, address):
+        """
+        Get information about public key by its address.
+        """
+        pass
+
     def get(self, address):
         """
         Get information about public key by its address.
         """
         pass
 
+    async def get_list_async(self, address):
+        """
+        Get a list of the addresses of the public keys by account address.
+        """
+        pass
+
     def get_list(self, address):
         """
         Get a list of the addresses of the public keys by account address.
@@ -1,14 +1,11 @@
 """
 Provide implementation of the public key.
 """
-import asyncio
-
 from accessify import implements
 from aiohttp_json_rpc import RpcGenericServerDefinedError
 
 from cli.public_key.interfaces import PublicKeyInterface
-
-loop = asyncio.get_event_loop()
+from cli.utils import run_until_complete
 
 
 @implements(PublicKeyInterface)
@@ -26,14 +23,12 @@ class PublicKey:
         """
         self.service = service
 
-    def get(self, address):
+    async def get_async(self, address):
         """
         Get information about public key by its address.
         """
         try:
-            public_key_info = loop.run_until_complete(
-                self.service.public_key_storage.get_info(public_key_address=address),
-            )
+            public_key_info = await self.service.public_key_storage.get_info(public_key_address=address)
 
         except RpcGenericServerDefinedError as error:
             return None, str(error.message)
@@ -45,14 +40,18 @@ class PublicKey:
             'information': public_key_info.data,
         }, None
 
-    def get_list(self, address):
+    def get(self, address):
+        """
+        Get information about public key by its address.
+        """
+        return run_until_complete(self.get_async(address=address))
+
+    async def get_list_async(self, address):
         """
         Get a list of the addresses of the public keys by account address.
         """
         try:
-            public_key_addresses = loop.run_until_complete(
-                self.service.public_key_storage.get_account_public_keys(address=address),
-            )
+            public_key_addresses = await self.service.public_key_storage.get_account_public_keys(address=address)
 
         except Exception as error:
             return None, str(error)
@@ -60,3 +59,9 @@ class PublicKey:
         return {
             'addresses': public_key_addresses,
         }, None
+
+    def get_list(self, address):
+        """
+        Get a list of the addresses of the public keys by account address.
+        """
+        return run_until_complete(self.get_list_async(address=address))
@@ -4,10 +4,12 @@ Provide implementation of the command line interface's receipt commands.
 import sys
 
 import click
-from remme import Remme
 
+from cli.cache import ObjectCache
+from cli.client import RemmeClient
 from cli.constants import (
     FAILED_EXIT_FROM_COMMAND_CODE,
+    NO_CACHE_ARGUMENT_HELP_MESSAGE,
     NODE_URL_ARGUMENT_HELP_MESSAGE,
 )
 from cli.receipt.forms import GetReceiptsForm
@@ -29,14 +31,16 @@ def receipt_commands():
 
 
 @click.option('--ids', type=str, required=True, help=RECEIPT_TRANSACTION_IDENTIFIERS_ARGUMENT_HELP_MESSAGE)
-@click.option('--node-url', type=str, required=False, help=NODE_URL_ARGUMENT_HELP_MESSAGE, default=default_node_url())
+@click.option('--no-cache', required=False, is_flag=True, help=NO_CACHE_ARGUMENT_HELP_MESSAGE)
+@click.option('--node-url', type=str, required=False, help=NODE_URL_ARGUMENT_HELP_MESSAGE, default=default_node_url)
 @receipt_commands.command('get')
-def get_receipt(ids, node_url):
+def get_receipt(ids, no_cache, node_url):
     """
     Get a list of the transaction's receipts by identifiers.
     """
     arguments, errors = GetReceiptsForm().load({
         'ids': ids,
+        'no_cache': no_cache,
         'node_url': node_url,
     })
 
@@ -45,13 +49,14 @@ def get_receipt(ids, node_url):
         sys.exit(FAILED_EXIT_FROM_COMMAND_CODE)
 
     identifiers = arguments.get('ids')
+    no_cache = arguments.get('no_cache')
     node_url = arguments.get('node_url')
 
-    remme = Remme(network_config={
-        'node_address': str(node_url) + ':8080',
-    })
+    cache = None if no_cache else ObjectCache.get()
+
+    remme = RemmeClient.get(node_url=node_url)
 
-    result, errors = Receipt(service=remme).get(identifiers=identifiers)
+    result, errors = Receipt(service=remme, cache=cache).get(identifiers=identifiers)
 
     if errors is not None:
         print_errors(errors=errors)
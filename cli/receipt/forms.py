@@ -1,18 +1,20 @@
 """
 Provide forms for command line interface's receipt commands.
 """
-from marshmallow import Schema
+from marshmallow import fields
 
 from cli.generic.forms.fields import (
     NodeUrlField,
     TransactionIdentifiersListField,
 )
+from cli.generic.forms.forms import Form
 
 
-class GetReceiptsForm(Schema):
+class GetReceiptsForm(Form):
     """
     Get a list of the transaction's receipts by identifiers form.
     """
 
     ids = TransactionIdentifiersListField(required=True)
     node_url = NodeUrlField(required=True)
+    no_cache = fields.Boolean(required=False)
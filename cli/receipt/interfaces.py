@@ -8,6 +8,12 @@ class ReceiptInterface:
     Implements receipt interface.
     """
 
+    async def get_async(self, identifiers):
+        """
+        Get a list of the transaction's receipts by identifiers.
+        """
+        pass
+
     def get(self, identifiers):
         """
         Get a list of the transaction's receipts by identifiers.
@@ -1,14 +1,12 @@
 """
 Provide implementation of the receipt.
 """
-import asyncio
-
 from accessify import implements
 from aiohttp_json_rpc import RpcGenericServerDefinedError
 
+from cli.cache import RECEIPT_CACHE_KIND
 from cli.receipt.interfaces import ReceiptInterface
-
-loop = asyncio.get_event_loop()
+from cli.utils import run_until_complete
 
 
 @implements(ReceiptInterface)
@@ -17,21 +15,39 @@ class Receipt:
     Implements receipt.
     """
 
-    def __init__(self, service):
+    def __init__(self, service, cache=None):
         """
         Constructor.
 
         Arguments:
             service: object to interact with Remme core API.
+            cache (ObjectCache, optional): on-disk cache of the chain objects, nothing is cached if it isn't passed.
         """
         self.service = service
+        self.cache = cache
 
-    def get(self, identifiers):
+    async def get_async(self, identifiers):
         """
         Get a list of the transaction's receipts by identifiers.
+
+        Cached receipts are taken from the cache, the rest of them are requested from the node in a single request.
         """
+        cached_receipts = {}
+
+        if self.cache is not None:
+            for identifier in identifiers:
+                receipt = self.cache.load(kind=RECEIPT_CACHE_KIND, identifier=identifier)
+
+                if receipt is not None:
+                    cached_receipts[identifier] = receipt
+
+        missed_identifiers = [identifier for identifier in identifiers if identifier not in cached_receipts]
+
+        if not missed_identifiers:
+            return [cached_receipts.get(identifier) for identifier in identifiers], None
+
         try:
-            receipts = loop.run_until_complete(self.service.blockchain_info.get_receipts(ids=identifiers))
+            receipts = await self.service.blockchain_info.get_receipts(ids=missed_identifiers)
 
         except RpcGenericServerDefinedError as error:
             return None, str(error.message)
@@ -39,4 +55,20 @@ class Receipt:
         except Exception as error:
             return None, str(error)
 
-        return receipts, None
+        if self.cache is not None:
+            for receipt in receipts:
+                self.cache.store(kind=RECEIPT_CACHE_KIND, identifier=receipt.get('id'), value=receipt)
+
+        if not cached_receipts:
+            return receipts, None
+
+        receipts = {receipt.get('id'): receipt for receipt in receipts}
+        receipts.update(cached_receipts)
+
+        return [receipts.get(identifier) for identifier in identifiers if identifier in receipts], None
+
+    def get(self, identifiers):
+        """
+        Get a list of the transaction's receipts by identifiers.
+        """
+        return run_until_complete(self.get_async(identifiers=identifiers))
@@ -0,0 +1,128 @@
+"""
+Provide implementation of the signer of transactions in the pool of processes.
+"""
+import base64
+import hashlib
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+from sawtooth_sdk.protobuf.transaction_pb2 import (
+    Transaction,
+    TransactionHeader,
+)
+from sawtooth_signing.secp256k1 import (
+    Secp256k1Context,
+    Secp256k1PrivateKey,
+)
+
+from cli.utils import get_event_loop
+
+_private_keys = {}
+
+
+def sign_transaction(private_key, header, payload_bytes):
+    """
+    Build the transaction, sign and serialize it the same way Remme core API does.
+
+    Executed by the processes of the pool, so the private key's object is kept per process and is created
+    only once for all transactions the process signs.
+
+    Arguments:
+        private_key (string, required): private key to sign the transaction with in hex format.
+        header (dict, required): fields of the transaction's header except the payload's hash.
+        payload_bytes (bytes, required): payload of the transaction.
+
+    Returns the transaction's identifier and the transaction encoded to base64 as Remme core API sends it.
+    """
+    if private_key not in _private_keys:
+        _private_keys[private_key] = Secp256k1PrivateKey.from_hex(private_key)
+
+    header_bytes = TransactionHeader(
+        payload_sha512=hashlib.sha512(payload_bytes).hexdigest(), **header,
+    ).SerializeToString()
+
+    header_signature = Secp256k1Context().sign(message=header_bytes, private_key=_private_keys[private_key])
+
+    transaction = Transaction(
+        header=header_bytes, header_signature=header_signature, payload=payload_bytes,
+    ).SerializeToString()
+
+    return header_signature, base64.b64encode(transaction).decode('utf-8')
+
+
+class TransactionSigner:
+    """
+    Implements signer of transactions in the pool of processes.
+
+    Signing with secp256k1 is CPU-bound, so signing transactions one by one in the process sending them bounds
+    the throughput of bulk writes. Transactions are signed by the pool of processes instead, while the event loop
+    keeps sending already signed ones. The node's public key (the batcher's one) is requested once.
+    """
+
+    def __init__(self, service, processes):
+        """
+        Constructor.
+
+        Arguments:
+            service: object to interact with Remme core API, transactions are signed with its account.
+            processes (int, required): amount of processes to sign transactions in.
+        """
+        self.service = service
+        self.processes = processes
+
+        self._batcher_public_key = None
+        self._executor = None
+
+    async def get_batcher_public_key_async(self):
+        """
+        Get the node's public key to put to the transactions' headers as the batcher's one.
+        """
+        if self._batcher_public_key is None:
+            node_configurations = await self.service.node_management.get_node_config()
+            self._batcher_public_key = node_configurations.node_public_key
+
+        return self._batcher_public_key
+
+    async def sign_async(self, family_name, family_version, inputs, outputs, payload_bytes):
+        """
+        Sign the transaction in the pool of processes.
+
+        The account's address is added to the inputs and outputs as Remme core API does. Unlike Remme core API,
+        the nonce is random 512 bits, so transactions with the same payload never clash.
+
+        Arguments:
+            family_name (string, required): transaction's family name.
+            family_version (string, required): transaction's family version.
+            inputs (list, required): addresses the transaction reads.
+            outputs (list, required): addresses the transaction writes.
+            payload_bytes (bytes, required): payload of the transaction.
+
+        Returns the transaction's identifier and the transaction encoded to base64.
+        """
+        account = self.service.account
+
+        header = {
+            'family_name': family_name,
+            'family_version': family_version,
+            'inputs': inputs + [account.address],
+            'outputs': outputs + [account.address],
+            'signer_public_key': account.public_key_hex,
+            'batcher_public_key': await self.get_batcher_public_key_async(),
+            'nonce': os.urandom(64).hex(),
+            'dependencies': [],
+        }
+
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self.processes)
+
+        return await get_event_loop().run_in_executor(
+            self._executor, sign_transaction, account.private_key_hex, header, payload_bytes,
+        )
+
+    def close(self):
+        """
+        Shut the pool of processes down.
+        """
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
@@ -0,0 +1,43 @@
+"""
+Provide implementation of the command line interface's startup profile command.
+"""
+import sys
+
+import click
+
+from cli.constants import FAILED_EXIT_FROM_COMMAND_CODE
+from cli.entrypoint import COMMANDS
+from cli.startup_profile.forms import StartupProfileForm
+from cli.startup_profile.help import STARTUP_PROFILE_REPEAT_ARGUMENT_HELP_MESSAGE
+from cli.startup_profile.service import StartupProfile
+from cli.utils import (
+    print_errors,
+    print_result,
+)
+
+
+@click.option('--repeat', type=int, required=False, default=3, help=STARTUP_PROFILE_REPEAT_ARGUMENT_HELP_MESSAGE)
+@click.command('startup-profile')
+def startup_profile_command(repeat):
+    """
+    Report import time of the commands' modules.
+    """
+    arguments, errors = StartupProfileForm().load({
+        'repeat': repeat,
+    })
+
+    if errors:
+        print_errors(errors=errors)
+        sys.exit(FAILED_EXIT_FROM_COMMAND_CODE)
+
+    repeat = arguments.get('repeat')
+
+    modules = ['cli.entrypoint'] + [module for module, _, _ in COMMANDS.values()]
+
+    result, errors = StartupProfile(repeat=repeat).get_import_time(modules=modules)
+
+    if errors is not None:
+        print_errors(errors=errors)
+        sys.exit(FAILED_EXIT_FROM_COMMAND_CODE)
+
+    print_result(result=result)
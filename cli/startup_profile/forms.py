@@ -0,0 +1,23 @@
+"""
+Provide forms for command line interface's startup profile command.
+"""
+from marshmallow import (
+    fields,
+    validate,
+)
+
+from cli.generic.forms.forms import Form
+
+
+class StartupProfileForm(Form):
+    """
+    Report import time of the commands' modules form.
+    """
+
+    repeat = fields.Integer(
+        strict=True,
+        required=True,
+        validate=[
+            validate.Range(min=1, error='Repeat must be greater than 0.'),
+        ],
+    )
@@ -0,0 +1,4 @@
+"""
+Provide help messages for command line interface's startup profile command.
+"""
+STARTUP_PROFILE_REPEAT_ARGUMENT_HELP_MESSAGE = 'Amount of imports to take the minimum import time of per module.'
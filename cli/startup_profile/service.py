@@ -0,0 +1,72 @@
+"""
+Provide implementation of the startup profile.
+"""
+import os
+import subprocess
+import sys
+
+import cli
+
+IMPORT_TIME_MEASUREMENT_CODE = 'import time; start = time.perf_counter(); import {module}; ' \
+                               'print(time.perf_counter() - start)'
+
+
+class StartupProfile:
+    """
+    Implements startup profile.
+    """
+
+    def __init__(self, repeat):
+        """
+        Constructor.
+
+        Arguments:
+            repeat (int, required): amount of imports to take the minimum import time of per module.
+        """
+        self.repeat = repeat
+
+    def _measure_import_time(self, module):
+        """
+        Import the module by a fresh interpreter and get the import time in seconds.
+        """
+        environment = dict(os.environ)
+        environment['PYTHONPATH'] = os.pathsep.join(
+            path for path in [os.path.dirname(os.path.dirname(cli.__file__)), environment.get('PYTHONPATH')] if path
+        )
+
+        process = subprocess.run(
+            [sys.executable, '-c', IMPORT_TIME_MEASUREMENT_CODE.format(module=module)],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            env=environment,
+            universal_newlines=True,
+        )
+
+        if process.returncode != 0:
+            error = process.stderr.strip().splitlines()[-1] if process.stderr.strip() else ''
+            raise ImportError(f'The following module `{module}` could not be imported: {error}')
+
+        return float(process.stdout.strip())
+
+    def get_import_time(self, modules):
+        """
+        Get import time of the modules in milliseconds.
+
+        Every module is imported by a fresh interpreter, so its import time includes the import time of its
+        dependencies (e.g. Remme core API) even if they are shared with other modules. The minimum import time
+        among the repeats is taken to reduce the noise.
+
+        Arguments:
+            modules (list, required): names of the modules to get import time of.
+        """
+        import_time = {}
+
+        try:
+            for module in modules:
+                measurements = [self._measure_import_time(module=module) for _ in range(self.repeat)]
+                import_time[module] = round(min(measurements) * 1000, 2)
+
+        except Exception as error:
+            return None, str(error)
+
+        return import_time, None
@@ -4,11 +4,16 @@ Provide implementation of the command line interface's state commands.
 import sys
 
 import click
-from remme import Remme
 
+from cli.cache import ReadCache
+from cli.client import RemmeClient
 from cli.constants import (
+    DEFAULT_PAGE_SIZE,
     FAILED_EXIT_FROM_COMMAND_CODE,
+    JSON_OUTPUT_FORMAT,
+    NDJSON_OUTPUT_FORMAT,
     NODE_URL_ARGUMENT_HELP_MESSAGE,
+    OUTPUT_ARGUMENT_HELP_MESSAGE,
 )
 from cli.state.forms import (
     GetStateForm,
@@ -16,8 +21,10 @@ from cli.state.forms import (
 )
 from cli.state.help import (
     STATE_ACCOUNT_ADDRESS_ARGUMENT_HELP_MESSAGE,
+    STATES_ALL_ARGUMENT_HELP_MESSAGE,
     STATES_HEAD_ARGUMENT_HELP_MESSAGE,
     STATES_LIMIT_ARGUMENT_HELP_MESSAGE,
+    STATES_PAGE_SIZE_ARGUMENT_HELP_MESSAGE,
     STATES_REVERSE_ARGUMENT_HELP_MESSAGE,
     STATES_START_ADDRESS_ARGUMENT_HELP_MESSAGE,
 )
@@ -26,6 +33,8 @@ from cli.utils import (
     default_node_url,
     print_errors,
     print_result,
+    print_result_lines,
+    print_result_pages,
 )
 
 
@@ -38,7 +47,7 @@ def state_command():
 
 
 @click.option('--address', required=True, type=str, help=STATE_ACCOUNT_ADDRESS_ARGUMENT_HELP_MESSAGE)
-@click.option('--node-url', required=False, type=str, help=NODE_URL_ARGUMENT_HELP_MESSAGE, default=default_node_url())
+@click.option('--node-url', required=False, type=str, help=NODE_URL_ARGUMENT_HELP_MESSAGE, default=default_node_url)
 @state_command.command('get')
 def get_state(address, node_url):
     """
@@ -56,11 +65,9 @@ def get_state(address, node_url):
     address = arguments.get('address')
     node_url = arguments.get('node_url')
 
-    remme = Remme(network_config={
-        'node_address': str(node_url) + ':8080',
-    })
+    remme = RemmeClient.get(node_url=node_url)
 
-    result, errors = State(service=remme).get(address=address)
+    result, errors = State(service=remme, cache=ReadCache.get()).get(address=address)
 
     if errors is not None:
         print_errors(errors=errors)
@@ -74,9 +81,14 @@ def get_state(address, node_url):
 @click.option('--limit', required=False, type=int, help=STATES_LIMIT_ARGUMENT_HELP_MESSAGE)
 @click.option('--head', required=False, type=str, help=STATES_HEAD_ARGUMENT_HELP_MESSAGE)
 @click.option('--reverse', required=False, is_flag=True, help=STATES_REVERSE_ARGUMENT_HELP_MESSAGE)
-@click.option('--node-url', required=False, type=str, help=NODE_URL_ARGUMENT_HELP_MESSAGE, default=default_node_url())
+@click.option('--all', 'all_pages', required=False, is_flag=True, help=STATES_ALL_ARGUMENT_HELP_MESSAGE)
+@click.option(
+    '--page-size', required=False, type=int, help=STATES_PAGE_SIZE_ARGUMENT_HELP_MESSAGE, default=DEFAULT_PAGE_SIZE,
+)
+@click.option('--output', required=False, type=str, help=OUTPUT_ARGUMENT_HELP_MESSAGE, default=JSON_OUTPUT_FORMAT)
+@click.option('--node-url', required=False, type=str, help=NODE_URL_ARGUMENT_HELP_MESSAGE, default=default_node_url)
 @state_command.command('get-list')
-def get_states(address, start, limit, head, reverse, node_url):
+def get_states(address, start, limit, head, reverse, all_pages, page_size, output, node_url):
     """
     Get a list of states.
     """
@@ -86,6 +98,9 @@ def get_states(address, start, limit, head, reverse, node_url):
         'limit': limit,
         'head': head,
         'reverse': reverse,
+        'all_pages': all_pages,
+        'page_size': page_size,
+        'output': output,
         'node_url': node_url,
     })
 
@@ -98,13 +113,27 @@ def get_states(address, start, limit, head, reverse, node_url):
     limit = arguments.get('limit')
     head = arguments.get('head')
     reverse = arguments.get('reverse')
+    all_pages = arguments.get('all_pages')
+    page_size = arguments.get('page_size')
+    output = arguments.get('output')
     node_url = arguments.get('node_url')
 
-    remme = Remme(network_config={
-        'node_address': str(node_url) + ':8080',
-    })
+    remme = RemmeClient.get(node_url=node_url)
+
+    if all_pages:
+        print_pages = print_result_lines if output == NDJSON_OUTPUT_FORMAT else print_result_pages
 
-    result, errors = State(service=remme).get_list(
+        errors = print_pages(pages=State(service=remme).get_pages(
+            address=address, start=start, limit=limit, head=head, reverse=reverse, page_size=page_size,
+        ))
+
+        if errors is not None:
+            print_errors(errors=errors)
+            sys.exit(FAILED_EXIT_FROM_COMMAND_CODE)
+
+        return
+
+    result, errors = State(service=remme, cache=ReadCache.get()).get_list(
         address=address, start=start, limit=limit, head=head, reverse=reverse,
     )
 
@@ -112,4 +141,8 @@ def get_states(address, start, limit, head, reverse, node_url):
         print_errors(errors=errors)
         sys.exit(FAILED_EXIT_FROM_COMMAND_CODE)
 
+    if output == NDJSON_OUTPUT_FORMAT:
+        print_result_lines(pages=[(result, None)])
+        return
+
     print_result(result=result)
@@ -2,7 +2,6 @@
 Provide forms for command line interface's state commands.
 """
 from marshmallow import (
-    Schema,
     fields,
     validate,
 )
@@ -11,10 +10,12 @@ from cli.generic.forms.fields import (
     AccountAddressField,
     BlockIdentifierField,
     NodeUrlField,
+    OutputFormatField,
 )
+from cli.generic.forms.forms import Form
 
 
-class GetStateForm(Schema):
+class GetStateForm(Form):
     """
     Get a state by its address form.
     """
@@ -23,7 +24,7 @@ class GetStateForm(Schema):
     node_url = NodeUrlField(required=True)
 
 
-class GetStateListForm(Schema):
+class GetStateListForm(Form):
     """
     Get a list of states form.
     """
@@ -40,4 +41,14 @@ class GetStateListForm(Schema):
         ],
     )
     reverse = fields.Boolean(required=False)
+    all_pages = fields.Boolean(required=False)
+    page_size = fields.Integer(
+        allow_none=True,
+        strict=True,
+        required=False,
+        validate=[
+            validate.Range(min=1, error='Page size must be greater than 0.'),
+        ],
+    )
+    output = OutputFormatField(required=False)
     node_url = NodeUrlField(required=True)
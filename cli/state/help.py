@@ -6,3 +6,5 @@ STATES_START_ADDRESS_ARGUMENT_HELP_MESSAGE = 'Account address to get a list of s
 STATES_LIMIT_ARGUMENT_HELP_MESSAGE = 'Maximum amount of states to return.'
 STATES_HEAD_ARGUMENT_HELP_MESSAGE = 'Block identifier to get a list of states to.'
 STATES_REVERSE_ARGUMENT_HELP_MESSAGE = 'Parameter to reverse result.'
+STATES_ALL_ARGUMENT_HELP_MESSAGE = 'The flag to get all states page by page following the node\'s paging.'
+STATES_PAGE_SIZE_ARGUMENT_HELP_MESSAGE = 'Maximum amount of states to request per page with `--all`.'
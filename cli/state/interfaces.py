@@ -8,12 +8,33 @@ class StateInterface:
     Implements state interface.
     """
 
+    async def get_async(self, address):
+        """
+        Get a state by its address.
+        """
+        pass
+
     def get(self, address):
         """
         Get a state by its address.
         """
         pass
 
+    async def get_list_async(self, address, start, limit, head, reverse):
+        """
+        Get a list of states.
+
+        A list of states could be filtered by account address, start address, limit, head identifier, reverse.
+
+        Arguments:
+            address (string, optional): account address to get a state by.
+            start (string, optional): account address to get a list of states starting from.
+            limit (int, optional): maximum amount of states to return.
+            head (string, optional): block identifier to get a list of states to.
+            reverse (bool, optional): parameter to reverse result.
+        """
+        pass
+
     def get_list(self, address, start, limit, head, reverse):
         """
         Get a list of states.
@@ -28,3 +49,37 @@ class StateInterface:
             reverse (bool, optional): parameter to reverse result.
         """
         pass
+
+    async def get_pages_async(self, address, start, limit, head, reverse, page_size):
+        """
+        Get a list of states by pages.
+
+        Follows the node's paging cursors and yields states page by page as tuples of the page's states
+        and errors, so the whole list is never kept in memory.
+
+        Arguments:
+            address (string, optional): account address to get a list of states by.
+            start (string, optional): account address to get a list of states starting from.
+            limit (int, optional): maximum amount of states to return.
+            head (string, optional): block identifier to get a list of states from.
+            reverse (bool, optional): parameter to reverse result.
+            page_size (int, required): maximum amount of states to request per page.
+        """
+        pass
+
+    def get_pages(self, address, start, limit, head, reverse, page_size):
+        """
+        Get a list of states by pages.
+
+        Follows the node's paging cursors and yields states page by page as tuples of the page's states
+        and errors, so the whole list is never kept in memory.
+
+        Arguments:
+            address (string, optional): account address to get a list of states by.
+            start (string, optional): account address to get a list of states starting from.
+            limit (int, optional): maximum amount of states to return.
+            head (string, optional): block identifier to get a list of states from.
+            reverse (bool, optional): parameter to reverse result.
+            page_size (int, required): maximum amount of states to request per page.
+        """
+        pass
@@ -1,14 +1,16 @@
 """
 Provide implementation of the state.
 """
-import asyncio
-
 from accessify import implements
 from aiohttp_json_rpc import RpcGenericServerDefinedError
 
+from cli.cache import cached_read
 from cli.state.interfaces import StateInterface
-
-loop = asyncio.get_event_loop()
+from cli.utils import (
+    iterate_pages,
+    iterate_until_complete,
+    run_until_complete,
+)
 
 
 @implements(StateInterface)
@@ -17,23 +19,24 @@ class State:
     Implements state.
     """
 
-    def __init__(self, service):
+    def __init__(self, service, cache=None):
         """
         Constructor.
 
         Arguments:
             service: object to interact with Remme core API.
+            cache (ReadCache, optional): in-process cache of the reads, nothing is cached if it isn't passed.
         """
         self.service = service
+        self.cache = cache
 
-    def get(self, address):
+    @cached_read(name='state')
+    async def get_async(self, address):
         """
         Get a state by its address.
         """
         try:
-            state = loop.run_until_complete(
-                self.service.blockchain_info.get_state_by_address(address=address),
-            )
+            state = await self.service.blockchain_info.get_state_by_address(address=address)
 
         except RpcGenericServerDefinedError as error:
             return None, str(error.message)
@@ -45,7 +48,13 @@ class State:
             'state': state,
         }, None
 
-    def get_list(self, address, start, limit, head, reverse):
+    def get(self, address):
+        """
+        Get a state by its address.
+        """
+        return run_until_complete(self.get_async(address=address))
+
+    async def get_list_async(self, address, start, limit, head, reverse):
         """
         Get a list of states.
 
@@ -59,15 +68,13 @@ class State:
             reverse (bool, optional): parameter to reverse result.
         """
         try:
-            states = loop.run_until_complete(
-                self.service.blockchain_info.get_states(query={
-                    'address': address,
-                    'start': start,
-                    'limit': limit,
-                    'head': head,
-                    'reverse': reverse,
-                }),
-            )
+            states = await self.service.blockchain_info.get_states(query={
+                'address': address,
+                'start': start,
+                'limit': limit,
+                'head': head,
+                'reverse': reverse,
+            })
 
         except RpcGenericServerDefinedError as error:
             return None, str(error.message)
@@ -75,4 +82,66 @@ class State:
         except Exception as error:
             return None, str(error)
 
+        if self.cache is not None and head is None:
+            self.cache.observe_head(service=self.service, head=states.get('head'))
+
         return states.get('data'), None
+
+    def get_list(self, address, start, limit, head, reverse):
+        """
+        Get a list of states.
+
+        A list of states could be filtered by account address, start address, limit, head identifier, reverse.
+
+        Arguments:
+            address (string, optional): account address to get a state by.
+            start (string, optional): account address to get a list of states starting from.
+            limit (int, optional): maximum amount of states to return.
+            head (string, optional): block identifier to get a list of states to.
+            reverse (bool, optional): parameter to reverse result.
+        """
+        return run_until_complete(
+            self.get_list_async(address=address, start=start, limit=limit, head=head, reverse=reverse),
+        )
+
+    async def get_pages_async(self, address, start, limit, head, reverse, page_size):
+        """
+        Get a list of states by pages.
+
+        Follows the node's paging cursors and yields states page by page as tuples of the page's states
+        and errors, so the whole list is never kept in memory.
+
+        Arguments:
+            address (string, optional): account address to get a list of states by.
+            start (string, optional): account address to get a list of states starting from.
+            limit (int, optional): maximum amount of states to return.
+            head (string, optional): block identifier to get a list of states from.
+            reverse (bool, optional): parameter to reverse result.
+            page_size (int, required): maximum amount of states to request per page.
+        """
+        async for states, errors in iterate_pages(
+            request=self.service.blockchain_info.get_states,
+            query={'address': address, 'start': start, 'head': head, 'reverse': reverse},
+            page_size=page_size,
+            limit=limit,
+        ):
+            yield states, errors
+
+    def get_pages(self, address, start, limit, head, reverse, page_size):
+        """
+        Get a list of states by pages.
+
+        Follows the node's paging cursors and yields states page by page as tuples of the page's states
+        and errors, so the whole list is never kept in memory.
+
+        Arguments:
+            address (string, optional): account address to get a list of states by.
+            start (string, optional): account address to get a list of states starting from.
+            limit (int, optional): maximum amount of states to return.
+            head (string, optional): block identifier to get a list of states from.
+            reverse (bool, optional): parameter to reverse result.
+            page_size (int, required): maximum amount of states to request per page.
+        """
+        return iterate_until_complete(self.get_pages_async(
+            address=address, start=start, limit=limit, head=head, reverse=reverse, page_size=page_size,
+        ))
@@ -0,0 +1,200 @@
+"""
+Provide implementation of the tracing of the command's execution.
+
+The tracing is imported by the entrypoint on every call, so it imports neither Remme core API nor the commands.
+"""
+import json
+import sys
+import time
+
+import cli
+
+STARTUP_TRACE_EVENT = 'startup'
+IMPORT_TRACE_EVENT = 'import'
+CONFIG_TRACE_EVENT = 'config'
+FORM_TRACE_EVENT = 'form'
+CLIENT_TRACE_EVENT = 'client'
+CONNECT_TRACE_EVENT = 'connect'
+RPC_TRACE_EVENT = 'rpc'
+JSON_TRACE_EVENT = 'json'
+OUTPUT_TRACE_EVENT = 'output'
+TOTAL_TRACE_EVENT = 'total'
+
+AGGREGATED_TRACE_EVENTS = (JSON_TRACE_EVENT, OUTPUT_TRACE_EVENT)
+
+
+class Tracer:
+    """
+    Implements the tracer of the command's execution.
+
+    The tracer records events of the execution's phases: the startup (the interpreter's and the entrypoint's imports
+    and parsing of the arguments), the command's imports, parsing of the configuration file, validation of the forms,
+    construction of the clients, connections and requests to the node, JSON encoding and printing of the result.
+    Encoding and printing happen per item of the long lists, so they are aggregated to their total duration
+    and count instead. Events are written at the end of the execution as newline-delimited JSON, times are
+    in milliseconds since the start of the tracing.
+
+    The startup is the process' one, so it is recorded by the first traced execution of the process only
+    (the daemon or tests execute many commands per process).
+    """
+
+    active = None
+    startup_started_at = cli.STARTED_AT
+
+    def __init__(self, file=None, clock=time.perf_counter):
+        """
+        Constructor.
+
+        Arguments:
+            file (file, optional): file to write the events to, the standard error by default.
+            clock (callable, optional): function to get the current time in seconds with.
+        """
+        self.file = file
+        self.clock = clock
+
+        self.started_at = clock()
+        self.events = []
+        self.aggregated_events = {}
+
+    @classmethod
+    def start(cls, file=None):
+        """
+        Start tracing the execution, the process' startup is recorded as the first event if it is not yet.
+        """
+        tracer = cls(file=file)
+
+        if cls.startup_started_at is not None:
+            tracer.record(event=STARTUP_TRACE_EVENT, start=cls.startup_started_at, end=tracer.started_at)
+            tracer.started_at = cls.startup_started_at
+            cls.startup_started_at = None
+
+        cls.active = tracer
+
+        return tracer
+
+    def record(self, event, start, end, attributes=None):
+        """
+        Record the event.
+
+        Arguments:
+            event (string, required): name of the event.
+            start (float, required): time the event is started at by the tracer's clock.
+            end (float, required): time the event is ended at by the tracer's clock.
+            attributes (dict, optional): attributes of the event, e.g. method of the request.
+        """
+        if event in AGGREGATED_TRACE_EVENTS:
+            aggregated_event = self.aggregated_events.setdefault(event, {'event': event, 'count': 0, 'duration': 0})
+            aggregated_event['count'] += 1
+            aggregated_event['duration'] += end - start
+            return
+
+        self.events.append(dict(attributes or {}, event=event, start=start, duration=end - start))
+
+    @staticmethod
+    def to_milliseconds(seconds):
+        """
+        Convert the seconds to the milliseconds.
+        """
+        return round(seconds * 1000, 3)
+
+    def finish(self, exit_code):
+        """
+        Finish tracing the execution, write the recorded events.
+        """
+        Tracer.active = None
+
+        events = [
+            dict(event, start=self.to_milliseconds(event.get('start') - self.started_at)) for event in self.events
+        ]
+
+        events += list(self.aggregated_events.values())
+        events.append({
+            'event': TOTAL_TRACE_EVENT,
+            'duration': self.clock() - self.started_at,
+            'exit_code': exit_code,
+        })
+
+        for event in events:
+            event['duration'] = self.to_milliseconds(event.get('duration'))
+
+        lines = ''.join(json.dumps(event, sort_keys=True) + '\n' for event in events)
+
+        if self.file is None:
+            sys.stderr.write(lines)
+            sys.stderr.flush()
+            return
+
+        with open(self.file, 'a') as file:
+            file.write(lines)
+
+
+class Span:
+    """
+    Implements the span of the traced event, records the event when the span is exited.
+    """
+
+    __slots__ = ('tracer', 'event', 'attributes', 'start')
+
+    def __init__(self, tracer, event, attributes):
+        """
+        Constructor.
+        """
+        self.tracer = tracer
+        self.event = event
+        self.attributes = attributes
+        self.start = None
+
+    def __enter__(self):
+        """
+        Start the span.
+        """
+        self.start = self.tracer.clock()
+        return self
+
+    def __exit__(self, error_type, error, error_traceback):
+        """
+        End the span, the failed span's event has the error.
+        """
+        if error_type is not None and not issubclass(error_type, SystemExit):
+            self.attributes['error'] = str(error) or error_type.__name__
+
+        self.tracer.record(event=self.event, start=self.start, end=self.tracer.clock(), attributes=self.attributes)
+
+
+class NoSpan:
+    """
+    Implements the span used when the execution isn't traced, it does nothing.
+    """
+
+    __slots__ = ()
+
+    def __enter__(self):
+        """
+        Start the span.
+        """
+        return self
+
+    def __exit__(self, error_type, error, error_traceback):
+        """
+        End the span.
+        """
+        pass
+
+
+NO_SPAN = NoSpan()
+
+
+def trace(event, **attributes):
+    """
+    Get the span of the event if the execution is traced.
+
+    To use:
+        with trace(RPC_TRACE_EVENT, method='get_node_info'):
+            ...
+    """
+    tracer = Tracer.active
+
+    if tracer is None:
+        return NO_SPAN
+
+    return Span(tracer=tracer, event=event, attributes=attributes)
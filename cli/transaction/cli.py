@@ -4,11 +4,18 @@ Provide implementation of the command line interface's transaction commands.
 import sys
 
 import click
-from remme import Remme
 
+from cli.cache import ObjectCache
+from cli.client import RemmeClient
 from cli.constants import (
+    DEFAULT_FOLLOW_POLL_INTERVAL,
+    DEFAULT_PAGE_SIZE,
     FAILED_EXIT_FROM_COMMAND_CODE,
+    JSON_OUTPUT_FORMAT,
+    NDJSON_OUTPUT_FORMAT,
+    NO_CACHE_ARGUMENT_HELP_MESSAGE,
     NODE_URL_ARGUMENT_HELP_MESSAGE,
+    OUTPUT_ARGUMENT_HELP_MESSAGE,
 )
 from cli.transaction.forms import (
     GetTransactionForm,
@@ -16,19 +23,25 @@ from cli.transaction.forms import (
 )
 from cli.transaction.help import (
     TRANSACTION_ID_ARGUMENT_HELP_MESSAGE,
+    TRANSACTIONS_ALL_ARGUMENT_HELP_MESSAGE,
     TRANSACTIONS_FAMILY_NAME_ARGUMENT_HELP_MESSAGE,
+    TRANSACTIONS_FOLLOW_ARGUMENT_HELP_MESSAGE,
     TRANSACTIONS_HEAD_ARGUMENT_HELP_MESSAGE,
     TRANSACTIONS_IDENTIFIERS_ARGUMENT_HELP_MESSAGE,
     TRANSACTIONS_IDENTIFIERS_ONLY_ARGUMENT_HELP_MESSAGE,
     TRANSACTIONS_LIMIT_ARGUMENT_HELP_MESSAGE,
+    TRANSACTIONS_PAGE_SIZE_ARGUMENT_HELP_MESSAGE,
     TRANSACTIONS_REVERSE_ARGUMENT_HELP_MESSAGE,
     TRANSACTIONS_START_ARGUMENT_HELP_MESSAGE,
 )
 from cli.transaction.service import Transaction
 from cli.utils import (
     default_node_url,
+    iterate_identifiers,
     print_errors,
     print_result,
+    print_result_lines,
+    print_result_pages,
 )
 
 
@@ -45,11 +58,23 @@ def transaction_command():
 @click.option('--limit', required=False, type=int, help=TRANSACTIONS_LIMIT_ARGUMENT_HELP_MESSAGE)
 @click.option('--head', required=False, type=str, help=TRANSACTIONS_HEAD_ARGUMENT_HELP_MESSAGE)
 @click.option('--reverse', required=False, is_flag=True, help=TRANSACTIONS_REVERSE_ARGUMENT_HELP_MESSAGE)
+@click.option('--all', 'all_pages', required=False, is_flag=True, help=TRANSACTIONS_ALL_ARGUMENT_HELP_MESSAGE)
+@click.option(
+    '--page-size',
+    required=False,
+    type=int,
+    help=TRANSACTIONS_PAGE_SIZE_ARGUMENT_HELP_MESSAGE,
+    default=DEFAULT_PAGE_SIZE,
+)
 @click.option('--family-name', required=False, type=str, help=TRANSACTIONS_FAMILY_NAME_ARGUMENT_HELP_MESSAGE)
 @click.option('--ids-only', required=False, is_flag=True, help=TRANSACTIONS_IDENTIFIERS_ONLY_ARGUMENT_HELP_MESSAGE)
-@click.option('--node-url', required=False, type=str, help=NODE_URL_ARGUMENT_HELP_MESSAGE, default=default_node_url())
+@click.option('--follow', required=False, is_flag=True, help=TRANSACTIONS_FOLLOW_ARGUMENT_HELP_MESSAGE)
+@click.option('--output', required=False, type=str, help=OUTPUT_ARGUMENT_HELP_MESSAGE, default=JSON_OUTPUT_FORMAT)
+@click.option('--node-url', required=False, type=str, help=NODE_URL_ARGUMENT_HELP_MESSAGE, default=default_node_url)
 @transaction_command.command('get-list')
-def get_transactions(ids, start, limit, head, reverse, family_name, ids_only, node_url):
+def get_transactions(
+    ids, start, limit, head, reverse, family_name, ids_only, all_pages, page_size, follow, output, node_url,
+):
     """
     Get a list of transactions.
     """
@@ -61,6 +86,10 @@ def get_transactions(ids, start, limit, head, reverse, family_name, ids_only, no
         'family_name': family_name,
         'reverse': reverse,
         'ids_only': ids_only,
+        'all_pages': all_pages,
+        'page_size': page_size,
+        'follow': follow,
+        'output': output,
         'node_url': node_url,
     })
 
@@ -74,11 +103,48 @@ def get_transactions(ids, start, limit, head, reverse, family_name, ids_only, no
     head = arguments.get('head')
     reverse = arguments.get('reverse')
     family_name = arguments.get('family_name')
+    all_pages = arguments.get('all_pages')
+    page_size = arguments.get('page_size')
+    follow = arguments.get('follow')
+    output = arguments.get('output')
     node_url = arguments.get('node_url')
 
-    remme = Remme(network_config={
-        'node_address': str(node_url) + ':8080',
-    })
+    remme = RemmeClient.get(node_url=node_url)
+
+    if follow:
+        pages = Transaction(service=remme).follow(
+            family_name=family_name, limit=limit, page_size=page_size, poll_interval=DEFAULT_FOLLOW_POLL_INTERVAL,
+        )
+
+        errors = print_result_lines(pages=iterate_identifiers(pages=pages) if ids_only else pages)
+
+        if errors is not None:
+            print_errors(errors=errors)
+            sys.exit(FAILED_EXIT_FROM_COMMAND_CODE)
+
+        return
+
+    if all_pages:
+        transaction = Transaction(service=remme)
+        get_pages = transaction.get_ids_pages if ids_only else transaction.get_pages
+
+        print_pages = print_result_lines if output == NDJSON_OUTPUT_FORMAT else print_result_pages
+
+        errors = print_pages(pages=get_pages(
+            ids=transaction_ids,
+            start=start,
+            limit=limit,
+            head=head,
+            family_name=family_name,
+            reverse=reverse,
+            page_size=page_size,
+        ))
+
+        if errors is not None:
+            print_errors(errors=errors)
+            sys.exit(FAILED_EXIT_FROM_COMMAND_CODE)
+
+        return
 
     if ids_only:
         result, errors = Transaction(service=remme).get_list_ids(
@@ -94,18 +160,24 @@ def get_transactions(ids, start, limit, head, reverse, family_name, ids_only, no
         print_errors(errors=errors)
         sys.exit(FAILED_EXIT_FROM_COMMAND_CODE)
 
+    if output == NDJSON_OUTPUT_FORMAT:
+        print_result_lines(pages=[(result if ids_only else result.get('data'), None)])
+        return
+
     print_result(result=result)
 
 
 @click.option('--id', required=True, type=str, help=TRANSACTION_ID_ARGUMENT_HELP_MESSAGE)
-@click.option('--node-url', required=False, type=str, help=NODE_URL_ARGUMENT_HELP_MESSAGE, default=default_node_url())
+@click.option('--no-cache', required=False, is_flag=True, help=NO_CACHE_ARGUMENT_HELP_MESSAGE)
+@click.option('--node-url', required=False, type=str, help=NODE_URL_ARGUMENT_HELP_MESSAGE, default=default_node_url)
 @transaction_command.command('get')
-def get_transaction(id, node_url):
+def get_transaction(id, no_cache, node_url):
     """
     Fetch transaction by its identifier.
     """
     arguments, errors = GetTransactionForm().load({
         'id': id,
+        'no_cache': no_cache,
         'node_url': node_url,
     })
 
@@ -114,13 +186,14 @@ def get_transaction(id, node_url):
         sys.exit(FAILED_EXIT_FROM_COMMAND_CODE)
 
     transaction_id = arguments.get('id')
+    no_cache = arguments.get('no_cache')
     node_url = arguments.get('node_url')
 
-    remme = Remme(network_config={
-        'node_address': str(node_url) + ':8080',
-    })
+    cache = None if no_cache else ObjectCache.get()
+
+    remme = RemmeClient.get(node_url=node_url)
 
-    transaction, errors = Transaction(service=remme).get(transaction_id=transaction_id)
+    transaction, errors = Transaction(service=remme, cache=cache).get(transaction_id=transaction_id)
 
     if errors is not None:
         print_errors(errors=errors)
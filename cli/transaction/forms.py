@@ -2,20 +2,23 @@
 Provide forms for command line interface's transaction commands.
 """
 from marshmallow import (
-    Schema,
+    ValidationError,
     fields,
     validate,
+    validates_schema,
 )
 
 from cli.generic.forms.fields import (
     FamilyNameField,
     NodeUrlField,
+    OutputFormatField,
     TransactionIdentifierField,
     TransactionIdentifiersListField,
 )
+from cli.generic.forms.forms import Form
 
 
-class GetTransactionsListForm(Schema):
+class GetTransactionsListForm(Form):
     """
     Get a list of transactions form.
     """
@@ -34,13 +37,35 @@ class GetTransactionsListForm(Schema):
     reverse = fields.Boolean(required=False)
     ids_only = fields.Boolean(required=False)
     family_name = FamilyNameField(allow_none=True, required=False)
+    all_pages = fields.Boolean(required=False)
+    page_size = fields.Integer(
+        allow_none=True,
+        strict=True,
+        required=False,
+        validate=[
+            validate.Range(min=1, error='Page size must be greater than 0.'),
+        ],
+    )
+    follow = fields.Boolean(required=False)
+    output = OutputFormatField(required=False)
     node_url = NodeUrlField(required=True)
 
+    @validates_schema(skip_on_field_errors=True)
+    def validate_follow(self, data):
+        """
+        Validate following isn't combined with the arguments to get the committed list by.
+        """
+        if data.get('follow') and any(data.get(name) for name in ('ids', 'start', 'head', 'reverse', 'all_pages')):
+            raise ValidationError(
+                'Follow could not be combined with identifiers, start, head, reverse or all.', 'follow',
+            )
+
 
-class GetTransactionForm(Schema):
+class GetTransactionForm(Form):
     """
     Get transaction by its identifier form.
     """
 
     id = TransactionIdentifierField(required=True)
     node_url = NodeUrlField(required=True)
+    no_cache = fields.Boolean(required=False)
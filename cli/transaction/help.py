@@ -9,3 +9,6 @@ TRANSACTIONS_HEAD_ARGUMENT_HELP_MESSAGE = 'Block identifier to get a list of tra
 TRANSACTIONS_REVERSE_ARGUMENT_HELP_MESSAGE = 'Parameter to reverse result.'
 TRANSACTIONS_FAMILY_NAME_ARGUMENT_HELP_MESSAGE = 'List of transactions by its family name.'
 TRANSACTIONS_IDENTIFIERS_ONLY_ARGUMENT_HELP_MESSAGE = 'The flag to get a list of transactions\' identifiers.'
+TRANSACTIONS_ALL_ARGUMENT_HELP_MESSAGE = 'The flag to get all transactions page by page following the node\'s paging.'
+TRANSACTIONS_PAGE_SIZE_ARGUMENT_HELP_MESSAGE = 'Maximum amount of transactions to request per page with `--all`.'
+TRANSACTIONS_FOLLOW_ARGUMENT_HELP_MESSAGE = 'The flag to print transactions committed from now on as JSON lines.'
@@ -8,6 +8,23 @@ class TransactionInterface:
     Implements transaction interface.
     """
 
+    async def get_list_async(self, ids, start, limit, head, reverse, family_name):
+        """
+        Get a list of transactions.
+
+        A list of transactions could be filtered by transactions identifiers, start identifier, limit, head identifier,
+        reverse, family name.
+
+        Arguments:
+            ids (list, optional): identifiers to get a list of transactions by.
+            start (string, optional): transaction identifier to get a list transaction starting from.
+            limit (int, optional): maximum amount of transactions to return.
+            head (string, optional): block identifier to get a list of transactions from.
+            reverse (bool, optional): parameter to reverse result.
+            family_name (string, optional): list of a transactions by its family name.
+        """
+        pass
+
     def get_list(self, ids, start, limit, head, reverse, family_name):
         """
         Get a list of transactions.
@@ -25,6 +42,23 @@ class TransactionInterface:
         """
         pass
 
+    async def get_list_ids_async(self, ids, start, limit, head, reverse, family_name):
+        """
+        Get a list of transactions' identifiers.
+
+        A list of transactions' identifiers could be filtered by transactions' identifiers,
+        start, limit, head, reverse, family_name.
+
+        Arguments:
+            ids (list, optional): identifiers to get a list of blocks by.
+            start (string, optional): transaction identifier to get a list transaction starting from.
+            limit (int, optional): maximum amount of blocks to return.
+            head (string, optional): block identifier to get a list of transactions to.
+            reverse (bool, optional): parameter to reverse result.
+            family_name (string, optional): list of a transactions by its family name.
+        """
+        pass
+
     def get_list_ids(self, ids, start, limit, head, reverse, family_name):
         """
         Get a list of transactions' identifiers.
@@ -42,6 +76,111 @@ class TransactionInterface:
         """
         pass
 
+    async def get_pages_async(self, ids, start, limit, head, reverse, family_name, page_size):
+        """
+        Get a list of transactions by pages.
+
+        Follows the node's paging cursors and yields transactions page by page as tuples of the page's transactions
+        and errors, so the whole list is never kept in memory.
+
+        Arguments:
+            ids (list, optional): identifiers to get a list of transactions by.
+            start (string, optional): transaction identifier to get a list transaction starting from.
+            limit (int, optional): maximum amount of transactions to return.
+            head (string, optional): block identifier to get a list of transactions from.
+            reverse (bool, optional): parameter to reverse result.
+            family_name (string, optional): list of a transactions by its family name.
+            page_size (int, required): maximum amount of transactions to request per page.
+        """
+        pass
+
+    def get_pages(self, ids, start, limit, head, reverse, family_name, page_size):
+        """
+        Get a list of transactions by pages.
+
+        Follows the node's paging cursors and yields transactions page by page as tuples of the page's transactions
+        and errors, so the whole list is never kept in memory.
+
+        Arguments:
+            ids (list, optional): identifiers to get a list of transactions by.
+            start (string, optional): transaction identifier to get a list transaction starting from.
+            limit (int, optional): maximum amount of transactions to return.
+            head (string, optional): block identifier to get a list of transactions from.
+            reverse (bool, optional): parameter to reverse result.
+            family_name (string, optional): list of a transactions by its family name.
+            page_size (int, required): maximum amount of transactions to request per page.
+        """
+        pass
+
+    async def get_ids_pages_async(self, ids, start, limit, head, reverse, family_name, page_size):
+        """
+        Get a list of transactions identifiers by pages.
+
+        Yields transaction identifiers page by page as tuples of the page's identifiers and errors.
+
+        Arguments:
+            ids (list, optional): identifiers to get a list of transactions by.
+            start (string, optional): transaction identifier to get a list transaction starting from.
+            limit (int, optional): maximum amount of transactions to return.
+            head (string, optional): block identifier to get a list of transactions from.
+            reverse (bool, optional): parameter to reverse result.
+            family_name (string, optional): list of a transactions by its family name.
+            page_size (int, required): maximum amount of transactions to request per page.
+        """
+        pass
+
+    def get_ids_pages(self, ids, start, limit, head, reverse, family_name, page_size):
+        """
+        Get a list of transactions identifiers by pages.
+
+        Yields transaction identifiers page by page as tuples of the page's identifiers and errors.
+
+        Arguments:
+            ids (list, optional): identifiers to get a list of transactions by.
+            start (string, optional): transaction identifier to get a list transaction starting from.
+            limit (int, optional): maximum amount of transactions to return.
+            head (string, optional): block identifier to get a list of transactions from.
+            reverse (bool, optional): parameter to reverse result.
+            family_name (string, optional): list of a transactions by its family name.
+            page_size (int, required): maximum amount of transactions to request per page.
+        """
+        pass
+
+    async def follow_async(self, family_name, limit, page_size, poll_interval):
+        """
+        Follow transactions of blocks committed after the node's current head, from the oldest to the newest.
+
+        Arguments:
+            family_name (string, optional): family name to follow transactions by.
+            limit (int, optional): maximum amount of transactions to yield, transactions are followed endlessly
+                if not passed.
+            page_size (int, required): maximum amount of blocks to request per page.
+            poll_interval (float, required): minimum amount of seconds between polls of the node's head.
+        """
+        pass
+
+    def follow(self, family_name, limit, page_size, poll_interval):
+        """
+        Follow transactions of blocks committed after the node's current head, from the oldest to the newest.
+
+        Arguments:
+            family_name (string, optional): family name to follow transactions by.
+            limit (int, optional): maximum amount of transactions to yield, transactions are followed endlessly
+                if not passed.
+            page_size (int, required): maximum amount of blocks to request per page.
+            poll_interval (float, required): minimum amount of seconds between polls of the node's head.
+        """
+        pass
+
+    async def get_async(self, transaction_id):
+        """
+        Get transaction by its identifier.
+
+        Arguments:
+            transaction_id (string, required): transaction identifier.
+        """
+        pass
+
     def get(self, transaction_id):
         """
         Get transaction by its identifier.
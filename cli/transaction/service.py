@@ -1,14 +1,19 @@
 """
 Provide implementation of the transaction.
 """
-import asyncio
-
 from accessify import implements
 from aiohttp_json_rpc import RpcGenericServerDefinedError
 
+from cli.block.service import Block
+from cli.cache import TRANSACTION_CACHE_KIND
+from cli.constants import DEFAULT_PAGE_SIZE
 from cli.transaction.interfaces import TransactionInterface
-
-loop = asyncio.get_event_loop()
+from cli.utils import (
+    collect_pages,
+    iterate_pages,
+    iterate_until_complete,
+    run_until_complete,
+)
 
 
 @implements(TransactionInterface)
@@ -17,16 +22,18 @@ class Transaction:
     Implements transaction.
     """
 
-    def __init__(self, service):
+    def __init__(self, service, cache=None):
         """
         Constructor.
 
         Arguments:
             service: object to interact with Remme core API.
+            cache (ObjectCache, optional): on-disk cache of the chain objects, nothing is cached if it isn't passed.
         """
         self.service = service
+        self.cache = cache
 
-    def get_list(self, ids, start, limit, head, reverse, family_name):
+    async def get_list_async(self, ids, start, limit, head, reverse, family_name):
         """
         Get a list of transactions.
 
@@ -39,16 +46,14 @@ class Transaction:
             family_name (string, optional): list of a transactions by its family name.
         """
         try:
-            transactions = loop.run_until_complete(
-                self.service.blockchain_info.get_transactions(query={
-                    'ids': ids,
-                    'start': start,
-                    'limit': limit,
-                    'head': head,
-                    'family_name': family_name,
-                    'reverse': reverse,
-                }),
-            )
+            transactions = await self.service.blockchain_info.get_transactions(query={
+                'ids': ids,
+                'start': start,
+                'limit': limit,
+                'head': head,
+                'family_name': family_name,
+                'reverse': reverse,
+            })
 
         except RpcGenericServerDefinedError as error:
             return None, str(error.message)
@@ -58,13 +63,34 @@ class Transaction:
 
         return transactions, None
 
-    def get_list_ids(self, ids, start, limit, head, reverse, family_name):
+    def get_list(self, ids, start, limit, head, reverse, family_name):
+        """
+        Get a list of transactions.
+
+        Arguments:
+            ids (list, optional): identifiers to get a list of transactions by.
+            start (string, optional): transaction identifier to get a list transaction starting from.
+            limit (int, optional): maximum amount of transactions to return.
+            head (string, optional): block identifier to get a list of transactions from.
+            reverse (bool, optional): parameter to reverse result.
+            family_name (string, optional): list of a transactions by its family name.
+        """
+        return run_until_complete(self.get_list_async(
+            ids=ids, start=start, limit=limit, head=head, reverse=reverse, family_name=family_name,
+        ))
+
+    async def get_list_ids_async(self, ids, start, limit, head, reverse, family_name):
         """
         Get a list of transactions' identifiers.
 
         A list of transactions' identifiers could be filtered by transactions' identifiers,
         start, limit, head, reverse, family_name.
 
+        If the limit is over the page's size, transactions are requested by pages and only identifiers are kept
+        of each page, so the limit doesn't bound the amount of transactions (with their payloads) kept in memory
+        at once. Otherwise a single list is requested, as for the full transactions; the whole list is streamed
+        by `--all`.
+
         Arguments:
             ids (list, optional): identifiers to get a list of blocks by.
             start (string, optional): transaction identifier to get a list transaction starting from.
@@ -73,7 +99,18 @@ class Transaction:
             reverse (bool, optional): parameter to reverse result.
             family_name (string, optional): list of a transactions by its family name.
         """
-        transactions, errors = self.get_list(
+        if limit is not None and limit > DEFAULT_PAGE_SIZE:
+            return await collect_pages(pages=self.get_ids_pages_async(
+                ids=ids,
+                start=start,
+                limit=limit,
+                head=head,
+                reverse=reverse,
+                family_name=family_name,
+                page_size=DEFAULT_PAGE_SIZE,
+            ))
+
+        transactions, errors = await self.get_list_async(
             ids=ids, start=start, head=head, limit=limit, reverse=reverse, family_name=family_name,
         )
 
@@ -88,17 +125,181 @@ class Transaction:
 
         return transactions_identifiers, None
 
-    def get(self, transaction_id):
+    def get_list_ids(self, ids, start, limit, head, reverse, family_name):
+        """
+        Get a list of transactions' identifiers.
+
+        A list of transactions' identifiers could be filtered by transactions' identifiers,
+        start, limit, head, reverse, family_name.
+
+        Arguments:
+            ids (list, optional): identifiers to get a list of blocks by.
+            start (string, optional): transaction identifier to get a list transaction starting from.
+            limit (int, optional): maximum amount of blocks to return.
+            head (string, optional): block identifier to get a list of transactions to.
+            reverse (bool, optional): parameter to reverse result.
+            family_name (string, optional): list of a transactions by its family name.
+        """
+        return run_until_complete(self.get_list_ids_async(
+            ids=ids, start=start, limit=limit, head=head, reverse=reverse, family_name=family_name,
+        ))
+
+    async def get_pages_async(self, ids, start, limit, head, reverse, family_name, page_size):
+        """
+        Get a list of transactions by pages.
+
+        Follows the node's paging cursors and yields transactions page by page as tuples of the page's transactions
+        and errors, so the whole list is never kept in memory.
+
+        Arguments:
+            ids (list, optional): identifiers to get a list of transactions by.
+            start (string, optional): transaction identifier to get a list transaction starting from.
+            limit (int, optional): maximum amount of transactions to return.
+            head (string, optional): block identifier to get a list of transactions from.
+            reverse (bool, optional): parameter to reverse result.
+            family_name (string, optional): list of a transactions by its family name.
+            page_size (int, required): maximum amount of transactions to request per page.
+        """
+        async for transactions, errors in iterate_pages(
+            request=self.service.blockchain_info.get_transactions,
+            query={'ids': ids, 'start': start, 'head': head, 'reverse': reverse, 'family_name': family_name},
+            page_size=page_size,
+            limit=limit,
+        ):
+            yield transactions, errors
+
+    def get_pages(self, ids, start, limit, head, reverse, family_name, page_size):
+        """
+        Get a list of transactions by pages.
+
+        Follows the node's paging cursors and yields transactions page by page as tuples of the page's transactions
+        and errors, so the whole list is never kept in memory.
+
+        Arguments:
+            ids (list, optional): identifiers to get a list of transactions by.
+            start (string, optional): transaction identifier to get a list transaction starting from.
+            limit (int, optional): maximum amount of transactions to return.
+            head (string, optional): block identifier to get a list of transactions from.
+            reverse (bool, optional): parameter to reverse result.
+            family_name (string, optional): list of a transactions by its family name.
+            page_size (int, required): maximum amount of transactions to request per page.
+        """
+        return iterate_until_complete(self.get_pages_async(
+            ids=ids, start=start, limit=limit, head=head, reverse=reverse, family_name=family_name, page_size=page_size,
+        ))
+
+    async def get_ids_pages_async(self, ids, start, limit, head, reverse, family_name, page_size):
+        """
+        Get a list of transactions identifiers by pages.
+
+        Yields transaction identifiers page by page as tuples of the page's identifiers and errors.
+
+        Arguments:
+            ids (list, optional): identifiers to get a list of transactions by.
+            start (string, optional): transaction identifier to get a list transaction starting from.
+            limit (int, optional): maximum amount of transactions to return.
+            head (string, optional): block identifier to get a list of transactions from.
+            reverse (bool, optional): parameter to reverse result.
+            family_name (string, optional): list of a transactions by its family name.
+            page_size (int, required): maximum amount of transactions to request per page.
+        """
+        async for transactions, errors in self.get_pages_async(
+            ids=ids, start=start, limit=limit, head=head, reverse=reverse, family_name=family_name, page_size=page_size,
+        ):
+            if errors is not None:
+                yield None, errors
+                continue
+
+            yield [transaction.get('header_signature') for transaction in transactions], None
+
+    def get_ids_pages(self, ids, start, limit, head, reverse, family_name, page_size):
+        """
+        Get a list of transactions identifiers by pages.
+
+        Yields transaction identifiers page by page as tuples of the page's identifiers and errors.
+
+        Arguments:
+            ids (list, optional): identifiers to get a list of transactions by.
+            start (string, optional): transaction identifier to get a list transaction starting from.
+            limit (int, optional): maximum amount of transactions to return.
+            head (string, optional): block identifier to get a list of transactions from.
+            reverse (bool, optional): parameter to reverse result.
+            family_name (string, optional): list of a transactions by its family name.
+            page_size (int, required): maximum amount of transactions to request per page.
+        """
+        return iterate_until_complete(self.get_ids_pages_async(
+            ids=ids, start=start, limit=limit, head=head, reverse=reverse, family_name=family_name, page_size=page_size,
+        ))
+
+    async def follow_async(self, family_name, limit, page_size, poll_interval):
+        """
+        Follow transactions of blocks committed after the node's current head, from the oldest to the newest.
+
+        Transactions are taken from the followed blocks, so they are yielded once their blocks are committed,
+        as tuples of transactions and errors.
+
+        Arguments:
+            family_name (string, optional): family name to follow transactions by.
+            limit (int, optional): maximum amount of transactions to yield, transactions are followed endlessly
+                if not passed.
+            page_size (int, required): maximum amount of blocks to request per page.
+            poll_interval (float, required): minimum amount of seconds between polls of the node's head.
+        """
+        transactions_amount = 0
+
+        async for blocks, errors in Block(service=self.service).follow_async(
+            limit=None, page_size=page_size, poll_interval=poll_interval,
+        ):
+            if errors is not None:
+                yield None, errors
+                return
+
+            transactions = [
+                transaction for block in blocks for batch in block.get('batches') or []
+                for transaction in batch.get('transactions') or []
+                if family_name is None or transaction.get('header').get('family_name') == family_name
+            ]
+
+            if limit is not None:
+                transactions = transactions[:limit - transactions_amount]
+
+            if transactions:
+                transactions_amount += len(transactions)
+                yield transactions, None
+
+            if limit is not None and transactions_amount >= limit:
+                return
+
+    def follow(self, family_name, limit, page_size, poll_interval):
+        """
+        Follow transactions of blocks committed after the node's current head, from the oldest to the newest.
+
+        Arguments:
+            family_name (string, optional): family name to follow transactions by.
+            limit (int, optional): maximum amount of transactions to yield, transactions are followed endlessly
+                if not passed.
+            page_size (int, required): maximum amount of blocks to request per page.
+            poll_interval (float, required): minimum amount of seconds between polls of the node's head.
+        """
+        return iterate_until_complete(self.follow_async(
+            family_name=family_name, limit=limit, page_size=page_size, poll_interval=poll_interval,
+        ))
+
+    async def get_async(self, transaction_id):
         """
         Get a transaction.
 
         Arguments:
             transaction_id (string, required): transaction identifier.
         """
+        if self.cache is not None:
+            transaction = self.cache.load(kind=TRANSACTION_CACHE_KIND, identifier=transaction_id)
+
+            if transaction is not None:
+                return transaction, None
+
         try:
-            transaction = loop.run_until_complete(
-                self.service.blockchain_info.get_transaction_by_id(transaction_id=transaction_id),
-            )
+            transaction = await self.service.blockchain_info.get_transaction_by_id(transaction_id=transaction_id)
 
         except RpcGenericServerDefinedError as error:
             return None, str(error.message)
@@ -106,4 +307,16 @@ class Transaction:
         except Exception as error:
             return None, str(error)
 
+        if self.cache is not None:
+            self.cache.store(kind=TRANSACTION_CACHE_KIND, identifier=transaction_id, value=transaction)
+
         return transaction, None
+
+    def get(self, transaction_id):
+        """
+        Get a transaction.
+
+        Arguments:
+            transaction_id (string, required): transaction identifier.
+        """
+        return run_until_complete(self.get_async(transaction_id=transaction_id))
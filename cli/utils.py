@@ -1,11 +1,19 @@
 """
 Provide utils for command line interface.
 """
+import asyncio
 import json
+import textwrap
 
 import click
+from aiohttp_json_rpc import RpcGenericServerDefinedError
 
-from cli.config import ConfigFile
+from cli.config import Settings
+from cli.trace import (
+    JSON_TRACE_EVENT,
+    OUTPUT_TRACE_EVENT,
+    trace,
+)
 
 
 def dict_to_pretty_json(data):
@@ -29,14 +37,104 @@ def dict_to_pretty_json(data):
         - https://www.python.org/dev/peps/pep-0257/#id15
         - https://stackoverflow.com/a/33734332/9632462
     """
-    return json.dumps(data, indent=4, sort_keys=True)
+    with trace(JSON_TRACE_EVENT):
+        return json.dumps(data, indent=4, sort_keys=True)
+
+
+def dict_to_json_line(data):
+    """
+    Convert dictionary to compact single-line json (a line of newline-delimited JSON).
+
+    Keys are not sorted and separators have no whitespaces, as lines are meant to be parsed, not read.
+    """
+    with trace(JSON_TRACE_EVENT):
+        return json.dumps(data, separators=(',', ':'))
 
 
 def print_result(result):
     """
     Print successful result to the terminal.
     """
-    return click.echo(dict_to_pretty_json({'result': result}))
+    result = dict_to_pretty_json({'result': result})
+
+    with trace(OUTPUT_TRACE_EVENT):
+        return click.echo(result)
+
+
+def print_result_pages(pages):
+    """
+    Print successful result, that is received by pages, to the terminal.
+
+    Each page is printed as soon as it is received, the output is the same as printing the whole result at once.
+    If there is an error while receiving pages, the result received so far is closed and the error is returned.
+
+    Arguments:
+        pages (iterable, required): tuples of the page's items and errors.
+    """
+    is_result_started = False
+
+    for items, errors in pages:
+        if errors is not None:
+            break
+
+        for item in items:
+            prefix = ',\n' if is_result_started else '{\n    "result": [\n'
+            item = textwrap.indent(dict_to_pretty_json(item), ' ' * 8)
+
+            with trace(OUTPUT_TRACE_EVENT):
+                click.echo(prefix + item, nl=False)
+
+            is_result_started = True
+
+    else:
+        errors = None
+
+    if is_result_started:
+        click.echo('\n    ]\n}')
+
+    elif errors is None:
+        print_result(result=[])
+
+    return errors
+
+
+def print_result_lines(pages, file=None):
+    """
+    Print successful result, that is received by pages, to the terminal as newline-delimited JSON.
+
+    Each item of the result is printed as a single line of JSON as soon as its page is received.
+    If there is an error while receiving pages, the error is returned.
+
+    Arguments:
+        pages (iterable, required): tuples of the page's items and errors.
+        file (file, optional): file to print the result to instead of the terminal.
+    """
+    for items, errors in pages:
+        if errors is not None:
+            return errors
+
+        for item in items:
+            line = dict_to_json_line(item)
+
+            with trace(OUTPUT_TRACE_EVENT):
+                click.echo(line, file=file)
+
+    return None
+
+
+def iterate_identifiers(pages):
+    """
+    Iterate over the pages of the chain objects' identifiers.
+
+    Arguments:
+        pages (iterable, required): tuples of the page's chain objects (blocks, batches, transactions) and errors.
+    """
+    for items, errors in pages:
+        if errors is not None:
+            yield None, errors
+            continue
+
+        yield [item.get('header_signature') for item in items], None
 
 
 def print_errors(errors):
@@ -49,19 +147,167 @@ def print_errors(errors):
     References:
         - https://click.palletsprojects.com/en/7.x/utils/#ansi-colors
     """
-    click.secho(dict_to_pretty_json({'errors': errors}), blink=True, bold=True, fg='red')
+    errors = dict_to_pretty_json({'errors': errors})
+
+    with trace(OUTPUT_TRACE_EVENT):
+        click.secho(errors, blink=True, bold=True, fg='red')
 
 
 def default_node_url():
     """
     Get default node URL.
+
+    Passed to the options as is (not called), so it is resolved only if the option is not passed and, by shared
+    settings, once per process.
+    """
+    return Settings.get().node_url
+
+
+def default_node_urls():
+    """
+    Get default node URLs to apply read commands to concurrently, none if there are no such nodes.
+    """
+    return Settings.get().node_urls
+
+
+def resolve_node_urls(node_url, node_urls):
+    """
+    Get node URL and node URLs to apply a read command to.
+
+    The command is applied to every node of node URLs if they are passed. Otherwise, it is applied to node URL
+    if it is passed, else to the node URLs of the settings (e.g. `nodes` of the configuration file) if there are
+    any, else to the default node URL. So the configured nodes don't override the explicitly passed node URL.
+
+    Arguments:
+        node_url (string, optional): passed node URL.
+        node_urls (string, optional): passed comma-separated node URLs.
+
+    Returns node URL and node URLs, node URLs are none if the command is applied to the single node.
+    """
+    if node_urls is None and node_url is None:
+        node_urls = default_node_urls()
+
+    if node_url is None:
+        node_url = default_node_url()
+
+    return node_url, node_urls
+
+
+def default_index_path():
     """
-    config_parameters = ConfigFile().parse()
+    Get default path to the local index of blocks, batches and transactions.
+    """
+    return Settings.get().index_path
+
+
+def default_mirror_path():
+    """
+    Get default path to the directory of the local mirror of blocks.
+    """
+    return Settings.get().mirror_path
+
+
+def get_event_loop():
+    """
+    Get the event loop of the current thread, create and set it if there is no one yet.
+    """
+    try:
+        return asyncio.get_event_loop()
+
+    except RuntimeError:
+        loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+        return loop
+
+
+def run_until_complete(coroutine):
+    """
+    Run the coroutine on the event loop of the current thread until it is complete and return its result.
+
+    Used by the synchronous methods of the services, which are thin wrappers over their asynchronous versions.
+    """
+    return get_event_loop().run_until_complete(coroutine)
+
+
+def iterate_until_complete(async_iterator):
+    """
+    Iterate over the asynchronous iterator on the event loop of the current thread.
+
+    Used by the synchronous generators of the services, which are thin wrappers over their asynchronous versions.
+    """
+    loop = get_event_loop()
+
+    while True:
+        try:
+            yield loop.run_until_complete(async_iterator.__anext__())
+
+        except StopAsyncIteration:
+            return
+
+
+async def iterate_pages(request, query, page_size, limit=None):
+    """
+    Iterate over the pages of the list by following the node's paging cursors.
+
+    The head of the first page is used for the next pages, so the pages are consistent even if new blocks
+    are committed meanwhile. Pages are yielded as tuples of the page's items and errors.
+
+    Arguments:
+        request (coroutine function, required): request to get a page of the list with, accepts `query`.
+        query (dict, required): query to get the list by.
+        page_size (int, required): maximum amount of items to request per page.
+        limit (int, optional): maximum amount of items to return in total.
+    """
+    query = dict(query)
+    items_amount = 0
 
-    if config_parameters.node_url is None:
-        return 'localhost'
+    while limit is None or items_amount < limit:
+        query['limit'] = page_size if limit is None else min(page_size, limit - items_amount)
 
-    return config_parameters.node_url
+        try:
+            page = await request(query=dict(query))
+
+        except RpcGenericServerDefinedError as error:
+            yield None, str(error.message)
+            return
+
+        except Exception as error:
+            yield None, str(error)
+            return
+
+        items = page.get('data') or []
+
+        if items:
+            yield items, None
+
+        items_amount += len(items)
+        next_position = (page.get('paging') or {}).get('next')
+
+        if not items or not next_position:
+            return
+
+        query['start'] = next_position
+        query['head'] = page.get('head') or query.get('head')
+
+
+async def collect_pages(pages):
+    """
+    Collect items of the pages to a single list.
+
+    Arguments:
+        pages (async iterable, required): pages as tuples of the page's items and errors.
+
+    Returns the list of items and errors, the first errors stop collecting.
+    """
+    items = []
+
+    async for page_items, errors in pages:
+        if errors is not None:
+            return None, errors
+
+        items.extend(page_items)
+
+    return items, None
 
 
 async def return_async_value(value):
@@ -78,3 +324,29 @@ async def return_async_value(value):
         - https://github.com/pytest-dev/pytest-mock/issues/60
     """
     return value
+
+
+def async_side_effect(*values):
+    """
+    Asynchronous function side effect impostor.
+
+    Using for mock particular asynchronous function with specified return values on every Python version:
+    since Python 3.8 the mock of the asynchronous function awaits its asynchronous side effect, before it returns
+    the side effect's coroutine to be awaited by the caller. Values are returned (exceptions are raised) one per call,
+    the last one is returned for the rest of the calls.
+
+    Example of usage in code:
+        mock_account_get_balance = mock.patch('remme.token.RemmeToken.get_balance')
+        mock_account_get_balance.side_effect = async_side_effect(13500)
+    """
+    values = list(values)
+
+    async def side_effect(*args, **kwargs):
+        value = values.pop(0) if len(values) > 1 else values[0]
+
+        if isinstance(value, BaseException) or isinstance(value, type) and issubclass(value, BaseException):
+            raise value
+
+        return value
+
+    return side_effect
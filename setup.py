@@ -23,11 +23,11 @@ setup(
     license='MIT',
     author='Remme',
     author_email='developers@remme.io',
-    packages=find_packages(),
+    packages=find_packages(exclude=['benchmarks']),
     install_requires=requirements,
     entry_points={
         'console_scripts': [
-            'remme = cli.entrypoint:cli',
+            'remme = cli.entrypoint:main',
         ],
     },
     classifiers=[
@@ -12,7 +12,10 @@ from cli.constants import (
     PASSED_EXIT_FROM_COMMAND_CODE,
 )
 from cli.entrypoint import cli
-from cli.utils import dict_to_pretty_json
+from cli.utils import (
+    async_side_effect,
+    dict_to_pretty_json,
+)
 
 
 def test_get_account_balance():
@@ -72,8 +75,8 @@ def test_get_account_balance_without_node_url(mocker):
     """
     balance = 13500
 
-    mock_account_get_balance = mocker.patch('cli.account.service.loop.run_until_complete')
-    mock_account_get_balance.return_value = balance
+    mock_account_get_balance = mocker.patch('remme.token.RemmeToken.get_balance')
+    mock_account_get_balance.side_effect = async_side_effect(balance)
 
     runner = CliRunner()
     result = runner.invoke(cli, [
@@ -173,3 +176,64 @@ def test_get_account_balance_non_existing_node_url():
 
     assert FAILED_EXIT_FROM_COMMAND_CODE == result.exit_code
     assert dict_to_pretty_json(expected_error) in result.output
+
+
+def test_get_account_balance_twice_within_time_to_live(mocker):
+    """
+    Case: get a balance of an account by address twice within the time to live of the read cache.
+    Expect: the balance is requested from the node once, the second time it is returned from the read cache.
+    """
+    mock_get_balance = mocker.patch('remme.token.RemmeToken.get_balance')
+    mock_get_balance.side_effect = async_side_effect(13500)
+
+    runner = CliRunner()
+
+    for _ in range(2):
+        result = runner.invoke(cli, [
+            'account',
+            'get-balance',
+            '--address',
+            '1120076ecf036e857f42129b58303bcf1e03723764a1702cbe98529802aad8514ee3cf',
+            '--node-url',
+            DEV_BRANCH_NODE_IP_ADDRESS_FOR_TESTING,
+        ])
+
+        assert PASSED_EXIT_FROM_COMMAND_CODE == result.exit_code
+        assert {'result': {'balance': 13500}} == json.loads(result.output)
+
+    assert 1 == mock_get_balance.call_count
+
+
+def test_get_account_balance_from_several_nodes(mocker):
+    """
+    Case: get a balance of an account by address from several nodes concurrently, one of the nodes fails.
+    Expect: balances and errors are returned keyed by node URLs.
+    """
+    mock_get_balance = mocker.patch('remme.token.RemmeToken.get_balance')
+    mock_get_balance.side_effect = async_side_effect(13500, Exception('Connection refused.'))
+
+    runner = CliRunner()
+    result = runner.invoke(cli, [
+        'account',
+        'get-balance',
+        '--address',
+        '1120076ecf036e857f42129b58303bcf1e03723764a1702cbe98529802aad8514ee3cf',
+        '--node-urls',
+        'node-1-testnet.remme.io,node-2-testnet.remme.io',
+    ])
+
+    expected_result = {
+        'result': {
+            'node-1-testnet.remme.io': {
+                'result': {
+                    'balance': 13500,
+                },
+            },
+            'node-2-testnet.remme.io': {
+                'errors': 'Connection refused.',
+            },
+        },
+    }
+
+    assert FAILED_EXIT_FROM_COMMAND_CODE == result.exit_code
+    assert expected_result == json.loads(result.output)
@@ -16,7 +16,10 @@ from cli.constants import (
     PASSED_EXIT_FROM_COMMAND_CODE,
 )
 from cli.entrypoint import cli
-from cli.utils import dict_to_pretty_json
+from cli.utils import (
+    async_side_effect,
+    dict_to_pretty_json,
+)
 
 ADDRESS_PRESENTED_ON_THE_TEST_NODE = '112007d71fa7e120c60fb392a64fd69de891a60c667d9ea9e5d9d9d617263be6c20202'
 
@@ -174,8 +177,8 @@ def test_transfer_tokens_without_node_url(mocker, sent_transaction):
     Case: transfer tokens to address without passing node URL.
     Expect: batch identifier is returned from a node on localhost.
     """
-    mock_account_transfer_tokens = mocker.patch('cli.account.service.loop.run_until_complete')
-    mock_account_transfer_tokens.return_value = sent_transaction
+    mock_account_transfer_tokens = mocker.patch('remme.token.RemmeToken.transfer')
+    mock_account_transfer_tokens.side_effect = async_side_effect(sent_transaction)
 
     runner = CliRunner()
     result = runner.invoke(cli, [
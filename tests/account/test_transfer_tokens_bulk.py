@@ -0,0 +1,209 @@
+"""
+Provide tests for command line interface's account transfer tokens in bulk command.
+"""
+import base64
+import csv
+import hashlib
+import json
+
+from click.testing import CliRunner
+from sawtooth_sdk.protobuf.transaction_pb2 import (
+    Transaction,
+    TransactionHeader,
+)
+from sawtooth_signing.secp256k1 import (
+    Secp256k1Context,
+    Secp256k1PublicKey,
+)
+
+from cli.constants import (
+    DEV_BRANCH_NODE_PRIVATE_KEY_WITH_MONEY,
+    FAILED_EXIT_FROM_COMMAND_CODE,
+    PASSED_EXIT_FROM_COMMAND_CODE,
+)
+from cli.entrypoint import cli
+from cli.utils import async_side_effect
+
+ADDRESSES = [
+    '112007d71fa7e120c60fb392a64fd69de891a60c667d9ea9e5d9d9d617263be6c20202',
+    '1120076ecf036e857f42129b58303bcf1e03723764a1702cbe98529802aad8514ee3cf',
+    '112007db8a00c010402e2e3a7d03491323e761e0ea612481c518605648ceeb5ed454f7',
+]
+
+
+def write_payouts(tmpdir, rows):
+    """
+    Write the input file of the transfers.
+    """
+    path = str(tmpdir.join('payouts.csv'))
+
+    with open(path, 'w', newline='') as payouts_file:
+        payouts = csv.writer(payouts_file)
+        payouts.writerow(['address_to', 'amount'])
+        payouts.writerows(rows)
+
+    return path
+
+
+def read_results(path):
+    """
+    Read the results file of the transfers.
+    """
+    with open(path, newline='') as results_file:
+        return list(csv.DictReader(results_file))
+
+
+def transfer_tokens_bulk(input_path, output_path):
+    """
+    Transfer tokens in bulk by the command line interface.
+    """
+    return CliRunner().invoke(cli, [
+        'account',
+        'transfer-tokens-bulk',
+        '--private-key',
+        DEV_BRANCH_NODE_PRIVATE_KEY_WITH_MONEY,
+        '--input',
+        input_path,
+        '--output-file',
+        output_path,
+        '--concurrency',
+        2,
+        '--processes',
+        2,
+        '--node-url',
+        'localhost',
+    ])
+
+
+def mock_node(mocker):
+    """
+    Mock the node's configurations request and sending of the transactions.
+    """
+    mock_send_request = mocker.patch('remme.api.RemmeAPI.send_request')
+    mock_send_request.side_effect = async_side_effect({'node_public_key': '02' + 'a' * 64})
+
+    async def send(payload):
+        return mocker.Mock(batch_id=hashlib.sha512(payload.encode()).hexdigest())
+
+    mock_send = mocker.patch('remme.transaction_service.RemmeTransactionService.send')
+    mock_send.side_effect = send
+
+    return mock_send_request, mock_send
+
+
+def test_transfer_tokens_bulk(mocker, tmpdir):
+    """
+    Case: transfer tokens to addresses of the input file.
+    Expect: every transfer is sent, its batch identifier is written to the results file.
+    """
+    _, mock_send = mock_node(mocker=mocker)
+
+    input_path = write_payouts(tmpdir=tmpdir, rows=[(address, 10) for address in ADDRESSES])
+    output_path = str(tmpdir.join('results.csv'))
+
+    result = transfer_tokens_bulk(input_path=input_path, output_path=output_path)
+
+    results = sorted(read_results(path=output_path), key=lambda row: row.get('row'))
+
+    assert PASSED_EXIT_FROM_COMMAND_CODE == result.exit_code
+    assert {'sent': 3, 'skipped': 0, 'failed': 0} == json.loads(result.output).get('result')
+    assert ['1', '2', '3'] == [row.get('row') for row in results]
+    assert ADDRESSES == [row.get('address_to') for row in results]
+    assert 3 == len({row.get('batch_id') for row in results})
+    assert 3 == mock_send.call_count
+
+
+def test_transfer_tokens_bulk_signed_transactions(mocker, tmpdir):
+    """
+    Case: transfer tokens to addresses of the input file signing transactions in the pool of processes.
+    Expect: every sent transaction is signed by the account, has the node as batcher and a unique nonce.
+    """
+    _, mock_send = mock_node(mocker=mocker)
+
+    input_path = write_payouts(tmpdir=tmpdir, rows=[(ADDRESSES[0], 10)] * 3)
+
+    result = transfer_tokens_bulk(input_path=input_path, output_path=str(tmpdir.join('results.csv')))
+
+    transactions = [
+        Transaction.FromString(base64.b64decode(call[1].get('payload'))) for call in mock_send.call_args_list
+    ]
+    headers = [TransactionHeader.FromString(transaction.header) for transaction in transactions]
+
+    assert PASSED_EXIT_FROM_COMMAND_CODE == result.exit_code
+    assert 3 == len({header.nonce for header in headers})
+
+    for transaction, header in zip(transactions, headers):
+        assert '02' + 'a' * 64 == header.batcher_public_key
+        assert hashlib.sha512(transaction.payload).hexdigest() == header.payload_sha512
+        assert Secp256k1Context().verify(
+            transaction.header_signature,
+            transaction.header,
+            Secp256k1PublicKey.from_hex(header.signer_public_key),
+        )
+
+
+def test_resume_transfer_tokens_bulk(mocker, tmpdir):
+    """
+    Case: transfer tokens in bulk again after sending of a transfer failed.
+    Expect: only the failed transfer is sent again, the same signed transaction is sent instead of a new one.
+    """
+    mock_send_request, mock_send = mock_node(mocker=mocker)
+    send = mock_send.side_effect
+
+    async def send_or_fail(payload):
+        if len(mock_send.call_args_list) == 2:
+            raise Exception('Connection refused.')
+
+        return await send(payload=payload)
+
+    mock_send.side_effect = send_or_fail
+
+    input_path = write_payouts(tmpdir=tmpdir, rows=[(address, 10) for address in ADDRESSES])
+    output_path = str(tmpdir.join('results.csv'))
+
+    result = transfer_tokens_bulk(input_path=input_path, output_path=output_path)
+
+    assert FAILED_EXIT_FROM_COMMAND_CODE == result.exit_code
+    assert {'sent': 2, 'skipped': 0, 'failed': 1} == json.loads(result.output).get('result')
+
+    failed_payload = mock_send.call_args_list[1][1].get('payload')
+    node_configurations_requests_amount = mock_send_request.call_count
+
+    mock_send.side_effect = send
+
+    result = transfer_tokens_bulk(input_path=input_path, output_path=output_path)
+
+    assert PASSED_EXIT_FROM_COMMAND_CODE == result.exit_code
+    assert {'sent': 1, 'skipped': 2, 'failed': 0} == json.loads(result.output).get('result')
+    assert failed_payload == mock_send.call_args_list[-1][1].get('payload')
+    assert node_configurations_requests_amount == mock_send_request.call_count
+    assert 3 == len({row.get('batch_id') for row in read_results(path=output_path) if row.get('batch_id')})
+
+
+def test_transfer_tokens_bulk_with_invalid_rows(mocker, tmpdir):
+    """
+    Case: transfer tokens in bulk by the input file with invalid rows.
+    Expect: errors of all invalid rows are printed, no transfer is sent.
+    """
+    _, mock_send = mock_node(mocker=mocker)
+
+    input_path = write_payouts(tmpdir=tmpdir, rows=[(ADDRESSES[0], 10), ('1120076e', 10), (ADDRESSES[2], 0)])
+
+    result = transfer_tokens_bulk(input_path=input_path, output_path=str(tmpdir.join('results.csv')))
+
+    expected_error = {
+        'errors': {
+            'input': {
+                '2': {
+                    'address_to': ['The following address `1120076e` is invalid.'],
+                },
+                '3': {
+                    'amount': ['Amount must be greater than 0.'],
+                },
+            },
+        },
+    }
+
+    assert FAILED_EXIT_FROM_COMMAND_CODE == result.exit_code
+    assert expected_error == json.loads(result.output)
+    assert not mock_send.called
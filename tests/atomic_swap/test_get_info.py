@@ -15,7 +15,10 @@ from cli.constants import (
     SWAP_IDENTIFIER_REGEXP,
 )
 from cli.entrypoint import cli
-from cli.utils import dict_to_pretty_json
+from cli.utils import (
+    async_side_effect,
+    dict_to_pretty_json,
+)
 
 SWAP_IDENTIFIER_PRESENTED_ON_THE_TEST_NODE = '133102e41346242476b15a3a7966eb5249271025fc7fb0b37ed3fdb4bcce380e'
 
@@ -51,8 +54,8 @@ def test_get_swap_info_without_node_url(mocker, swap_info):
     Case: get information about atomic swap by its identifier without passing node URL.
     Expect: information about the swap is returned from a node on localhost.
     """
-    mock_swap_get_info = mocker.patch('cli.atomic_swap.service.loop.run_until_complete')
-    mock_swap_get_info.return_value = swap_info
+    mock_swap_get_info = mocker.patch('remme.atomic_swap.RemmeSwap.get_info')
+    mock_swap_get_info.side_effect = async_side_effect(swap_info)
 
     runner = CliRunner()
     result = runner.invoke(cli, [
@@ -14,7 +14,10 @@ from cli.constants import (
     PUBLIC_KEY_REGEXP,
 )
 from cli.entrypoint import cli
-from cli.utils import dict_to_pretty_json
+from cli.utils import (
+    async_side_effect,
+    dict_to_pretty_json,
+)
 
 
 def test_get_public_key():
@@ -42,8 +45,8 @@ def test_get_public_key_without_node_url(mocker):
     Expect: a public key is returned from node on localhost.
     """
     public_key = '03738df3f4ac3621ba8e89413d3ff4ad036c3a0a4dbb164b695885aab6aab614ad'
-    mock_swap_get_public_key = mocker.patch('cli.node.service.loop.run_until_complete')
-    mock_swap_get_public_key.return_value = public_key
+    mock_swap_get_public_key = mocker.patch('remme.atomic_swap.RemmeSwap.get_public_key')
+    mock_swap_get_public_key.side_effect = async_side_effect(public_key)
 
     runner = CliRunner()
     result = runner.invoke(cli, [
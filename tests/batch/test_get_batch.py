@@ -12,7 +12,10 @@ from cli.constants import (
     PASSED_EXIT_FROM_COMMAND_CODE,
 )
 from cli.entrypoint import cli
-from cli.utils import dict_to_pretty_json
+from cli.utils import (
+    async_side_effect,
+    dict_to_pretty_json,
+)
 
 BATCH_IDENTIFIER_PRESENTED_ON_THE_TEST_NODE = 'ccb529856e538325b435c6a75261702d1bdb52d3873b29189a722330cda628a6' \
                                               '62028a7b39d1f5475cb78f5fc12efb986a35553ce8f1b63580b97fc6ab9e9655'
@@ -109,8 +112,8 @@ def test_get_batch_without_node_url(mocker):
         },
     }
 
-    mock_get_batch_by_id = mocker.patch('cli.batch.service.loop.run_until_complete')
-    mock_get_batch_by_id.return_value = expected_result
+    mock_get_batch_by_id = mocker.patch('remme.blockchain_info.RemmeBlockchainInfo.get_batch_by_id')
+    mock_get_batch_by_id.side_effect = async_side_effect(expected_result)
 
     runner = CliRunner()
     result = runner.invoke(cli, [
@@ -12,7 +12,10 @@ from cli.constants import (
     PASSED_EXIT_FROM_COMMAND_CODE,
 )
 from cli.entrypoint import cli
-from cli.utils import dict_to_pretty_json
+from cli.utils import (
+    async_side_effect,
+    dict_to_pretty_json,
+)
 
 BATCH_IDENTIFIER_PRESENTED_ON_THE_TEST_NODE = '6f200995e766da7218ec2a3d0aeabbe1151128063cdf4e954cd08390a879b28e' \
                                               '085a06f8708d2e6bb34f6501e8ddc981f0353627c1d4f90c80a656a8090c8751'
@@ -95,6 +98,35 @@ def test_get_batch_status_with_invalid_id():
     assert dict_to_pretty_json(expected_error_message) in result.output
 
 
+def test_get_batch_status_with_trailing_newline_id():
+    """
+    Case: get a batch status by identifier with the trailing newline.
+    Expect: the following identifier is invalid error message.
+    """
+    invalid_batch_id = BATCH_IDENTIFIER_PRESENTED_ON_THE_TEST_NODE + '\n'
+
+    runner = CliRunner()
+    result = runner.invoke(cli, [
+        'batch',
+        'get-status',
+        '--id',
+        invalid_batch_id,
+        '--node-url',
+        DEV_BRANCH_NODE_IP_ADDRESS_FOR_TESTING,
+    ])
+
+    expected_error_message = {
+        'errors': {
+            'id': [
+                f'The following identifier `{invalid_batch_id}` is invalid.',
+            ],
+        },
+    }
+
+    assert FAILED_EXIT_FROM_COMMAND_CODE == result.exit_code
+    assert dict_to_pretty_json(expected_error_message) in result.output
+
+
 def test_get_batch_status_without_node_url(mocker):
     """
     Case: get a batch status by its identifier without passing node URL.
@@ -106,8 +138,8 @@ def test_get_batch_status_without_node_url(mocker):
         'result': committed_status,
     }
 
-    mock_get_batch_status_by_id = mocker.patch('cli.batch.service.loop.run_until_complete')
-    mock_get_batch_status_by_id.return_value = committed_status
+    mock_get_batch_status_by_id = mocker.patch('remme.blockchain_info.RemmeBlockchainInfo.get_batch_status')
+    mock_get_batch_status_by_id.side_effect = async_side_effect(committed_status)
 
     runner = CliRunner()
     result = runner.invoke(cli, [
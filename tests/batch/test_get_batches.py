@@ -14,7 +14,10 @@ from cli.constants import (
     PASSED_EXIT_FROM_COMMAND_CODE,
 )
 from cli.entrypoint import cli
-from cli.utils import dict_to_pretty_json
+from cli.utils import (
+    async_side_effect,
+    dict_to_pretty_json,
+)
 
 COMMITTED_BATCH_IDENTIFIERS = '3f04a6bddf7504fe5e9669b87f5de773c47598c5f753aca39748d4888a695a7f' \
                               '020e64dd8872e169086216765c3b9404807c7d6d53db7363388e89b89f89c29a, ' \
@@ -140,6 +143,37 @@ def test_get_batches_with_invalid_ids():
     assert dict_to_pretty_json(expected_error_message) in result.output
 
 
+def test_get_batches_with_several_invalid_ids():
+    """
+    Case: get a list of batches by several invalid identifiers, one of them is uppercase.
+    Expect: the following identifier is invalid error message per invalid identifier.
+    """
+    uppercase_id = COMMITTED_BATCH_IDENTIFIER.upper()
+    batch_ids = f'6f200, {COMMITTED_BATCH_IDENTIFIER}, {uppercase_id}, 6f200'
+
+    runner = CliRunner()
+    result = runner.invoke(cli, [
+        'batch',
+        'get-list',
+        '--ids',
+        batch_ids,
+        '--node-url',
+        DEV_BRANCH_NODE_IP_ADDRESS_FOR_TESTING,
+    ])
+
+    expected_error_message = {
+        'errors': {
+            'ids': [
+                'The following identifier `6f200` is invalid.',
+                f'The following identifier `{uppercase_id}` is invalid.',
+            ],
+        },
+    }
+
+    assert FAILED_EXIT_FROM_COMMAND_CODE == result.exit_code
+    assert dict_to_pretty_json(expected_error_message) in result.output
+
+
 def test_get_batches_with_start():
     """
     Case: get a list of batches by batch identifier starting from.
@@ -430,8 +464,8 @@ def test_get_batches_without_node_url(mocker):
         'result': batch_data.get('data'),
     }
 
-    mock_get_batches = mocker.patch('cli.batch.service.loop.run_until_complete')
-    mock_get_batches.return_value = batch_data
+    mock_get_batches = mocker.patch('remme.blockchain_info.RemmeBlockchainInfo.get_batches')
+    mock_get_batches.side_effect = async_side_effect(batch_data)
 
     runner = CliRunner()
     result = runner.invoke(cli, [
@@ -496,3 +530,37 @@ def test_get_batches_with_non_existing_node_url():
 
     assert FAILED_EXIT_FROM_COMMAND_CODE == result.exit_code
     assert dict_to_pretty_json(expected_error) in result.output
+
+
+def test_get_batches_all_pages(mocker):
+    """
+    Case: get all batches page by page following the node's paging.
+    Expect: batches from all pages are returned, next page is requested starting from the paging's next batch.
+    """
+    first_page_batches = [{'header_signature': 'a' * 128}]
+    second_page_batches = [{'header_signature': 'b' * 128}]
+
+    mock_get_batches = mocker.patch('remme.blockchain_info.RemmeBlockchainInfo.get_batches')
+    mock_get_batches.side_effect = async_side_effect(
+        {'data': first_page_batches, 'head': 'c' * 128, 'paging': {'limit': 1, 'next': 'b' * 128}},
+        {'data': second_page_batches, 'head': 'c' * 128, 'paging': {'limit': 1, 'next': ''}},
+    )
+
+    runner = CliRunner()
+    result = runner.invoke(cli, [
+        'batch',
+        'get-list',
+        '--all',
+        '--page-size',
+        1,
+        '--node-url',
+        'localhost',
+    ])
+
+    expected_result = {
+        'result': first_page_batches + second_page_batches,
+    }
+
+    assert PASSED_EXIT_FROM_COMMAND_CODE == result.exit_code
+    assert dict_to_pretty_json(expected_result) + '\n' == result.output
+    assert 'b' * 128 == mock_get_batches.call_args_list[1][1].get('query').get('start')
@@ -0,0 +1,185 @@
+"""
+Provide tests for command line interface's wait for batches command.
+"""
+import json
+
+from click.testing import CliRunner
+
+from cli.constants import (
+    FAILED_EXIT_FROM_COMMAND_CODE,
+    PASSED_EXIT_FROM_COMMAND_CODE,
+)
+from cli.entrypoint import cli
+from cli.utils import async_side_effect
+
+FIRST_BATCH_IDENTIFIER = 'a' * 128
+SECOND_BATCH_IDENTIFIER = 'b' * 128
+THIRD_BATCH_IDENTIFIER = 'c' * 128
+
+
+def mock_batches_statuses(mocker, statuses):
+    """
+    Mock requests of the batches' statuses to return the following statuses of each batch one by one.
+    """
+    statuses = {batch_id: iter(batch_statuses) for batch_id, batch_statuses in statuses.items()}
+
+    async def get_batch_status(batch_id):
+        return next(statuses.get(batch_id))
+
+    mock_get_batch_status = mocker.patch('remme.blockchain_info.RemmeBlockchainInfo.get_batch_status')
+    mock_get_batch_status.side_effect = get_batch_status
+
+    return mock_get_batch_status
+
+
+def test_wait_batches(mocker):
+    """
+    Case: wait for batches read from stdin to be committed.
+    Expect: changes of the statuses are printed as they are polled, the summary is printed, polls are backed off.
+    """
+    mock_batches_statuses(mocker=mocker, statuses={
+        FIRST_BATCH_IDENTIFIER: ['PENDING', 'PENDING', 'COMMITTED'],
+        SECOND_BATCH_IDENTIFIER: ['UNKNOWN', 'COMMITTED'],
+    })
+
+    mock_sleep = mocker.patch('asyncio.sleep', side_effect=async_side_effect(None))
+
+    runner = CliRunner()
+    result = runner.invoke(cli, [
+        'batch',
+        'wait',
+        '--node-url',
+        'localhost',
+    ], input=f'{FIRST_BATCH_IDENTIFIER}\n{SECOND_BATCH_IDENTIFIER}\n')
+
+    lines = [json.loads(line) for line in result.output.splitlines()]
+
+    assert PASSED_EXIT_FROM_COMMAND_CODE == result.exit_code
+    assert [
+        {'id': FIRST_BATCH_IDENTIFIER, 'status': 'PENDING'},
+        {'id': FIRST_BATCH_IDENTIFIER, 'status': 'COMMITTED'},
+    ] == [line for line in lines if line.get('id') == FIRST_BATCH_IDENTIFIER]
+    assert [
+        {'id': SECOND_BATCH_IDENTIFIER, 'status': 'UNKNOWN'},
+        {'id': SECOND_BATCH_IDENTIFIER, 'status': 'COMMITTED'},
+    ] == [line for line in lines if line.get('id') == SECOND_BATCH_IDENTIFIER]
+    assert {'result': {'UNKNOWN': 0, 'INVALID': 0, 'PENDING': 0, 'COMMITTED': 2}} == lines[-1]
+    assert [0.5, 0.5, 1] == sorted(call[0][0] for call in mock_sleep.call_args_list)
+
+
+def test_wait_batches_with_invalid_batch(mocker):
+    """
+    Case: wait for batches to be pending when one of them is invalid.
+    Expect: the invalid batch isn't polled after it is invalid, the summary is printed, the command is failed.
+    """
+    mock_get_batch_status = mock_batches_statuses(mocker=mocker, statuses={
+        FIRST_BATCH_IDENTIFIER: ['PENDING'],
+        SECOND_BATCH_IDENTIFIER: ['INVALID'],
+        THIRD_BATCH_IDENTIFIER: ['COMMITTED'],
+    })
+
+    mocker.patch('asyncio.sleep', side_effect=async_side_effect(None))
+
+    runner = CliRunner()
+    result = runner.invoke(cli, [
+        'batch',
+        'wait',
+        '--ids',
+        f'{FIRST_BATCH_IDENTIFIER}, {SECOND_BATCH_IDENTIFIER}, {THIRD_BATCH_IDENTIFIER}',
+        '--until',
+        'PENDING',
+        '--node-url',
+        'localhost',
+    ])
+
+    lines = [json.loads(line) for line in result.output.splitlines()]
+
+    assert FAILED_EXIT_FROM_COMMAND_CODE == result.exit_code
+    assert {'result': {'UNKNOWN': 0, 'INVALID': 1, 'PENDING': 1, 'COMMITTED': 1}} == lines[-1]
+    assert 3 == mock_get_batch_status.call_count
+
+
+def test_wait_batches_with_retried_request(mocker):
+    """
+    Case: wait for the batch when the first request of its status fails.
+    Expect: the status is requested again, the batch is committed, the error isn't printed.
+    """
+    mock_get_batch_status = mocker.patch('remme.blockchain_info.RemmeBlockchainInfo.get_batch_status')
+    mock_get_batch_status.side_effect = async_side_effect(Exception('Request timed out.'), 'COMMITTED')
+
+    mocker.patch('asyncio.sleep', side_effect=async_side_effect(None))
+
+    runner = CliRunner()
+    result = runner.invoke(cli, [
+        'batch',
+        'wait',
+        '--ids',
+        FIRST_BATCH_IDENTIFIER,
+        '--node-url',
+        'localhost',
+    ])
+
+    lines = [json.loads(line) for line in result.output.splitlines()]
+
+    assert PASSED_EXIT_FROM_COMMAND_CODE == result.exit_code
+    assert [
+        {'id': FIRST_BATCH_IDENTIFIER, 'status': 'COMMITTED'},
+        {'result': {'UNKNOWN': 0, 'INVALID': 0, 'PENDING': 0, 'COMMITTED': 1}},
+    ] == lines
+    assert 2 == mock_get_batch_status.call_count
+
+
+def test_wait_batches_with_failed_request(mocker):
+    """
+    Case: wait for the batch when its status could not be requested until the timeout.
+    Expect: the last error is printed for the batch, its status is unknown in the summary, the command is failed.
+    """
+    mock_get_batch_status = mocker.patch('remme.blockchain_info.RemmeBlockchainInfo.get_batch_status')
+    mock_get_batch_status.side_effect = Exception('Connection refused.')
+
+    runner = CliRunner()
+    result = runner.invoke(cli, [
+        'batch',
+        'wait',
+        '--ids',
+        FIRST_BATCH_IDENTIFIER,
+        '--timeout',
+        '1',
+        '--node-url',
+        'localhost',
+    ])
+
+    lines = [json.loads(line) for line in result.output.splitlines()]
+
+    assert FAILED_EXIT_FROM_COMMAND_CODE == result.exit_code
+    assert {'id': FIRST_BATCH_IDENTIFIER, 'errors': 'Connection refused.'} == lines[0]
+    assert {'result': {'UNKNOWN': 1, 'INVALID': 0, 'PENDING': 0, 'COMMITTED': 0}} == lines[-1]
+
+
+def test_wait_batches_with_invalid_until():
+    """
+    Case: wait for batches to reach the status that isn't supported.
+    Expect: until must be one of the supported statuses error message.
+    """
+    runner = CliRunner()
+    result = runner.invoke(cli, [
+        'batch',
+        'wait',
+        '--ids',
+        FIRST_BATCH_IDENTIFIER,
+        '--until',
+        'INVALID',
+        '--node-url',
+        'localhost',
+    ])
+
+    expected_error = {
+        'errors': {
+            'until': [
+                'Until must be one of: PENDING, COMMITTED.',
+            ],
+        },
+    }
+
+    assert FAILED_EXIT_FROM_COMMAND_CODE == result.exit_code
+    assert expected_error == json.loads(result.output)
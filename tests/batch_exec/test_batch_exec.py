@@ -0,0 +1,203 @@
+"""
+Provide tests for command line interface's batch execution command.
+"""
+import json
+
+from click.testing import CliRunner
+
+from cli.batch_exec.service import BatchExecution
+from cli.constants import (
+    BATCH_EXECUTION_PENDING_COMMANDS_PER_CONCURRENCY,
+    FAILED_EXIT_FROM_COMMAND_CODE,
+    PASSED_EXIT_FROM_COMMAND_CODE,
+)
+from cli.entrypoint import cli
+from cli.utils import dict_to_pretty_json
+
+
+def test_batch_exec_empty_input():
+    """
+    Case: execute a batch of commands from the input without commands.
+    Expect: nothing is returned.
+    """
+    runner = CliRunner()
+    result = runner.invoke(cli, [
+        'batch-exec',
+        '--concurrency',
+        1,
+    ], input='\n\n')
+
+    assert PASSED_EXIT_FROM_COMMAND_CODE == result.exit_code
+    assert '' == result.output
+
+
+def test_batch_exec_invalid_commands():
+    """
+    Case: execute a batch of commands with invalid JSON, not supported command and command's invalid arguments.
+    Expect: errors are returned per each line in the order of the input.
+    """
+    invalid_address = '1120076ecf036e857f42129b5830'
+
+    commands = '\n'.join([
+        'not a json',
+        '{"cmd": "account transfer-tokens"}',
+        '',
+        '{"cmd": "account get-balance", "address": "' + invalid_address + '"}',
+    ])
+
+    runner = CliRunner()
+    result = runner.invoke(cli, [
+        'batch-exec',
+        '--concurrency',
+        1,
+    ], input=commands)
+
+    expected_results = [
+        {
+            'errors': 'The line is not a valid JSON.',
+            'line': 1,
+        },
+        {
+            'cmd': 'account transfer-tokens',
+            'errors': 'The following command `account transfer-tokens` is not supported.',
+            'line': 2,
+        },
+        {
+            'cmd': 'account get-balance',
+            'errors': {
+                'address': [
+                    f'The following address `{invalid_address}` is invalid.',
+                ],
+            },
+            'line': 4,
+        },
+    ]
+
+    assert FAILED_EXIT_FROM_COMMAND_CODE == result.exit_code
+    assert expected_results == [json.loads(line) for line in result.output.splitlines()]
+
+
+def test_batch_exec_arguments_of_invalid_types(mock_node):
+    """
+    Case: execute a batch of commands with arguments of invalid types and a valid command after them.
+    Expect: errors are returned per each line with invalid arguments, the valid command is executed.
+    """
+    block_identifier = mock_node.chain.head.get('header_signature')
+
+    commands = '\n'.join([
+        '{"cmd": "block get", "id": 5}',
+        '{"cmd": "block get-list", "ids": [1, 2]}',
+        '{"cmd": "block get", "id": {"value": "' + block_identifier + '"}}',
+        '{"cmd": ["block", "get"]}',
+        '{"cmd": "block get", "id": "' + block_identifier + '"}',
+    ])
+
+    runner = CliRunner()
+    result = runner.invoke(cli, ['batch-exec'], input=commands)
+
+    results = [json.loads(line) for line in result.output.splitlines()]
+
+    assert FAILED_EXIT_FROM_COMMAND_CODE == result.exit_code
+    assert [
+        {
+            'cmd': 'block get',
+            'errors': 'The command\'s arguments are of invalid types.',
+            'line': 1,
+        },
+        {
+            'cmd': 'block get-list',
+            'errors': {
+                'ids': [
+                    'Not a valid string, number, boolean or list of strings.',
+                ],
+            },
+            'line': 2,
+        },
+        {
+            'cmd': 'block get',
+            'errors': {
+                'id': [
+                    'Not a valid string, number, boolean or list of strings.',
+                ],
+            },
+            'line': 3,
+        },
+        {
+            'cmd': ['block', 'get'],
+            'errors': 'The following command `[\'block\', \'get\']` is not supported.',
+            'line': 4,
+        },
+    ] == results[:4]
+    assert block_identifier == results[4].get('result').get('header_signature')
+
+
+def test_batch_exec_reads_lines_as_executed():
+    """
+    Case: execute a large batch of commands.
+    Expect: lines are read as the commands are executed, the amount of the read lines is bounded by the concurrency.
+    """
+    read_lines = []
+
+    def get_lines():
+        for line_number in range(1000):
+            read_lines.append(line_number)
+            yield 'not a json'
+
+    for order in ('input', 'completion'):
+        read_lines.clear()
+
+        results = BatchExecution(concurrency=2, order=order).execute(lines=get_lines())
+
+        next(results)
+        assert len(read_lines) <= 2 * BATCH_EXECUTION_PENDING_COMMANDS_PER_CONCURRENCY + 1
+
+        assert 999 == len(list(results))
+        assert 1000 == len(read_lines)
+
+
+def test_batch_exec_invalid_concurrency():
+    """
+    Case: execute a batch of commands with invalid concurrency.
+    Expect: concurrency must be greater than 0 error message.
+    """
+    runner = CliRunner()
+    result = runner.invoke(cli, [
+        'batch-exec',
+        '--concurrency',
+        0,
+    ], input='')
+
+    expected_error = {
+        'errors': {
+            'concurrency': [
+                'Concurrency must be greater than 0.',
+            ],
+        },
+    }
+
+    assert FAILED_EXIT_FROM_COMMAND_CODE == result.exit_code
+    assert dict_to_pretty_json(expected_error) in result.output
+
+
+def test_batch_exec_invalid_order():
+    """
+    Case: execute a batch of commands with invalid order of the results.
+    Expect: order must be one of the supported orders error message.
+    """
+    runner = CliRunner()
+    result = runner.invoke(cli, [
+        'batch-exec',
+        '--order',
+        'random',
+    ], input='')
+
+    expected_error = {
+        'errors': {
+            'order': [
+                'Order must be one of: input, completion.',
+            ],
+        },
+    }
+
+    assert FAILED_EXIT_FROM_COMMAND_CODE == result.exit_code
+    assert dict_to_pretty_json(expected_error) in result.output
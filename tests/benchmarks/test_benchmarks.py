@@ -0,0 +1,56 @@
+"""
+Provide tests for the benchmarks of the commands.
+"""
+from benchmarks.cases import (
+    LATENCY_CASES,
+    PEAK_RSS_CASES,
+    THROUGHPUT_CASES,
+)
+from benchmarks.suite import (
+    compare_results,
+    run_benchmarks,
+)
+
+
+def test_run_benchmarks():
+    """
+    Case: run the latency, throughput and peak memory usage benchmarks against the mock node.
+    Expect: results of every case are measured.
+    """
+    results = run_benchmarks(sections=['latency', 'throughput', 'peak-rss'], iterations=2, sizes=[10])
+
+    assert set(LATENCY_CASES) == set(results.get('latency'))
+    assert set(THROUGHPUT_CASES) == set(results.get('throughput'))
+    assert set(PEAK_RSS_CASES) == set(results.get('peak_rss'))
+    assert 'cold_start' not in results
+
+    for latency in results.get('latency').values():
+        assert 0 < latency.get('p50') <= latency.get('p90') <= latency.get('p99')
+
+    for peak_rss in results.get('peak_rss').values():
+        assert 0 < peak_rss.get('10')
+
+
+def test_compare_benchmarks_results():
+    """
+    Case: compare the benchmarks' results with the previous ones.
+    Expect: ratios of the metrics measured by both results.
+    """
+    previous_results = {
+        'commit': 'a' * 40,
+        'latency': {'block get': {'p50': 2.0, 'p99': 4.0}},
+        'throughput': {'batch wait': 1000.0},
+    }
+
+    results = {
+        'commit': 'b' * 40,
+        'latency': {'block get': {'p50': 3.0, 'p99': 4.0}, 'node get-info': {'p50': 1.0}},
+        'throughput': {'batch wait': 500.0},
+        'peak_rss': {'block get-list': {'1000': 100.0}},
+    }
+
+    assert {
+        'latency.block get.p50': 1.5,
+        'latency.block get.p99': 1.0,
+        'throughput.batch wait': 0.5,
+    } == compare_results(previous_results=previous_results, results=results)
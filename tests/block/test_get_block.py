@@ -12,7 +12,10 @@ from cli.constants import (
     PASSED_EXIT_FROM_COMMAND_CODE,
 )
 from cli.entrypoint import cli
-from cli.utils import dict_to_pretty_json
+from cli.utils import (
+    async_side_effect,
+    dict_to_pretty_json,
+)
 
 EXISTING_BLOCK_IDENTIFIER = '95849a2a9a4775b6432b181e12749c43724682e37ca3560223586b01cbb40593' \
                             '31a7d970e4ebfdc328cd000adb4ddc9e3296b5cfb7045543006ca58214c25eb7'
@@ -142,8 +145,8 @@ def test_get_block_without_node_url(mocker):
         },
     }
 
-    mock_get_block_by_id = mocker.patch('cli.block.service.loop.run_until_complete')
-    mock_get_block_by_id.return_value = block
+    mock_get_block_by_id = mocker.patch('remme.blockchain_info.RemmeBlockchainInfo.get_block_by_id')
+    mock_get_block_by_id.side_effect = async_side_effect(block)
 
     runner = CliRunner()
     result = runner.invoke(cli, [
@@ -268,3 +271,67 @@ def test_get_block_non_existing_identifier():
 
     assert FAILED_EXIT_FROM_COMMAND_CODE == result.exit_code
     assert dict_to_pretty_json(expected_error) in result.output
+
+
+def test_get_block_from_cache(mocker):
+    """
+    Case: get a block by identifier twice.
+    Expect: the block is requested from the node once, the second time it is loaded from the on-disk cache.
+    """
+    block = {
+        'data': {
+            'header_signature': EXISTING_BLOCK_IDENTIFIER,
+        },
+    }
+
+    mock_get_block_by_id = mocker.patch('remme.blockchain_info.RemmeBlockchainInfo.get_block_by_id')
+    mock_get_block_by_id.side_effect = async_side_effect(block)
+
+    runner = CliRunner()
+
+    for _ in range(2):
+        result = runner.invoke(cli, [
+            'block',
+            'get',
+            '--id',
+            EXISTING_BLOCK_IDENTIFIER,
+            '--node-url',
+            DEV_BRANCH_NODE_IP_ADDRESS_FOR_TESTING,
+        ])
+
+        assert PASSED_EXIT_FROM_COMMAND_CODE == result.exit_code
+        assert {'result': block.get('data')} == json.loads(result.output)
+
+    assert 1 == mock_get_block_by_id.call_count
+
+
+def test_get_block_without_cache(mocker):
+    """
+    Case: get a block by identifier twice bypassing the cache.
+    Expect: the block is requested from the node each time.
+    """
+    block = {
+        'data': {
+            'header_signature': EXISTING_BLOCK_IDENTIFIER,
+        },
+    }
+
+    mock_get_block_by_id = mocker.patch('remme.blockchain_info.RemmeBlockchainInfo.get_block_by_id')
+    mock_get_block_by_id.side_effect = async_side_effect(block)
+
+    runner = CliRunner()
+
+    for _ in range(2):
+        result = runner.invoke(cli, [
+            'block',
+            'get',
+            '--id',
+            EXISTING_BLOCK_IDENTIFIER,
+            '--no-cache',
+            '--node-url',
+            DEV_BRANCH_NODE_IP_ADDRESS_FOR_TESTING,
+        ])
+
+        assert PASSED_EXIT_FROM_COMMAND_CODE == result.exit_code
+
+    assert 2 == mock_get_block_by_id.call_count
@@ -14,7 +14,10 @@ from cli.constants import (
     PASSED_EXIT_FROM_COMMAND_CODE,
 )
 from cli.entrypoint import cli
-from cli.utils import dict_to_pretty_json
+from cli.utils import (
+    async_side_effect,
+    dict_to_pretty_json,
+)
 
 EXISTING_BLOCKS_IDENTIFIERS = 'b757c74fbcd57ae12577b71490878affb6b688434c2e20170138760e72e937ca' \
                               '1bb3d6773e2ef37b5151ed74dcb663114a181072e0870e7a4d452c58659a6dbb, ' \
@@ -141,6 +144,59 @@ def test_get_blocks_invalid_ids():
     assert dict_to_pretty_json(expected_error_message) in result.output
 
 
+def test_get_blocks_with_many_ids(mock_node):
+    """
+    Case: get a list of blocks by identifiers of all the blocks.
+    Expect: blocks of the identifiers are returned.
+    """
+    block_identifiers = [block.get('header_signature') for block in mock_node.chain.blocks]
+
+    runner = CliRunner()
+    result = runner.invoke(cli, [
+        'block',
+        'get-list',
+        '--ids',
+        ', '.join(block_identifiers),
+        '--ids-only',
+    ])
+
+    assert PASSED_EXIT_FROM_COMMAND_CODE == result.exit_code
+    assert sorted(block_identifiers) == sorted(json.loads(result.output).get('result'))
+
+
+def test_get_blocks_several_invalid_ids():
+    """
+    Case: get a list of blocks by valid identifiers and several invalid ones.
+    Expect: the following block identifier is invalid error message per invalid identifier.
+    """
+    block_identifier = 'afb21d7012d9a65f8bf35bfa8fd648757ece23e7687f16b1254957a92119912d' \
+                       '1c1bdbbce01984ad73a12277dedfd0fe5f7af3d0f6139952b9b5ac09481ccd94'
+    short_block_identifier = block_identifier[:-1]
+    non_hexadecimal_block_identifier = block_identifier[:-1] + 'g'
+
+    runner = CliRunner()
+    result = runner.invoke(cli, [
+        'block',
+        'get-list',
+        '--ids',
+        f'{block_identifier},{short_block_identifier},{non_hexadecimal_block_identifier}',
+        '--node-url',
+        DEV_BRANCH_NODE_IP_ADDRESS_FOR_TESTING,
+    ])
+
+    expected_error_message = {
+        'errors': {
+            'ids': [
+                f'The following block identifier `{short_block_identifier}` is invalid.',
+                f'The following block identifier `{non_hexadecimal_block_identifier}` is invalid.',
+            ],
+        },
+    }
+
+    assert FAILED_EXIT_FROM_COMMAND_CODE == result.exit_code
+    assert dict_to_pretty_json(expected_error_message) in result.output
+
+
 def test_get_blocks_with_non_existing_ids():
     """
     Case: get a list of blocks by non-existing identifiers.
@@ -456,8 +512,8 @@ def test_get_blocks_without_node_url(mocker):
         ],
     }
 
-    mock_get_blocks = mocker.patch('cli.block.service.loop.run_until_complete')
-    mock_get_blocks.return_value = blocks
+    mock_get_blocks = mocker.patch('remme.blockchain_info.RemmeBlockchainInfo.get_blocks')
+    mock_get_blocks.side_effect = async_side_effect(blocks)
 
     expected_result = {
         'result': blocks.get('data'),
@@ -499,3 +555,295 @@ def test_get_blocks_node_url_with_protocol(node_url_with_protocol):
 
     assert FAILED_EXIT_FROM_COMMAND_CODE == result.exit_code
     assert dict_to_pretty_json(expected_error) in result.output
+
+
+def test_get_blocks_all_pages(mocker):
+    """
+    Case: get all blocks page by page following the node's paging.
+    Expect: blocks from all pages are returned, next pages are requested from the first page's head.
+    """
+    head = 'fe56a16dab009cc96e7125c647b6c71eb1063818cf8dece283b125423ecb184f' \
+           '7f1e61802bf66382da904698413f80831031f8a1b29150260c3fa4db537fdf4c'
+
+    first_page_blocks = [
+        {'header': {'block_num': '2'}, 'header_signature': head},
+        {'header': {'block_num': '1'}, 'header_signature': '1' * 128},
+    ]
+    second_page_blocks = [
+        {'header': {'block_num': '0'}, 'header_signature': '0' * 128},
+    ]
+
+    mock_get_blocks = mocker.patch('remme.blockchain_info.RemmeBlockchainInfo.get_blocks')
+    mock_get_blocks.side_effect = async_side_effect(
+        {'data': first_page_blocks, 'head': head, 'paging': {'limit': 2, 'next': '0x0000000000000000', 'start': ''}},
+        {'data': second_page_blocks, 'head': head, 'paging': {'limit': 2, 'next': '', 'start': '0x0000000000000000'}},
+    )
+
+    runner = CliRunner()
+    result = runner.invoke(cli, [
+        'block',
+        'get-list',
+        '--all',
+        '--page-size',
+        2,
+        '--node-url',
+        'localhost',
+    ])
+
+    expected_result = {
+        'result': first_page_blocks + second_page_blocks,
+    }
+
+    assert PASSED_EXIT_FROM_COMMAND_CODE == result.exit_code
+    assert dict_to_pretty_json(expected_result) + '\n' == result.output
+
+    first_page_query = mock_get_blocks.call_args_list[0][1].get('query')
+    second_page_query = mock_get_blocks.call_args_list[1][1].get('query')
+
+    assert 2 == first_page_query.get('limit')
+    assert first_page_query.get('start') is None
+    assert '0x0000000000000000' == second_page_query.get('start')
+    assert head == second_page_query.get('head')
+
+
+def test_get_blocks_identifiers_all_pages_with_limit(mocker):
+    """
+    Case: get identifiers of all blocks page by page with limit of the total amount of blocks.
+    Expect: identifiers of the blocks are returned, pages are not requested over the limit.
+    """
+    mock_get_blocks = mocker.patch('remme.blockchain_info.RemmeBlockchainInfo.get_blocks')
+    mock_get_blocks.side_effect = async_side_effect(
+        {'data': [{'header_signature': '2' * 128}], 'head': '2' * 128, 'paging': {'next': '0x0000000000000001'}},
+        {'data': [{'header_signature': '1' * 128}], 'head': '2' * 128, 'paging': {'next': '0x0000000000000000'}},
+    )
+
+    runner = CliRunner()
+    result = runner.invoke(cli, [
+        'block',
+        'get-list',
+        '--all',
+        '--ids-only',
+        '--page-size',
+        1,
+        '--limit',
+        2,
+        '--node-url',
+        'localhost',
+    ])
+
+    expected_result = {
+        'result': ['2' * 128, '1' * 128],
+    }
+
+    assert PASSED_EXIT_FROM_COMMAND_CODE == result.exit_code
+    assert expected_result == json.loads(result.output)
+    assert 2 == mock_get_blocks.call_count
+
+
+def test_get_blocks_with_invalid_page_size():
+    """
+    Case: get all blocks page by page with invalid page size.
+    Expect: page size must be greater than 0 error message.
+    """
+    runner = CliRunner()
+    result = runner.invoke(cli, [
+        'block',
+        'get-list',
+        '--all',
+        '--page-size',
+        0,
+        '--node-url',
+        'localhost',
+    ])
+
+    expected_error = {
+        'errors': {
+            'page_size': [
+                'Page size must be greater than 0.',
+            ],
+        },
+    }
+
+    assert FAILED_EXIT_FROM_COMMAND_CODE == result.exit_code
+    assert dict_to_pretty_json(expected_error) in result.output
+
+
+def test_get_blocks_all_pages_ndjson_output(mocker):
+    """
+    Case: get all blocks page by page in newline-delimited JSON output format.
+    Expect: a line of JSON is printed per block.
+    """
+    blocks = [
+        {'header': {'block_num': '1'}, 'header_signature': '1' * 128},
+        {'header': {'block_num': '0'}, 'header_signature': '0' * 128},
+    ]
+
+    mock_get_blocks = mocker.patch('remme.blockchain_info.RemmeBlockchainInfo.get_blocks')
+    mock_get_blocks.side_effect = async_side_effect(
+        {'data': blocks[:1], 'head': '1' * 128, 'paging': {'next': '0x0000000000000000'}},
+        {'data': blocks[1:], 'head': '1' * 128, 'paging': {'next': ''}},
+    )
+
+    runner = CliRunner()
+    result = runner.invoke(cli, [
+        'block',
+        'get-list',
+        '--all',
+        '--page-size',
+        1,
+        '--output',
+        'ndjson',
+        '--node-url',
+        'localhost',
+    ])
+
+    assert PASSED_EXIT_FROM_COMMAND_CODE == result.exit_code
+    assert blocks == [json.loads(line) for line in result.output.splitlines()]
+
+
+def test_get_blocks_invalid_output():
+    """
+    Case: get a list of blocks with invalid output format.
+    Expect: the following output format is invalid error message.
+    """
+    runner = CliRunner()
+    result = runner.invoke(cli, [
+        'block',
+        'get-list',
+        '--output',
+        'xml',
+        '--node-url',
+        'localhost',
+    ])
+
+    expected_error = {
+        'errors': {
+            'output': [
+                'The following output format `xml` is invalid.',
+            ],
+        },
+    }
+
+    assert FAILED_EXIT_FROM_COMMAND_CODE == result.exit_code
+    assert dict_to_pretty_json(expected_error) in result.output
+
+
+def test_get_blocks_follow(mocker):
+    """
+    Case: follow blocks while the node commits several blocks between polls.
+    Expect: every committed block is printed once from the oldest to the newest, idle polls are done less often.
+    """
+    heads = iter([10, 10, 13])
+
+    async def get_blocks(query):
+        if query.get('start') is None:
+            return {'data': [{'header': {'block_num': str(next(heads))}, 'header_signature': 'head'}]}
+
+        start = int(query.get('start'), 16)
+
+        return {
+            'data': [
+                {'header': {'block_num': str(num)}, 'header_signature': str(num)}
+                for num in range(start, start + query.get('limit'))
+            ],
+            'paging': {'next': ''},
+        }
+
+    mock_get_blocks = mocker.patch('remme.blockchain_info.RemmeBlockchainInfo.get_blocks')
+    mock_get_blocks.side_effect = get_blocks
+
+    mock_sleep = mocker.patch('asyncio.sleep', side_effect=async_side_effect(None))
+
+    runner = CliRunner()
+    result = runner.invoke(cli, [
+        'block',
+        'get-list',
+        '--follow',
+        '--ids-only',
+        '--limit',
+        3,
+        '--node-url',
+        'localhost',
+    ])
+
+    assert PASSED_EXIT_FROM_COMMAND_CODE == result.exit_code
+    assert ['11', '12', '13'] == [json.loads(line) for line in result.output.splitlines()]
+    assert [1, 2] == [call[0][0] for call in mock_sleep.call_args_list]
+    assert '0x000000000000000b' == mock_get_blocks.call_args_list[-1][1].get('query').get('start')
+
+
+def test_get_blocks_follow_with_head():
+    """
+    Case: follow blocks to the head.
+    Expect: follow could not be combined with head error message.
+    """
+    runner = CliRunner()
+    result = runner.invoke(cli, [
+        'block',
+        'get-list',
+        '--follow',
+        '--reverse',
+        '--node-url',
+        'localhost',
+    ])
+
+    expected_error = {
+        'errors': {
+            'follow': [
+                'Follow could not be combined with identifiers, head, reverse or all.',
+            ],
+        },
+    }
+
+    assert FAILED_EXIT_FROM_COMMAND_CODE == result.exit_code
+    assert dict_to_pretty_json(expected_error) in result.output
+
+
+def test_get_blocks_from_several_nodes_with_follow():
+    """
+    Case: get a list of blocks from several nodes following new blocks.
+    Expect: node URLs could not be combined with follow error message.
+    """
+    runner = CliRunner()
+    result = runner.invoke(cli, [
+        'block',
+        'get-list',
+        '--follow',
+        '--node-urls',
+        'node-1-testnet.remme.io,node-2-testnet.remme.io',
+    ])
+
+    expected_error = {
+        'errors': {
+            'node_urls': [
+                'Node URLs could not be combined with follow, all or NDJSON output.',
+            ],
+        },
+    }
+
+    assert FAILED_EXIT_FROM_COMMAND_CODE == result.exit_code
+    assert expected_error == json.loads(result.output)
+
+
+def test_get_blocks_identifiers_without_limit(mocker):
+    """
+    Case: get a list of blocks' identifiers without the limit when the node has the next page.
+    Expect: identifiers of the single list are returned, the next page isn't requested.
+    """
+    mock_get_blocks = mocker.patch('remme.blockchain_info.RemmeBlockchainInfo.get_blocks')
+    mock_get_blocks.side_effect = async_side_effect(
+        {'data': [{'header_signature': '2' * 128}], 'head': '2' * 128, 'paging': {'next': '0x0000000000000001'}},
+    )
+
+    runner = CliRunner()
+    result = runner.invoke(cli, [
+        'block',
+        'get-list',
+        '--ids-only',
+        '--node-url',
+        'localhost',
+    ])
+
+    assert PASSED_EXIT_FROM_COMMAND_CODE == result.exit_code
+    assert {'result': ['2' * 128]} == json.loads(result.output)
+    assert 1 == mock_get_blocks.call_count
@@ -0,0 +1,188 @@
+"""
+Provide tests for command line interface's get blocks range command.
+"""
+import json
+
+from click.testing import CliRunner
+
+from cli.constants import (
+    FAILED_EXIT_FROM_COMMAND_CODE,
+    PASSED_EXIT_FROM_COMMAND_CODE,
+)
+from cli.entrypoint import cli
+
+HEAD_BLOCK_NUM = 20
+
+
+async def get_blocks(query):
+    """
+    Get the page of blocks from the paging start block number, or the head block, as the node returns it.
+    """
+    if query.get('start') is None:
+        return {'data': [{'header': {'block_num': str(HEAD_BLOCK_NUM)}}], 'head': 'h' * 128, 'paging': {'next': ''}}
+
+    start = int(query.get('start'), 16)
+
+    if start > HEAD_BLOCK_NUM:
+        raise Exception(f'Start `{query.get("start")}` not found.')
+
+    end = min(start + query.get('limit'), HEAD_BLOCK_NUM + 1)
+
+    return {
+        'data': [{'header': {'block_num': str(num)}} for num in range(start, end)],
+        'head': 'h' * 128,
+        'paging': {'start': query.get('start'), 'next': ''},
+    }
+
+
+def test_get_blocks_range(mocker):
+    """
+    Case: get a range of blocks by chunks requested concurrently.
+    Expect: blocks of all chunks are printed from the oldest to the newest, a line of JSON per block.
+    """
+    mock_get_blocks = mocker.patch('remme.blockchain_info.RemmeBlockchainInfo.get_blocks')
+    mock_get_blocks.side_effect = get_blocks
+
+    result = CliRunner().invoke(cli, [
+        'block',
+        'get-range',
+        '--from', 5,
+        '--to', 16,
+        '--concurrency', 3,
+        '--chunk-size', 5,
+        '--node-url', 'localhost',
+    ])
+
+    assert PASSED_EXIT_FROM_COMMAND_CODE == result.exit_code
+    assert [str(num) for num in range(5, 17)] == [
+        json.loads(line).get('header').get('block_num') for line in result.output.splitlines()
+    ]
+    assert [(5, 5), (10, 5), (15, 2)] == sorted(
+        (int(call[1].get('query').get('start'), 16), call[1].get('query').get('limit'))
+        for call in mock_get_blocks.call_args_list if call[1].get('query').get('start') is not None
+    )
+
+
+def test_get_blocks_range_to_output_file(mocker, tmpdir):
+    """
+    Case: get a range of blocks to the output file.
+    Expect: blocks are written to the file, a line of JSON per block.
+    """
+    output_file = str(tmpdir.join('blocks.ndjson'))
+
+    mock_get_blocks = mocker.patch('remme.blockchain_info.RemmeBlockchainInfo.get_blocks')
+    mock_get_blocks.side_effect = get_blocks
+
+    result = CliRunner().invoke(cli, [
+        'block',
+        'get-range',
+        '--from', 0,
+        '--to', 2,
+        '--output-file', output_file,
+        '--node-url', 'localhost',
+    ])
+
+    assert PASSED_EXIT_FROM_COMMAND_CODE == result.exit_code
+    assert '' == result.output
+
+    with open(output_file) as file:
+        assert ['0', '1', '2'] == [json.loads(line).get('header').get('block_num') for line in file]
+
+
+def test_get_blocks_range_with_failed_chunk(mocker):
+    """
+    Case: get a range of blocks when requesting a chunk fails.
+    Expect: blocks of the preceding chunks are printed, then the error is printed.
+    """
+    async def get_blocks_or_fail(query):
+        if query.get('start') is not None and int(query.get('start'), 16) >= 4:
+            raise Exception('Connection refused.')
+
+        return await get_blocks(query=query)
+
+    mock_get_blocks = mocker.patch('remme.blockchain_info.RemmeBlockchainInfo.get_blocks')
+    mock_get_blocks.side_effect = get_blocks_or_fail
+
+    result = CliRunner().invoke(cli, [
+        'block',
+        'get-range',
+        '--from', 0,
+        '--to', 7,
+        '--chunk-size', 2,
+        '--node-url', 'localhost',
+    ])
+
+    lines = result.output.splitlines()
+
+    assert FAILED_EXIT_FROM_COMMAND_CODE == result.exit_code
+    assert ['0', '1', '2', '3'] == [json.loads(line).get('header').get('block_num') for line in lines[:4]]
+    assert 'Connection refused.' in ''.join(lines[4:])
+
+
+def test_get_blocks_range_past_head(mocker):
+    """
+    Case: get a range of blocks which end block number is greater than the node's head block number.
+    Expect: blocks up to the node's head block are printed.
+    """
+    mock_get_blocks = mocker.patch('remme.blockchain_info.RemmeBlockchainInfo.get_blocks')
+    mock_get_blocks.side_effect = get_blocks
+
+    result = CliRunner().invoke(cli, [
+        'block',
+        'get-range',
+        '--from', 15,
+        '--to', 40,
+        '--chunk-size', 4,
+        '--node-url', 'localhost',
+    ])
+
+    assert PASSED_EXIT_FROM_COMMAND_CODE == result.exit_code
+    assert [str(num) for num in range(15, HEAD_BLOCK_NUM + 1)] == [
+        json.loads(line).get('header').get('block_num') for line in result.output.splitlines()
+    ]
+
+
+def test_get_blocks_range_to_unwritable_output_file(mocker, tmpdir):
+    """
+    Case: get a range of blocks to the output file in the directory that does not exist.
+    Expect: the output file could not be opened error message.
+    """
+    mock_get_blocks = mocker.patch('remme.blockchain_info.RemmeBlockchainInfo.get_blocks')
+    mock_get_blocks.side_effect = get_blocks
+
+    result = CliRunner().invoke(cli, [
+        'block',
+        'get-range',
+        '--from', 0,
+        '--to', 2,
+        '--output-file', str(tmpdir.join('missing', 'blocks.ndjson')),
+        '--node-url', 'localhost',
+    ])
+
+    assert FAILED_EXIT_FROM_COMMAND_CODE == result.exit_code
+    assert 'No such file or directory' in json.loads(result.output).get('errors')
+
+
+def test_get_blocks_range_with_invalid_range():
+    """
+    Case: get a range of blocks with the end block number less than the start one.
+    Expect: the end block number must be greater than or equal to the start one error message.
+    """
+    result = CliRunner().invoke(cli, [
+        'block',
+        'get-range',
+        '--from', 10,
+        '--to', 5,
+        '--node-url', 'localhost',
+    ])
+
+    expected_error = {
+        'errors': {
+            'end': [
+                'To must be greater than or equal to from.',
+            ],
+        },
+    }
+
+    assert FAILED_EXIT_FROM_COMMAND_CODE == result.exit_code
+    assert expected_error == json.loads(result.output)
@@ -0,0 +1,147 @@
+"""
+Provide tests for command line interface's mirror blocks command.
+"""
+import json
+import os
+
+from click.testing import CliRunner
+
+from cli.constants import (
+    FAILED_EXIT_FROM_COMMAND_CODE,
+    PASSED_EXIT_FROM_COMMAND_CODE,
+)
+from cli.entrypoint import cli
+from cli.utils import async_side_effect
+
+
+def create_block(block_num, fork='a'):
+    """
+    Create the block with the number on the fork.
+    """
+    return {
+        'batches': [],
+        'header': {'block_num': str(block_num)},
+        'header_signature': fork * 127 + str(block_num),
+    }
+
+
+def create_page(blocks, start=None, next_position=''):
+    """
+    Create the page of blocks as the node returns it.
+    """
+    return {'data': blocks, 'head': 'h' * 128, 'paging': {'start': start, 'next': next_position}}
+
+
+def mirror_blocks(path, commit_every=1000):
+    """
+    Mirror blocks by the command line interface.
+    """
+    return CliRunner().invoke(cli, [
+        'block', 'mirror', '--path', path, '--commit-every', commit_every, '--recheck', 2, '--node-url', 'localhost',
+    ])
+
+
+def read_mirrored_blocks_identifiers(path):
+    """
+    Read identifiers of the mirrored blocks.
+    """
+    with open(os.path.join(path, 'blocks.ndjson')) as blocks_file:
+        return [json.loads(line).get('header_signature') for line in blocks_file]
+
+
+def test_mirror_blocks_from_genesis(mocker, tmpdir):
+    """
+    Case: mirror blocks of the node to the empty mirror.
+    Expect: blocks of all pages are appended from the oldest to the newest.
+    """
+    path = str(tmpdir.join('mirror'))
+
+    mock_get_blocks = mocker.patch('remme.blockchain_info.RemmeBlockchainInfo.get_blocks')
+    mock_get_blocks.side_effect = async_side_effect(
+        create_page([create_block(0), create_block(1)], next_position='2'),
+        create_page([create_block(2)], start='2'),
+    )
+
+    result = mirror_blocks(path=path)
+
+    assert PASSED_EXIT_FROM_COMMAND_CODE == result.exit_code
+    assert {'blocks': 3, 'discarded': 0, 'head': 2} == json.loads(result.output).get('result')
+    assert [create_block(num).get('header_signature') for num in range(3)] == read_mirrored_blocks_identifiers(path)
+    assert mock_get_blocks.call_args_list[0][1].get('query').get('reverse') is True
+
+
+def test_resume_mirror_blocks(mocker, tmpdir):
+    """
+    Case: mirror blocks of the node which committed new blocks since the previous mirroring.
+    Expect: the last mirrored blocks are checked, only new blocks are appended from the last block's page.
+    """
+    path = str(tmpdir.join('mirror'))
+
+    mock_get_blocks = mocker.patch('remme.blockchain_info.RemmeBlockchainInfo.get_blocks')
+    mock_get_blocks.side_effect = async_side_effect(
+        create_page([create_block(0), create_block(1)], next_position='2'),
+        create_page([create_block(2)], start='2'),
+        create_page([create_block(2), create_block(1)]),
+        create_page([create_block(2), create_block(3)], start='2'),
+    )
+
+    mirror_blocks(path=path)
+    result = mirror_blocks(path=path)
+
+    assert PASSED_EXIT_FROM_COMMAND_CODE == result.exit_code
+    assert {'blocks': 1, 'discarded': 0, 'head': 3} == json.loads(result.output).get('result')
+    assert [create_block(num).get('header_signature') for num in range(4)] == read_mirrored_blocks_identifiers(path)
+    assert '2' == mock_get_blocks.call_args_list[3][1].get('query').get('start')
+
+
+def test_mirror_blocks_after_fork(mocker, tmpdir):
+    """
+    Case: mirror blocks of the node which switched to another fork of the last mirrored block.
+    Expect: the block of the abandoned fork is discarded and replaced with the node's blocks.
+    """
+    path = str(tmpdir.join('mirror'))
+
+    mock_get_blocks = mocker.patch('remme.blockchain_info.RemmeBlockchainInfo.get_blocks')
+    mock_get_blocks.side_effect = async_side_effect(
+        create_page([create_block(0), create_block(1), create_block(2)]),
+        create_page([create_block(1)]),
+        create_page([create_block(0), create_block(1), create_block(2, fork='f'), create_block(3, fork='f')]),
+    )
+
+    mirror_blocks(path=path)
+    result = mirror_blocks(path=path)
+
+    assert PASSED_EXIT_FROM_COMMAND_CODE == result.exit_code
+    assert {'blocks': 2, 'discarded': 1, 'head': 3} == json.loads(result.output).get('result')
+    assert [
+        create_block(0).get('header_signature'),
+        create_block(1).get('header_signature'),
+        create_block(2, fork='f').get('header_signature'),
+        create_block(3, fork='f').get('header_signature'),
+    ] == read_mirrored_blocks_identifiers(path)
+
+
+def test_resume_interrupted_mirror_blocks(mocker, tmpdir):
+    """
+    Case: mirror blocks after the previous mirroring failed with blocks written after the last checkpoint.
+    Expect: blocks written after the checkpoint are discarded and mirrored again.
+    """
+    path = str(tmpdir.join('mirror'))
+
+    mock_get_blocks = mocker.patch('remme.blockchain_info.RemmeBlockchainInfo.get_blocks')
+    mock_get_blocks.side_effect = async_side_effect(
+        create_page([create_block(0), create_block(1), create_block(2)], next_position='3'),
+        Exception('Connection refused.'),
+        create_page([create_block(0), create_block(1)]),
+        create_page([create_block(0), create_block(1), create_block(2), create_block(3)]),
+    )
+
+    result = mirror_blocks(path=path, commit_every=2)
+
+    assert FAILED_EXIT_FROM_COMMAND_CODE == result.exit_code
+
+    result = mirror_blocks(path=path, commit_every=2)
+
+    assert PASSED_EXIT_FROM_COMMAND_CODE == result.exit_code
+    assert {'blocks': 2, 'discarded': 0, 'head': 3} == json.loads(result.output).get('result')
+    assert [create_block(num).get('header_signature') for num in range(4)] == read_mirrored_blocks_identifiers(path)
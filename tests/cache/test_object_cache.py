@@ -0,0 +1,106 @@
+"""
+Provide tests for implementation of the on-disk cache of the chain objects.
+"""
+import json
+
+from cli.cache import (
+    BLOCK_CACHE_KIND,
+    RECEIPT_CACHE_KIND,
+    ObjectCache,
+)
+
+BLOCK = {
+    'header_signature': 'block-identifier',
+}
+
+
+def test_load_stored_object(object_cache_path):
+    """
+    Case: store an object to the cache and load it.
+    Expect: the stored object is loaded by its kind and identifier, other kinds do not share identifiers.
+    """
+    cache = ObjectCache(path=object_cache_path, max_size=1024)
+
+    cache.store(kind=BLOCK_CACHE_KIND, identifier='block-identifier', value=BLOCK)
+
+    assert BLOCK == cache.load(kind=BLOCK_CACHE_KIND, identifier='block-identifier')
+    assert cache.load(kind=RECEIPT_CACHE_KIND, identifier='block-identifier') is None
+
+
+def test_load_object_from_another_process_cache(object_cache_path):
+    """
+    Case: store an object to the cache and load it by another cache instance on the same file.
+    Expect: the stored object is loaded.
+    """
+    ObjectCache(path=object_cache_path, max_size=1024).store(
+        kind=BLOCK_CACHE_KIND, identifier='block-identifier', value=BLOCK,
+    )
+
+    assert BLOCK == ObjectCache(path=object_cache_path, max_size=1024).load(
+        kind=BLOCK_CACHE_KIND, identifier='block-identifier',
+    )
+
+
+def test_evict_least_recently_used_objects(object_cache_path):
+    """
+    Case: store objects to the cache over its maximum size.
+    Expect: the least recently used objects are evicted, recently loaded objects are kept.
+    """
+    object_size = len(json.dumps(BLOCK))
+
+    cache = ObjectCache(path=object_cache_path, max_size=object_size * 2)
+
+    cache.store(kind=BLOCK_CACHE_KIND, identifier='first', value=BLOCK)
+    cache.store(kind=BLOCK_CACHE_KIND, identifier='second', value=BLOCK)
+    cache.load(kind=BLOCK_CACHE_KIND, identifier='first')
+    cache.store(kind=BLOCK_CACHE_KIND, identifier='third', value=BLOCK)
+
+    assert BLOCK == cache.load(kind=BLOCK_CACHE_KIND, identifier='first')
+    assert cache.load(kind=BLOCK_CACHE_KIND, identifier='second') is None
+    assert BLOCK == cache.load(kind=BLOCK_CACHE_KIND, identifier='third')
+
+
+def test_load_object_from_unavailable_cache(tmpdir):
+    """
+    Case: load an object from the cache which file could not be opened.
+    Expect: none is returned instead of an error.
+    """
+    cache = ObjectCache(path=str(tmpdir.join('missed-directory', 'cache.sqlite3')), max_size=1024)
+
+    cache.store(kind=BLOCK_CACHE_KIND, identifier='block-identifier', value=BLOCK)
+
+    assert cache.load(kind=BLOCK_CACHE_KIND, identifier='block-identifier') is None
+
+
+def test_evict_objects_stored_by_another_process(object_cache_path):
+    """
+    Case: store objects to the cache over its maximum size, some of them by another cache instance on the same file.
+    Expect: objects are evicted by the total size of the cache's file, the latest stored object is kept.
+    """
+    object_size = len(json.dumps(BLOCK))
+
+    cache = ObjectCache(path=object_cache_path, max_size=object_size * 2)
+    another_cache = ObjectCache(path=object_cache_path, max_size=object_size * 2)
+
+    cache.store(kind=BLOCK_CACHE_KIND, identifier='first', value=BLOCK)
+    another_cache.store(kind=BLOCK_CACHE_KIND, identifier='second', value=BLOCK)
+    another_cache.store(kind=BLOCK_CACHE_KIND, identifier='third', value=BLOCK)
+
+    assert cache.load(kind=BLOCK_CACHE_KIND, identifier='first') is None
+    assert BLOCK == cache.load(kind=BLOCK_CACHE_KIND, identifier='third')
+
+
+def test_load_corrupted_object(object_cache_path):
+    """
+    Case: load an object which cached data could not be parsed.
+    Expect: none is returned instead of an error, the object is removed from the cache.
+    """
+    cache = ObjectCache(path=object_cache_path, max_size=1024)
+
+    cache.store(kind=BLOCK_CACHE_KIND, identifier='block-identifier', value=BLOCK)
+
+    with cache.connection:
+        cache.connection.execute("UPDATE objects SET data = '{' WHERE identifier = 'block-identifier'")
+
+    assert cache.load(kind=BLOCK_CACHE_KIND, identifier='block-identifier') is None
+    assert 0 == cache.connection.execute('SELECT COUNT(*) FROM objects').fetchone()[0]
@@ -0,0 +1,197 @@
+"""
+Provide tests for implementation of the in-process cache of the reads.
+"""
+import asyncio
+from unittest import mock
+
+from cli.account.service import Account
+from cli.block.service import Block
+from cli.cache import ReadCache
+from cli.utils import (
+    async_side_effect,
+    run_until_complete,
+)
+
+
+class Clock:
+    """
+    Impose clock which time is set by a test.
+    """
+
+    def __init__(self):
+        self.time = 0
+
+    def __call__(self):
+        """
+        Get the time set by a test.
+        """
+        return self.time
+
+
+class Request:
+    """
+    Impose request to the node that counts its calls.
+    """
+
+    def __init__(self, result=None, errors=None):
+        self.result = result
+        self.errors = errors
+        self.calls = 0
+
+    async def __call__(self):
+        """
+        Return the result and errors of the request.
+        """
+        self.calls += 1
+        await asyncio.sleep(0)
+        return self.result, self.errors
+
+
+SERVICE = object()
+
+
+def test_fetch_within_time_to_live():
+    """
+    Case: fetch the same value twice within the time to live and once after it expires.
+    Expect: the value is requested twice, the second fetch is served from the cache.
+    """
+    clock = Clock()
+    cache = ReadCache(ttl=3, clock=clock)
+    request = Request(result={'balance': 100})
+
+    for _ in range(2):
+        assert ({'balance': 100}, None) == run_until_complete(
+            cache.fetch(service=SERVICE, key=('balance',), request=request),
+        )
+
+    assert 1 == request.calls
+
+    clock.time = 3
+    run_until_complete(cache.fetch(service=SERVICE, key=('balance',), request=request))
+
+    assert 2 == request.calls
+
+
+def test_fetch_concurrently():
+    """
+    Case: fetch the same value concurrently.
+    Expect: the value is requested once for all the fetches.
+    """
+    cache = ReadCache(ttl=3, clock=Clock())
+    request = Request(result={'balance': 100})
+
+    results = run_until_complete(asyncio.gather(*[
+        cache.fetch(service=SERVICE, key=('balance',), request=request) for _ in range(5)
+    ]))
+
+    assert [({'balance': 100}, None)] * 5 == results
+    assert 1 == request.calls
+
+
+def test_fetch_errors():
+    """
+    Case: fetch a value which request returns errors twice.
+    Expect: errors are returned and not cached, the value is requested each time.
+    """
+    cache = ReadCache(ttl=3, clock=Clock())
+    request = Request(errors='Connection refused.')
+
+    for _ in range(2):
+        assert (None, 'Connection refused.') == run_until_complete(
+            cache.fetch(service=SERVICE, key=('balance',), request=request),
+        )
+
+    assert 2 == request.calls
+
+
+def test_observe_new_head():
+    """
+    Case: fetch a value, observe the service's head, observe the same head, observe a new head.
+    Expect: the value is kept while the head is the same and requested again after the head changes.
+    """
+    cache = ReadCache(ttl=3, clock=Clock())
+    request = Request(result={'balance': 100})
+
+    cache.observe_head(service=SERVICE, head='first-head')
+    run_until_complete(cache.fetch(service=SERVICE, key=('balance',), request=request))
+
+    cache.observe_head(service=SERVICE, head='first-head')
+    run_until_complete(cache.fetch(service=SERVICE, key=('balance',), request=request))
+
+    assert 1 == request.calls
+
+    cache.observe_head(service=SERVICE, head='second-head')
+    run_until_complete(cache.fetch(service=SERVICE, key=('balance',), request=request))
+
+    assert 2 == request.calls
+
+
+def test_invalidate_after_sending_transaction():
+    """
+    Case: get the account's balance, transfer tokens, get the account's balance again.
+    Expect: the balance is requested again after the transfer, even if the transfer fails.
+    """
+    service = mock.Mock()
+    service.token.get_balance.side_effect = async_side_effect(100)
+    service.token.transfer.side_effect = async_side_effect(Exception('Connection refused.'))
+
+    account = Account(service=service, cache=ReadCache(ttl=3, clock=Clock()))
+
+    for _ in range(2):
+        account.get_balance(address='address')
+
+    assert 1 == service.token.get_balance.call_count
+
+    account.transfer_tokens(address_to='address', amount=10)
+    account.get_balance(address='address')
+
+    assert 2 == service.token.get_balance.call_count
+
+
+def test_observe_head_from_list_of_blocks():
+    """
+    Case: get the account's balance, get a list of blocks to the node's new head, then to the specified head.
+    Expect: the balance is requested again after the node's new head is observed, the specified head isn't observed.
+    """
+    service = mock.Mock()
+    service.token.get_balance.side_effect = async_side_effect(100)
+    service.blockchain_info.get_blocks.side_effect = async_side_effect(
+        {'data': [], 'head': 'first-head'}, {'data': [], 'head': 'second-head'}, {'data': [], 'head': 'first-head'},
+    )
+
+    cache = ReadCache(ttl=3, clock=Clock())
+    account, block = Account(service=service, cache=cache), Block(service=service, read_cache=cache)
+
+    block.get_list(ids=None, head=None, limit=1, reverse=False)
+    account.get_balance(address='address')
+
+    block.get_list(ids=None, head=None, limit=1, reverse=False)
+    account.get_balance(address='address')
+
+    assert 2 == service.token.get_balance.call_count
+
+    block.get_list(ids=None, head='first-head', limit=1, reverse=False)
+    account.get_balance(address='address')
+
+    assert 2 == service.token.get_balance.call_count
+
+
+def test_invalidate_reads_of_another_client_of_the_node():
+    """
+    Case: get the balance with a client, transfer tokens with another client of the node, get the balance again.
+    Expect: the balance is requested again after the transfer.
+    """
+    reading_service, sending_service = mock.Mock(), mock.Mock()
+    reading_service.network_config = sending_service.network_config = {'node_address': 'localhost:8080'}
+    reading_service.token.get_balance.side_effect = async_side_effect(100)
+    sending_service.token.transfer.side_effect = async_side_effect(mock.Mock(batch_id='batch-identifier'))
+
+    cache = ReadCache(ttl=3, clock=Clock())
+    reading_account = Account(service=reading_service, cache=cache)
+    sending_account = Account(service=sending_service, cache=cache)
+
+    reading_account.get_balance(address='address')
+    sending_account.transfer_tokens(address_to='address', amount=10)
+    reading_account.get_balance(address='address')
+
+    assert 2 == reading_service.token.get_balance.call_count
@@ -0,0 +1,78 @@
+"""
+Provide tests for implementation of the shared clients to interact with Remme-core.
+"""
+import asyncio
+
+import pytest
+from remme.models.account.account_type import AccountType
+
+from cli import client
+from cli.client import (
+    PersistentJsonRpcClient,
+    RemmeClient,
+)
+from cli.constants import DEV_BRANCH_NODE_PRIVATE_KEY_WITH_MONEY
+from cli.utils import get_event_loop
+
+
+def test_get_client():
+    """
+    Case: get the client to interact with Remme-core by node URL.
+    Expect: client which sends requests to the node through the persistent JSON-RPC client is returned.
+    """
+    remme = RemmeClient.get(node_url='node-genesis-testnet.remme.io')
+
+    assert 'node-genesis-testnet.remme.io:8080' == remme.network_config.get('node_address')
+    assert isinstance(remme._remme_api._rpc_client, PersistentJsonRpcClient)
+
+
+def test_get_client_is_shared():
+    """
+    Case: get the client to interact with Remme-core by the same node URL and account configurations twice.
+    Expect: the same client is returned.
+    """
+    remme = RemmeClient.get(node_url='node-6-testnet.remme.io', private_key=DEV_BRANCH_NODE_PRIVATE_KEY_WITH_MONEY)
+
+    assert remme is RemmeClient.get(
+        node_url='node-6-testnet.remme.io', private_key=DEV_BRANCH_NODE_PRIVATE_KEY_WITH_MONEY,
+    )
+
+
+def test_get_client_is_not_shared_among_configurations():
+    """
+    Case: get the client to interact with Remme-core by different node URLs and account configurations.
+    Expect: different clients are returned.
+    """
+    remme = RemmeClient.get(node_url='node-1-testnet.remme.io')
+
+    assert remme is not RemmeClient.get(node_url='node-6-testnet.remme.io')
+    assert remme is not RemmeClient.get(
+        node_url='node-1-testnet.remme.io', private_key=DEV_BRANCH_NODE_PRIVATE_KEY_WITH_MONEY,
+    )
+    assert remme is not RemmeClient.get(
+        node_url='node-1-testnet.remme.io',
+        private_key=DEV_BRANCH_NODE_PRIVATE_KEY_WITH_MONEY,
+        account_type=AccountType.NODE,
+    )
+
+
+def test_timed_out_requests_are_not_pending(mock_node, capsys):
+    """
+    Case: send requests to the node that respond later than the requests are timed out.
+    Expect: timed out requests aren't pending, late responses to them are skipped without errors.
+    """
+    mock_node.latency = 0.2
+
+    rpc_client = RemmeClient.get(node_url='localhost')._remme_api._rpc_client
+    loop = get_event_loop()
+
+    loop.run_until_complete(rpc_client.connect_url(url=f'ws://localhost:{client.NODE_PORT}/'))
+
+    for _ in range(3):
+        with pytest.raises(asyncio.TimeoutError):
+            loop.run_until_complete(rpc_client.call(method='get_node_info', timeout=0.05))
+
+    loop.run_until_complete(asyncio.sleep(0.3))
+
+    assert {} == dict(rpc_client._pending)
+    assert '' == capsys.readouterr().err
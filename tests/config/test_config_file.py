@@ -5,6 +5,7 @@ from cli.config import ConfigFile
 
 CLI_CONFIG_FILE_NAME_EMPTY_FILE = 'remme-core-cli-empty-file'
 CLI_CONFIG_FILE_NAME_WITHOUT_URL = 'remme-core-cli-without-url'
+CLI_CONFIG_FILE_NAME_WITH_NODES = 'remme-core-cli-with-nodes'
 
 
 def test_get_node_url(create_config_file):
@@ -45,3 +46,23 @@ def test_get_node_url_without_file():
     config = ConfigFile().parse()
 
     assert config.node_url is None
+
+
+def test_get_node_urls(create_config_file_with_nodes):
+    """
+    Case: get node URLs from the configuration file with nodes.
+    Expect: list of node URLs is returned.
+    """
+    config = ConfigFile().parse(name=CLI_CONFIG_FILE_NAME_WITH_NODES)
+
+    assert ['node-1-testnet.remme.io', 'node-2-testnet.remme.io'] == config.node_urls
+
+
+def test_get_node_urls_without_nodes(create_config_file):
+    """
+    Case: get node URLs from a configuration file without nodes.
+    Expect: none is returned.
+    """
+    config = ConfigFile().parse()
+
+    assert config.node_urls is None
@@ -0,0 +1,196 @@
+"""
+Provide tests for implementation of the settings.
+"""
+import json
+
+from click.testing import CliRunner
+
+from cli.config import Settings
+from cli.constants import (
+    CACHE_MAX_SIZE_ENVIRONMENT_VARIABLE,
+    FAILED_EXIT_FROM_COMMAND_CODE,
+    NODE_URL_ENVIRONMENT_VARIABLE,
+    NODE_URLS_ENVIRONMENT_VARIABLE,
+    PASSED_EXIT_FROM_COMMAND_CODE,
+    READ_CACHE_TTL_ENVIRONMENT_VARIABLE,
+)
+from cli.entrypoint import cli
+from cli.utils import dict_to_pretty_json
+
+
+def test_get_node_url_from_config_file(create_config_file):
+    """
+    Case: get node URL from settings with the configuration file.
+    Expect: node URL from the configuration file is returned.
+    """
+    settings = Settings(environment={})
+
+    assert 'node-genesis-testnet.remme.io' == settings.node_url
+
+
+def test_get_node_url_from_environment(create_config_file):
+    """
+    Case: get node URL from settings with the environment variable and the configuration file.
+    Expect: node URL from the environment variable is returned.
+    """
+    settings = Settings(environment={NODE_URL_ENVIRONMENT_VARIABLE: 'node-6-testnet.remme.io'})
+
+    assert 'node-6-testnet.remme.io' == settings.node_url
+
+
+def test_get_default_node_url():
+    """
+    Case: get node URL from settings without the environment variable and the configuration file.
+    Expect: localhost is returned.
+    """
+    settings = Settings(environment={})
+
+    assert 'localhost' == settings.node_url
+
+
+def test_config_file_is_parsed_once(mocker):
+    """
+    Case: get node URL from settings several times.
+    Expect: the configuration file is parsed once.
+    """
+    mock_config_file_parse = mocker.patch('cli.config.ConfigFile.parse')
+    mock_config_file_parse.return_value.node_url = 'node-genesis-testnet.remme.io'
+
+    settings = Settings(environment={})
+
+    for _ in range(3):
+        assert 'node-genesis-testnet.remme.io' == settings.node_url
+
+    assert 1 == mock_config_file_parse.call_count
+
+
+def test_node_url_option_default_is_resolved_on_invocation(mocker):
+    """
+    Case: get a balance of an account without passing node URL.
+    Expect: node URL is resolved from the shared settings when the command is invoked.
+    """
+    mocker.patch('cli.config.Settings._shared', Settings(
+        environment={NODE_URL_ENVIRONMENT_VARIABLE: 'node-6-testnet.remme.io'},
+    ))
+
+    mock_remme_client_get = mocker.patch('cli.account.cli.RemmeClient.get')
+    mock_account_get_balance = mocker.patch('cli.account.cli.Account.get_balance')
+    mock_account_get_balance.return_value = ({'balance': 13500}, None)
+
+    runner = CliRunner()
+    result = runner.invoke(cli, [
+        'account',
+        'get-balance',
+        '--address',
+        '1120076ecf036e857f42129b58303bcf1e03723764a1702cbe98529802aad8514ee3cf',
+    ])
+
+    assert PASSED_EXIT_FROM_COMMAND_CODE == result.exit_code
+    mock_remme_client_get.assert_called_once_with(node_url='node-6-testnet.remme.io')
+
+
+def test_get_node_urls_from_config_file(create_config_file_with_nodes):
+    """
+    Case: get node URLs from settings with the configuration file with nodes.
+    Expect: comma-separated node URLs from the configuration file are returned.
+    """
+    settings = Settings(environment={}, config_file_name='remme-core-cli-with-nodes')
+
+    assert 'node-1-testnet.remme.io,node-2-testnet.remme.io' == settings.node_urls
+
+
+def test_get_node_urls_from_environment(create_config_file_with_nodes):
+    """
+    Case: get node URLs from settings with the environment variable and the configuration file with nodes.
+    Expect: node URLs from the environment variable are returned.
+    """
+    settings = Settings(
+        environment={NODE_URLS_ENVIRONMENT_VARIABLE: 'node-6-testnet.remme.io'},
+        config_file_name='remme-core-cli-with-nodes',
+    )
+
+    assert 'node-6-testnet.remme.io' == settings.node_urls
+
+
+def test_get_default_node_urls():
+    """
+    Case: get node URLs from settings without the environment variable and the configuration file.
+    Expect: none is returned.
+    """
+    settings = Settings(environment={})
+
+    assert settings.node_urls is None
+
+
+def test_node_url_option_takes_precedence_over_node_urls_settings(mocker):
+    """
+    Case: get a balance of an account by passing node URL with node URLs in the shared settings.
+    Expect: the balance is requested from the passed node only.
+    """
+    mocker.patch('cli.config.Settings._shared', Settings(
+        environment={NODE_URLS_ENVIRONMENT_VARIABLE: 'node-1-testnet.remme.io'},
+    ))
+
+    mock_remme_client_get = mocker.patch('cli.account.cli.RemmeClient.get')
+    mock_account_get_balance = mocker.patch('cli.account.cli.Account.get_balance')
+    mock_account_get_balance.return_value = ({'balance': 13500}, None)
+
+    runner = CliRunner()
+    result = runner.invoke(cli, [
+        'account',
+        'get-balance',
+        '--address',
+        '1120076ecf036e857f42129b58303bcf1e03723764a1702cbe98529802aad8514ee3cf',
+        '--node-url',
+        'node-6-testnet.remme.io',
+    ])
+
+    assert PASSED_EXIT_FROM_COMMAND_CODE == result.exit_code
+    assert {'result': {'balance': 13500}} == json.loads(result.output)
+    mock_remme_client_get.assert_called_once_with(node_url='node-6-testnet.remme.io')
+
+
+def test_get_cache_settings_from_environment():
+    """
+    Case: get the cache's maximum size and the read cache's time to live from the environment variables.
+    Expect: the environment variables converted to the numbers are returned.
+    """
+    settings = Settings(environment={
+        CACHE_MAX_SIZE_ENVIRONMENT_VARIABLE: '1024',
+        READ_CACHE_TTL_ENVIRONMENT_VARIABLE: '0.5',
+    })
+
+    assert 1024 == settings.cache_max_size
+    assert 0.5 == settings.read_cache_ttl
+    assert settings.validate() is None
+
+
+def test_invalid_settings(mocker):
+    """
+    Case: execute the command with the invalid cache's maximum size and read cache's time to live.
+    Expect: the following setting is invalid error message per invalid setting.
+    """
+    mocker.patch('cli.config.Settings._shared', Settings(environment={
+        CACHE_MAX_SIZE_ENVIRONMENT_VARIABLE: '10MB',
+        READ_CACHE_TTL_ENVIRONMENT_VARIABLE: '-1',
+    }))
+
+    runner = CliRunner()
+    result = runner.invoke(cli, [
+        'node',
+        'get-info',
+    ])
+
+    expected_error = {
+        'errors': {
+            'cache_max_size': [
+                'The following cache maximum size `10MB` is invalid.',
+            ],
+            'read_cache_ttl': [
+                'The following read cache time to live `-1` is invalid.',
+            ],
+        },
+    }
+
+    assert FAILED_EXIT_FROM_COMMAND_CODE == result.exit_code
+    assert dict_to_pretty_json(expected_error) in result.output
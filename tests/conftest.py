@@ -1,6 +1,7 @@
 """
 Provide configurations for testing.
 """
+import collections
 import os
 import pathlib
 import shutil
@@ -8,6 +9,16 @@ import sys
 
 import pytest
 
+from cli import client
+from cli.cache import ReadCache
+from cli.client import RemmeClient
+from cli.config import Settings
+from cli.constants import CACHE_PATH_ENVIRONMENT_VARIABLE
+from cli.mock_node.service import (
+    MockNode,
+    SyntheticChain,
+)
+
 NODE_PRIVATE_KEY_DIRECTORY_PATH = str(pathlib.Path.home()) + '/docker/volumes/remme_validator_keys/_data/'
 NODE_PRIVATE_KEY_FILE_PATH_IN_TESTING = NODE_PRIVATE_KEY_DIRECTORY_PATH + 'validator.priv'
 
@@ -29,6 +40,30 @@ def pytest_configure():
     sys.path.insert(0, str(pathlib.Path(__file__).parents[1]))
 
 
+@pytest.fixture(autouse=True)
+def object_cache_path(tmpdir, monkeypatch):
+    """
+    Keep the on-disk cache of the chain objects in the test's temporary directory.
+
+    Otherwise objects cached by a test are loaded by the following tests instead of requesting the (mocked) node.
+    """
+    cache_path = str(tmpdir.join('cache.sqlite3'))
+
+    monkeypatch.setattr(Settings, '_shared', Settings(
+        environment=collections.ChainMap({CACHE_PATH_ENVIRONMENT_VARIABLE: cache_path}, os.environ),
+    ))
+
+    return cache_path
+
+
+@pytest.fixture(autouse=True)
+def read_cache(monkeypatch):
+    """
+    Start each test with empty in-process caches of the reads, so values read by a test aren't returned to the next.
+    """
+    monkeypatch.setattr(ReadCache, '_caches', {})
+
+
 @pytest.fixture()
 def node_private_key_file_path():
     """
@@ -88,6 +123,23 @@ def create_empty_config_file():
     os.remove(path_to_copy_fixture_file_to)
 
 
+@pytest.yield_fixture()
+def create_config_file_with_nodes():
+    """
+    Create configuration file with nodes to apply read commands to concurrently for testing.
+
+    The example of the configuration file is located in the tests fixture folder.
+    """
+    fixture_file_path = os.getcwd() + '/tests/fixtures/.remme-core-cli-with-nodes.yml'
+    path_to_copy_fixture_file_to = str(pathlib.Path.home()) + '/.remme-core-cli-with-nodes.yml'
+
+    shutil.copyfile(fixture_file_path, path_to_copy_fixture_file_to)
+
+    yield
+
+    os.remove(path_to_copy_fixture_file_to)
+
+
 @pytest.yield_fixture()
 def create_node_private_key_file():
     """
@@ -378,3 +430,24 @@ def transaction():
     Get the transaction fixture.
     """
     return Transaction()
+
+
+@pytest.yield_fixture()
+def mock_node(monkeypatch):
+    """
+    Run the mock node serving the synthetic chain, so commands with `--node-url localhost` work offline.
+
+    The mock node listens to a free port, clients are pointed to it instead of the node's port.
+    """
+    chain = SyntheticChain(blocks_amount=30, transactions_per_block=2)
+    node = MockNode(chain=chain)
+
+    port = node.start(host='localhost', port=0)
+
+    monkeypatch.setattr(client, 'NODE_PORT', port)
+    monkeypatch.setattr(RemmeClient, '_clients', {})
+
+    yield node
+
+    RemmeClient.close()
+    node.stop()
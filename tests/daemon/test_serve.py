@@ -0,0 +1,241 @@
+"""
+Provide tests for command line interface's daemon command and forwarding of the commands to the daemon.
+"""
+import os
+import socket
+import stat
+import threading
+
+import pytest
+
+from cli.constants import (
+    FAILED_EXIT_FROM_COMMAND_CODE,
+    NODE_URL_ENVIRONMENT_VARIABLE,
+    PASSED_EXIT_FROM_COMMAND_CODE,
+)
+from cli.daemon.client import (
+    DAEMON_FAILED_EXIT_CODE,
+    DAEMON_READY_MESSAGE,
+    forward,
+    is_local_command,
+)
+from cli.daemon.server import (
+    Daemon,
+    DaemonRequestHandler,
+    execute_command,
+)
+from cli.errors import DaemonIsAlreadyRunningError
+from cli.utils import dict_to_pretty_json
+
+ACCOUNT_ADDRESS = '1120076ecf036e857f42129b58303bcf1e03723764a1702cbe98529802aad8514ee3cf'
+
+
+@pytest.yield_fixture()
+def daemon_socket_path(tmpdir, mocker):
+    """
+    Run the daemon on the temporary socket in the background thread.
+    """
+    mocker.patch('cli.config.Settings._shared', None)
+    mocker.patch('cli.daemon.server.RemmeClient.close')
+
+    socket_path = str(tmpdir.join('remme-core-cli.sock'))
+
+    daemon = Daemon(socket_path=socket_path)
+
+    daemon_thread = threading.Thread(target=daemon.serve_forever)
+    daemon_thread.start()
+
+    yield socket_path
+
+    daemon.shutdown()
+    daemon.server_close()
+    daemon_thread.join()
+
+
+def test_execute_command(mocker):
+    """
+    Case: execute the command by the daemon.
+    Expect: output and exit code of the command are returned.
+    """
+    mocker.patch('cli.config.Settings._shared', None)
+
+    response = execute_command(arguments=['account', 'get-balance', '--address', 'invalid'], environment={})
+
+    expected_error = {
+        'errors': {
+            'address': [
+                'The following address `invalid` is invalid.',
+            ],
+        },
+    }
+
+    assert FAILED_EXIT_FROM_COMMAND_CODE == response.get('exit_code')
+    assert dict_to_pretty_json(expected_error) in response.get('output')
+
+
+def test_execute_local_command():
+    """
+    Case: execute the command that should be executed without the daemon by the daemon.
+    Expect: the command could not be executed by the daemon error message.
+    """
+    response = execute_command(arguments=['serve'], environment={})
+
+    assert FAILED_EXIT_FROM_COMMAND_CODE == response.get('exit_code')
+    assert 'The command could not be executed by the daemon' in response.get('errors_output')
+
+
+def test_forward_without_daemon(tmpdir):
+    """
+    Case: forward the command without the running daemon.
+    Expect: none is returned, so the command is executed locally.
+    """
+    socket_path = str(tmpdir.join('remme-core-cli.sock'))
+
+    assert forward(arguments=['account', 'get-balance', '--address', ACCOUNT_ADDRESS], socket_path=socket_path) is None
+
+
+def test_forward_local_command(daemon_socket_path):
+    """
+    Case: forward the command that should be executed without the daemon to the running daemon.
+    Expect: none is returned, so the command is executed locally.
+    """
+    assert forward(arguments=['batch-exec', '--concurrency', '2'], socket_path=daemon_socket_path) is None
+
+
+@pytest.mark.parametrize('arguments', [
+    ['batch', 'wait', '--node-url', 'node-6-testnet.remme.io'],
+    ['block', 'get-list', '--follow'],
+    ['transaction', 'get-list', '--all', '--output', 'ndjson'],
+    ['block', 'get-list', '--all', '--output=ndjson'],
+    ['block', 'get-range', '--from', '0', '--to', '10', '--output-file', 'blocks.ndjson'],
+    ['block', 'mirror', '--path', 'mirror'],
+    ['index', 'query', '--path', 'index.sqlite3'],
+    ['account', 'transfer-tokens-bulk', '--input', 'payouts.csv', '--output-file', 'results.csv'],
+])
+def test_streaming_and_file_commands_are_not_forwarded(arguments):
+    """
+    Case: check if the commands reading the input or files, writing files or streaming output are executed locally.
+    Expect: such commands are never forwarded to the daemon, others are.
+    """
+    assert is_local_command(arguments=arguments)
+    assert not is_local_command(arguments=['block', 'get-list', '--all', '--output', 'json'])
+    assert not is_local_command(arguments=['batch', 'get-status', '--id', 'a' * 128])
+
+
+def test_forward(daemon_socket_path, mocker, capsys, monkeypatch):
+    """
+    Case: forward the command to the running daemon.
+    Expect: the command is executed by the daemon with the node URL from the client's environment.
+    """
+    monkeypatch.setenv(NODE_URL_ENVIRONMENT_VARIABLE, 'node-6-testnet.remme.io')
+
+    mock_remme_client_get = mocker.patch('cli.account.cli.RemmeClient.get')
+    mock_account_get_balance = mocker.patch('cli.account.cli.Account.get_balance')
+    mock_account_get_balance.return_value = ({'balance': 13500}, None)
+
+    exit_code = forward(
+        arguments=['account', 'get-balance', '--address', ACCOUNT_ADDRESS], socket_path=daemon_socket_path,
+    )
+
+    assert PASSED_EXIT_FROM_COMMAND_CODE == exit_code
+    assert dict_to_pretty_json({'result': {'balance': 13500}}) in capsys.readouterr().out
+    mock_remme_client_get.assert_called_once_with(node_url='node-6-testnet.remme.io')
+
+
+def test_forward_while_other_client_is_silent(daemon_socket_path, mocker, capsys):
+    """
+    Case: forward the command to the running daemon while the other client is connected but doesn't send a command.
+    Expect: the command is executed by the daemon once the silent client's request is timed out.
+    """
+    mocker.patch.object(DaemonRequestHandler, 'timeout', 0.1)
+
+    mocker.patch('cli.account.cli.RemmeClient.get')
+    mock_account_get_balance = mocker.patch('cli.account.cli.Account.get_balance')
+    mock_account_get_balance.return_value = ({'balance': 13500}, None)
+
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as silent_connection:
+        silent_connection.connect(daemon_socket_path)
+
+        exit_code = forward(
+            arguments=['account', 'get-balance', '--address', ACCOUNT_ADDRESS], socket_path=daemon_socket_path,
+        )
+
+    assert PASSED_EXIT_FROM_COMMAND_CODE == exit_code
+    assert dict_to_pretty_json({'result': {'balance': 13500}}) in capsys.readouterr().out
+
+
+def test_serve_already_running_daemon(daemon_socket_path):
+    """
+    Case: run the daemon on the socket the other daemon is listening to.
+    Expect: the daemon is already running error is raised.
+    """
+    with pytest.raises(DaemonIsAlreadyRunningError):
+        Daemon(socket_path=daemon_socket_path)
+
+
+def test_forward_to_busy_daemon(tmpdir, mocker):
+    """
+    Case: forward the command to the daemon that accepts connections but doesn't get ready to read the command.
+    Expect: none is returned once the connect timeout is expired, so the command is executed locally.
+    """
+    mocker.patch('cli.daemon.client.DAEMON_CONNECT_TIMEOUT', 0.1)
+
+    socket_path = str(tmpdir.join('remme-core-cli.sock'))
+
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as busy_daemon:
+        busy_daemon.bind(socket_path)
+        busy_daemon.listen(1)
+
+        assert forward(
+            arguments=['account', 'get-balance', '--address', ACCOUNT_ADDRESS], socket_path=socket_path,
+        ) is None
+
+
+def test_forward_to_stuck_daemon(tmpdir, mocker, capsys):
+    """
+    Case: forward the command to the daemon that reads the command but doesn't send its output back.
+    Expect: the daemon has not responded error message once the response timeout is expired, the command is failed.
+    """
+    mocker.patch('cli.daemon.client.DAEMON_RESPONSE_TIMEOUT', 0.1)
+
+    socket_path = str(tmpdir.join('remme-core-cli.sock'))
+
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as stuck_daemon:
+        stuck_daemon.bind(socket_path)
+        stuck_daemon.listen(1)
+
+        def accept_command():
+            connection, _ = stuck_daemon.accept()
+
+            with connection:
+                connection.sendall(DAEMON_READY_MESSAGE)
+
+                while connection.recv(1024):
+                    pass
+
+        daemon_thread = threading.Thread(target=accept_command)
+        daemon_thread.start()
+
+        exit_code = forward(
+            arguments=['account', 'get-balance', '--address', ACCOUNT_ADDRESS], socket_path=socket_path,
+        )
+
+        daemon_thread.join()
+
+    assert DAEMON_FAILED_EXIT_CODE == exit_code
+    assert 'has not responded in 0.1 seconds' in capsys.readouterr().err
+
+
+def test_daemon_socket_is_created_without_others_permissions(tmpdir, mocker):
+    """
+    Case: create the daemon's socket before its permissions are changed.
+    Expect: the socket has no permissions for the group and other users as soon as it is created.
+    """
+    mocker.patch('os.chmod')
+
+    socket_path = str(tmpdir.join('remme-core-cli.sock'))
+
+    daemon = Daemon(socket_path=socket_path)
+    daemon.server_close()
+
+    assert 0 == stat.S_IMODE(os.stat(socket_path).st_mode) & 0o077
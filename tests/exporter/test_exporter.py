@@ -0,0 +1,115 @@
+"""
+Provide tests for the exporter of the nodes' metrics.
+"""
+import json
+
+import aiohttp
+from click.testing import CliRunner
+
+from cli.client import RemmeClient
+from cli.constants import (
+    EXPORTER_METRICS_CONTENT_TYPE,
+    FAILED_EXIT_FROM_COMMAND_CODE,
+)
+from cli.entrypoint import cli
+from cli.exporter.service import Exporter
+from cli.utils import run_until_complete
+
+
+def get_exporter():
+    """
+    Get the exporter of the mock node's metrics.
+    """
+    return Exporter(services={'localhost': RemmeClient.get(node_url='localhost')}, interval=15)
+
+
+def test_collect_metrics(mock_node):
+    """
+    Case: collect metrics of the node.
+    Expect: the node's information, peers, head block and account's metrics, the collection's duration are exported.
+    """
+    exporter = get_exporter()
+
+    _, errors = exporter.collect()
+
+    metrics = exporter.get_metrics().splitlines()
+
+    assert errors is None
+    assert '# TYPE remme_node_up gauge' in metrics
+    assert 'remme_node_up{node_url="localhost"} 1' in metrics
+    assert 'remme_node_is_synced{node_url="localhost"} 1' in metrics
+    assert 'remme_node_peers{node_url="localhost"} 1' in metrics
+    assert 'remme_node_head_block_number{node_url="localhost"} 29' in metrics
+    assert 'remme_node_account_reputation_frozen{node_url="localhost"} 250000.0' in metrics
+    assert 'remme_node_account_state{node_url="localhost",state="OPENED"} 1' in metrics
+    assert 'remme_exporter_collections_total 1' in metrics
+    assert 'remme_exporter_collection_errors_total{node_url="localhost"} 0' in metrics
+    assert '# TYPE remme_exporter_collection_duration_seconds histogram' in metrics
+    assert 'remme_exporter_collection_duration_seconds_bucket{node_url="localhost",le="+Inf"} 1' in metrics
+    assert 'remme_exporter_collection_duration_seconds_count{node_url="localhost"} 1' in metrics
+
+
+def test_collect_metrics_of_failing_node(mock_node):
+    """
+    Case: collect metrics of the node failing every request.
+    Expect: the node is exported as down, the failed collection is counted.
+    """
+    mock_node.error_rate = 1
+
+    exporter = get_exporter()
+
+    _, errors = exporter.collect()
+
+    metrics = exporter.get_metrics().splitlines()
+
+    assert 'localhost' in errors
+    assert 'remme_node_up{node_url="localhost"} 0' in metrics
+    assert 'remme_exporter_collection_errors_total{node_url="localhost"} 1' in metrics
+    assert not [line for line in metrics if line.startswith('remme_node_head_block_number')]
+
+
+def test_serve_metrics(mock_node):
+    """
+    Case: scrape the metrics served by the exporter.
+    Expect: metrics of the first collection are served in Prometheus text exposition format.
+    """
+    exporter = get_exporter()
+
+    port = exporter.start(host='localhost', port=0)
+
+    async def scrape():
+        async with aiohttp.ClientSession() as session:
+            async with session.get(f'http://localhost:{port}/metrics') as response:
+                return response.headers.get('Content-Type'), await response.text()
+
+    try:
+        content_type, metrics = run_until_complete(scrape())
+
+    finally:
+        exporter.stop()
+
+    assert EXPORTER_METRICS_CONTENT_TYPE == content_type
+    assert 'remme_node_up{node_url="localhost"} 1' in metrics.splitlines()
+
+
+def test_exporter_with_invalid_interval():
+    """
+    Case: run the exporter with the interval less than a second.
+    Expect: interval must be greater than or equal to 1 error message.
+    """
+    result = CliRunner().invoke(cli, [
+        'exporter',
+        '--node-urls', 'localhost',
+        '--interval', '0.5',
+    ])
+
+    expected_error = {
+        'errors': {
+            'interval': [
+                'Interval must be greater than or equal to 1.',
+            ],
+        },
+    }
+
+    assert FAILED_EXIT_FROM_COMMAND_CODE == result.exit_code
+    assert expected_error == json.loads(result.output)
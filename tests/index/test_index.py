@@ -0,0 +1,231 @@
+"""
+Provide tests for command line interface's index commands.
+"""
+import json
+
+from click.testing import CliRunner
+
+from cli.constants import (
+    FAILED_EXIT_FROM_COMMAND_CODE,
+    PASSED_EXIT_FROM_COMMAND_CODE,
+)
+from cli.entrypoint import cli
+from cli.utils import (
+    async_side_effect,
+    dict_to_pretty_json,
+)
+
+ADDRESS = '1120076ecf036e857f42129b58303bcf1e03723764a1702cbe98529802aad8514ee3cf'
+SIGNER = '03309c84260e7265a296c77df42397372c658e30541ddc99b39cc52ce1f86dfb19'
+
+
+def create_block(block_num, fork='a'):
+    """
+    Create the block with a batch of the account and the block info transactions.
+    """
+    return {
+        'header': {
+            'block_num': str(block_num),
+            'previous_block_id': fork * 127 + str(block_num - 1) if block_num else '0' * 128,
+            'signer_public_key': SIGNER,
+            'state_root_hash': 'c' * 64,
+        },
+        'header_signature': fork * 127 + str(block_num),
+        'batches': [{
+            'header': {'signer_public_key': SIGNER},
+            'header_signature': 'b' * 127 + str(block_num),
+            'transactions': [{
+                'header': {
+                    'family_name': 'account',
+                    'family_version': '0.1',
+                    'inputs': [ADDRESS],
+                    'outputs': [ADDRESS],
+                    'signer_public_key': SIGNER,
+                },
+                'header_signature': fork * 126 + 't' + str(block_num),
+                'payload': 'payload',
+            }, {
+                'header': {
+                    'family_name': 'block_info',
+                    'family_version': '1.0',
+                    'inputs': ['00b10c00'],
+                    'outputs': ['00b10c00'],
+                    'signer_public_key': SIGNER,
+                },
+                'header_signature': fork * 126 + 'i' + str(block_num),
+                'payload': 'payload',
+            }],
+        }],
+    }
+
+
+def create_page(blocks, next_position=''):
+    """
+    Create the page of blocks as the node returns it.
+    """
+    return {'data': blocks, 'head': blocks[0].get('header_signature'), 'paging': {'next': next_position}}
+
+
+def sync_index(path):
+    """
+    Synchronize the index by the command line interface.
+    """
+    return CliRunner().invoke(cli, ['index', 'sync', '--path', path, '--page-size', 2, '--node-url', 'localhost'])
+
+
+def query_index(path, *options):
+    """
+    Get a list of the indexed transactions by the command line interface.
+    """
+    return CliRunner().invoke(cli, ['index', 'query', '--path', path, *options])
+
+
+def test_sync_index_and_query_transactions(mocker, tmpdir):
+    """
+    Case: index blocks of the node page by page and get a list of the indexed transactions by family and address.
+    Expect: all blocks are indexed, account transactions of the address are returned, the latest first.
+    """
+    path = str(tmpdir.join('index.sqlite3'))
+
+    mock_get_blocks = mocker.patch('remme.blockchain_info.RemmeBlockchainInfo.get_blocks')
+    mock_get_blocks.side_effect = async_side_effect(
+        create_page([create_block(2), create_block(1)], next_position='0'),
+        create_page([create_block(0)]),
+    )
+
+    result = sync_index(path=path)
+
+    assert PASSED_EXIT_FROM_COMMAND_CODE == result.exit_code
+    assert {'blocks': 3, 'batches': 3, 'transactions': 6, 'head': 2} == json.loads(result.output).get('result')
+
+    result = query_index(path, '--family-name', 'account', '--address', ADDRESS, '--limit', 2)
+
+    assert PASSED_EXIT_FROM_COMMAND_CODE == result.exit_code
+    assert [('a' * 126 + 't2', 2), ('a' * 126 + 't1', 1)] == [
+        (transaction.get('header_signature'), transaction.get('block_num'))
+        for transaction in json.loads(result.output).get('result')
+    ]
+
+
+def test_resume_index_sync(mocker, tmpdir):
+    """
+    Case: synchronize the index after new blocks are committed to the node.
+    Expect: only the new blocks are requested and indexed.
+    """
+    path = str(tmpdir.join('index.sqlite3'))
+
+    mock_get_blocks = mocker.patch('remme.blockchain_info.RemmeBlockchainInfo.get_blocks')
+    mock_get_blocks.side_effect = async_side_effect(
+        create_page([create_block(1), create_block(0)]),
+        create_page([create_block(3), create_block(2)], next_position='1'),
+        create_page([create_block(1), create_block(0)]),
+    )
+
+    sync_index(path=path)
+    result = sync_index(path=path)
+
+    assert PASSED_EXIT_FROM_COMMAND_CODE == result.exit_code
+    assert {'blocks': 2, 'batches': 2, 'transactions': 4, 'head': 3} == json.loads(result.output).get('result')
+    assert 3 == mock_get_blocks.call_count
+
+
+def test_resume_interrupted_index_sync(mocker, tmpdir):
+    """
+    Case: synchronize the index which previous synchronization was interrupted after the first page.
+    Expect: the walk jumps over the indexed blocks and indexes the rest of them down to genesis.
+    """
+    path = str(tmpdir.join('index.sqlite3'))
+
+    mock_get_blocks = mocker.patch('remme.blockchain_info.RemmeBlockchainInfo.get_blocks')
+    mock_get_blocks.side_effect = async_side_effect(
+        create_page([create_block(3), create_block(2)], next_position='1'),
+        Exception('Connection refused.'),
+        create_page([create_block(3), create_block(2)], next_position='1'),
+        create_page([create_block(1), create_block(0)]),
+    )
+
+    result = sync_index(path=path)
+
+    assert FAILED_EXIT_FROM_COMMAND_CODE == result.exit_code
+
+    result = sync_index(path=path)
+
+    assert PASSED_EXIT_FROM_COMMAND_CODE == result.exit_code
+    assert 2 == json.loads(result.output).get('result').get('blocks')
+    assert create_block(2).get('header').get('previous_block_id') == \
+        mock_get_blocks.call_args_list[3][1].get('query').get('head')
+
+
+def test_sync_index_after_fork(mocker, tmpdir):
+    """
+    Case: synchronize the index after the node switched to a fork of the indexed blocks.
+    Expect: indexed blocks of the abandoned fork are replaced with the node's blocks.
+    """
+    path = str(tmpdir.join('index.sqlite3'))
+
+    mock_get_blocks = mocker.patch('remme.blockchain_info.RemmeBlockchainInfo.get_blocks')
+    mock_get_blocks.side_effect = async_side_effect(
+        create_page([create_block(1), create_block(0)]),
+        create_page([create_block(2, fork='f'), create_block(1, fork='f')], next_position='0'),
+        create_page([create_block(0)]),
+    )
+
+    sync_index(path=path)
+    result = sync_index(path=path)
+
+    assert PASSED_EXIT_FROM_COMMAND_CODE == result.exit_code
+    assert 2 == json.loads(result.output).get('result').get('blocks')
+
+    result = query_index(path, '--family-name', 'account')
+
+    assert ['f' * 126 + 't2', 'f' * 126 + 't1', 'a' * 126 + 't0'] == [
+        transaction.get('header_signature') for transaction in json.loads(result.output).get('result')
+    ]
+
+
+def test_sync_index_after_fork_to_shorter_chain(mocker, tmpdir):
+    """
+    Case: synchronize the index after the node switched to a shorter fork of the indexed blocks.
+    Expect: indexed blocks above the node's head are removed with their transactions.
+    """
+    path = str(tmpdir.join('index.sqlite3'))
+
+    mock_get_blocks = mocker.patch('remme.blockchain_info.RemmeBlockchainInfo.get_blocks')
+    mock_get_blocks.side_effect = async_side_effect(
+        create_page([create_block(3), create_block(2)], next_position='1'),
+        create_page([create_block(1), create_block(0)]),
+        create_page([create_block(2, fork='f'), create_block(1)], next_position='0'),
+    )
+
+    sync_index(path=path)
+    result = sync_index(path=path)
+
+    assert PASSED_EXIT_FROM_COMMAND_CODE == result.exit_code
+    assert {'blocks': 1, 'batches': 1, 'transactions': 2, 'head': 2} == json.loads(result.output).get('result')
+
+    result = query_index(path, '--family-name', 'account')
+
+    assert ['f' * 126 + 't2', 'a' * 126 + 't1', 'a' * 126 + 't0'] == [
+        transaction.get('header_signature') for transaction in json.loads(result.output).get('result')
+    ]
+
+
+def test_query_index_invalid_address(tmpdir):
+    """
+    Case: get a list of the indexed transactions by invalid address.
+    Expect: the following address is invalid error message.
+    """
+    invalid_address = '1120076ecf036e857f42129b5830'
+
+    result = query_index(str(tmpdir.join('index.sqlite3')), '--address', invalid_address)
+
+    expected_error = {
+        'errors': {
+            'address': [
+                f'The following address `{invalid_address}` is invalid.',
+            ],
+        },
+    }
+
+    assert FAILED_EXIT_FROM_COMMAND_CODE == result.exit_code
+    assert dict_to_pretty_json(expected_error) in result.output
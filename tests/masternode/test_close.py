@@ -7,6 +7,7 @@ from click.testing import CliRunner
 
 from cli.constants import PASSED_EXIT_FROM_COMMAND_CODE
 from cli.entrypoint import cli
+from cli.utils import async_side_effect
 
 
 def test_close_masternode(mocker, close_masternode_transaction):
@@ -17,8 +18,8 @@ def test_close_masternode(mocker, close_masternode_transaction):
     mock_get_node_private_key = mocker.patch('cli.config.NodePrivateKey.get')
     mock_get_node_private_key.return_value = '42dada12f863528bd456785d8c544154db6ec9455be2c123d91b687df3697314'
 
-    mock_close_masternode = mocker.patch('cli.masternode.service.loop.run_until_complete')
-    mock_close_masternode.return_value = close_masternode_transaction
+    mock_close_masternode = mocker.patch('remme.node_management.RemmeNodeManagement.close_master_node')
+    mock_close_masternode.side_effect = async_side_effect(close_masternode_transaction)
 
     runner = CliRunner()
     result = runner.invoke(cli, [
@@ -11,7 +11,10 @@ from cli.constants import (
     PASSED_EXIT_FROM_COMMAND_CODE,
 )
 from cli.entrypoint import cli
-from cli.utils import dict_to_pretty_json
+from cli.utils import (
+    async_side_effect,
+    dict_to_pretty_json,
+)
 
 
 @pytest.mark.parametrize('bet', ['max', 'min', '2'])
@@ -23,8 +26,8 @@ def test_set_bet_masternode(mocker, transaction, bet):
     mock_get_node_private_key = mocker.patch('cli.config.NodePrivateKey.get')
     mock_get_node_private_key.return_value = '42dada12f863528bd456785d8c544154db6ec9455be2c123d91b687df3697314'
 
-    mock_set_bet_masternode = mocker.patch('cli.masternode.service.loop.run_until_complete')
-    mock_set_bet_masternode.return_value = transaction
+    mock_set_bet_masternode = mocker.patch('remme.node_management.RemmeNodeManagement.set_bet')
+    mock_set_bet_masternode.side_effect = async_side_effect(transaction)
 
     runner = CliRunner()
     result = runner.invoke(cli, [
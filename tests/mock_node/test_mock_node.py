@@ -0,0 +1,205 @@
+"""
+Provide tests for the mock node serving the synthetic chain.
+"""
+import json
+
+from click.testing import CliRunner
+
+from cli.constants import (
+    COMMITTED_BATCH_STATUS,
+    FAILED_EXIT_FROM_COMMAND_CODE,
+    MOCK_NODE_INITIAL_STAKE,
+    PASSED_EXIT_FROM_COMMAND_CODE,
+)
+from cli.entrypoint import cli
+from cli.mock_node.service import SyntheticChain
+
+
+def test_synthetic_chain():
+    """
+    Case: build synthetic chains with the same size and seed.
+    Expect: chains are the same, blocks are linked to their previous ones and contain the transactions per block.
+    """
+    chain = SyntheticChain(blocks_amount=5, transactions_per_block=3, seed=1)
+
+    assert chain.blocks == SyntheticChain(blocks_amount=5, transactions_per_block=3, seed=1).blocks
+    assert chain.blocks != SyntheticChain(blocks_amount=5, transactions_per_block=3, seed=2).blocks
+
+    assert 12 == len(chain.batches) == len(chain.transactions)
+    assert '4' == chain.head.get('header').get('block_num')
+
+    for previous_block, block in zip(chain.blocks, chain.blocks[1:]):
+        assert previous_block.get('header_signature') == block.get('header').get('previous_block_id')
+
+
+def test_get_blocks_list_from_mock_node(mock_node):
+    """
+    Case: get a list of blocks from the mock node.
+    Expect: the newest blocks are returned with the paging's next position of the following page.
+    """
+    result = CliRunner().invoke(cli, [
+        'block',
+        'get-list',
+        '--limit', 3,
+        '--node-url', 'localhost',
+    ])
+
+    blocks = json.loads(result.output).get('result')
+
+    assert PASSED_EXIT_FROM_COMMAND_CODE == result.exit_code
+    assert ['29', '28', '27'] == [block.get('header').get('block_num') for block in blocks]
+
+
+def test_get_blocks_range_from_mock_node(mock_node):
+    """
+    Case: get a range of blocks from the mock node by chunks.
+    Expect: blocks of the range are printed from the oldest to the newest.
+    """
+    result = CliRunner().invoke(cli, [
+        'block',
+        'get-range',
+        '--from', 3,
+        '--to', 17,
+        '--chunk-size', 4,
+        '--node-url', 'localhost',
+    ])
+
+    assert PASSED_EXIT_FROM_COMMAND_CODE == result.exit_code
+    assert [str(num) for num in range(3, 18)] == [
+        json.loads(line).get('header').get('block_num') for line in result.output.splitlines()
+    ]
+
+
+def test_get_batch_status_from_mock_node(mock_node):
+    """
+    Case: get a status of the batch of the mock node's chain.
+    Expect: the batch is committed.
+    """
+    result = CliRunner().invoke(cli, [
+        'batch',
+        'get-status',
+        '--id', mock_node.chain.batches[0].get('header_signature'),
+        '--node-url', 'localhost',
+    ])
+
+    assert PASSED_EXIT_FROM_COMMAND_CODE == result.exit_code
+    assert COMMITTED_BATCH_STATUS == json.loads(result.output).get('result')
+
+
+def test_get_node_information_from_mock_node(mock_node):
+    """
+    Case: get information about the mock node.
+    Expect: the mock node is synced.
+    """
+    result = CliRunner().invoke(cli, [
+        'node',
+        'get-info',
+        '--node-url', 'localhost',
+    ])
+
+    assert PASSED_EXIT_FROM_COMMAND_CODE == result.exit_code
+    assert json.loads(result.output).get('result').get('information').get('is_synced')
+
+
+def test_get_states_list_from_mock_node(mock_node):
+    """
+    Case: get a list of states of the address from the mock node.
+    Expect: the state written by the transaction of the mock node's chain is returned.
+    """
+    transaction = mock_node.chain.transactions[0]
+    address = transaction.get('header').get('outputs')[0]
+
+    result = CliRunner().invoke(cli, [
+        'state',
+        'get-list',
+        '--address', address,
+        '--node-url', 'localhost',
+    ])
+
+    assert PASSED_EXIT_FROM_COMMAND_CODE == result.exit_code
+    assert [{'address': address, 'data': transaction.get('payload')}] == json.loads(result.output).get('result')
+
+
+def test_get_receipts_from_mock_node(mock_node):
+    """
+    Case: get the transaction's receipt from the mock node.
+    Expect: the receipt with the state's change of the transaction is returned.
+    """
+    transaction = mock_node.chain.transactions[0]
+
+    result = CliRunner().invoke(cli, [
+        'receipt',
+        'get',
+        '--ids', transaction.get('header_signature'),
+        '--node-url', 'localhost',
+    ])
+
+    receipts = json.loads(result.output).get('result')
+
+    assert PASSED_EXIT_FROM_COMMAND_CODE == result.exit_code
+    assert [transaction.get('header_signature')] == [receipt.get('id') for receipt in receipts]
+    assert transaction.get('header').get('outputs') == [
+        state_change.get('address') for state_change in receipts[0].get('state_changes')
+    ]
+
+
+def test_get_initial_stake_from_mock_node(mock_node):
+    """
+    Case: get the initial stake of the mock node.
+    Expect: the mock node's initial stake is returned.
+    """
+    result = CliRunner().invoke(cli, [
+        'node',
+        'get-initial-stake',
+        '--node-url', 'localhost',
+    ])
+
+    assert PASSED_EXIT_FROM_COMMAND_CODE == result.exit_code
+    assert MOCK_NODE_INITIAL_STAKE == json.loads(result.output).get('result')
+
+
+def test_get_public_key_and_atomic_swap_from_mock_node(mock_node):
+    """
+    Case: get information about the public key and atomic swap from the mock node.
+    Expect: information about the public key and atomic swap is returned.
+    """
+    public_key_result = CliRunner().invoke(cli, [
+        'public-key',
+        'get-info',
+        '--address', 'a23be1ae97d605bcbe61c312d9a443c010dbe7e6a0761e24b10d5368829ab0a7d36acc',
+        '--node-url', 'localhost',
+    ])
+
+    swap_id = '033402fe1346742486b15a3a9966eb5249271025fc7fb0b37ed3fdb4bcce6808'
+
+    atomic_swap_result = CliRunner().invoke(cli, [
+        'atomic-swap',
+        'get-info',
+        '--id', swap_id,
+        '--node-url', 'localhost',
+    ])
+
+    assert PASSED_EXIT_FROM_COMMAND_CODE == public_key_result.exit_code
+    assert json.loads(public_key_result.output).get('result').get('information').get('is_valid')
+
+    assert PASSED_EXIT_FROM_COMMAND_CODE == atomic_swap_result.exit_code
+    assert swap_id == json.loads(atomic_swap_result.output).get('result').get('information').get('swap_id')
+
+
+def test_mock_node_with_error_rate(mock_node):
+    """
+    Case: get a balance from the mock node failing every request.
+    Expect: the node's server error message.
+    """
+    mock_node.error_rate = 1
+
+    result = CliRunner().invoke(cli, [
+        'account',
+        'get-balance',
+        '--address', '1120076ecf036e857f42129b58303bcf1e03723764a1702cbe98529802aad8514ee3cf',
+        '--node-url', 'localhost',
+    ])
+
+    assert FAILED_EXIT_FROM_COMMAND_CODE == result.exit_code
+    assert {'errors': 'Generic server defined Error'} == json.loads(result.output)
+    assert 1 == mock_node.requests_amount
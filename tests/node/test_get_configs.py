@@ -15,7 +15,10 @@ from cli.constants import (
     PUBLIC_KEY_REGEXP,
 )
 from cli.entrypoint import cli
-from cli.utils import dict_to_pretty_json
+from cli.utils import (
+    async_side_effect,
+    dict_to_pretty_json,
+)
 
 
 def test_get_node_configs():
@@ -46,8 +49,8 @@ def test_get_node_configs_without_node_url(mocker, node_configurations):
     Case: get node configurations without passing node URL.
     Expect: batch identifier is returned from a node on localhost.
     """
-    mock_get_node_configs = mocker.patch('cli.node.service.loop.run_until_complete')
-    mock_get_node_configs.return_value = node_configurations
+    mock_get_node_configs = mocker.patch('remme.node_management.RemmeNodeManagement.get_node_config')
+    mock_get_node_configs.side_effect = async_side_effect(node_configurations)
 
     runner = CliRunner()
     result = runner.invoke(cli, [
@@ -0,0 +1,160 @@
+"""
+Provide tests for command line interface's node get fleet status command.
+"""
+import json
+
+from click.testing import CliRunner
+
+from cli.constants import (
+    FAILED_EXIT_FROM_COMMAND_CODE,
+    PASSED_EXIT_FROM_COMMAND_CODE,
+)
+from cli.entrypoint import cli
+from cli.utils import async_side_effect
+
+NODE_URLS = ['node-1-testnet.remme.io', 'node-2-testnet.remme.io', 'node-3-testnet.remme.io', 'node-4-testnet.remme.io']
+
+CHAIN = {block_num: f'{block_num:0128x}' for block_num in range(100)}
+FORK = dict(CHAIN)
+FORK.update({block_num: f'{block_num:0128x}'.replace('0', 'f') for block_num in range(95, 100)})
+
+NODES_CHAINS = {
+    'node-1-testnet.remme.io': (CHAIN, 99),
+    'node-2-testnet.remme.io': (CHAIN, 98),
+    'node-3-testnet.remme.io': (CHAIN, 80),
+    'node-4-testnet.remme.io': (FORK, 99),
+}
+
+
+async def get_blocks(self, query):
+    """
+    Get the node's recent blocks, the latest first, by the node's address.
+    """
+    node_url = self._remme_api._network_config.get('node_address').split(':')[0]
+    chain, head_block_num = NODES_CHAINS.get(node_url)
+
+    return {
+        'data': [{
+            'header': {'block_num': str(block_num)},
+            'header_signature': chain.get(block_num),
+        } for block_num in range(head_block_num, max(head_block_num - query.get('limit'), -1), -1)],
+    }
+
+
+def mock_fleet(mocker, node_information):
+    """
+    Mock the nodes' information, peers and blocks.
+    """
+    mock_get_node_info = mocker.patch('remme.node_management.RemmeNodeManagement.get_node_info')
+    mock_get_node_info.side_effect = async_side_effect(node_information)
+
+    mock_get_peers = mocker.patch('remme.blockchain_info.RemmeBlockchainInfo.get_peers')
+    mock_get_peers.side_effect = async_side_effect(['tcp://node-2-testnet.remme.io:8800'])
+
+    mock_get_blocks = mocker.patch('remme.blockchain_info.RemmeBlockchainInfo.get_blocks', autospec=True)
+    mock_get_blocks.side_effect = get_blocks
+
+    return mock_get_blocks
+
+
+def test_get_fleet_status(mocker, node_information):
+    """
+    Case: get status of the fleet with a lagging node and a node on a fork.
+    Expect: the nodes on the chain most of the nodes are on are ok, the lagging and diverged nodes are flagged.
+    """
+    mock_get_blocks = mock_fleet(mocker=mocker, node_information=node_information)
+
+    result = CliRunner().invoke(cli, [
+        'node',
+        'fleet-status',
+        '--node-urls',
+        ','.join(NODE_URLS),
+        '--max-lag',
+        10,
+    ])
+
+    fleet_status = json.loads(result.output).get('result')
+    nodes = fleet_status.get('nodes')
+
+    assert FAILED_EXIT_FROM_COMMAND_CODE == result.exit_code
+    assert {'block_id': CHAIN.get(99), 'block_num': 99} == fleet_status.get('head')
+    assert {
+        'node-1-testnet.remme.io': ('ok', 0),
+        'node-2-testnet.remme.io': ('ok', 1),
+        'node-3-testnet.remme.io': ('lagging', 19),
+        'node-4-testnet.remme.io': ('diverged', 0),
+    } == {node_url: (status.get('status'), status.get('lag')) for node_url, status in nodes.items()}
+    assert FORK.get(99) == nodes.get('node-4-testnet.remme.io').get('head_block_id')
+    assert node_information.data.get('peer_count') == nodes.get('node-1-testnet.remme.io').get('peer_count')
+    assert 4 == mock_get_blocks.call_count
+
+
+def test_get_fleet_status_with_unavailable_node(mocker, node_information):
+    """
+    Case: get status of the fleet in the machine-readable format with an unavailable node.
+    Expect: a line of JSON per node, the unavailable node is flagged with its errors.
+    """
+    mock_get_blocks = mock_fleet(mocker=mocker, node_information=node_information)
+
+    async def get_blocks_or_fail(self, query):
+        if self._remme_api._network_config.get('node_address').startswith('node-2-testnet.remme.io'):
+            raise Exception('Connection refused.')
+
+        return await get_blocks(self, query)
+
+    mock_get_blocks.side_effect = get_blocks_or_fail
+
+    result = CliRunner().invoke(cli, [
+        'node',
+        'fleet-status',
+        '--node-urls',
+        ','.join(NODE_URLS[:2]),
+        '--output',
+        'ndjson',
+    ])
+
+    lines = [json.loads(line) for line in result.output.splitlines()]
+
+    assert FAILED_EXIT_FROM_COMMAND_CODE == result.exit_code
+    assert ['node-1-testnet.remme.io', 'node-2-testnet.remme.io'] == [line.get('node_url') for line in lines]
+    assert 'ok' == lines[0].get('status')
+    assert {'node_url': 'node-2-testnet.remme.io', 'status': 'unavailable', 'errors': 'Connection refused.'} == lines[1]
+
+
+def test_get_fleet_status_of_synced_fleet(mocker, node_information):
+    """
+    Case: get status of the fleet which nodes are on the same chain within the maximum lag.
+    Expect: every node is ok.
+    """
+    mock_fleet(mocker=mocker, node_information=node_information)
+
+    result = CliRunner().invoke(cli, [
+        'node',
+        'fleet-status',
+        '--node-urls',
+        ','.join(NODE_URLS[:2]),
+    ])
+
+    assert PASSED_EXIT_FROM_COMMAND_CODE == result.exit_code
+
+
+def test_get_fleet_status_without_node_urls():
+    """
+    Case: get status of the fleet without passing node URLs and without nodes in the configuration file.
+    Expect: node URLs must be passed error message.
+    """
+    result = CliRunner().invoke(cli, [
+        'node',
+        'fleet-status',
+    ])
+
+    expected_error = {
+        'errors': {
+            'node_urls': [
+                'Node URLs must be passed or declared by the configuration file.',
+            ],
+        },
+    }
+
+    assert FAILED_EXIT_FROM_COMMAND_CODE == result.exit_code
+    assert expected_error == json.loads(result.output)
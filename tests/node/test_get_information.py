@@ -6,13 +6,17 @@ import json
 import pytest
 from click.testing import CliRunner
 
+from cli.config import Settings
 from cli.constants import (
     DEV_BRANCH_NODE_IP_ADDRESS_FOR_TESTING,
     FAILED_EXIT_FROM_COMMAND_CODE,
     PASSED_EXIT_FROM_COMMAND_CODE,
 )
 from cli.entrypoint import cli
-from cli.utils import dict_to_pretty_json
+from cli.utils import (
+    async_side_effect,
+    dict_to_pretty_json,
+)
 
 
 def test_get_node_info():
@@ -43,8 +47,8 @@ def test_get_node_info_without_node_url(mocker, node_information):
     Case: get information about synchronization and peer count of the node without passing node URL.
     Expect: the flag is synced and peer count are returned from a node on localhost
     """
-    mock_node_get_info = mocker.patch('cli.node.service.loop.run_until_complete')
-    mock_node_get_info.return_value = node_information
+    mock_node_get_info = mocker.patch('remme.node_management.RemmeNodeManagement.get_node_info')
+    mock_node_get_info.side_effect = async_side_effect(node_information)
 
     runner = CliRunner()
     result = runner.invoke(cli, [
@@ -136,3 +140,41 @@ def test_get_node_info_non_existing_node_url():
 
     assert FAILED_EXIT_FROM_COMMAND_CODE == result.exit_code
     assert dict_to_pretty_json(expected_error) in result.output
+
+
+def test_get_node_info_from_config_file_nodes(mocker, node_information, create_config_file_with_nodes):
+    """
+    Case: get information about synchronization and peer count of the nodes of the configuration file.
+    Expect: information of every node is returned keyed by node URLs.
+    """
+    mocker.patch('cli.config.Settings._shared', Settings(
+        environment={}, config_file_name='remme-core-cli-with-nodes',
+    ))
+
+    mock_node_get_info = mocker.patch('remme.node_management.RemmeNodeManagement.get_node_info')
+    mock_node_get_info.side_effect = async_side_effect(node_information)
+
+    runner = CliRunner()
+    result = runner.invoke(cli, [
+        'node',
+        'get-info',
+    ])
+
+    expected_result = {
+        'result': {
+            'node-1-testnet.remme.io': {
+                'result': {
+                    'information': node_information.data,
+                },
+            },
+            'node-2-testnet.remme.io': {
+                'result': {
+                    'information': node_information.data,
+                },
+            },
+        },
+    }
+
+    assert PASSED_EXIT_FROM_COMMAND_CODE == result.exit_code
+    assert expected_result == json.loads(result.output)
+    assert 2 == mock_node_get_info.call_count
@@ -12,7 +12,10 @@ from cli.constants import (
     PASSED_EXIT_FROM_COMMAND_CODE,
 )
 from cli.entrypoint import cli
-from cli.utils import dict_to_pretty_json
+from cli.utils import (
+    async_side_effect,
+    dict_to_pretty_json,
+)
 
 
 def test_get_initial_stake():
@@ -41,8 +44,8 @@ def test_get_initial_stake_without_node_url(mocker):
     """
     initial_stake = 250000
 
-    mock_node_get_initial_stake = mocker.patch('cli.node.service.loop.run_until_complete')
-    mock_node_get_initial_stake.return_value = initial_stake
+    mock_node_get_initial_stake = mocker.patch('remme.node_management.RemmeNodeManagement.get_initial_stake')
+    mock_node_get_initial_stake.side_effect = async_side_effect(initial_stake)
 
     runner = CliRunner()
     result = runner.invoke(cli, [
@@ -12,7 +12,10 @@ from cli.constants import (
     PASSED_EXIT_FROM_COMMAND_CODE,
 )
 from cli.entrypoint import cli
-from cli.utils import dict_to_pretty_json
+from cli.utils import (
+    async_side_effect,
+    dict_to_pretty_json,
+)
 
 
 def test_get_node_peers():
@@ -50,8 +53,8 @@ def test_get_node_peers_without_node_url(mocker):
         'tcp://node-18-testnet.remme.io:8800',
     ]
 
-    mock_get_node_peers = mocker.patch('cli.node.service.loop.run_until_complete')
-    mock_get_node_peers.return_value = peers
+    mock_get_node_peers = mocker.patch('remme.blockchain_info.RemmeBlockchainInfo.get_peers')
+    mock_get_node_peers.side_effect = async_side_effect(peers)
 
     runner = CliRunner()
     result = runner.invoke(cli, [
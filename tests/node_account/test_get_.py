@@ -13,7 +13,10 @@ from cli.constants import (
     PASSED_EXIT_FROM_COMMAND_CODE,
 )
 from cli.entrypoint import cli
-from cli.utils import dict_to_pretty_json
+from cli.utils import (
+    async_side_effect,
+    dict_to_pretty_json,
+)
 
 
 def test_get_information_with_address():
@@ -44,8 +47,8 @@ def test_get_information_without_node_url(mocker, node_account_information):
     Case: get information about the node account without passing node URL.
     Expect: information about the node account is returned from a node on localhost.
     """
-    mock_node_account_get_info = mocker.patch('cli.atomic_swap.service.loop.run_until_complete')
-    mock_node_account_get_info.return_value = node_account_information
+    mock_node_account_get_info = mocker.patch('remme.node_management.RemmeNodeManagement.get_node_account')
+    mock_node_account_get_info.side_effect = async_side_effect(node_account_information)
 
     runner = CliRunner()
     result = runner.invoke(cli, [
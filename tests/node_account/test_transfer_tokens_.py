@@ -16,7 +16,10 @@ from cli.constants import (
     PASSED_EXIT_FROM_COMMAND_CODE,
 )
 from cli.entrypoint import cli
-from cli.utils import dict_to_pretty_json
+from cli.utils import (
+    async_side_effect,
+    dict_to_pretty_json,
+)
 
 NODE_PRIVATE_KEY_WITH_MONEY = '7ae575740dcdae8e704ff461ab89ad42505e06abbbae8ea68e18387e537b7462'
 
@@ -174,8 +177,8 @@ def test_transfer_tokens_without_node_url(mocker, sent_transaction):
     Case: transfer tokens to address without passing node URL.
     Expect: batch identifier is returned from a node on localhost.
     """
-    mock_node_account_transfer_tokens = mocker.patch('cli.node_account.service.loop.run_until_complete')
-    mock_node_account_transfer_tokens.return_value = sent_transaction
+    mock_node_account_transfer_tokens = mocker.patch('remme.token.RemmeToken.transfer')
+    mock_node_account_transfer_tokens.side_effect = async_side_effect(sent_transaction)
 
     runner = CliRunner()
     result = runner.invoke(cli, [
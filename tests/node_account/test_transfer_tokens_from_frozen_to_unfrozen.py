@@ -7,6 +7,7 @@ from click.testing import CliRunner
 
 from cli.constants import PASSED_EXIT_FROM_COMMAND_CODE
 from cli.entrypoint import cli
+from cli.utils import async_side_effect
 
 
 def test_transfer_tokens_from_frozen_to_unfrozen(mocker, transaction):
@@ -18,8 +19,8 @@ def test_transfer_tokens_from_frozen_to_unfrozen(mocker, transaction):
     mock_get_node_private_key.return_value = '42dada12f863528bd456785d8c544154db6ec9455be2c123d91b687df3697314'
 
     mock_node_account_transfer_tokens_from_frozen_to_unfrozen = \
-        mocker.patch('cli.node_account.service.loop.run_until_complete')
-    mock_node_account_transfer_tokens_from_frozen_to_unfrozen.return_value = transaction
+        mocker.patch('remme.token.RemmeToken.transfer_from_frozen_to_unfrozen')
+    mock_node_account_transfer_tokens_from_frozen_to_unfrozen.side_effect = async_side_effect(transaction)
 
     runner = CliRunner()
     result = runner.invoke(cli, [
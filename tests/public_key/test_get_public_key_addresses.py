@@ -15,7 +15,10 @@ from cli.constants import (
     PUBLIC_KEY_ADDRESS_REGEXP,
 )
 from cli.entrypoint import cli
-from cli.utils import dict_to_pretty_json
+from cli.utils import (
+    async_side_effect,
+    dict_to_pretty_json,
+)
 
 
 def test_get_public_keys():
@@ -80,8 +83,9 @@ def test_get_public_keys_without_node_url(mocker):
         'a23be17265e8393dd9ae7a46f1be662f86130c434fd54576a7d92b678e5c30de4f677f',
     ]
 
-    mock_public_key_get_public_keys = mocker.patch('cli.public_key.service.loop.run_until_complete')
-    mock_public_key_get_public_keys.return_value = public_key_addresses
+    mock_public_key_get_public_keys = \
+        mocker.patch('remme.public_key_storage.RemmePublicKeyStorage.get_account_public_keys')
+    mock_public_key_get_public_keys.side_effect = async_side_effect(public_key_addresses)
 
     runner = CliRunner()
     result = runner.invoke(cli, [
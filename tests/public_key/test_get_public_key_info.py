@@ -16,7 +16,10 @@ from cli.constants import (
     TRANSACTION_IDENTIFIER_REGEXP,
 )
 from cli.entrypoint import cli
-from cli.utils import dict_to_pretty_json
+from cli.utils import (
+    async_side_effect,
+    dict_to_pretty_json,
+)
 
 PUBLIC_KEY_ADDRESS_PRESENTED_ON_THE_TEST_NODE = \
     'a23be1a8c94d4a06d3dc8fa8f3df543d87ae79b3bf59cbae37490e1534393048873070'
@@ -83,8 +86,8 @@ def test_get_public_key_info_without_node_url(mocker, public_key_information):
     Case: get information about public key without passing node URL.
     Expect: a dictionary of public key information is returned from a node on localhost.
     """
-    mock_public_key_get_info = mocker.patch('cli.public_key.service.loop.run_until_complete')
-    mock_public_key_get_info.return_value = public_key_information
+    mock_public_key_get_info = mocker.patch('remme.public_key_storage.RemmePublicKeyStorage.get_info')
+    mock_public_key_get_info.side_effect = async_side_effect(public_key_information)
 
     runner = CliRunner()
     result = runner.invoke(cli, [
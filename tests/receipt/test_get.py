@@ -12,7 +12,10 @@ from cli.constants import (
     PASSED_EXIT_FROM_COMMAND_CODE,
 )
 from cli.entrypoint import cli
-from cli.utils import dict_to_pretty_json
+from cli.utils import (
+    async_side_effect,
+    dict_to_pretty_json,
+)
 
 TRANSACTION_IDENTIFIERS_PRESENTED_ON_THE_TEST_NODE = \
     '7c5d2651b8a1bb04b99b9a1ce201aaf9e0cb35357b9ab31611b7f7957e931a71' \
@@ -121,8 +124,8 @@ def test_get_receipts_without_node_url(mocker):
         },
     ]
 
-    mock_get_receipts = mocker.patch('cli.receipt.service.loop.run_until_complete')
-    mock_get_receipts.return_value = expected_list_of_receipts
+    mock_get_receipts = mocker.patch('remme.blockchain_info.RemmeBlockchainInfo.get_receipts')
+    mock_get_receipts.side_effect = async_side_effect(expected_list_of_receipts)
 
     runner = CliRunner()
     result = runner.invoke(cli, [
@@ -284,3 +287,40 @@ def test_get_receipts_node_url_with_protocol(node_url_with_protocol):
 
     assert FAILED_EXIT_FROM_COMMAND_CODE == result.exit_code
     assert dict_to_pretty_json(expected_error) in result.output
+
+
+def test_get_receipts_partially_from_cache(mocker):
+    """
+    Case: get a list of the transaction's receipts when a part of them is already cached.
+    Expect: only non-cached receipts are requested from the node, receipts are returned in the order of identifiers.
+    """
+    first_identifier, second_identifier = TRANSACTION_IDENTIFIERS_PRESENTED_ON_THE_TEST_NODE.split(', ')
+
+    first_receipt = {'data': [], 'events': [], 'id': first_identifier, 'state_changes': []}
+    second_receipt = {'data': [], 'events': [], 'id': second_identifier, 'state_changes': []}
+
+    mock_get_receipts = mocker.patch('remme.blockchain_info.RemmeBlockchainInfo.get_receipts')
+    mock_get_receipts.side_effect = async_side_effect([second_receipt], [first_receipt])
+
+    runner = CliRunner()
+    runner.invoke(cli, [
+        'receipt',
+        'get',
+        '--ids',
+        second_identifier,
+        '--node-url',
+        DEV_BRANCH_NODE_IP_ADDRESS_FOR_TESTING,
+    ])
+
+    result = runner.invoke(cli, [
+        'receipt',
+        'get',
+        '--ids',
+        TRANSACTION_IDENTIFIERS_PRESENTED_ON_THE_TEST_NODE,
+        '--node-url',
+        DEV_BRANCH_NODE_IP_ADDRESS_FOR_TESTING,
+    ])
+
+    assert PASSED_EXIT_FROM_COMMAND_CODE == result.exit_code
+    assert {'result': [first_receipt, second_receipt]} == json.loads(result.output)
+    mock_get_receipts.assert_called_with(ids=[first_identifier])
@@ -0,0 +1,73 @@
+"""
+Provide tests for command line interface's startup profile command.
+"""
+import json
+
+from click.testing import CliRunner
+
+from cli.constants import (
+    FAILED_EXIT_FROM_COMMAND_CODE,
+    PASSED_EXIT_FROM_COMMAND_CODE,
+)
+from cli.entrypoint import (
+    COMMANDS,
+    cli,
+)
+from cli.startup_profile.service import StartupProfile
+from cli.utils import dict_to_pretty_json
+
+
+def test_startup_profile(mocker):
+    """
+    Case: report import time of the commands' modules.
+    Expect: the minimum import time among the repeats in milliseconds is returned per module.
+    """
+    mock_measure_import_time = mocker.patch('cli.startup_profile.service.StartupProfile._measure_import_time')
+    mock_measure_import_time.side_effect = [0.25, 0.125] * (len(COMMANDS) + 1)
+
+    runner = CliRunner()
+    result = runner.invoke(cli, [
+        'startup-profile',
+        '--repeat',
+        2,
+    ])
+
+    expected_modules = {'cli.entrypoint'} | {module for module, _, _ in COMMANDS.values()}
+
+    assert PASSED_EXIT_FROM_COMMAND_CODE == result.exit_code
+    assert dict.fromkeys(expected_modules, 125.0) == json.loads(result.output).get('result')
+
+
+def test_startup_profile_entrypoint_import():
+    """
+    Case: report import time of the entrypoint only.
+    Expect: the entrypoint is imported by a fresh interpreter and its import time is returned.
+    """
+    result, errors = StartupProfile(repeat=1).get_import_time(modules=['cli.entrypoint'])
+
+    assert errors is None
+    assert result.get('cli.entrypoint') > 0
+
+
+def test_startup_profile_invalid_repeat():
+    """
+    Case: report import time of the commands' modules with invalid repeat.
+    Expect: repeat must be greater than 0 error message.
+    """
+    runner = CliRunner()
+    result = runner.invoke(cli, [
+        'startup-profile',
+        '--repeat',
+        0,
+    ])
+
+    expected_error = {
+        'errors': {
+            'repeat': [
+                'Repeat must be greater than 0.',
+            ],
+        },
+    }
+
+    assert FAILED_EXIT_FROM_COMMAND_CODE == result.exit_code
+    assert dict_to_pretty_json(expected_error) in result.output
@@ -14,7 +14,10 @@ from cli.constants import (
     PASSED_EXIT_FROM_COMMAND_CODE,
 )
 from cli.entrypoint import cli
-from cli.utils import dict_to_pretty_json
+from cli.utils import (
+    async_side_effect,
+    dict_to_pretty_json,
+)
 
 ADDRESS_WITH_STATE = '0000000000000000000000000000000000000000000000000000000000000000000001'
 
@@ -105,8 +108,8 @@ def test_get_state_without_node_url(mocker):
                 "2e9272264d138278057de2f7961dcc962b4b89713cf69d256299a6635532017b",
     }
 
-    mock_get_state_by_address = mocker.patch('cli.state.service.loop.run_until_complete')
-    mock_get_state_by_address.return_value = expected_result
+    mock_get_state_by_address = mocker.patch('remme.blockchain_info.RemmeBlockchainInfo.get_state_by_address')
+    mock_get_state_by_address.side_effect = async_side_effect(expected_result)
 
     runner = CliRunner()
     result = runner.invoke(cli, [
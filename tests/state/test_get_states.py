@@ -14,7 +14,10 @@ from cli.constants import (
     PASSED_EXIT_FROM_COMMAND_CODE,
 )
 from cli.entrypoint import cli
-from cli.utils import dict_to_pretty_json
+from cli.utils import (
+    async_side_effect,
+    dict_to_pretty_json,
+)
 
 ADDRESS_WITH_STATE = '0000000000000000000000000000000000000000000000000000000000000000000001'
 
@@ -308,8 +311,8 @@ def test_get_states_without_node_url(mocker):
         ],
     }
 
-    mock_get_states = mocker.patch('cli.state.service.loop.run_until_complete')
-    mock_get_states.return_value = expected_result
+    mock_get_states = mocker.patch('remme.blockchain_info.RemmeBlockchainInfo.get_states')
+    mock_get_states.side_effect = async_side_effect(expected_result)
 
     runner = CliRunner()
     result = runner.invoke(cli, [
@@ -397,3 +400,36 @@ def test_get_states_invalid_node_url():
 
     assert FAILED_EXIT_FROM_COMMAND_CODE == result.exit_code
     assert dict_to_pretty_json(expected_error) in result.output
+
+
+def test_get_states_all_pages(mocker):
+    """
+    Case: get all states page by page following the node's paging.
+    Expect: states from all pages are returned, empty page stops the paging.
+    """
+    first_page_states = [{'address': '0' * 69 + '1', 'data': 'EksSRjE='}]
+
+    mock_get_states = mocker.patch('remme.blockchain_info.RemmeBlockchainInfo.get_states')
+    mock_get_states.side_effect = async_side_effect(
+        {'data': first_page_states, 'head': 'c' * 128, 'paging': {'limit': 1, 'next': '0' * 69 + '2'}},
+        {'data': [], 'head': 'c' * 128, 'paging': {'limit': 1, 'next': '0' * 69 + '3'}},
+    )
+
+    runner = CliRunner()
+    result = runner.invoke(cli, [
+        'state',
+        'get-list',
+        '--all',
+        '--page-size',
+        1,
+        '--node-url',
+        'localhost',
+    ])
+
+    expected_result = {
+        'result': first_page_states,
+    }
+
+    assert PASSED_EXIT_FROM_COMMAND_CODE == result.exit_code
+    assert dict_to_pretty_json(expected_result) + '\n' == result.output
+    assert 2 == mock_get_states.call_count
@@ -1,7 +1,17 @@
 """
 Provide tests for implementation of the entrypoint commands.
 """
-from cli.entrypoint import cli
+import subprocess
+import sys
+
+from click.testing import CliRunner
+
+from cli.constants import PASSED_EXIT_FROM_COMMAND_CODE
+from cli.entrypoint import (
+    COMMANDS,
+    cli,
+    main,
+)
 
 
 def test_name():
@@ -10,3 +20,49 @@ def test_name():
     Expect: the name is the same as in setup.py (`cli`).
     """
     assert 'cli' == cli.name
+
+
+def test_commands_modules_are_not_imported_on_startup():
+    """
+    Case: import the CLI entrypoint and print its help message.
+    Expect: commands are listed, commands' modules are not imported.
+    """
+    code = 'import sys; from cli.entrypoint import cli, COMMANDS; ' \
+           'cli(["--help"], standalone_mode=False); ' \
+           'print(any(module in sys.modules for module, _, _ in COMMANDS.values()))'
+
+    process = subprocess.run([sys.executable, '-c', code], stdout=subprocess.PIPE, universal_newlines=True)
+
+    for command_name in COMMANDS:
+        assert command_name in process.stdout
+
+    assert 'False' == process.stdout.splitlines()[-1]
+
+
+def test_command_module_is_imported_on_invocation():
+    """
+    Case: invoke the command.
+    Expect: the command is loaded from its module.
+    """
+    runner = CliRunner()
+    result = runner.invoke(cli, ['block', '--help'])
+
+    assert PASSED_EXIT_FROM_COMMAND_CODE == result.exit_code
+    assert 'get-list' in result.output
+    assert 'cli.block.cli' in sys.modules
+
+
+def test_main_executes_command_locally_without_daemon(mocker):
+    """
+    Case: execute the command by the installed executable without the running daemon.
+    Expect: the command is executed locally.
+    """
+    mocker.patch('cli.entrypoint.sys.argv', ['remme', '--help'])
+    mock_forward = mocker.patch('cli.entrypoint.forward')
+    mock_forward.return_value = None
+    mock_cli = mocker.patch('cli.entrypoint.cli')
+
+    main()
+
+    mock_forward.assert_called_once_with(arguments=['--help'])
+    mock_cli.assert_called_once_with()
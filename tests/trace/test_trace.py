@@ -0,0 +1,125 @@
+"""
+Provide tests for the tracing of the command's execution.
+"""
+import json
+
+import pytest
+from click.testing import CliRunner
+from marshmallow import Schema
+
+from cli.constants import (
+    FAILED_EXIT_FROM_COMMAND_CODE,
+    PASSED_EXIT_FROM_COMMAND_CODE,
+)
+from cli.daemon.client import is_local_command
+from cli.entrypoint import cli
+from cli.trace import Tracer
+
+
+@pytest.fixture(autouse=True)
+def tracer(monkeypatch):
+    """
+    Trace the executions without the process' startup, it is recorded by the first traced execution only.
+    """
+    monkeypatch.setattr(Tracer, 'startup_started_at', None)
+    monkeypatch.setattr(Tracer, 'active', None)
+
+
+def test_trace_command(mock_node):
+    """
+    Case: get information about the node with tracing.
+    Expect: the result is printed to the output, the phases' events are written to the standard error.
+    """
+    result = CliRunner(mix_stderr=False).invoke(cli, [
+        '--trace',
+        'node',
+        'get-info',
+        '--node-url', 'localhost',
+    ])
+
+    events = [json.loads(line) for line in result.stderr.splitlines()]
+    events_by_names = {event.get('event'): event for event in events}
+
+    assert PASSED_EXIT_FROM_COMMAND_CODE == result.exit_code
+    assert json.loads(result.output).get('result').get('information').get('is_synced')
+
+    assert 'GetNodeInformationForm' == events_by_names.get('form').get('form')
+    assert 'localhost' == events_by_names.get('client').get('node_url')
+    assert 'get_node_info' == events_by_names.get('rpc').get('method')
+    assert 1 == events_by_names.get('json').get('count')
+    assert 1 == events_by_names.get('output').get('count')
+
+    assert 'total' == events[-1].get('event')
+    assert PASSED_EXIT_FROM_COMMAND_CODE == events[-1].get('exit_code')
+    assert all(event.get('duration') <= events[-1].get('duration') for event in events)
+    assert None is Tracer.active
+
+
+def test_trace_command_to_file(tmpdir):
+    """
+    Case: get a batch by the invalid identifier with tracing to the file.
+    Expect: the form's validation and the exit code are written to the file, nothing to the standard error.
+    """
+    trace_file = str(tmpdir.join('trace.ndjson'))
+
+    result = CliRunner(mix_stderr=False).invoke(cli, [
+        '--trace-file', trace_file,
+        'batch',
+        'get',
+        '--id', 'invalid',
+        '--node-url', 'localhost',
+    ])
+
+    with open(trace_file) as file:
+        events = [json.loads(line) for line in file]
+
+    assert FAILED_EXIT_FROM_COMMAND_CODE == result.exit_code
+    assert not result.stderr_bytes
+    assert 'GetBatchForm' in [event.get('form') for event in events if event.get('event') == 'form']
+    assert 'rpc' not in [event.get('event') for event in events]
+    assert {'event': 'total', 'exit_code': FAILED_EXIT_FROM_COMMAND_CODE} == {
+        'event': events[-1].get('event'), 'exit_code': events[-1].get('exit_code'),
+    }
+
+
+def test_trace_command_without_patching_schemas(mock_node):
+    """
+    Case: get information about the node with tracing.
+    Expect: marshmallow's schemas' load method isn't replaced, so other commands' schemas aren't traced.
+    """
+    load = Schema.load
+
+    result = CliRunner(mix_stderr=False).invoke(cli, [
+        '--trace',
+        'node',
+        'get-info',
+        '--node-url', 'localhost',
+    ])
+
+    assert PASSED_EXIT_FROM_COMMAND_CODE == result.exit_code
+    assert load is Schema.load
+
+
+def test_command_without_trace(mock_node):
+    """
+    Case: get information about the node without tracing.
+    Expect: nothing is written to the standard error.
+    """
+    result = CliRunner(mix_stderr=False).invoke(cli, [
+        'node',
+        'get-info',
+        '--node-url', 'localhost',
+    ])
+
+    assert PASSED_EXIT_FROM_COMMAND_CODE == result.exit_code
+    assert not result.stderr_bytes
+
+
+def test_traced_command_is_not_forwarded():
+    """
+    Case: check if the traced commands should be executed locally.
+    Expect: traced commands are never forwarded to the daemon.
+    """
+    assert is_local_command(arguments=['--trace', 'node', 'get-info'])
+    assert is_local_command(arguments=['--trace-file=trace.ndjson', 'node', 'get-info'])
+    assert not is_local_command(arguments=['node', 'get-info'])
@@ -14,7 +14,10 @@ from cli.constants import (
     TRANSACTION_IDENTIFIER_REGEXP,
 )
 from cli.entrypoint import cli
-from cli.utils import dict_to_pretty_json
+from cli.utils import (
+    async_side_effect,
+    dict_to_pretty_json,
+)
 
 
 def test_get_list_transactions_with_all_parameters(mocker):
@@ -53,8 +56,8 @@ def test_get_list_transactions_with_all_parameters(mocker):
         },
     }
 
-    mock_get_transaction_by_ids = mocker.patch('cli.transaction.service.loop.run_until_complete')
-    mock_get_transaction_by_ids.return_value = expected_result
+    mock_get_transaction_by_ids = mocker.patch('remme.blockchain_info.RemmeBlockchainInfo.get_transactions')
+    mock_get_transaction_by_ids.side_effect = async_side_effect(expected_result)
 
     runner = CliRunner()
     result = runner.invoke(cli, [
@@ -432,8 +435,8 @@ def test_get_list_transactions_without_node_url(mocker):
         },
     }
 
-    mock_get_transaction_by_ids = mocker.patch('cli.transaction.service.loop.run_until_complete')
-    mock_get_transaction_by_ids.return_value = expected_result
+    mock_get_transaction_by_ids = mocker.patch('remme.blockchain_info.RemmeBlockchainInfo.get_transactions')
+    mock_get_transaction_by_ids.side_effect = async_side_effect(expected_result)
 
     runner = CliRunner()
     result = runner.invoke(cli, [
@@ -476,3 +479,146 @@ def test_get_list_transactions_node_url_with_protocol(node_url_with_protocol):
 
     assert FAILED_EXIT_FROM_COMMAND_CODE == result.exit_code
     assert dict_to_pretty_json(expected_error) in result.output
+
+
+def test_get_list_transactions_all_pages(mocker):
+    """
+    Case: get all transactions page by page following the node's paging.
+    Expect: transactions from all pages are returned.
+    """
+    first_page_transactions = [{'header': {'family_name': 'account'}, 'header_signature': 'a' * 128}]
+    second_page_transactions = [{'header': {'family_name': 'account'}, 'header_signature': 'b' * 128}]
+
+    mock_get_transactions = mocker.patch('remme.blockchain_info.RemmeBlockchainInfo.get_transactions')
+    mock_get_transactions.side_effect = async_side_effect(
+        {'data': first_page_transactions, 'head': 'c' * 128, 'paging': {'limit': 1, 'next': 'b' * 128}},
+        {'data': second_page_transactions, 'head': 'c' * 128, 'paging': {'limit': 1, 'next': ''}},
+    )
+
+    runner = CliRunner()
+    result = runner.invoke(cli, [
+        'transaction',
+        'get-list',
+        '--all',
+        '--page-size',
+        1,
+        '--family-name',
+        'account',
+        '--node-url',
+        'localhost',
+    ])
+
+    expected_result = {
+        'result': first_page_transactions + second_page_transactions,
+    }
+
+    assert PASSED_EXIT_FROM_COMMAND_CODE == result.exit_code
+    assert dict_to_pretty_json(expected_result) + '\n' == result.output
+    assert 'account' == mock_get_transactions.call_args_list[1][1].get('query').get('family_name')
+
+
+def test_get_list_transactions_ndjson_output(mocker):
+    """
+    Case: get a list of transactions in newline-delimited JSON output format.
+    Expect: a line of JSON is printed per transaction.
+    """
+    transactions = [
+        {'header': {'family_name': 'account'}, 'header_signature': 'a' * 128},
+        {'header': {'family_name': 'account'}, 'header_signature': 'b' * 128},
+    ]
+
+    mock_get_transactions = mocker.patch('remme.blockchain_info.RemmeBlockchainInfo.get_transactions')
+    mock_get_transactions.side_effect = async_side_effect(
+        {'data': transactions, 'head': 'c' * 128, 'paging': {'next': ''}},
+    )
+
+    runner = CliRunner()
+    result = runner.invoke(cli, [
+        'transaction',
+        'get-list',
+        '--output',
+        'ndjson',
+        '--node-url',
+        'localhost',
+    ])
+
+    assert PASSED_EXIT_FROM_COMMAND_CODE == result.exit_code
+    assert transactions == [json.loads(line) for line in result.output.splitlines()]
+
+
+def test_get_list_transactions_identifiers_with_limit_by_pages(mocker):
+    """
+    Case: get a list of transactions' identifiers with a limit greater than the page size.
+    Expect: transactions are requested by pages up to the limit, only identifiers are returned.
+    """
+    mock_get_transactions = mocker.patch('remme.blockchain_info.RemmeBlockchainInfo.get_transactions')
+    mock_get_transactions.side_effect = async_side_effect(
+        {
+            'data': [{'header_signature': 'a' * 128, 'payload': 'payload'}] * 100,
+            'head': 'c' * 128,
+            'paging': {'limit': 100, 'next': 'b' * 128},
+        },
+        {
+            'data': [{'header_signature': 'b' * 128, 'payload': 'payload'}] * 50,
+            'head': 'c' * 128,
+            'paging': {'limit': 50, 'next': 'd' * 128},
+        },
+    )
+
+    runner = CliRunner()
+    result = runner.invoke(cli, [
+        'transaction',
+        'get-list',
+        '--ids-only',
+        '--limit',
+        150,
+        '--node-url',
+        'localhost',
+    ])
+
+    assert PASSED_EXIT_FROM_COMMAND_CODE == result.exit_code
+    assert ['a' * 128] * 100 + ['b' * 128] * 50 == json.loads(result.output).get('result')
+    assert [100, 50] == [call[1].get('query').get('limit') for call in mock_get_transactions.call_args_list]
+
+
+def test_get_list_transactions_follow(mocker):
+    """
+    Case: follow transactions of the family while the node commits blocks.
+    Expect: transactions of the family from the committed blocks are printed, the following is stopped at the limit.
+    """
+    def create_block(block_num, family_names):
+        return {
+            'header': {'block_num': str(block_num)},
+            'batches': [{'transactions': [
+                {'header': {'family_name': family_name}, 'header_signature': f'{block_num}-{family_name}'}
+                for family_name in family_names
+            ]}],
+        }
+
+    mock_get_blocks = mocker.patch('remme.blockchain_info.RemmeBlockchainInfo.get_blocks')
+    mock_get_blocks.side_effect = async_side_effect(
+        {'data': [create_block(4, ['account'])]},
+        {'data': [create_block(6, ['account'])]},
+        {'data': [create_block(5, ['account', 'node_account']), create_block(6, ['account'])], 'paging': {}},
+    )
+
+    mocker.patch('asyncio.sleep', side_effect=async_side_effect(None))
+
+    runner = CliRunner()
+    result = runner.invoke(cli, [
+        'transaction',
+        'get-list',
+        '--follow',
+        '--family-name',
+        'account',
+        '--limit',
+        2,
+        '--node-url',
+        'localhost',
+    ])
+
+    assert PASSED_EXIT_FROM_COMMAND_CODE == result.exit_code
+    assert ['5-account', '6-account'] == [
+        json.loads(line).get('header_signature') for line in result.output.splitlines()
+    ]
+    assert 3 == mock_get_blocks.call_count
@@ -12,7 +12,10 @@ from cli.constants import (
     PASSED_EXIT_FROM_COMMAND_CODE,
 )
 from cli.entrypoint import cli
-from cli.utils import dict_to_pretty_json
+from cli.utils import (
+    async_side_effect,
+    dict_to_pretty_json,
+)
 
 TRANSACTION_IDENTIFIER_PRESENTED_ON_THE_TEST_NODE = '640fe45794d2f63fbe1850aa99d0ac830ed94e1ac9b475e1e8c841f714b6250e' \
                                                     '64bc6fbd9f821147ee1eab4d76e5437f5b878a9b5288f1d4c1dc192060a82cf1'
@@ -103,8 +106,8 @@ def test_get_transaction_without_node_url(mocker):
         },
     }
 
-    mock_get_transaction_by_id = mocker.patch('cli.transaction.service.loop.run_until_complete')
-    mock_get_transaction_by_id.return_value = expected_result
+    mock_get_transaction_by_id = mocker.patch('remme.blockchain_info.RemmeBlockchainInfo.get_transaction_by_id')
+    mock_get_transaction_by_id.side_effect = async_side_effect(expected_result)
 
     runner = CliRunner()
     result = runner.invoke(cli, [
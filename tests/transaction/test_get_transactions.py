@@ -14,7 +14,10 @@ from cli.constants import (
     TRANSACTION_IDENTIFIER_REGEXP,
 )
 from cli.entrypoint import cli
-from cli.utils import dict_to_pretty_json
+from cli.utils import (
+    async_side_effect,
+    dict_to_pretty_json,
+)
 
 
 def test_get_transactions_with_all_parameters(mocker):
@@ -53,8 +56,8 @@ def test_get_transactions_with_all_parameters(mocker):
         },
     }
 
-    mock_get_transaction_by_ids = mocker.patch('cli.transaction.service.loop.run_until_complete')
-    mock_get_transaction_by_ids.return_value = expected_result
+    mock_get_transaction_by_ids = mocker.patch('remme.blockchain_info.RemmeBlockchainInfo.get_transactions')
+    mock_get_transaction_by_ids.side_effect = async_side_effect(expected_result)
 
     runner = CliRunner()
     result = runner.invoke(cli, [
@@ -454,8 +457,8 @@ def test_get_transactions_without_node_url(mocker):
         },
     }
 
-    mock_get_transactions = mocker.patch('cli.transaction.service.loop.run_until_complete')
-    mock_get_transactions.return_value = expected_result
+    mock_get_transactions = mocker.patch('remme.blockchain_info.RemmeBlockchainInfo.get_transactions')
+    mock_get_transactions.side_effect = async_side_effect(expected_result)
 
     runner = CliRunner()
     result = runner.invoke(cli, [